@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+
+import json
+import random
+from types import SimpleNamespace
+
+from .fixtures import make_window, make_text, scaled, SEED
+from .harness import benchmark
+
+
+def setup_command() -> SimpleNamespace:
+    """
+    Setup large model output with tool calls
+
+    :return: state
+    """
+    from pygpt_net.core.command import Command
+
+    rnd = random.Random(SEED)
+    parts = []
+    for i in range(scaled(500)):
+        parts.append(make_text(rnd, 120))
+        if i % 5 == 0:
+            cmd = {
+                "cmd": "read_file",
+                "params": {
+                    "path": "/tmp/file_{}.txt".format(i),
+                    "content": make_text(rnd, 40),
+                },
+            }
+            parts.append("<tool>{}</tool>".format(json.dumps(cmd)))
+    return SimpleNamespace(command=Command(make_window()), text="\n".join(parts))
+
+
+@benchmark(name="command.extract_cmds", group="command", rounds=10, setup=setup_command)
+def bench_extract_cmds(state: SimpleNamespace) -> dict:
+    """Extract tool calls from large output"""
+    cmds = state.command.extract_cmds(state.text)
+    return {"cmds": len(cmds), "chars": len(state.text)}
+
+
+@benchmark(name="command.has_cmds", group="command", rounds=10, setup=setup_command)
+def bench_has_cmds(state: SimpleNamespace) -> dict:
+    """Check tool calls presence in large output"""
+    return {"found": state.command.has_cmds(state.text)}
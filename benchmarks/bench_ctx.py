@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+import atexit
+from types import SimpleNamespace
+
+from .fixtures import CtxDatabase, make_window, make_items, scaled
+from .harness import benchmark, Skip
+
+
+_meta_state = None
+
+
+def setup_meta() -> SimpleNamespace:
+    """
+    Setup Ctx with 100k contexts in SQLite (shared by ctx meta benchmarks)
+
+    :return: state
+    """
+    global _meta_state
+    if _meta_state is None:
+        from pygpt_net.core.ctx import Ctx
+
+        db = CtxDatabase(metas=scaled(100_000), items_per_meta=1).setup()
+        atexit.register(db.teardown)
+        ctx = Ctx(db.window)
+        db.window.core.ctx = ctx
+        db.window.core.config.set("ctx.records.limit", 0)  # load all, worst case
+        _meta_state = SimpleNamespace(db=db, ctx=ctx)
+    return _meta_state
+
+
+@benchmark(name="ctx.load_meta", group="ctx", rounds=5, setup=setup_meta)
+def bench_load_meta(state: SimpleNamespace) -> dict:
+    """Load all ctx metas (pinned, grouped, ungrouped)"""
+    state.ctx.clear_search_string()
+    state.ctx.load_meta()
+    return {"metas": len(state.ctx.meta)}
+
+
+@benchmark(name="ctx.get_meta.search", group="ctx", rounds=5, setup=setup_meta)
+def bench_get_meta_search(state: SimpleNamespace) -> dict:
+    """Search ctx metas by name"""
+    state.db.window.core.config.set("ctx.search_content", False)
+    state.ctx.set_search_string("topic 4")
+    meta = state.ctx.get_meta(reload=True)
+    return {"found": len(meta)}
+
+
+@benchmark(name="ctx.get_meta.search_content", group="ctx", rounds=3, setup=setup_meta)
+def bench_get_meta_search_content(state: SimpleNamespace) -> dict:
+    """Search ctx metas by name and items content"""
+    state.db.window.core.config.set("ctx.search_content", True)
+    state.ctx.set_search_string("embedding memory")
+    meta = state.ctx.get_meta(reload=True)
+    state.db.window.core.config.set("ctx.search_content", False)
+    return {"found": len(meta)}
+
+
+_items_state = None
+
+
+def setup_items() -> SimpleNamespace:
+    """
+    Setup Ctx with single 5k items context with filled JSON columns
+
+    :return: state
+    """
+    global _items_state
+    if _items_state is None:
+        from pygpt_net.core.ctx import Ctx
+
+        db = CtxDatabase(metas=1, items_per_meta=scaled(5_000), json_columns=True).setup()
+        atexit.register(db.teardown)
+        ctx = Ctx(db.window)
+        db.window.core.ctx = ctx
+        _items_state = SimpleNamespace(db=db, ctx=ctx)
+    return _items_state
+
+
+@benchmark(name="ctx.load_items", group="ctx", rounds=5, setup=setup_items)
+def bench_load_items(state: SimpleNamespace) -> dict:
+    """Load 5k items context (JSON columns decoded on first access)"""
+    items = state.ctx.load(1)
+    return {"items": len(items)}
+
+
+@benchmark(name="ctx.load_items.decoded", group="ctx", rounds=5, setup=setup_items)
+def bench_load_items_decoded(state: SimpleNamespace) -> dict:
+    """Load 5k items context and access all JSON columns (worst case)"""
+    items = state.ctx.load(1)
+    for item in items:
+        item.additional_ctx, item.attachments, item.cmds, item.doc_ids
+        item.extra, item.files, item.images, item.results, item.urls
+    return {"items": len(items)}
+
+
+@benchmark(name="ctx.get_items_by_id", group="ctx", rounds=5, setup=setup_items)
+def bench_get_items_by_id(state: SimpleNamespace) -> dict:
+    """Load 5k items context as text (input/output columns only)"""
+    data = state.ctx.get_items_by_id(1)
+    return {"items": len(data)}
+
+
+def setup_history() -> SimpleNamespace:
+    """
+    Setup Ctx with long thread and real token counter
+
+    :return: state
+    """
+    from pygpt_net.core.ctx import Ctx
+    from pygpt_net.core.prompt.prefix import Prefix
+    from pygpt_net.core.tokens import Tokens
+
+    if not Tokens.from_str("ping", "gpt-4o"):
+        raise Skip("tiktoken encoding not available offline")
+    window = make_window()
+    window.core.tokens = Tokens(window)
+    window.core.prompt.prefix = Prefix(window)
+    ctx = Ctx(window)
+    return SimpleNamespace(ctx=ctx, items=make_items(scaled(2_000)))
+
+
+@benchmark(name="ctx.get_history", group="ctx", rounds=5, setup=setup_history)
+def bench_get_history(state: SimpleNamespace) -> dict:
+    """Fit long thread into token limit"""
+    items = state.ctx.get_history(
+        state.items,
+        model="gpt-4o",
+        mode="chat",
+        used_tokens=500,
+        max_tokens=128_000,
+    )
+    return {"items": len(items), "thread": len(state.items)}
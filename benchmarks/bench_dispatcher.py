@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.19 00:00:00                  #
+# ================================================== #
+
+
+import importlib
+from types import SimpleNamespace
+
+from .fixtures import make_window, make_items
+from .harness import benchmark
+
+PLUGINS = (
+    "voice_control", "agent", "real_time", "experts", "extra_prompt", "audio_input",
+    "audio_output", "cmd_web", "cmd_files", "cmd_code_interpreter", "cmd_system",
+    "cmd_custom", "cmd_api", "cmd_serial", "cmd_mouse_control", "cmd_history",
+    "openai_dalle", "openai_vision", "idx_llama_index", "mailer", "crontab", "google",
+    "twitter", "facebook", "telegram", "slack", "github", "bitbucket", "server", "tuya",
+    "wikipedia", "twelvelabs", "mcp", "wolfram", "osm",
+)
+AUDIO_PROVIDERS = (
+    ("input", "audio_input.openai_whisper", "OpenAIWhisper"),
+    ("output", "audio_output.openai_tts", "OpenAITextToSpeech"),
+)
+
+
+def setup_dispatcher() -> SimpleNamespace:
+    """
+    Setup dispatcher with all base plugins registered and enabled
+
+    :return: state
+    """
+    from pygpt_net.core.dispatcher import Dispatcher
+    from pygpt_net.core.plugins import Plugins
+
+    window = make_window(config={
+        "cmd": True,
+        "log.events": False,
+        "audio.cache.enabled": False,
+        "audio.output.backend": "pyaudio",  # TTS worker goes to (mocked) thread pool, no speech generated
+    })
+    providers = {"input": {}, "output": {}}
+    for type, path, cls in AUDIO_PROVIDERS:  # default providers, registered before plugins as in app
+        provider = getattr(importlib.import_module("pygpt_net.provider." + path), cls)()
+        providers[type][provider.id] = provider
+    window.core.audio.get_providers.side_effect = lambda type="output": providers[type]
+    window.core.plugins = Plugins(window)
+    skipped = []
+    for name in PLUGINS:
+        try:
+            module = importlib.import_module("pygpt_net.plugin." + name)
+            window.core.plugins.register(module.Plugin())
+        except Exception as e:
+            skipped.append("{}: {}".format(name, e))
+    dispatcher = Dispatcher(window)
+    return SimpleNamespace(
+        dispatcher=dispatcher,
+        ctx=make_items(1)[0],
+        plugins=len(window.core.plugins.plugins),
+        skipped=skipped,
+    )
+
+
+def make_events(ctx) -> list:
+    """
+    Make common prompt-cycle events
+
+    :param ctx: context item
+    :return: list of events
+    """
+    from pygpt_net.core.events import Event
+
+    return [
+        Event(Event.CMD_SYNTAX, {'prompt': "prompt", 'silent': True, 'syntax': [], 'cmd': []}),
+        Event(Event.SYSTEM_PROMPT, {'mode': "chat", 'value': "You are a helpful assistant.", 'is_expert': False}),
+        Event(Event.CTX_BEFORE, {'mode': "chat"}, ctx=ctx),
+        Event(Event.PRE_PROMPT, {'mode': "chat", 'value': "You are a helpful assistant."}),
+        Event(Event.POST_PROMPT_END, {'value': "You are a helpful assistant.", 'reply': False}, ctx=ctx),
+        Event(Event.CTX_AFTER, {'mode': "chat"}, ctx=ctx),
+    ]
+
+
+@benchmark(name="dispatcher.dispatch.all_plugins", group="dispatcher", rounds=5, setup=setup_dispatcher)
+def bench_dispatch(state: SimpleNamespace) -> dict:
+    """Dispatch prompt-cycle events to all enabled plugins (x100)"""
+    dispatch = state.dispatcher.dispatch
+    count = 0
+    for _ in range(100):
+        for event in make_events(state.ctx):
+            dispatch(event)
+            count += 1
+    return {"events": count, "plugins": state.plugins, "skipped": state.skipped}
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+
+import atexit
+import os
+import random
+import shutil
+import tempfile
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from .fixtures import make_window, make_text, scaled, SEED
+from .harness import benchmark, Skip
+
+
+def setup_indexing() -> SimpleNamespace:
+    """
+    Setup Indexing with in-memory vector index and fake embedder
+
+    :return: state
+    """
+    try:
+        from llama_index.core import VectorStoreIndex
+        from llama_index.core.embeddings import MockEmbedding
+    except ImportError as e:
+        raise Skip(str(e))
+    from pygpt_net.core.idx.indexing import Indexing
+    from pygpt_net.core.limiter import Limiter
+
+    path = tempfile.mkdtemp(prefix="pygpt_bench_idx_")
+    atexit.register(shutil.rmtree, path, True)
+    rnd = random.Random(SEED)
+    for i in range(scaled(200)):
+        with open(os.path.join(path, "doc_{}.txt".format(i)), "w", encoding="utf-8") as f:
+            f.write(make_text(rnd, 400))
+
+    window = make_window(config={
+        "llama.idx.recursive": False,
+        "llama.idx.replace_old": False,
+        "llama.idx.embeddings.limit.rpm": 0,
+        "llama.idx.embeddings.limit.tpm": 0,
+    })
+    window.core.idx = MagicMock()
+    window.core.limiter = Limiter(window)
+    indexing = Indexing(window)
+    return SimpleNamespace(
+        indexing=indexing,
+        path=path,
+        make_index=lambda: VectorStoreIndex([], embed_model=MockEmbedding(embed_dim=256)),
+    )
+
+
+@benchmark(name="idx.index_files", group="idx", rounds=3, setup=setup_indexing)
+def bench_index_files(state: SimpleNamespace) -> dict:
+    """Index directory of text files (fake embedder)"""
+    index = state.make_index()
+    indexed, errors = state.indexing.index_files("bench", index, path=state.path, is_tmp=True)
+    return {"files": len(indexed), "errors": len(errors)}
+
+
+_vector_state = None
+
+
+def setup_vector_stores() -> SimpleNamespace:
+    """
+    Setup Simple and Numpy vector stores with 50k clustered embeddings (384 dims)
+
+    :return: state
+    """
+    global _vector_state
+    if _vector_state is None:
+        try:
+            import numpy as np
+            from llama_index.core.schema import TextNode
+            from llama_index.core.vector_stores import SimpleVectorStore
+            from llama_index.core.vector_stores.types import VectorStoreQuery
+        except ImportError as e:
+            raise Skip(str(e))
+        from pygpt_net.provider.vector_stores.numpy_mmap import NumpyVectorStore
+
+        rnd = np.random.default_rng(SEED)
+        n = scaled(50_000)
+        centers = rnd.normal(size=(64, 384)).astype(np.float32)
+        data = centers[rnd.integers(0, 64, size=n)] + 0.5 * rnd.normal(size=(n, 384)).astype(np.float32)
+        nodes = [
+            TextNode(id_="node_{}".format(i), text="", embedding=row.tolist())
+            for i, row in enumerate(data)
+        ]
+        path = tempfile.mkdtemp(prefix="pygpt_bench_vectors_")
+        atexit.register(shutil.rmtree, path, True)
+        simple = SimpleVectorStore()
+        simple.add(nodes)
+        flat = NumpyVectorStore(path=os.path.join(path, "flat"))
+        flat.add(nodes)
+        ivf = NumpyVectorStore(path=os.path.join(path, "ivf"), index_type="ivf", ivf_min_rows=1)
+        ivf.add(nodes)
+        ivf.persist()
+        queries = [
+            VectorStoreQuery(query_embedding=(data[i] + rnd.normal(size=384)).tolist(), similarity_top_k=10)
+            for i in range(0, n, max(1, n // 20))
+        ]
+        _vector_state = SimpleNamespace(path=path, simple=simple, flat=flat, ivf=ivf, queries=queries, rows=n)
+    return _vector_state
+
+
+@benchmark(name="idx.vector_store.simple.query", group="idx", rounds=3, setup=setup_vector_stores)
+def bench_simple_query(state: SimpleNamespace) -> dict:
+    """Query SimpleVectorStore (20 queries, top 10)"""
+    for query in state.queries:
+        state.simple.query(query)
+    return {"rows": state.rows, "queries": len(state.queries)}
+
+
+@benchmark(name="idx.vector_store.numpy.query", group="idx", rounds=5, setup=setup_vector_stores)
+def bench_numpy_query(state: SimpleNamespace) -> dict:
+    """Query NumpyVectorStore, exact search (20 queries, top 10)"""
+    for query in state.queries:
+        state.flat.query(query)
+    return {"rows": state.rows, "queries": len(state.queries)}
+
+
+@benchmark(name="idx.vector_store.numpy.query.ivf", group="idx", rounds=5, setup=setup_vector_stores)
+def bench_numpy_query_ivf(state: SimpleNamespace) -> dict:
+    """Query NumpyVectorStore, IVF search (20 queries, top 10)"""
+    for query in state.queries:
+        state.ivf.query(query)
+    return {"rows": state.rows, "queries": len(state.queries)}
+
+
+@benchmark(name="idx.vector_store.numpy.open", group="idx", rounds=5, setup=setup_vector_stores)
+def bench_numpy_open(state: SimpleNamespace) -> dict:
+    """Open NumpyVectorStore (map matrix, load row IDs)"""
+    from pygpt_net.provider.vector_stores.numpy_mmap import NumpyVectorStore
+
+    store = NumpyVectorStore(path=os.path.join(state.path, "ivf"), index_type="ivf")
+    store.close()
+    return {"rows": state.rows}
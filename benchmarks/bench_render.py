@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.19 00:00:00                  #
+# ================================================== #
+
+
+import random
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from .fixtures import make_window, make_items, make_meta, make_text, scaled, SEED
+from .harness import benchmark
+
+
+def setup_render() -> SimpleNamespace:
+    """
+    Setup web renderer with payload sink (no WebEngine)
+
+    :return: state
+    """
+    from pygpt_net.core.render.web.renderer import Renderer
+
+    window = make_window()
+    window.core.ctx.output.get_pid = MagicMock(return_value=1)
+    renderer = Renderer(window)
+    state = SimpleNamespace(
+        renderer=renderer,
+        meta=make_meta(),
+        items=make_items(scaled(300), markdown=True),
+        bytes=0,
+    )
+
+    def sink(pid, payload: str, flush: bool = False, replace: bool = False):
+        state.bytes += len(payload or "")
+
+    renderer.append = sink
+    return state
+
+
+@benchmark(name="render.append_context_all", group="render", rounds=5, setup=setup_render)
+def bench_append_context_all(state: SimpleNamespace) -> dict:
+    """Build JSON nodes payload for whole context"""
+    state.bytes = 0
+    state.renderer.append_context_all(state.meta, state.items, clear=True)
+    return {"items": len(state.items), "payload_bytes": state.bytes}
+
+
+def make_answer(rnd: random.Random, size: int = 50_000, code_blocks: int = 20) -> str:
+    """
+    Make long Markdown answer with code blocks
+
+    :param rnd: random generator
+    :param size: answer size in chars
+    :param code_blocks: number of code blocks
+    :return: Markdown text
+    """
+    parts = []
+    per_section = size // code_blocks
+    for i in range(code_blocks):
+        section = ["### Step {}".format(i + 1)]
+        code = "\n".join(
+            "    value_{} = compute({}, '{}')".format(n, n, rnd.choice(["a", "b", "c"])) for n in range(20)
+        )
+        section.append("```python\ndef step_{}():\n{}\n    return value_0\n```".format(i, code))
+        while sum(len(p) for p in section) < per_section:
+            section.append(make_text(rnd, 50))
+        parts.append("\n\n".join(section))
+    return "\n\n".join(parts)
+
+
+def setup_parse() -> SimpleNamespace:
+    """
+    Setup legacy Markdown parser with 50 KB answer (20 code blocks) streamed in 1 KB chunks
+
+    :return: state
+    """
+    import pygpt_net.utils
+    from pygpt_net.core.locale.locale import Locale
+    from pygpt_net.core.render.markdown.parser import Parser
+
+    window = make_window()
+    pygpt_net.utils.locale = Locale(config=window.core.config)  # trans() for code block headers
+    text = make_answer(random.Random(SEED))
+    step = max(100, len(text) // scaled(50))
+    return SimpleNamespace(
+        parser=Parser(window),
+        text=text,
+        prefixes=[text[:n] for n in range(step, len(text) + step, step)],
+    )
+
+
+@benchmark(name="render.parse.stream", group="render", rounds=3, setup=setup_parse)
+def bench_parse_stream(state: SimpleNamespace) -> dict:
+    """Parse streamed answer after each chunk (incremental, completed blocks cached)"""
+    parser = state.parser
+    parser.reset()
+    for text in state.prefixes:
+        parser.parse(text)
+    return {"parses": len(state.prefixes), "chars": len(state.text), "cached_blocks": len(parser.blocks)}
+
+
+@benchmark(name="render.parse.stream.full", group="render", rounds=3, setup=setup_parse)
+def bench_parse_stream_full(state: SimpleNamespace) -> dict:
+    """Parse streamed answer after each chunk (whole text every time, baseline)"""
+    parser = state.parser
+    parser.init()
+    parser.reset()
+    for text in state.prefixes:
+        parser.parse_block(text)
+    return {"parses": len(state.prefixes), "chars": len(state.text)}
+
+
+@benchmark(name="render.parse.final", group="render", rounds=5, setup=setup_parse)
+def bench_parse_final(state: SimpleNamespace) -> dict:
+    """Parse whole answer once (cold cache)"""
+    parser = state.parser
+    parser.reset()
+    html = parser.parse(state.text)
+    return {"chars": len(state.text), "html_bytes": len(html)}
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+
+import os
+import subprocess
+import sys
+
+from .harness import benchmark, Skip
+
+SNIPPET = (
+    "import time; t = time.perf_counter(); "
+    "import {module}; "
+    "print(time.perf_counter() - t)"
+)
+
+
+def import_time(module: str, importtime: bool = False) -> subprocess.CompletedProcess:
+    """
+    Import module in fresh interpreter
+
+    :param module: module name
+    :param importtime: True to enable -X importtime
+    :return: completed process
+    """
+    args = [sys.executable]
+    if importtime:
+        args += ["-X", "importtime"]
+    args += ["-c", SNIPPET.format(module=module)]
+    import pygpt_net
+    src = os.path.dirname(os.path.dirname(os.path.abspath(pygpt_net.__file__)))
+    env = dict(os.environ, ENV_TEST="1")
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (src, env.get("PYTHONPATH")) if p)  # same package as runner
+    result = subprocess.run(args, capture_output=True, text=True, env=env, timeout=300)
+    if result.returncode != 0:
+        lines = result.stderr.strip().splitlines()
+        error = lines[-1] if lines else "exit code {}".format(result.returncode)
+        if error.startswith("ModuleNotFoundError"):
+            raise Skip(error)
+        raise RuntimeError(error)
+    return result
+
+
+def get_top_imports(stderr: str, limit: int = 15) -> list:
+    """
+    Parse -X importtime output
+
+    :param stderr: interpreter stderr
+    :param limit: number of modules
+    :return: list of (module, cumulative ms), slowest first
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        try:
+            rows.append((parts[2].strip(), int(parts[1].strip()) / 1000.0))
+        except (IndexError, ValueError):
+            continue
+    rows.sort(key=lambda row: row[1], reverse=True)
+    return rows[:limit]
+
+
+@benchmark(name="startup.import.app", group="startup", rounds=3, warmup=1)
+def bench_import_app(state) -> dict:
+    """Import main app module in fresh interpreter (wall time incl. interpreter start)"""
+    result = import_time("pygpt_net.app")
+    return {"import_s": float(result.stdout.strip().splitlines()[-1])}
+
+
+@benchmark(name="startup.import.app.profile", group="startup", rounds=1, warmup=0)
+def bench_import_app_profile(state) -> dict:
+    """Top cumulative imports of main app module"""
+    result = import_time("pygpt_net.app", importtime=True)
+    return {"top_ms": get_top_imports(result.stderr)}
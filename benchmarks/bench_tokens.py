@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+
+from types import SimpleNamespace
+
+from .fixtures import make_items, scaled
+from .harness import benchmark, Skip
+
+
+def setup_tokens() -> SimpleNamespace:
+    """
+    Setup long thread
+
+    :return: state
+    """
+    from pygpt_net.core.tokens import Tokens
+
+    if not Tokens.from_str("ping", "gpt-4o"):
+        raise Skip("tiktoken encoding not available offline")
+    return SimpleNamespace(tokens=Tokens, items=make_items(scaled(2_000)))
+
+
+@benchmark(name="tokens.from_ctx.chat", group="tokens", rounds=5, setup=setup_tokens)
+def bench_from_ctx_chat(state: SimpleNamespace) -> dict:
+    """Count tokens of all items in chat mode"""
+    from_ctx = state.tokens.from_ctx
+    total = 0
+    for item in state.items:
+        total += from_ctx(item, "chat", "gpt-4o")
+    return {"items": len(state.items), "tokens": total}
+
+
+@benchmark(name="tokens.from_ctx.completion", group="tokens", rounds=5, setup=setup_tokens)
+def bench_from_ctx_completion(state: SimpleNamespace) -> dict:
+    """Count tokens of all items in completion mode"""
+    from_ctx = state.tokens.from_ctx
+    total = 0
+    for item in state.items:
+        total += from_ctx(item, "completion", "gpt-4o")
+    return {"items": len(state.items), "tokens": total}
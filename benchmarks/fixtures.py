@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+import atexit
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+from typing import Optional, Dict, Any, List
+from unittest.mock import MagicMock
+
+from .harness import Skip
+
+SEED = 1234
+WORDS = (
+    "model context token prompt stream render index vector query agent tool "
+    "python json async cache thread window plugin event output input file "
+    "memory search result config provider embedding document history chat"
+).split()
+
+
+def get_scale() -> float:
+    """
+    Get fixture scale factor (env: PYGPT_BENCH_SCALE)
+
+    :return: scale factor
+    """
+    try:
+        return max(0.001, float(os.environ.get("PYGPT_BENCH_SCALE", "1")))
+    except ValueError:
+        return 1.0
+
+
+def scaled(n: int) -> int:
+    """
+    Scale fixture size
+
+    :param n: size at scale 1.0
+    :return: scaled size
+    """
+    return max(1, int(n * get_scale()))
+
+
+def make_text(rnd: random.Random, words: int) -> str:
+    """
+    Make random plain text
+
+    :param rnd: random generator
+    :param words: number of words
+    :return: text
+    """
+    return " ".join(rnd.choice(WORDS) for _ in range(words))
+
+
+def make_markdown(rnd: random.Random, paragraphs: int = 4) -> str:
+    """
+    Make random Markdown with code blocks and lists
+
+    :param rnd: random generator
+    :param paragraphs: number of paragraphs
+    :return: Markdown text
+    """
+    parts = ["## " + make_text(rnd, 4).title()]
+    for i in range(paragraphs):
+        parts.append(make_text(rnd, 60))
+        if i % 2 == 0:
+            parts.append("\n".join("- **{}** {}".format(rnd.choice(WORDS), make_text(rnd, 8)) for _ in range(4)))
+        else:
+            code = "\n".join("    value_{} = compute({}, '{}')".format(n, n, rnd.choice(WORDS)) for n in range(12))
+            parts.append("```python\ndef handler():\n{}\n    return value_0\n```".format(code))
+    return "\n\n".join(parts)
+
+
+def prepare_workdir() -> str:
+    """
+    Use isolated temporary workdir (env: PYGPT_WORKDIR), never the user one
+
+    :return: workdir path
+    """
+    path = os.environ.get("PYGPT_WORKDIR")
+    if not path:
+        path = tempfile.mkdtemp(prefix="pygpt_bench_workdir_")
+        atexit.register(shutil.rmtree, path, True)
+        os.environ["PYGPT_WORKDIR"] = path
+    os.makedirs(path, exist_ok=True)
+    path_file = os.path.join(path, "path.cfg")
+    if not os.path.exists(path_file):
+        with open(path_file, "w", encoding="utf-8") as f:
+            f.write("")
+    return path
+
+
+def make_window(config: Optional[Dict[str, Any]] = None, path: Optional[str] = None) -> MagicMock:
+    """
+    Make window with real Config (default app config) and mocked UI
+
+    :param config: config overrides
+    :param path: user config path
+    :return: window mock
+    """
+    import pygpt_net
+    from pygpt_net.config import Config
+
+    prepare_workdir()
+    window = MagicMock()
+    window.STATE_IDLE = 'idle'
+    window.STATE_BUSY = 'busy'
+    window.STATE_ERROR = 'error'
+    window.core = MagicMock()
+    window.core.config = Config(window)
+    window.core.config.initialized = True
+    window.core.config.init = MagicMock()
+    window.core.config.load = MagicMock()
+    window.core.config.save = MagicMock()
+    window.core.config.get_lang = MagicMock(return_value='en')
+    if path:
+        window.core.config.path = path
+    base = os.path.join(os.path.dirname(pygpt_net.__file__), "data", "config", "config.json")
+    with open(base, "r", encoding="utf-8") as f:
+        window.core.config.data = json.load(f)
+    window.core.config.data.pop("__meta__", None)
+    if config:
+        window.core.config.data.update(config)
+    window.core.debug = MagicMock()
+    window.core.debug.enabled = MagicMock(return_value=False)
+    window.core.platforms.is_windows = MagicMock(return_value=False)
+    window.controller = MagicMock()
+    window.controller.ui.get_colors = MagicMock(return_value={i: None for i in range(8)})
+    window.controller.plugins.is_enabled = MagicMock(return_value=True)
+    window.controller.idx.is_stopped = MagicMock(return_value=False)
+    window.controller.kernel.stopped = MagicMock(return_value=False)
+    return window
+
+
+def make_items(n: int, seed: int = SEED, markdown: bool = False) -> List[Any]:
+    """
+    Make context items (long thread)
+
+    :param n: number of items
+    :param seed: random seed
+    :param markdown: True to use Markdown outputs with code blocks
+    :return: list of CtxItem
+    """
+    from pygpt_net.item.ctx import CtxItem
+
+    rnd = random.Random(seed)
+    items = []
+    ts = int(time.time()) - n * 60
+    for i in range(n):
+        item = CtxItem()
+        item.id = i + 1
+        item.meta_id = 1
+        item.set_input(make_text(rnd, rnd.randint(10, 80)), "User")
+        item.set_output(make_markdown(rnd) if markdown else make_text(rnd, rnd.randint(50, 400)), "Assistant")
+        item.input_timestamp = ts + i * 60
+        item.output_timestamp = ts + i * 60 + 5
+        item.mode = "chat"
+        item.model = "gpt-4o"
+        items.append(item)
+    return items
+
+
+def make_meta(id: int = 1) -> Any:
+    """
+    Make context meta
+
+    :param id: meta ID
+    :return: CtxMeta
+    """
+    from pygpt_net.item.ctx import CtxMeta
+
+    meta = CtxMeta(id)
+    meta.name = "Benchmark"
+    meta.mode = "chat"
+    meta.model = "gpt-4o"
+    meta.initialized = True
+    return meta
+
+
+def make_json_columns(rnd: random.Random) -> Dict[str, str]:
+    """
+    Make JSON columns of context item (tool calls with results, urls, files, extra)
+
+    :param rnd: random generator
+    :return: dict column -> JSON string
+    """
+    cmds = [{
+        "cmd": rnd.choice(WORDS),
+        "params": {"query": make_text(rnd, 8), "limit": rnd.randint(1, 10)},
+    } for _ in range(rnd.randint(1, 3))]
+    results = [{
+        "request": {"cmd": cmd["cmd"]},
+        "result": make_text(rnd, rnd.randint(20, 120)),
+    } for cmd in cmds]
+    return {
+        "extra": json.dumps({
+            "tool_calls": cmds,
+            "usage": {"input": rnd.randint(10, 900), "output": rnd.randint(10, 900)},
+        }),
+        "cmds_json": json.dumps(cmds),
+        "results_json": json.dumps(results),
+        "urls_json": json.dumps(["https://example.com/{}".format(rnd.choice(WORDS)) for _ in range(rnd.randint(0, 3))]),
+        "files_json": json.dumps(["/tmp/{}.txt".format(rnd.choice(WORDS)) for _ in range(rnd.randint(0, 2))]),
+    }
+
+
+class CtxDatabase:
+    def __init__(
+            self,
+            metas: int,
+            items_per_meta: int = 1,
+            seed: int = SEED,
+            json_columns: bool = False,
+    ):
+        """
+        Temporary SQLite database with synthetic contexts (migrated schema)
+
+        :param metas: number of ctx metas
+        :param items_per_meta: number of items per meta
+        :param seed: random seed
+        :param json_columns: fill JSON columns (tool calls, results, urls, files, extra)
+        """
+        self.metas = metas
+        self.items_per_meta = items_per_meta
+        self.seed = seed
+        self.json_columns = json_columns
+        self.path = None
+        self.window = None
+        self.db = None
+
+    def setup(self) -> "CtxDatabase":
+        """
+        Create database, apply migrations and insert rows
+
+        :return: self
+        """
+        try:
+            from sqlalchemy import text
+            from pygpt_net.core.db import Database
+        except ImportError as e:
+            raise Skip(str(e))
+
+        self.path = tempfile.mkdtemp(prefix="pygpt_bench_")
+        self.window = make_window(path=self.path)
+        self.db = Database(self.window)
+        self.db.echo = False
+        self.db.db_path = os.path.join(self.path, self.db.db_name)
+        self.db.prepare()
+        self.db.migrate()
+        self.window.core.db = self.db
+
+        rnd = random.Random(self.seed)
+        now = int(time.time())
+        metas = []
+        items = []
+        for i in range(1, self.metas + 1):
+            ts = now - i * 60
+            metas.append({
+                "id": i,
+                "uuid": "bench-{}".format(i),
+                "created_ts": ts,
+                "updated_ts": ts,
+                "name": "topic {} {}".format(i, make_text(rnd, 4)),
+                "mode": "chat",
+                "model": "gpt-4o",
+                "is_important": 1 if i % 500 == 0 else 0,
+                "label": i % 8,
+                "group_id": (i % 50) + 1 if i % 10 == 0 else 0,
+            })
+            for j in range(self.items_per_meta):
+                row = {
+                    "meta_id": i,
+                    "input": make_text(rnd, 20),
+                    "output": make_text(rnd, 80),
+                    "input_ts": ts + j,
+                    "output_ts": ts + j + 1,
+                    "extra": "",
+                    "cmds_json": "[]",
+                    "results_json": "[]",
+                    "urls_json": "[]",
+                    "files_json": "[]",
+                }
+                if self.json_columns:
+                    row.update(make_json_columns(rnd))
+                items.append(row)
+        with self.db.get_db().begin() as conn:
+            conn.execute(text("""
+                INSERT INTO ctx_meta
+                (id, uuid, created_ts, updated_ts, name, mode, model, last_mode, last_model,
+                 status, extra, is_initialized, is_deleted, is_important, is_archived, label, group_id)
+                VALUES
+                (:id, :uuid, :created_ts, :updated_ts, :name, :mode, :model, :mode, :model,
+                 0, '', 1, 0, :is_important, 0, :label, :group_id)
+            """), metas)
+            if items:
+                conn.execute(text("""
+                    INSERT INTO ctx_item
+                    (meta_id, input, output, input_name, output_name, input_ts, output_ts, mode, model,
+                     extra, cmds_json, results_json, urls_json, images_json, files_json,
+                     attachments_json, additional_ctx_json, docs_json)
+                    VALUES
+                    (:meta_id, :input, :output, 'User', 'Assistant', :input_ts, :output_ts, 'chat', 'gpt-4o',
+                     :extra, :cmds_json, :results_json, :urls_json, '[]', :files_json, '[]', '[]', '[]')
+                """), items)
+        return self
+
+    def teardown(self):
+        """Remove database"""
+        try:
+            if self.db is not None:
+                self.db.close()
+        finally:
+            if self.path:
+                shutil.rmtree(self.path, ignore_errors=True)
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+import fnmatch
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import traceback
+from datetime import datetime
+from typing import Optional, Callable, Dict, Any, List
+
+SCHEMA_VERSION = 1
+
+
+class Skip(Exception):
+    """Raised by setup or benchmark when it cannot run in current environment"""
+    pass
+
+
+class Benchmark:
+    def __init__(
+            self,
+            name: str,
+            func: Callable[[Any], Optional[Dict[str, Any]]],
+            group: str = "default",
+            rounds: int = 5,
+            warmup: int = 1,
+            setup: Optional[Callable[[], Any]] = None,
+            teardown: Optional[Callable[[Any], None]] = None,
+    ):
+        """
+        Single benchmark
+
+        :param name: benchmark name
+        :param func: timed function, receives setup state, may return extra info dict
+        :param group: benchmark group
+        :param rounds: number of timed rounds
+        :param warmup: number of untimed warmup rounds
+        :param setup: untimed setup, returns state
+        :param teardown: untimed teardown, receives state
+        """
+        self.name = name
+        self.func = func
+        self.group = group
+        self.rounds = rounds
+        self.warmup = warmup
+        self.setup = setup
+        self.teardown = teardown
+
+    def run(self, rounds: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Run benchmark
+
+        :param rounds: override number of rounds
+        :return: result dict
+        """
+        rounds = max(1, int(rounds or self.rounds))
+        result = {
+            "name": self.name,
+            "group": self.group,
+            "status": "ok",
+        }
+        state = None
+        try:
+            if self.setup is not None:
+                state = self.setup()
+            for _ in range(self.warmup):
+                self.func(state)
+            times = []
+            extra = None
+            for _ in range(rounds):
+                gc.collect()
+                gc.disable()
+                try:
+                    start = time.perf_counter()
+                    extra = self.func(state)
+                    times.append(time.perf_counter() - start)
+                finally:
+                    gc.enable()
+            result.update(get_stats(times))
+            if isinstance(extra, dict):
+                result["extra"] = extra
+        except Skip as e:
+            result["status"] = "skipped"
+            result["reason"] = str(e)
+        except ImportError as e:
+            result["status"] = "skipped"
+            result["reason"] = "missing module: {}".format(e.name or e)
+        except Exception as e:
+            result["status"] = "error"
+            result["reason"] = "{}: {}".format(type(e).__name__, e)
+            result["traceback"] = traceback.format_exc()
+        finally:
+            if self.teardown is not None and state is not None:
+                try:
+                    self.teardown(state)
+                except Exception:
+                    pass
+        return result
+
+
+REGISTRY: List[Benchmark] = []
+
+
+def benchmark(
+        name: Optional[str] = None,
+        group: str = "default",
+        rounds: int = 5,
+        warmup: int = 1,
+        setup: Optional[Callable[[], Any]] = None,
+        teardown: Optional[Callable[[Any], None]] = None,
+):
+    """
+    Register benchmark function (decorator)
+
+    :param name: benchmark name (default: function name)
+    :param group: benchmark group
+    :param rounds: number of timed rounds
+    :param warmup: number of untimed warmup rounds
+    :param setup: untimed setup, returns state passed to benchmark
+    :param teardown: untimed teardown
+    :return: decorator
+    """
+    def decorator(func):
+        REGISTRY.append(Benchmark(
+            name=name or func.__name__,
+            func=func,
+            group=group,
+            rounds=rounds,
+            warmup=warmup,
+            setup=setup,
+            teardown=teardown,
+        ))
+        return func
+    return decorator
+
+
+def get_stats(times: List[float]) -> Dict[str, Any]:
+    """
+    Get timing stats (seconds)
+
+    :param times: list of round times
+    :return: stats dict
+    """
+    data = sorted(times)
+    return {
+        "rounds": len(data),
+        "min": data[0],
+        "max": data[-1],
+        "mean": statistics.fmean(data),
+        "median": statistics.median(data),
+        "p95": data[int(0.95 * (len(data) - 1))],
+        "stdev": statistics.stdev(data) if len(data) > 1 else 0.0,
+    }
+
+
+def select(pattern: Optional[str] = None) -> List[Benchmark]:
+    """
+    Select registered benchmarks
+
+    :param pattern: name or group pattern (fnmatch, e.g. "ctx.*")
+    :return: list of benchmarks
+    """
+    if not pattern:
+        return list(REGISTRY)
+    return [
+        b for b in REGISTRY
+        if fnmatch.fnmatch(b.name, pattern) or fnmatch.fnmatch(b.group, pattern)
+    ]
+
+
+def get_env() -> Dict[str, Any]:
+    """
+    Get environment info stored with results
+
+    :return: env dict
+    """
+    try:
+        from pygpt_net import __version__ as app_version
+    except Exception:
+        app_version = None
+    commit = None
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            timeout=5,
+        ).stdout.strip() or None
+    except Exception:
+        pass
+    return {
+        "version": app_version,
+        "commit": commit,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "executable": sys.executable,
+    }
+
+
+def run(
+        benchmarks: List[Benchmark],
+        rounds: Optional[int] = None,
+        log: Optional[Callable[[str], Any]] = print,
+) -> Dict[str, Any]:
+    """
+    Run benchmarks
+
+    :param benchmarks: list of benchmarks
+    :param rounds: override number of rounds
+    :param log: log callable
+    :return: results document
+    """
+    results = []
+    for b in benchmarks:
+        if log:
+            log("[bench] {} ...".format(b.name))
+        result = b.run(rounds)
+        if log:
+            log("[bench] {}".format(format_result(result)))
+        results.append(result)
+    return {
+        "schema": SCHEMA_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "env": get_env(),
+        "results": results,
+    }
+
+
+def format_result(result: Dict[str, Any]) -> str:
+    """
+    Format single result
+
+    :param result: result dict
+    :return: formatted line
+    """
+    if result["status"] != "ok":
+        return "{:<40} {} ({})".format(result["name"], result["status"].upper(), result.get("reason"))
+    return "{:<40} median {:>10.3f} ms  min {:>10.3f} ms  p95 {:>10.3f} ms  ({} rounds)".format(
+        result["name"],
+        result["median"] * 1000.0,
+        result["min"] * 1000.0,
+        result["p95"] * 1000.0,
+        result["rounds"],
+    )
+
+
+def save(doc: Dict[str, Any], path: str):
+    """
+    Save results as JSON
+
+    :param doc: results document
+    :param path: output path
+    """
+    dir = os.path.dirname(os.path.abspath(path))
+    os.makedirs(dir, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(doc, f, indent=2, ensure_ascii=False)
+
+
+def load(path: str) -> Dict[str, Any]:
+    """
+    Load results JSON
+
+    :param path: results path
+    :return: results document
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(
+        base: Dict[str, Any],
+        current: Dict[str, Any],
+        threshold: float = 0.10,
+) -> List[Dict[str, Any]]:
+    """
+    Compare results (median times)
+
+    :param base: baseline results document
+    :param current: current results document
+    :param threshold: relative change treated as regression / improvement
+    :return: list of rows: name, base, current, ratio, verdict
+    """
+    base_map = {r["name"]: r for r in base.get("results", [])}
+    rows = []
+    for r in current.get("results", []):
+        b = base_map.get(r["name"])
+        row = {
+            "name": r["name"],
+            "base": None,
+            "current": r.get("median"),
+            "ratio": None,
+            "verdict": "new",
+        }
+        if b is not None and b.get("status") == "ok":
+            row["base"] = b.get("median")
+        if r.get("status") != "ok":
+            row["verdict"] = r.get("status")
+        elif row["base"]:
+            row["ratio"] = row["current"] / row["base"]
+            if row["ratio"] > 1.0 + threshold:
+                row["verdict"] = "regression"
+            elif row["ratio"] < 1.0 - threshold:
+                row["verdict"] = "improvement"
+            else:
+                row["verdict"] = "same"
+        rows.append(row)
+    return rows
+
+
+def format_compare(rows: List[Dict[str, Any]]) -> str:
+    """
+    Format comparison table
+
+    :param rows: compare() rows
+    :return: formatted table
+    """
+    def ms(value):
+        return "{:.3f}".format(value * 1000.0) if value is not None else "-"
+
+    lines = ["{:<40} {:>12} {:>12} {:>8}  {}".format("benchmark", "base [ms]", "current [ms]", "ratio", "verdict")]
+    for row in rows:
+        lines.append("{:<40} {:>12} {:>12} {:>8}  {}".format(
+            row["name"],
+            ms(row["base"]),
+            ms(row["current"]),
+            "{:.2f}x".format(row["ratio"]) if row["ratio"] is not None else "-",
+            row["verdict"],
+        ))
+    return "\n".join(lines)
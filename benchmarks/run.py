@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.19 00:00:00                  #
+# ================================================== #
+
+
+import argparse
+import importlib
+import os
+import sys
+from datetime import datetime
+from typing import Optional, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    import pygpt_net  # noqa: F401
+except ImportError:
+    sys.path.insert(0, os.path.join(ROOT, "src"))  # run from source tree
+
+from . import harness
+
+MODULES = (
+    "bench_ctx",
+    "bench_tokens",
+    "bench_render",
+    "bench_dispatcher",
+    "bench_idx",
+    "bench_command",
+    "bench_startup",
+)
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+
+
+def load_modules():
+    """Import benchmark modules (registers benchmarks)"""
+    for name in MODULES:
+        importlib.import_module("benchmarks." + name)
+
+
+def get_default_path() -> str:
+    """
+    Get default results path
+
+    :return: path to JSON file
+    """
+    from pygpt_net import __version__
+    name = "{}_{}.json".format(__version__, datetime.now().strftime("%Y%m%d_%H%M%S"))
+    return os.path.join(RESULTS_DIR, name)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run benchmarks
+
+    :param argv: command line arguments
+    :return: exit code (1 if any benchmark raised)
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="PyGPT benchmarks (offline, synthetic fixtures)",
+    )
+    parser.add_argument("-k", "--filter", help="run only benchmarks matching name or group pattern, e.g. 'ctx.*'")
+    parser.add_argument("-r", "--rounds", type=int, help="override number of rounds")
+    parser.add_argument("-s", "--scale", type=float, help="fixture size factor (default: 1.0)")
+    parser.add_argument("-o", "--output", help="results JSON path (default: benchmarks/results/<version>_<time>.json)")
+    parser.add_argument("-c", "--compare", help="baseline results JSON to compare with")
+    parser.add_argument("-t", "--threshold", type=float, default=0.10, help="regression threshold (default: 0.10)")
+    parser.add_argument("--fail", action="store_true", help="exit with code 1 on regression")
+    parser.add_argument("--list", action="store_true", help="list benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    if args.scale is not None:
+        os.environ["PYGPT_BENCH_SCALE"] = str(args.scale)
+    os.environ.setdefault("ENV_TEST", "1")
+
+    load_modules()
+    benchmarks = harness.select(args.filter)
+    if args.list:
+        for b in benchmarks:
+            print("{:<40} [{}]".format(b.name, b.group))
+        return 0
+
+    doc = harness.run(benchmarks, rounds=args.rounds)
+    doc["scale"] = float(os.environ.get("PYGPT_BENCH_SCALE", "1"))
+    path = args.output or get_default_path()
+    harness.save(doc, path)
+    print("[bench] Results saved: {}".format(path))
+
+    errors = [r["name"] for r in doc["results"] if r["status"] == "error"]
+    if errors:
+        print("[bench] Failed: {}".format(", ".join(errors)))
+
+    if args.compare:
+        rows = harness.compare(harness.load(args.compare), doc, args.threshold)
+        print(harness.format_compare(rows))
+        if args.fail and any(row["verdict"] == "regression" for row in rows):
+            return 1
+    return 1 if errors else 0
@@ -0,0 +1,5 @@
+#!/bin/bash
+# This script is used to run the benchmarks using the virtual environment
+# Usage: ./run-benchmarks.sh [-k pattern] [-c baseline.json] [-s scale]
+source ./venv/bin/activate
+python -m benchmarks "$@"
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.06 20:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import os
@@ -290,6 +290,7 @@ def run(**kwargs):
         # vector store providers (llama-index)
         from pygpt_net.provider.vector_stores.chroma import ChromaProvider
         from pygpt_net.provider.vector_stores.elasticsearch import ElasticsearchProvider
+        from pygpt_net.provider.vector_stores.numpy_mmap import NumpyProvider
         from pygpt_net.provider.vector_stores.pinecode import PinecodeProvider
         from pygpt_net.provider.vector_stores.qdrant import QdrantProvider
         from pygpt_net.provider.vector_stores.redis import RedisProvider
@@ -505,6 +506,7 @@ def run(**kwargs):
         # register base vector store providers (llama-index)
         launcher.add_vector_store(ChromaProvider())
         launcher.add_vector_store(ElasticsearchProvider())
+        launcher.add_vector_store(NumpyProvider())
         launcher.add_vector_store(PinecodeProvider())
         launcher.add_vector_store(QdrantProvider())
         launcher.add_vector_store(RedisProvider())
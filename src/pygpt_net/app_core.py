@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.08.12 14:30:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from .config import Config
@@ -31,6 +31,7 @@ from .core.installer import Installer
 from .core.filesystem import Filesystem
 from .core.history import History
 from .core.image import Image
+from .core.limiter import Limiter
 from .core.llm import LLM
 from .core.models import Models
 from .core.modes import Modes
@@ -83,6 +84,7 @@ class Core:
         self.history = History(window)
         self.idx = Idx(window)
         self.image = Image(window)
+        self.limiter = Limiter(window)
         self.llm = LLM(window)
         self.installer = Installer(window)
         self.models = Models(window)
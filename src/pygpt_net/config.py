@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.20 20:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 import copy
@@ -431,7 +431,7 @@ class Config:
         :param key: key
         :return: True if exists
         """
-        return key in self.data
+        return self.data is not None and key in self.data  # None if user config not found
 
     def has_session(self, key: str) -> bool:
         """
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.02 19:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 from .access import Access
@@ -93,6 +93,7 @@ class Controller:
         """Setup controller"""
         self.debug.setup()  # prepare log level
         self.kernel.init()
+        self.window.core.ctx.buffer = self.kernel.buffer  # ctx writes batched during agent runs
         self.chat.init()
 
         # setup layout
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.02.06 01:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import os
@@ -167,6 +167,8 @@ class Attachment(QObject):
                 if result:
                     self.uploaded = True
         if self.uploaded:
+            if auto_index:
+                self.window.core.attachments.context.index_pending()  # index all uploaded in one batch
             self.window.core.ctx.save(meta.id)  # save meta
         return self.uploaded
 
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.15 23:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from typing import Optional, List
@@ -131,7 +131,12 @@ class Render:
             self.tool_output_end()
 
         elif name == RenderEvent.CTX_APPEND:
-            self.append_context(data.get("meta"), data.get("items"), data.get("clear", True))
+            self.append_context(
+                data.get("meta"),
+                data.get("items"),
+                data.get("clear", True),
+                data.get("payload"),
+            )
         elif name == RenderEvent.INPUT_APPEND:
             self.append_input(
                 data.get("meta"),
@@ -308,15 +313,22 @@ class Render:
         self.instance().reload()  # TODO: or all outputs?
         self.update()
 
-    def append_context(self, meta: CtxMeta, items: List[CtxItem], clear: bool = True) -> None:
+    def append_context(
+            self,
+            meta: CtxMeta,
+            items: List[CtxItem],
+            clear: bool = True,
+            payload: Optional[str] = None
+    ) -> None:
         """
         Append all context to output
 
         :param meta: context meta
         :param items: context items
         :param clear: True if clear all output before append
+        :param payload: prepared payload (prefetched)
         """
-        self.instance().append_context(meta, items, clear)
+        self.instance().append_context(meta, items, clear, payload=payload)
         self.update()
 
     def append_input(self, meta: CtxMeta, ctx: CtxItem, flush: bool = True, append: bool = False) -> None:
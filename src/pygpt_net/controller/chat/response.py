@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.07 05:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 from typing import Dict, Any
@@ -256,6 +256,7 @@ class Response:
         # post-handle, execute cmd, etc.
         chat_output.post_handle(ctx, mode, stream, reply, internal)
         chat_output.handle_end(ctx, mode)  # handle end.
+        controller.kernel.buffer.flush()  # step end, write buffered ctx updates
         dispatch(RenderEvent(RenderEvent.RELOAD))
 
         # ----------- EVALUATE AGENT RESPONSE -----------
@@ -314,6 +315,7 @@ class Response:
         :param extra: Extra data
         """
         msg = extra.get("error") if "error" in extra else None
+        self.window.core.bridge.report_error(context, msg)  # slow down on rate limit error
         self.window.controller.chat.log(f"Output ERROR: {msg}")  # log
         self.window.controller.chat.handle_error(msg)
         self.window.controller.chat.common.unlock_input()  # unlock input
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.08.16 17:40:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import io
@@ -446,6 +446,11 @@ class StreamWorker(QRunnable):
                     "reasoning_tokens": state.usage_payload.get("reasoning", 0),
                     "total_reported": state.usage_payload.get("total"),
                 }
+                core.prompt.prefix.record_usage(
+                    ctx,
+                    state.usage_payload.get("cached", 0),
+                    state.usage_payload.get("cache_write", 0),
+                )
             except Exception:
                 pass
         else:
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.18 01:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import json
@@ -52,6 +52,7 @@ class Command:
         # begin reply stack
         if event.name in self.flush_events:
             self.window.controller.kernel.replies.clear()
+            self.window.controller.kernel.replies.set_calls(event.data.get("commands"))
 
         for id in self.window.core.plugins.get_ids():
             force = False
@@ -87,6 +88,7 @@ class Command:
         self.window.core.debug.info(f"Dispatch CMD event begin: {event.name}")
         if event.name in self.flush_events:
             self.window.controller.kernel.replies.clear()
+            self.window.controller.kernel.replies.set_calls(event.data.get("commands"))
         for id in self.window.core.plugins.get_ids():
             self.window.core.dispatcher.apply(id, event)
         if event.name in self.flush_events:
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.08.18 17:30:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from typing import Dict, Any, List
@@ -47,6 +47,7 @@ class Placeholder:
             "langchain_providers": lambda p: self.get_langchain_providers(),
             "languages": lambda p: self.get_languages(),
             "llama_index_chat_modes": lambda p: self.get_llama_index_chat_modes(),
+            "llama_index_retrieval_modes": lambda p: self.get_llama_index_retrieval_modes(),
             "llama_index_loaders": lambda p: self.get_llama_index_loaders(),
             "llama_index_loaders_file": lambda p: self.get_llama_index_loaders(type="file"),
             "llama_index_loaders_web": lambda p: self.get_llama_index_loaders(type="web"),
@@ -257,6 +258,18 @@ class Placeholder:
             {"openai": "openai"},
         ]
 
+    def get_llama_index_retrieval_modes(self) -> List[Dict[str, str]]:
+        """
+        Get llama retrieval modes list
+
+        :return: Filled placeholder list
+        """
+        return [
+            {"vector": "vector (default)"},
+            {"hybrid": "hybrid (vector + BM25)"},
+            {"keyword": "keyword (BM25, no embeddings)"},
+        ]
+
     def get_llama_index_loaders(self, type: str = "all") -> List[Dict[str, str]]:
         """
         Get data loaders list
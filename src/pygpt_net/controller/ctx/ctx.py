@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.08.16 12:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 from typing import Optional, List, Union
@@ -172,6 +172,9 @@ class Ctx:
         :param select: select current ctx
         :param no_scroll: do not scroll to selected item
         """
+        if reload and not all and self.window.controller.kernel.buffer.defer_update():
+            return  # agent run in progress, coalesced into single update by kernel buffer
+
         if reload:
             self.update_list(True)
 
@@ -475,10 +478,13 @@ class Ctx:
 
     def refresh_output(self):
         """Refresh output"""
+        meta = self.window.core.ctx.get_current_meta()
+        items = self.window.core.ctx.get_items()
         data = {
-            "meta": self.window.core.ctx.get_current_meta(),
-            "items": self.window.core.ctx.get_items(),
+            "meta": meta,
+            "items": items,
             "clear": True,
+            "payload": self.window.core.ctx.prefetch.get_payload(meta, items),
         }
         event = RenderEvent(RenderEvent.CTX_APPEND, data)
         self.window.dispatch(event)
@@ -524,6 +530,8 @@ class Ctx:
             self.select(id)
             self.window.ui.nodes['ctx.list'].select_by_idx(select_idx)
 
+        self.window.core.ctx.prefetch.schedule(id)  # prepare next likely contexts in background
+
     def after_load(
             self,
             id: int,
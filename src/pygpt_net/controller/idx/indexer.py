@@ -6,14 +6,14 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.12.27 19:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import datetime
 import os
-from typing import Any, List, Dict, Union
+from typing import Any, List, Dict, Union, Optional
 
-from PySide6.QtCore import Slot, QObject
+from PySide6.QtCore import Slot, QObject, QTimer
 from PySide6.QtWidgets import QApplication
 
 from pygpt_net.core.idx.worker import IndexWorker
@@ -32,6 +32,9 @@ class Indexer(QObject):
         self.window = window
         self.worker = None
         self.tmp_idx = None
+        self.realtime_pending = {}  # meta id -> index name, waiting for debounced indexing
+        self.realtime_gen = 0  # debounce generation
+        self.realtime_running = 0  # running realtime workers
 
     def update_explorer(self):
         """Update file explorer view"""
@@ -159,25 +162,112 @@ class Indexer(QObject):
         """
         Index current appended context (threaded) - realtime
 
+        Async calls are debounced (llama.idx.auto.delay) and postponed while response
+        is being generated, then only new or changed items are indexed in background.
+
         :param meta: context meta
         :param idx: index name
         :param sync: sync mode
         """
+        if sync:
+            worker = self.create_realtime_worker([meta.id], idx)
+            if worker is not None:
+                self.worker = worker
+                worker.run()
+            return
+
+        self.realtime_pending[meta.id] = idx
+        self.realtime_gen += 1
+        self.schedule_ctx_realtime(self.realtime_gen)
+
+    def schedule_ctx_realtime(self, gen: int):
+        """
+        Schedule debounced realtime indexing
+
+        :param gen: debounce generation
+        """
+        delay = int(self.window.core.config.get("llama.idx.auto.delay", 3000) or 0)
+        QTimer.singleShot(max(0, delay), lambda: self.flush_ctx_realtime(gen))
+
+    def flush_ctx_realtime(self, gen: int):
+        """
+        Start pending realtime indexing (debounced)
+
+        :param gen: debounce generation
+        """
+        if gen != self.realtime_gen or not self.realtime_pending:
+            return  # newer call is waiting
+        if self.window.controller.kernel.busy or self.realtime_running > 0:
+            self.schedule_ctx_realtime(gen)  # wait for end of stream or previous indexing
+            return
+
+        pending = self.realtime_pending
+        self.realtime_pending = {}
+        batches = {}
+        for meta_id, idx in pending.items():
+            batches.setdefault(idx, []).append(meta_id)
+        for idx, ids in batches.items():
+            worker = self.create_realtime_worker(ids, idx)
+            if worker is None:
+                continue
+            self.worker = worker
+            self.realtime_running += 1
+            self.window.threadpool.start(worker, -1)  # low priority, background
+
+    def create_realtime_worker(self, ids: List[int], idx: str) -> Optional[IndexWorker]:
+        """
+        Create realtime indexing worker
+
+        :param ids: context meta ids
+        :param idx: index name
+        :return: worker or None if no meta found
+        """
+        ts_batch = {}
+        for meta_id in ids:
+            meta = self.window.core.ctx.get_meta_by_id(meta_id)
+            if meta is not None:
+                ts_batch[meta_id] = meta.indexed
+        if not ts_batch:
+            return None
         worker = IndexWorker()
         worker.window = self.window
-        worker.content = meta.id
+        worker.content = list(ts_batch.keys())
         worker.idx = idx
-        worker.type = "db_meta"
-        worker.from_ts = meta.indexed
+        worker.type = "db_meta_batch"
+        worker.from_ts_batch = ts_batch
         worker.silent = True
-        worker.signals.finished.connect(self.handle_finished_db_meta)
-        worker.signals.error.connect(self.handle_error)
-        self.worker = worker
+        worker.signals.finished.connect(self.handle_finished_ctx_realtime)
+        worker.signals.error.connect(self.handle_error_ctx_realtime)
+        return worker
 
-        if sync:
-            self.worker.run()
-        else:
-            self.window.threadpool.start(self.worker)
+    @Slot(str, object, object, bool)
+    def handle_finished_ctx_realtime(
+            self,
+            idx: str,
+            num: int,
+            errors: List[str],
+            silent: bool = False
+    ):
+        """
+        Handle realtime indexing finished signal
+
+        :param idx: index name
+        :param num: number of indexed records
+        :param errors: errors
+        :param silent: silent mode
+        """
+        self.realtime_running = max(0, self.realtime_running - 1)
+        self.handle_finished_db_meta(idx, num, errors, silent)
+
+    @Slot(object)
+    def handle_error_ctx_realtime(self, err: Any):
+        """
+        Handle realtime indexing error signal
+
+        :param err: error message
+        """
+        self.realtime_running = max(0, self.realtime_running - 1)
+        self.handle_error(err)
 
     def index_ctx_from_ts_confirm(self, ts: int):
         """
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.19 00:00:00                  #
+# ================================================== #
+
+import threading
+import time
+from collections import OrderedDict
+
+from PySide6.QtCore import QTimer
+
+from pygpt_net.item.ctx import CtxItem
+
+
+class Buffer:
+    def __init__(self, window=None):
+        """
+        Run-scoped ctx write buffer
+
+        While agent or expert run is in progress, ctx item updates and meta saves
+        are collected (latest state only) and written in single batch at step
+        boundaries, finish, stop and error. Context list updates are coalesced.
+
+        :param window: Window instance
+        """
+        self.window = window
+        self.lock = threading.RLock()
+        self.runs = 0  # open run scopes (agent runners, expert workers)
+        self.busy = False  # kernel step in progress (buffered mode)
+        self.items = OrderedDict()  # item ID -> CtxItem
+        self.metas = OrderedDict()  # meta ID -> None (ordered set)
+        self.timer = None
+        self.last_update = 0.0
+        self.updating = False
+        self.writes = 0  # buffered writes (stats)
+        self.flushes = 0  # batch writes (stats)
+
+    def is_enabled(self) -> bool:
+        """
+        Check if buffer is enabled
+
+        :return: True if enabled
+        """
+        return bool(self.window.core.config.get("ctx.buffer", True))
+
+    def is_active(self) -> bool:
+        """
+        Check if writes are buffered now
+
+        :return: True if run in progress
+        """
+        return self.runs > 0 or self.busy
+
+    def get_interval(self) -> int:
+        """
+        Get min interval between ctx list updates during run
+
+        :return: interval in ms
+        """
+        return max(0, int(self.window.core.config.get("ctx.buffer.interval", 500) or 0))
+
+    def begin(self):
+        """Begin run scope"""
+        if not self.is_enabled():
+            return
+        with self.lock:
+            self.runs += 1
+
+    def end(self):
+        """End run scope and flush"""
+        with self.lock:
+            self.runs = max(0, self.runs - 1)
+        self.flush()
+
+    def set_busy(self, busy: bool):
+        """
+        Set kernel step state (busy: begin step, idle: end step and flush)
+
+        :param busy: True if step in progress
+        """
+        with self.lock:
+            self.busy = busy and self.is_enabled()
+        if not busy:
+            self.flush()
+
+    def reset(self):
+        """Close all scopes and flush (stop, error)"""
+        with self.lock:
+            self.runs = 0
+            self.busy = False
+        self.flush()
+
+    def update_item(self, item: CtxItem) -> bool:
+        """
+        Buffer ctx item update
+
+        :param item: CtxItem
+        :return: True if buffered, False if must be written now
+        """
+        if item.id is None:
+            return False
+        with self.lock:
+            if not self.is_active():
+                self.items.pop(item.id, None)  # failed write queued for retry is outdated now
+                return False
+            self.items[item.id] = item
+            self.items.move_to_end(item.id)
+            self.writes += 1
+        return True
+
+    def save(self, id: int) -> bool:
+        """
+        Buffer ctx meta save
+
+        :param id: ctx meta ID
+        :return: True if buffered, False if must be written now
+        """
+        with self.lock:
+            if not self.is_active():
+                self.metas.pop(id, None)
+                return False
+            self.metas[id] = None
+            self.writes += 1
+        return True
+
+    def flush(self) -> int:
+        """
+        Write buffered updates, failed writes are kept in buffer for retry in next flush
+
+        :return: number of written items and metas
+        """
+        with self.lock:
+            if not self.items and not self.metas:
+                return 0
+            items = list(self.items.values())
+            metas = list(self.metas.keys())
+            self.items.clear()
+            self.metas.clear()
+
+            core = self.window.core
+            ctx = core.ctx
+            written = 0
+            failed_items = []
+            failed_metas = []
+            if items:
+                try:
+                    ctx.provider.update_items(items)
+                    written += len(items)
+                except Exception as e:
+                    core.debug.log(e)
+                    failed_items = items
+            for i, id in enumerate(metas):
+                if id not in ctx.meta:
+                    continue
+                try:
+                    ctx.provider.save(id, ctx.meta[id], ctx.get_items())
+                    written += 1
+                except Exception as e:
+                    core.debug.log(e)
+                    failed_metas = metas[i:]
+                    break
+            if failed_items or failed_metas:
+                self.requeue(failed_items, failed_metas)
+                core.debug.info("[ctx] Buffer write failed, queued for retry: {} items, {} metas".format(
+                    len(failed_items),
+                    len(failed_metas),
+                ))
+            for meta_id in set([item.meta_id for item in items] + metas):
+                ctx.prefetch.invalidate(meta_id)  # loaded in background before write
+            self.flushes += 1
+        return written
+
+    def requeue(self, items: list, metas: list):
+        """
+        Put failed writes back in front of buffer (newer buffered state is kept)
+
+        :param items: CtxItem list
+        :param metas: ctx meta IDs
+        """
+        with self.lock:
+            pending_items = OrderedDict((item.id, item) for item in items if item.id not in self.items)
+            pending_items.update(self.items)
+            self.items = pending_items
+            pending_metas = OrderedDict((id, None) for id in metas)
+            pending_metas.update(self.metas)
+            self.metas = pending_metas
+
+    def defer_update(self) -> bool:
+        """
+        Coalesce ctx list update, at most one per interval while run is in progress
+
+        :return: True if update is deferred, False if must be updated now
+        """
+        if self.updating or not self.is_active():
+            return False
+        interval = self.get_interval()
+        now = time.monotonic()
+        elapsed = (now - self.last_update) * 1000
+        if elapsed >= interval and (self.timer is None or not self.timer.isActive()):
+            self.last_update = now
+            return False
+        if self.timer is None:
+            self.timer = QTimer()
+            self.timer.setSingleShot(True)
+            self.timer.timeout.connect(self.handle_update)
+        if not self.timer.isActive():
+            self.timer.start(max(0, int(interval - elapsed)))
+        return True
+
+    def handle_update(self):
+        """Run deferred ctx list update"""
+        self.last_update = time.monotonic()
+        self.updating = True
+        try:
+            self.window.controller.ctx.update(reload=True, all=False)
+        finally:
+            self.updating = False
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.21 13:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 import threading
@@ -28,6 +28,7 @@ from pygpt_net.core.bridge.context import BridgeContext
 from pygpt_net.item.ctx import CtxItem
 from pygpt_net.utils import trans
 
+from .buffer import Buffer
 from .reply import Reply
 from .stack import Stack
 
@@ -42,6 +43,7 @@ class Kernel:
         "window",
         "replies",
         "stack",
+        "buffer",
         "halt",
         "busy",
         "last_stack",
@@ -75,6 +77,7 @@ class Kernel:
         (MODE_ASSISTANT, MODE_AGENT, MODE_EXPERT, MODE_AGENT_LLAMA, MODE_AGENT_OPENAI, MODE_LLAMA_INDEX)
     )
     _THREADED_MODES = frozenset((MODE_AGENT_LLAMA, MODE_AGENT_OPENAI))
+    _BUFFERED_MODES = frozenset((MODE_AGENT, MODE_AGENT_LLAMA, MODE_AGENT_OPENAI, MODE_EXPERT))
 
     def __init__(self, window=None):
         """
@@ -85,6 +88,7 @@ class Kernel:
         self.window = window
         self.replies = Reply(window)
         self.stack = Stack(window)
+        self.buffer = Buffer(window)
         self.halt = False
         self.busy = False
         self.last_stack = []
@@ -113,6 +117,7 @@ class Kernel:
         self.busy = False
         self.state = self.STATE_IDLE
         self.status = ""
+        self.buffer.reset()
 
     @Slot(object)
     def listener(self, event: BaseEvent):
@@ -297,6 +302,7 @@ class Kernel:
         :param exit: If True, exit the application after stopping.
         """
         self.halt = True
+        self.buffer.reset()  # persist buffered ctx writes
         w = self.window
         w.controller.chat.common.stop(exit=exit)
         w.controller.audio.stop_audio()
@@ -318,18 +324,21 @@ class Kernel:
         if name == KernelEvent.STATE_BUSY:
             self.busy = True
             self.state = self.STATE_BUSY
+            self.buffer.set_busy(self.is_buffered())
             tray.set_icon(self.STATE_BUSY)
             if not self.halt and is_main:
                 w.dispatch(RenderEvent(RenderEvent.STATE_BUSY))
         elif name == KernelEvent.STATE_IDLE:
             self.busy = False
             self.state = self.STATE_IDLE
+            self.buffer.set_busy(False)  # step end, flush
             tray.set_icon(self.STATE_IDLE)
             if is_main:
                 w.dispatch(RenderEvent(RenderEvent.STATE_IDLE))
         elif name == KernelEvent.STATE_ERROR:
             self.busy = False
             self.state = self.STATE_ERROR
+            self.buffer.reset()
             tray.set_icon(self.STATE_ERROR)
             if is_main:
                 w.dispatch(RenderEvent(RenderEvent.STATE_ERROR))
@@ -395,6 +404,14 @@ class Kernel:
         """
         return self.window.core.config.get("mode") in self._THREADED_MODES
 
+    def is_buffered(self) -> bool:
+        """
+        Check if ctx writes are buffered in the current mode (agent and expert runs).
+
+        :return: bool: True if ctx writes are batched at step boundaries, False otherwise.
+        """
+        return self.window.core.config.get("mode") in self._BUFFERED_MODES
+
     def is_main_thread(self) -> bool:
         """
         Check if the current thread is the main thread.
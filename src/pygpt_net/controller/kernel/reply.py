@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.31 23:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import json
@@ -14,6 +14,7 @@ from typing import Optional, Dict, Any, List
 
 from pygpt_net.core.events import KernelEvent, RenderEvent
 from pygpt_net.core.bridge import BridgeContext
+from pygpt_net.core.command.scheduler import sort_results
 from pygpt_net.core.types import MODE_LLAMA_INDEX
 from pygpt_net.item.ctx import CtxItem
 
@@ -29,6 +30,8 @@ class Reply:
         self.reply_ctx = None
         self.last_result = None
         self.reply_idx = -1
+        self.pending = 0  # running async command workers
+        self.calls = []  # dispatched commands (results order)
 
     def add(
             self,
@@ -60,7 +63,8 @@ class Reply:
             core.debug.debug("CTX REPLY: " + str(ctx))
 
         if ctx.reply:
-            if self.reply_idx >= ctx.pid:  # prevent multiple replies per ctx
+            # prevent multiple replies per ctx (results from many plugins are joined before flush)
+            if self.reply_idx >= ctx.pid and ctx is not self.reply_ctx:
                 return []
             self.reply_idx = ctx.pid
             self.append(ctx)
@@ -85,6 +89,8 @@ class Reply:
         """Flush reply stack"""
         if self.reply_ctx is None or len(self.reply_stack) == 0:
             return
+        if self.pending > 0:
+            return  # wait for all command workers
 
         core = self.window.core
         dispatch = self.window.dispatch
@@ -94,6 +100,7 @@ class Reply:
         for responses in self.reply_stack:
             for result in responses:
                 results.append(result)
+        results = sort_results(self.calls, results)  # call order
 
         self.window.update_status("")  # clear status
         self.window.controller.agent.on_reply(self.reply_ctx)  # handle reply in agent
@@ -160,6 +167,28 @@ class Reply:
         self.window.core.debug.info("Reply stack (clear)...")
         self.reply_ctx = None
         self.reply_stack = []
+        self.pending = 0
+        self.calls = []
+
+    def set_calls(self, calls: List[Dict[str, Any]]):
+        """
+        Set dispatched commands, results are sent back in the same order
+
+        :param calls: commands list
+        """
+        self.calls = list(calls or [])
+
+    def wait(self):
+        """Register running async command worker (reply is sent when all workers finish)"""
+        self.pending += 1
+
+    def release(self):
+        """Unregister finished async command worker and flush replies if it was the last one"""
+        if self.pending <= 0:
+            return
+        self.pending -= 1
+        if self.pending == 0:
+            self.flush()
 
     def is_log(self) -> bool:
         """
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.12.26 12:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 import copy
@@ -133,6 +133,9 @@ class Editor:
         self.window.controller.ui.update()
 
         self.window.core.idx.sync()
+        self.window.core.idx.llm.clear_cache()  # config may change LLM / embeddings providers
+        self.window.core.idx.chat.cache.clear()
+        self.window.core.bridge.cache.clear()  # cached responses and embeddings model
         self.window.controller.idx.update()
 
         # update layout if needed
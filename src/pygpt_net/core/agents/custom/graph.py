@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.24 23:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from __future__ import annotations
@@ -14,7 +14,7 @@ import re
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 
-from .schema import FlowSchema, AgentNode, StartNode, EndNode, MemoryNode
+from .schema import FlowSchema, AgentNode, StartNode, EndNode, MemoryNode, ParallelNode, JoinNode
 
 
 @dataclass
@@ -35,6 +35,26 @@ class FlowGraph:
                 return out
         return None
 
+    def find_join(self, node_id: str) -> Optional[str]:
+        """Find nearest join node reachable from fan-out node (BFS)."""
+        seen = {node_id}
+        queue = list(self.get_next(node_id))
+        while queue:
+            nid = queue.pop(0)
+            if nid in seen:
+                continue
+            seen.add(nid)
+            if nid in self.schema.joins:
+                return nid
+            queue.extend(self.get_next(nid))
+        return None
+
+    def get_concurrency(self) -> int:
+        """Max number of agents running in parallel (per flow, from START node), 0 = no limit."""
+        for snode in self.schema.starts.values():
+            return max(0, int(snode.concurrency or 0))
+        return 0
+
     def pick_default_start_agent(self) -> Optional[str]:
         """Pick lowest numeric agent id if no start is present."""
         if not self.schema.agents:
@@ -59,6 +79,12 @@ def build_graph(fs: FlowSchema) -> FlowGraph:
         g.adjacency[aid] = list(anode.outputs or [])
         g.agent_to_memory[aid] = anode.memory_out
 
+    # adjacency from fan-out and join nodes
+    for pid, pnode in fs.parallels.items():
+        g.adjacency[pid] = list(pnode.outputs or [])
+    for jid, jnode in fs.joins.items():
+        g.adjacency[jid] = list(jnode.outputs or [])
+
     # adjacency from start nodes
     g.end_nodes = list(fs.ends.keys())
     g.start_targets = []
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+from __future__ import annotations
+import json
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+
+@dataclass
+class BranchOutput:
+    node_id: str          # first node of branch
+    name: str             # display name of branch (last agent name)
+    content: str          # final output of branch
+    join_id: Optional[str] = None  # join node reached by branch
+    duration: float = 0.0
+
+
+def reduce_concat(outputs: List[BranchOutput]) -> str:
+    """Concatenate outputs with branch names as headers."""
+    parts = []
+    for out in outputs:
+        if out.content:
+            parts.append(f"### {out.name}\n\n{out.content}")
+    return "\n\n".join(parts)
+
+
+def reduce_json(outputs: List[BranchOutput]) -> str:
+    """JSON list of {agent, content}."""
+    return json.dumps(
+        [{"agent": out.name, "content": out.content} for out in outputs],
+        ensure_ascii=False,
+        indent=2,
+    )
+
+
+def reduce_first(outputs: List[BranchOutput]) -> str:
+    """Output of the first finished branch (non-empty)."""
+    for out in sorted(outputs, key=lambda o: o.duration):
+        if out.content:
+            return out.content
+    return ""
+
+
+def reduce_longest(outputs: List[BranchOutput]) -> str:
+    """Longest output."""
+    return max((out.content or "" for out in outputs), key=len, default="")
+
+
+REDUCERS: Dict[str, Callable[[List[BranchOutput]], str]] = {
+    "concat": reduce_concat,
+    "json": reduce_json,
+    "first": reduce_first,
+    "longest": reduce_longest,
+}
+
+
+def reduce_outputs(outputs: List[BranchOutput], reducer: str = "concat") -> str:
+    """
+    Merge outputs of parallel branches at join node.
+
+    Unknown reducer falls back to "concat".
+    """
+    fn = REDUCERS.get((reducer or "").lower(), reduce_concat)
+    return fn(outputs)
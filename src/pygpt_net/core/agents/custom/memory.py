@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.24 23:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from __future__ import annotations
@@ -22,6 +22,7 @@ class MemoryState:
     mem_id: str
     items: List[TResponseInputItem] = field(default_factory=list)
     last_response_id: Optional[str] = None
+    version: int = 0  # incremented on every update
 
     def is_empty(self) -> bool:
         return not self.items
@@ -29,21 +30,43 @@ class MemoryState:
     def set_from(self, items: List[TResponseInputItem], last_response_id: Optional[str]) -> None:
         self.items = list(items or [])
         self.last_response_id = last_response_id
+        self.version += 1
 
     def update_from_result(self, items: List[TResponseInputItem], last_response_id: Optional[str]) -> None:
         self.set_from(items, last_response_id)
 
 
 class MemoryManager:
-    """Manages MemoryState instances keyed by memory node id."""
-    def __init__(self) -> None:
+    """
+    Manages MemoryState instances keyed by memory node id.
+    Parallel branches use fork(): branch sees copy of parent state and its updates stay
+    isolated until merged back at join.
+    """
+    def __init__(self, parent: Optional["MemoryManager"] = None) -> None:
         self._mem: Dict[str, MemoryState] = {}
+        self._parent = parent
+        self._forked: Dict[str, int] = {}  # mem_id -> version copied from parent
 
     def get(self, mem_id: str) -> MemoryState:
         if mem_id not in self._mem:
-            self._mem[mem_id] = MemoryState(mem_id=mem_id)
+            state = MemoryState(mem_id=mem_id)
+            if self._parent is not None:
+                base = self._parent.get(mem_id)
+                state.set_from(base.items, base.last_response_id)
+                self._forked[mem_id] = state.version
+            self._mem[mem_id] = state
         return self._mem[mem_id]
 
+    def fork(self) -> "MemoryManager":
+        """Create isolated branch memory (copy-on-read from this manager)."""
+        return MemoryManager(parent=self)
+
+    def merge(self, branch: "MemoryManager") -> None:
+        """Write back memory states updated by branch."""
+        for mem_id, state in branch._mem.items():
+            if state.version != branch._forked.get(mem_id, 0):
+                self.set(mem_id, state.items, state.last_response_id)
+
     def set(self, mem_id: str, items: List[TResponseInputItem], last_response_id: Optional[str]) -> None:
         self.get(mem_id).set_from(items, last_response_id)
 
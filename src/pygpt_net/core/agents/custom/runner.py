@@ -6,12 +6,14 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.27 06:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from __future__ import annotations
+import asyncio
+import contextlib
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from time import perf_counter
 
 from agents import Runner, TResponseInputItem
@@ -36,6 +38,7 @@ from .utils import (
 )
 from .router_streamer import DelayedRouterStreamer, RealtimeRouterStreamer
 from .debug import items_preview, ellipsize
+from .join import BranchOutput, reduce_outputs
 
 
 @dataclass
@@ -187,6 +190,253 @@ class FlowOrchestrator:
         except Exception as e:
             self.logger.error(f"[memory] update failed for {node_id}: {e}")
 
+    # ---------- Parallel fan-out / join ----------
+
+    def _emit_block(
+        self,
+        *,
+        ctx: CtxItem,
+        bridge: ConnectionContext,
+        handler: StreamHandler,
+        name: str,
+        text: str,
+        begin: bool,
+        use_partial_ctx: bool,
+        last_response_id: Optional[str],
+        finish: bool,
+    ) -> CtxItem:
+        """Emit finished agent output as separate block (header + content); returns current ctx."""
+        ctx.set_agent_name(name)
+        bridge.on_step(ctx, begin)
+        handler.begin = False
+        if text:
+            ctx.stream = text
+            bridge.on_step(ctx, False)
+            if not use_partial_ctx:
+                handler.to_buffer(text)
+        if use_partial_ctx:
+            ctx = bridge.on_next_ctx(
+                ctx=ctx,
+                input="",
+                output=text,
+                response_id=last_response_id or "",
+                finish=finish,
+                stream=True,
+            )
+            handler.new()
+        else:
+            bridge.on_next(ctx)
+        return ctx
+
+    async def _run_agent_once(
+        self,
+        *,
+        node: AgentNode,
+        g: FlowGraph,
+        fs: FlowSchema,
+        factory: AgentFactory,
+        prepared_items: List[TResponseInputItem],
+        agent_kwargs: Dict[str, Any],
+        preset: Optional[PresetItem],
+        model: ModelItem,
+        base_prompt: Optional[str],
+        allow_local_tools_default: bool,
+        allow_remote_tools_default: bool,
+        function_tools: List[dict],
+        max_iterations: int,
+        option_get: OptionGetter,
+        dbg: DebugConfig,
+    ) -> Tuple[str, Optional[str], Optional[str]]:
+        """
+        Run single agent to completion without UI output (used by parallel branches).
+
+        Returns: (display_text, next_id, last_response_id)
+        """
+        node_rt = resolve_node_runtime(
+            window=self.window,
+            node=node,
+            option_get=option_get,
+            default_model=model,
+            base_prompt=base_prompt,
+            schema_allow_local=node.allow_local_tools,
+            schema_allow_remote=node.allow_remote_tools,
+            default_allow_local=allow_local_tools_default,
+            default_allow_remote=allow_remote_tools_default,
+        )
+        allowed_map = {rid: fs.agents[rid].name or rid for rid in (node.outputs or []) if rid in fs.agents}
+        built = factory.build(
+            node=node,
+            node_runtime=node_rt,
+            preset=preset,
+            function_tools=function_tools,
+            force_router=False,
+            friendly_map=allowed_map,
+            handoffs_enabled=True,
+            context=agent_kwargs.get("context"),
+        )
+        result = await Runner.run(
+            built.instance,
+            input=prepared_items,
+            max_turns=int(agent_kwargs.get("max_iterations", max_iterations)),
+        )
+        last_response_id = getattr(result, "last_response_id", None)
+        raw_text = extract_text_output(result)
+        if built.multi_output:
+            decision = parse_route_output(raw_text, built.allowed_routes)
+            if decision.valid:
+                next_id = decision.route
+            else:
+                if dbg.log_routes:
+                    self.logger.warning(f"[branch] Invalid JSON: {decision.error}; fallback first route.")
+                next_id = built.allowed_routes[0] if built.allowed_routes else None
+            return decision.content or "", next_id, last_response_id
+        outs = g.get_next(node.id)
+        next_id = outs[0] if outs else g.first_connected_end(node.id)
+        return raw_text or "", next_id, last_response_id
+
+    async def _run_parallel(
+        self,
+        *,
+        parallel_id: str,
+        g: FlowGraph,
+        fs: FlowSchema,
+        mem: MemoryManager,
+        factory: AgentFactory,
+        semaphore: Optional[asyncio.Semaphore],
+        ctx: CtxItem,
+        bridge: ConnectionContext,
+        handler: StreamHandler,
+        begin: bool,
+        use_partial_ctx: bool,
+        initial_messages: List[TResponseInputItem],
+        first_dispatch_done: bool,
+        last_plain_output: str,
+        run_kwargs: Dict[str, Any],
+        max_iterations: int,
+        max_steps: int,
+        dbg: DebugConfig,
+        timings: List[Tuple[str, float]],
+    ) -> Tuple[CtxItem, str, Optional[str], Optional[str], int]:
+        """
+        Fan-out: run every branch of parallel node concurrently (each branch is a chain of agents
+        ending at join node), then merge branch outputs with join reducer.
+        Branch memory is isolated (forked) and merged back in branch order after all branches finish.
+        Every branch is shown as separate block once it finishes.
+
+        Returns: (ctx, merged_output, next_id, last_response_id, agent_steps)
+        """
+        branches = list(g.get_next(parallel_id))
+        join_id = g.find_join(parallel_id)
+        join = fs.joins.get(join_id) if join_id else None
+        after = g.get_next(join_id) if join_id else []
+        ends_after = not after or after[0] in fs.ends
+        ui = {"ctx": ctx, "begin": begin, "done": 0}
+        state = {"steps": 0, "last_response_id": None}
+
+        self.logger.debug(f"[parallel] {parallel_id} branches={branches} join={join_id} "
+                          f"reducer={join.reducer if join else None}")
+
+        async def run_branch(start_id: str) -> Tuple[BranchOutput, MemoryManager]:
+            branch_mem = mem.fork()
+            branch_start = perf_counter()
+            node_id: Optional[str] = start_id
+            output = last_plain_output
+            name = start_id
+            dispatched = first_dispatch_done
+            while node_id in fs.agents and not bridge.stopped():
+                if max_steps and state["steps"] >= max_steps:
+                    self.logger.warning(f"[branch {start_id}] max iterations reached")
+                    break
+                state["steps"] += 1
+                node = fs.agents[node_id]
+                name = node.name or node_id
+                prepared, baton, mem_id, mem_state, source = self._build_baton_input(
+                    node_id=node_id,
+                    g=g,
+                    mem=branch_mem,
+                    initial_messages=initial_messages,
+                    first_dispatch_done=dispatched,
+                    last_plain_output=output,
+                    dbg=dbg,
+                )
+                if dbg.log_inputs:
+                    self.logger.debug(f"[branch {start_id}] [input] node={node_id} source={source} "
+                                      f"preview={items_preview(prepared, dbg.preview_chars)}")
+                wait_start = perf_counter()
+                async with (semaphore or contextlib.nullcontext()):
+                    node_start = perf_counter()
+                    output, next_id, rid = await self._run_agent_once(node=node, g=g, fs=fs, factory=factory,
+                                                                      prepared_items=prepared, dbg=dbg,
+                                                                      max_iterations=max_iterations, **run_kwargs)
+                node_dur = perf_counter() - node_start
+                timings.append((node_id, node_dur))
+                self.logger.debug(f"[timing] node={node_id} name={name} branch={start_id} "
+                                  f"duration={node_dur:.3f}s wait={node_start - wait_start:.3f}s")
+                self._update_memory_after_step(
+                    node_id=node_id,
+                    mem_state=mem_state,
+                    baton_user_text=baton,
+                    display_text=output,
+                    last_response_id=rid,
+                    dbg=dbg,
+                )
+                if rid:
+                    state["last_response_id"] = rid
+                dispatched = True
+                if isinstance(next_id, str) and next_id.lower() == "end":
+                    next_id = None
+                node_id = next_id
+
+            if node_id and node_id not in fs.joins and node_id not in fs.ends:
+                self.logger.warning(f"[branch {start_id}] stopped at unsupported node {node_id}")
+
+            # show finished branch as its own block
+            ui["done"] += 1
+            ui["ctx"] = self._emit_block(
+                ctx=ui["ctx"],
+                bridge=bridge,
+                handler=handler,
+                name=name,
+                text=output,
+                begin=ui["begin"],
+                use_partial_ctx=use_partial_ctx,
+                last_response_id=state["last_response_id"],
+                finish=ends_after and ui["done"] == len(branches),
+            )
+            ui["begin"] = False
+            return BranchOutput(
+                node_id=start_id,
+                name=name,
+                content=output,
+                join_id=node_id if node_id in fs.joins else None,
+                duration=perf_counter() - branch_start,
+            ), branch_mem
+
+        fan_start = perf_counter()
+        results = await asyncio.gather(*[run_branch(bid) for bid in branches], return_exceptions=True)
+        outputs: List[BranchOutput] = []
+        errors = []
+        for bid, res in zip(branches, results):
+            if isinstance(res, BaseException):
+                self.logger.error(f"[branch {bid}] failed: {res}")
+                errors.append(res)
+                continue
+            out, branch_mem = res
+            mem.merge(branch_mem)
+            outputs.append(out)
+            self.logger.debug(f"[timing] branch={bid} name={out.name} duration={out.duration:.3f}s")
+        if errors and not outputs:
+            raise errors[0]
+
+        merged = reduce_outputs(outputs, join.reducer if join else "concat")
+        fan_dur = perf_counter() - fan_start
+        timings.append((parallel_id, fan_dur))
+        self.logger.debug(f"[timing] node={parallel_id} branches={len(branches)} duration={fan_dur:.3f}s "
+                          f"sum={sum(o.duration for o in outputs):.3f}s")
+
+        next_id = after[0] if after else None
+        return ui["ctx"], merged, next_id, state["last_response_id"], state["steps"]
+
     # ---------- Main flow ----------
 
     async def run_flow(
@@ -224,6 +474,12 @@ class FlowOrchestrator:
             preview_chars=int(option_get("debug", "preview_chars", 280)),
         )
 
+        # Parallel branches limit (per flow) and per-node timings
+        concurrency = g.get_concurrency()
+        semaphore = asyncio.Semaphore(concurrency) if concurrency > 0 else None
+        timings: List[Tuple[str, float]] = []
+        flow_start = perf_counter()
+
         # Entry
         if g.start_targets:
             current_ids: List[str] = [g.start_targets[0]]
@@ -261,6 +517,60 @@ class FlowOrchestrator:
                 self.logger.info(f"Reached END node: {current_id}")
                 break
 
+            # Fan-out: run branches concurrently, continue after join
+            if current_id in fs.parallels:
+                ctx, merged, next_id, rid, used = await self._run_parallel(
+                    parallel_id=current_id,
+                    g=g,
+                    fs=fs,
+                    mem=mem,
+                    factory=factory,
+                    semaphore=semaphore,
+                    ctx=ctx,
+                    bridge=bridge,
+                    handler=handler,
+                    begin=begin,
+                    use_partial_ctx=use_partial_ctx,
+                    initial_messages=initial_messages,
+                    first_dispatch_done=first_dispatch_done,
+                    last_plain_output=last_plain_output,
+                    run_kwargs={
+                        "agent_kwargs": agent_kwargs,
+                        "preset": preset,
+                        "model": model,
+                        "base_prompt": base_prompt,
+                        "allow_local_tools_default": allow_local_tools_default,
+                        "allow_remote_tools_default": allow_remote_tools_default,
+                        "function_tools": function_tools,
+                        "option_get": option_get,
+                    },
+                    max_iterations=max_iterations,
+                    max_steps=max(1, max_iterations - steps) if max_iterations else 0,
+                    dbg=dbg,
+                    timings=timings,
+                )
+                steps += used
+                begin = False
+                if rid:
+                    last_response_id = rid
+                first_dispatch_done = True
+                last_plain_output = merged
+                final_output = merged
+                if dbg.log_outputs:
+                    self.logger.debug(f"[join] preview='{ellipsize(merged, dbg.preview_chars)}'")
+                current_ids = [next_id] if next_id else []
+                if current_ids and current_ids[0] in fs.agents:
+                    ctx.set_agent_name(fs.agents[current_ids[0]].name)
+                dur = perf_counter() - step_start
+                self.logger.debug(f"[step {steps}] duration={dur:.3f}s")
+                continue
+
+            # Join reached outside of fan-out: pass-through
+            if current_id in fs.joins:
+                outs = g.get_next(current_id)
+                current_ids = [outs[0]] if outs else []
+                continue
+
             # Validate agent
             if current_id not in fs.agents:
                 self.logger.warning(f"Next id {current_id} is not an agent; stopping or jumping to END.")
@@ -569,10 +879,15 @@ class FlowOrchestrator:
 
             # Step duration
             dur = perf_counter() - step_start
+            timings.append((current_id, dur))
             self.logger.debug(f"[step {steps}] duration={dur:.3f}s")
+            self.logger.debug(f"[timing] node={current_id} name={node.name} duration={dur:.3f}s")
 
         if bridge.stopped():
             bridge.on_stop(ctx)
 
+        if timings:
+            summary = ", ".join(f"{nid}={dur:.3f}s" for nid, dur in timings)
+            self.logger.debug(f"[timing] total={perf_counter() - flow_start:.3f}s nodes: {summary}")
         self.logger.info(f"Flow finished. steps={steps} final_len={len(final_output)}")
         return FlowResult(ctx=ctx, final_output=final_output, last_response_id=last_response_id)
\ No newline at end of file
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.25 14:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from __future__ import annotations
@@ -37,6 +37,7 @@ class AgentNode(BaseNode):
 @dataclass
 class StartNode(BaseNode):
     outputs: List[str] = field(default_factory=list)
+    concurrency: int = 0  # max parallel agents in flow, 0 = no limit
 
 
 @dataclass
@@ -44,6 +45,21 @@ class EndNode(BaseNode):
     inputs: List[str] = field(default_factory=list)
 
 
+@dataclass
+class ParallelNode(BaseNode):
+    """Fan-out: all connected outputs run concurrently."""
+    outputs: List[str] = field(default_factory=list)
+    inputs: List[str] = field(default_factory=list)
+
+
+@dataclass
+class JoinNode(BaseNode):
+    """Join: waits for parallel branches and merges their outputs with reducer."""
+    reducer: str = "concat"
+    outputs: List[str] = field(default_factory=list)
+    inputs: List[str] = field(default_factory=list)
+
+
 @dataclass
 class MemoryNode(BaseNode):
     name: str = ""
@@ -56,6 +72,8 @@ class FlowSchema:
     memories: Dict[str, MemoryNode] = field(default_factory=dict)
     starts: Dict[str, StartNode] = field(default_factory=dict)
     ends: Dict[str, EndNode] = field(default_factory=dict)
+    parallels: Dict[str, ParallelNode] = field(default_factory=dict)
+    joins: Dict[str, JoinNode] = field(default_factory=dict)
 
 
 def _safe_get(d: Dict[str, Any], *keys, default=None):
@@ -69,6 +87,13 @@ def _safe_get(d: Dict[str, Any], *keys, default=None):
     return cur
 
 
+def _safe_int(value: Any, default: int = 0) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
 def parse_schema(schema: List[Dict[str, Any]]) -> FlowSchema:
     """
     Parse NodeEditor-exported schema list into FlowSchema.
@@ -102,6 +127,7 @@ def parse_schema(schema: List[Dict[str, Any]]) -> FlowSchema:
                 type=ntype,
                 slots=slots,
                 outputs=list(_safe_get(slots, "output", "out", default=[])) or [],
+                concurrency=_safe_int(_safe_get(slots, "concurrency", default=0)),
             )
             fs.starts[nid] = node
 
@@ -114,6 +140,27 @@ def parse_schema(schema: List[Dict[str, Any]]) -> FlowSchema:
             )
             fs.ends[nid] = node
 
+        elif ntype == "parallel":
+            node = ParallelNode(
+                id=nid,
+                type=ntype,
+                slots=slots,
+                outputs=list(_safe_get(slots, "output", "out", default=[])) or [],
+                inputs=list(_safe_get(slots, "input", "in", default=[])) or [],
+            )
+            fs.parallels[nid] = node
+
+        elif ntype == "join":
+            node = JoinNode(
+                id=nid,
+                type=ntype,
+                slots=slots,
+                reducer=_safe_get(slots, "reducer", default="concat") or "concat",
+                outputs=list(_safe_get(slots, "output", "out", default=[])) or [],
+                inputs=list(_safe_get(slots, "input", "in", default=[])) or [],
+            )
+            fs.joins[nid] = node
+
         elif ntype == "memory":
             node = MemoryNode(
                 id=nid,
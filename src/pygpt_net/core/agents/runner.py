@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.21 07:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 import asyncio
@@ -78,6 +78,8 @@ class Runner:
 
         agent_id = extra.get("agent_provider", "openai")
         verbose = self.is_verbose()
+        buffer = self.window.controller.kernel.buffer
+        buffer.begin()  # batch ctx writes until run end
 
         try:
             # first, check if agent exists
@@ -214,6 +216,9 @@ class Runner:
             self.last_error = e
             return False
 
+        finally:
+            buffer.end()
+
     def call_once(
             self,
             context: BridgeContext,
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.26 19:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 from typing import Optional, List
@@ -59,6 +59,7 @@ class Loop(BaseRunner):
             model=model,
             prompt=self.prepare_input(input),
             stream=False,
+            cache_bypass=True,  # evaluation of the current step, never reused
         )
         extra = {
             "agent_provider": "react",  # use React workflow provider
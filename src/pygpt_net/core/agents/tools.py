@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.24 02:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import json
@@ -97,10 +97,14 @@ class Tools:
         # add query engine tool if idx is provided
         idx = extra.get("agent_idx", None)
         if self.window.core.idx.is_valid(idx):
-            llm, embed_model = self.window.core.idx.llm.get_service_context(model=context.model)
-            index = self.window.core.idx.storage.get(idx, llm, embed_model)  # get index
+            index, llm = self.window.core.idx.chat.get_index(idx, context.model)  # get index
             if index is not None:
-                query_engine = index.as_query_engine(similarity_top_k=3)
+                query_engine = self.window.core.idx.chat.get_query_engine(
+                    idx,
+                    index,
+                    llm=llm,
+                    similarity_top_k=3,
+                )  # reused by agent sub-queries until index is updated
                 tool = [
                     QueryEngineTool(
                         query_engine=query_engine,
@@ -393,10 +397,14 @@ class Tools:
                 return "Context is not set for query_engine tool."
             if not self.window.core.idx.is_valid(self.agent_idx):
                 return "Agent index is not set for query_engine tool."
-            llm, embed_model = self.window.core.idx.llm.get_service_context(model=self.context.model)
-            index = self.window.core.idx.storage.get(self.agent_idx, llm, embed_model)  # get index
+            index, llm = self.window.core.idx.chat.get_index(self.agent_idx, self.context.model)  # get index
             if index is not None:
-                query_engine = index.as_query_engine(similarity_top_k=3)
+                query_engine = self.window.core.idx.chat.get_query_engine(
+                    self.agent_idx,
+                    index,
+                    llm=llm,
+                    similarity_top_k=3,
+                )
                 response = query_engine.query(params["query"])
                 print(f"[Plugin] Query engine response: {response}")
                 self.log(f"[Plugin] Query engine response: {response}")
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.02.06 01:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import copy
@@ -40,6 +40,7 @@ class Context:
         self.last_used_context = None
         self.last_files = []
         self.last_urls = []
+        self.pending = []  # uploaded attachments waiting for batch indexing
         self.summary_prompt = """
         Summarize the text below by extracting the most important information, 
         especially those that may help answer the question: 
@@ -199,8 +200,8 @@ class Context:
             return ""
         idx_path = os.path.join(self.get_dir(meta), self.dir_index)
 
-        indexed = False
         has_local_context = False
+        to_index = []
         # index local files if not indexed by auto_index; native refs bypass local RAG entirely
         for i, file in enumerate(meta.get_additional_ctx()):
             if file.get("type") == "native_file":
@@ -217,15 +218,15 @@ class Context:
                     if file["type"] == "url":
                         type = AttachmentItem.TYPE_URL
                         source = file["path"] # URL
-                doc_ids = self.index_attachment(
+                to_index.append(self.prepare_index_item(
+                    file,
                     type,
                     source,
-                    idx_path,
                     context_name=self.get_context_filename(file),
-                )
-                file["indexed"] = True
-                file["doc_ids"] = doc_ids
-                indexed = True
+                ))
+
+        # index all missing files in one batch
+        indexed = self.index_attachments(to_index, idx_path) > 0
 
         if indexed:
             # update ctx in DB
@@ -412,20 +413,6 @@ class Context:
             size = os.path.getsize(src_file)
             type = "url"  # extra ctx type
 
-        # index file to ctx index
-        doc_ids = []
-        if auto_index:
-            source = src_file
-            if attachment.type == AttachmentItem.TYPE_URL:
-                source = attachment.path  # URL
-            doc_ids = self.index_attachment(
-                attachment.type,
-                source,
-                index_path,
-                documents=documents,
-                context_name=self.get_attachment_context_name(attachment, real_path),
-            )
-
         result = {
             "name": name,
             "context_name": self.get_attachment_context_name(attachment, real_path),
@@ -438,9 +425,20 @@ class Context:
             "tokens": tokens,
             "indexed": False,
         }
+        # queue file for ctx index, indexed in batch by index_pending()
         if auto_index:
-            result["indexed"] = True
-            result["doc_ids"] = doc_ids
+            source = src_file
+            if attachment.type == AttachmentItem.TYPE_URL:
+                source = attachment.path  # URL
+            item = self.prepare_index_item(
+                result,
+                attachment.type,
+                source,
+                documents=documents,
+                context_name=result["context_name"],
+            )
+            item["index_path"] = index_path
+            self.pending.append(item)
 
         if real_path:
             result["real_path"] = real_path
@@ -450,6 +448,93 @@ class Context:
 
         return result
 
+    def index_pending(self) -> int:
+        """
+        Index uploaded attachments waiting for indexing (batch per context index)
+
+        :return: number of indexed attachments
+        """
+        pending, self.pending = self.pending, []
+        by_path = {}
+        for item in pending:
+            by_path.setdefault(item["index_path"], []).append(item)
+        num = 0
+        for index_path, items in by_path.items():
+            num += self.index_attachments(items, index_path)
+        return num
+
+    def prepare_index_item(
+            self,
+            file: Dict[str, Any],
+            type: str,
+            source: str,
+            documents: Optional[List[Document]] = None,
+            context_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Prepare item for batch indexing
+
+        :param file: additional context item (updated after indexing)
+        :param type: attachment type
+        :param source: source file or URL
+        :param documents: list of documents (optional)
+        :param context_name: model-facing filename or archive-relative path
+        :return: item for index_attachments()
+        """
+        return {
+            "file": file,
+            "source": source,
+            "web": type == AttachmentItem.TYPE_URL,
+            "documents": documents,
+            "context_name": context_name if type == AttachmentItem.TYPE_FILE else None,
+        }
+
+    def index_attachments(
+            self,
+            items: List[Dict[str, Any]],
+            idx_path: str
+    ) -> int:
+        """
+        Index attachments in one batch (parallel embeddings, single index update)
+
+        :param items: items from prepare_index_item()
+        :param idx_path: index path
+        :return: number of indexed attachments
+        """
+        if not items:
+            return 0
+        model, model_item = self.get_selected_model("query")
+        results = self.window.core.idx.indexing.index_attachments(
+            items,
+            idx_path,
+            model_item,
+            prepare=self.prepare_index_documents,
+        )
+        num = 0
+        for item, doc_ids in zip(items, results):
+            if doc_ids is None:
+                continue  # failed, retry on next query
+            item["file"]["indexed"] = True
+            item["file"]["doc_ids"] = doc_ids
+            num += 1
+            if self.is_verbose():
+                print("Attachments: indexed. Doc IDs: {}".format(doc_ids))
+        return num
+
+    def prepare_index_documents(
+            self,
+            item: Dict[str, Any],
+            documents: List[Document]
+    ):
+        """
+        Prepare loaded documents before indexing (called from indexing workers)
+
+        :param item: item from prepare_index_item()
+        :param documents: list of documents
+        """
+        if item.get("context_name"):
+            self.normalize_attachment_document_metadata(documents, item["context_name"])
+
     def create_native_item(
             self,
             attachment: AttachmentItem,
@@ -927,6 +1012,10 @@ class Context:
         :param meta: CtxMeta instance
         """
         meta_path = self.get_dir(meta)
+        self.window.core.idx.storage.release_ctx_idx(
+            os.path.join(meta_path, self.dir_index),
+            persist=False,
+        )
         if os.path.exists(meta_path) and os.path.isdir(meta_path):
             shutil.rmtree(meta_path)
             if self.is_verbose():
@@ -966,6 +1055,7 @@ class Context:
         """Truncate all attachments"""
         try:
             idx_path = self.window.core.config.get_user_dir("ctx_idx")
+            self.window.core.idx.storage.release_ctx_idx(persist=False)
             if os.path.exists(idx_path) and os.path.isdir(idx_path):
                 shutil.rmtree(idx_path)
             os.makedirs(idx_path, exist_ok=True)
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.31 04:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from typing import Optional
@@ -909,6 +909,7 @@ class NativeBackend(QObject):
             rate = int(payload.get("rate", 24000) or 24000)
             channels = int(payload.get("channels", 1) or 1)
             final = bool(payload.get("final", False))
+            ts = payload.get("ts")  # socket receive time
 
             # only raw PCM/L16
             if ("pcm" not in mime) and ("l16" not in mime):
@@ -926,7 +927,7 @@ class NativeBackend(QObject):
                 if (out_fmt.sampleRate() != rate) or (out_fmt.channelCount() != channels) or (
                         out_fmt.sampleFormat() != QAudioFormat.SampleFormat.Int16):
                     data = self._convert_pcm_for_output(data, rate, channels, out_fmt)
-                session.feed(data)
+                session.feed(data, ts)
 
             if final:
                 session.mark_final()
@@ -6,15 +6,19 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.31 23:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
+from typing import Optional
+
 import numpy as np
 
 from PySide6.QtCore import Qt
 from PySide6.QtMultimedia import QAudioFormat, QAudioSink
 from PySide6.QtCore import QTimer, QObject
 
+from ..shared import PcmRingBuffer, get_latency_meter
+
 
 class RealtimeSession(QObject):
     """Global realtime session: pumps PCM bytes to QAudioSink without blocking the GUI."""
@@ -47,14 +51,19 @@ class RealtimeSession(QObject):
         if self.io is None:
             raise RuntimeError("QAudioSink.start() returned None (no IO for writing)")
 
-        # user buffer and simple timing
-        self.buffer = bytearray()
         self.final = False
 
         # format helpers
         self.frame_bytes = max(1, fmt.channelCount() * fmt.bytesPerSample())
         self.bytes_per_ms = max(1, int(fmt.sampleRate() * fmt.channelCount() * fmt.bytesPerSample() / 1000))
 
+        # user buffer: preallocated ring (~2 s), measures socket-to-speaker latency
+        self.buffer = PcmRingBuffer(
+            capacity=self.bytes_per_ms * 2000,
+            frame_bytes=self.frame_bytes,
+            meter=get_latency_meter("socket_to_speaker"),
+        )
+
         # NOTE: keep writes reasonably sized
         self.min_write_bytes = max(self.bytes_per_ms * 20, self.frame_bytes)  # ~20 ms
         self.max_write_bytes = max(self.bytes_per_ms * 100, self.frame_bytes) # ~100 ms
@@ -82,15 +91,16 @@ class RealtimeSession(QObject):
 
         self.on_stopped = None  # callback set by NativeBackend
 
-    def feed(self, data: bytes) -> None:
+    def feed(self, data: bytes, ts: Optional[float] = None) -> None:
         """
         Feed PCM bytes (already in device format).
 
         :param data: bytes
+        :param ts: socket receive time (time.monotonic), for latency
         """
         if not data or self.io is None:
             return
-        self.buffer.extend(data)
+        self.buffer.write(data, ts)
         # NOTE: try pump quickly (non-blocking)
         self._pump()
 
@@ -99,7 +109,7 @@ class RealtimeSession(QObject):
         if not self.final:
             pad = self._align_down(self.bytes_per_ms * self.tail_ms)
             if pad > 0:
-                self.buffer.extend(self._silence(pad))
+                self.buffer.write(self._silence(pad))
         self.final = True
         self._pump()
 
@@ -159,10 +169,10 @@ class RealtimeSession(QObject):
             return
 
         if to_write > 0:
-            chunk = bytes(self.buffer[:to_write])
+            chunk = self.buffer.peek(to_write)
             written = self.io.write(chunk)
             if written and written > 0:
-                del self.buffer[:written]
+                self.buffer.consume(written)
                 # simple volume window
                 self._vol_push(chunk[:self._align_down(written)])
 
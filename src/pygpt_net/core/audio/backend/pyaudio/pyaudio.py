@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.31 04:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from typing import List, Tuple, Optional
@@ -851,6 +851,7 @@ class PyaudioBackend:
             rate = int(payload.get("rate", 24000) or 24000)
             channels = int(payload.get("channels", 1) or 1)
             final = bool(payload.get("final", False))
+            ts = payload.get("ts")  # socket receive time
 
             # only raw PCM/L16 is supported here
             if ("pcm" not in mime) and ("l16" not in mime):
@@ -871,7 +872,7 @@ class PyaudioBackend:
                         out_rate=session.rate, out_channels=session.channels,
                         out_width=session.width
                     )
-                session.feed(data)
+                session.feed(data, ts)
 
             if final:
                 session.mark_final()
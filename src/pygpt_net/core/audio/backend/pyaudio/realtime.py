@@ -5,6 +5,8 @@ import numpy as np
 
 from PySide6.QtCore import QTimer, QObject, Qt
 
+from ..shared import PcmRingBuffer, get_latency_meter
+
 
 class RealtimeSessionPyAudio(QObject):
     """
@@ -36,9 +38,12 @@ class RealtimeSessionPyAudio(QObject):
             unsigned=(self.width == 1)
         )
 
-        # internal buffers/flags
-        self._buffer = bytearray()
-        self._buf_lock = threading.Lock()
+        # internal buffers/flags: preallocated ring (~2 s), measures socket-to-speaker latency
+        self._buffer = PcmRingBuffer(
+            capacity=self.bytes_per_ms * 2000,
+            frame_bytes=self.frame_bytes,
+            meter=get_latency_meter("socket_to_speaker"),
+        )
         self._final = False
         self._tail_ms = 60  # add a small silence tail to avoid clicks
 
@@ -99,16 +104,16 @@ class RealtimeSessionPyAudio(QObject):
         """
         return bool(self._final)
 
-    def feed(self, data: bytes) -> None:
+    def feed(self, data: bytes, ts: Optional[float] = None) -> None:
         """
         Append PCM bytes (already in session/device format).
 
         :param data: bytes to append
+        :param ts: socket receive time (time.monotonic), for latency
         """
         if not data:
             return
-        with self._buf_lock:
-            self._buffer.extend(data)
+        self._buffer.write(data, ts)
         # push to volume window from the same bytes
         self._vol_push(data)
 
@@ -118,8 +123,7 @@ class RealtimeSessionPyAudio(QObject):
             pad = self.bytes_per_ms * self._tail_ms
             pad -= (pad % self.frame_bytes)
             if pad > 0:
-                with self._buf_lock:
-                    self._buffer.extend(self._silence(pad))
+                self._buffer.write(self._silence(pad))
         self._final = True
 
     def stop(self) -> None:
@@ -192,14 +196,7 @@ class RealtimeSessionPyAudio(QObject):
         """
         import pyaudio
         need = frame_count * self.frame_bytes
-        out = b""
-        with self._buf_lock:
-            if len(self._buffer) >= need:
-                out = bytes(self._buffer[:need])
-                del self._buffer[:need]
-            elif len(self._buffer) > 0:
-                out = bytes(self._buffer)
-                self._buffer.clear()
+        out = self._buffer.read(need)
 
         if len(out) < need:
             out += self._silence(need - len(out))
@@ -245,8 +242,7 @@ class RealtimeSessionPyAudio(QObject):
 
         :return: True if empty
         """
-        with self._buf_lock:
-            return len(self._buffer) == 0
+        return len(self._buffer) == 0
 
     def _silence(self, n: int) -> bytes:
         """
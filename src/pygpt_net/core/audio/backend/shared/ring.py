@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+import threading
+import time
+from collections import deque
+from typing import Optional, Dict, Any
+
+
+class LatencyMeter:
+    """
+    Rolling latency statistics (last N samples).
+    """
+    def __init__(self, name: str, size: int = 500):
+        """
+        Initialize meter.
+
+        :param name: meter name
+        :param size: number of samples kept
+        """
+        self.name = name
+        self.samples = deque(maxlen=max(1, int(size)))
+        self.lock = threading.Lock()
+
+    def add(self, seconds: float) -> None:
+        """
+        Add latency sample.
+
+        :param seconds: latency in seconds
+        """
+        if seconds < 0:
+            return
+        with self.lock:
+            self.samples.append(seconds)
+
+    def reset(self) -> None:
+        """Clear samples."""
+        with self.lock:
+            self.samples.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get stats in milliseconds.
+
+        :return: dict with count, last, p50, p95 and max
+        """
+        with self.lock:
+            data = list(self.samples)
+        if not data:
+            return {"count": 0, "last": None, "p50": None, "p95": None, "max": None}
+        last = data[-1]
+        data.sort()
+        return {
+            "count": len(data),
+            "last": round(last * 1000.0, 1),
+            "p50": round(data[int(0.50 * (len(data) - 1))] * 1000.0, 1),
+            "p95": round(data[int(0.95 * (len(data) - 1))] * 1000.0, 1),
+            "max": round(data[-1] * 1000.0, 1),
+        }
+
+
+class PcmRingBuffer:
+    """
+    Preallocated byte ring buffer for PCM frames.
+
+    Writes copy into a fixed bytearray (grown only on overflow), reads return
+    one contiguous copy, so there is no per-chunk reallocation or memmove as
+    with `bytearray.extend()` + `del buf[:n]`.
+
+    Optional timestamps passed to write() are resolved on read(), when the
+    last byte of the written chunk leaves the buffer, and added to the
+    latency meter.
+    """
+    def __init__(
+            self,
+            capacity: int = 65536,
+            frame_bytes: int = 2,
+            meter: Optional[LatencyMeter] = None
+    ):
+        """
+        Initialize ring buffer.
+
+        :param capacity: initial capacity in bytes
+        :param frame_bytes: frame size in bytes (reads are aligned to frames)
+        :param meter: optional latency meter
+        """
+        self.frame_bytes = max(1, int(frame_bytes))
+        capacity = max(self.frame_bytes, int(capacity))
+        self._buf = bytearray(capacity)
+        self._view = memoryview(self._buf)
+        self._start = 0  # read position
+        self._size = 0  # number of bytes stored
+        self._written = 0  # total bytes written (for timestamp marks)
+        self._read = 0  # total bytes read
+        self._marks = deque()  # (written offset, timestamp)
+        self.meter = meter
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """
+        Number of buffered bytes.
+
+        :return: size in bytes
+        """
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """
+        Current capacity.
+
+        :return: capacity in bytes
+        """
+        return len(self._buf)
+
+    def write(self, data, ts: Optional[float] = None) -> int:
+        """
+        Append bytes.
+
+        :param data: bytes-like object
+        :param ts: capture/receive timestamp (time.monotonic), for latency
+        :return: number of bytes written
+        """
+        n = len(data)
+        if n == 0:
+            return 0
+        with self.lock:
+            if self._size + n > len(self._buf):
+                self._grow(self._size + n)
+            cap = len(self._buf)
+            end = (self._start + self._size) % cap
+            first = min(n, cap - end)
+            src = memoryview(data).cast("B")
+            self._view[end:end + first] = src[:first]
+            if first < n:
+                self._view[0:n - first] = src[first:]
+            self._size += n
+            self._written += n
+            if ts is not None and self.meter is not None:
+                self._marks.append((self._written, ts))
+        return n
+
+    def read(self, n: Optional[int] = None) -> bytes:
+        """
+        Pop up to n bytes (aligned down to frame size).
+
+        :param n: max number of bytes, None = all
+        :return: bytes
+        """
+        with self.lock:
+            out = self._peek(n)
+            self._consume(len(out))
+        return out
+
+    def peek(self, n: Optional[int] = None) -> bytes:
+        """
+        Get up to n bytes without removing them (aligned down to frame size).
+
+        :param n: max number of bytes, None = all
+        :return: bytes
+        """
+        with self.lock:
+            return self._peek(n)
+
+    def consume(self, n: int) -> int:
+        """
+        Remove n bytes (e.g. after partial device write).
+
+        :param n: number of bytes
+        :return: number of bytes removed
+        """
+        with self.lock:
+            return self._consume(n)
+
+    def _peek(self, n: Optional[int]) -> bytes:
+        """
+        Copy up to n bytes from read position (lock must be held).
+
+        :param n: max number of bytes, None = all
+        :return: bytes
+        """
+        if n is None or n > self._size:
+            n = self._size
+        n -= n % self.frame_bytes
+        if n <= 0:
+            return b""
+        cap = len(self._buf)
+        first = min(n, cap - self._start)
+        if first == n:
+            return bytes(self._view[self._start:self._start + n])
+        return b"".join((self._view[self._start:cap], self._view[0:n - first]))
+
+    def _consume(self, n: int) -> int:
+        """
+        Advance read position (lock must be held).
+
+        :param n: number of bytes
+        :return: number of bytes removed
+        """
+        n = max(0, min(int(n), self._size))
+        if n == 0:
+            return 0
+        self._start = (self._start + n) % len(self._buf)
+        self._size -= n
+        self._read += n
+        if self._size == 0:
+            self._start = 0
+        self._resolve_marks()
+        return n
+
+    def clear(self) -> None:
+        """Drop all data."""
+        with self.lock:
+            self._start = 0
+            self._size = 0
+            self._read = self._written
+            self._marks.clear()
+
+    def _resolve_marks(self) -> None:
+        """Add latency samples for chunks fully read."""
+        if not self._marks:
+            return
+        now = time.monotonic()
+        while self._marks and self._marks[0][0] <= self._read:
+            _, ts = self._marks.popleft()
+            self.meter.add(now - ts)
+
+    def _grow(self, need: int) -> None:
+        """
+        Grow buffer (keeps data order, resets read position).
+
+        :param need: required capacity
+        """
+        cap = len(self._buf)
+        new_cap = cap
+        while new_cap < need:
+            new_cap *= 2
+        buf = bytearray(new_cap)
+        first = min(self._size, cap - self._start)
+        buf[0:first] = self._view[self._start:self._start + first]
+        if first < self._size:
+            buf[first:self._size] = self._view[0:self._size - first]
+        self._view.release()
+        self._buf = buf
+        self._view = memoryview(self._buf)
+        self._start = 0
+
+
+class PacketBatcher:
+    """
+    Batches small PCM chunks into fixed-size packets.
+    """
+    def __init__(
+            self,
+            packet_bytes: int,
+            frame_bytes: int = 2,
+            meter: Optional[LatencyMeter] = None
+    ):
+        """
+        Initialize batcher.
+
+        :param packet_bytes: packet size in bytes
+        :param frame_bytes: frame size in bytes
+        :param meter: optional latency meter (capture -> packet ready)
+        """
+        self.frame_bytes = max(1, int(frame_bytes))
+        self.packet_bytes = max(self.frame_bytes, int(packet_bytes) - int(packet_bytes) % self.frame_bytes)
+        self.ring = PcmRingBuffer(max(self.packet_bytes * 4, 4096), self.frame_bytes, meter)
+
+    def push(self, data, ts: Optional[float] = None) -> list:
+        """
+        Add chunk and return full packets.
+
+        :param data: PCM bytes
+        :param ts: capture timestamp (time.monotonic)
+        :return: list of packets (bytes)
+        """
+        if data:
+            self.ring.write(data, ts)
+        packets = []
+        while len(self.ring) >= self.packet_bytes:
+            packets.append(self.ring.read(self.packet_bytes))
+        return packets
+
+    def flush(self) -> list:
+        """
+        Return remaining data as last packet.
+
+        :return: list with 0 or 1 packet
+        """
+        rest = self.ring.read()
+        return [rest] if rest else []
+
+    def clear(self) -> None:
+        """Drop buffered data."""
+        self.ring.clear()
+
+
+_METERS: Dict[str, LatencyMeter] = {}
+_METERS_LOCK = threading.Lock()
+
+
+def get_latency_meter(name: str) -> LatencyMeter:
+    """
+    Get process-wide latency meter by name (created on first use).
+
+    Used names: "mic_to_socket", "socket_to_speaker".
+
+    :param name: meter name
+    :return: LatencyMeter
+    """
+    with _METERS_LOCK:
+        meter = _METERS.get(name)
+        if meter is None:
+            meter = LatencyMeter(name)
+            _METERS[name] = meter
+        return meter
+
+
+def get_latency_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Get stats of all latency meters.
+
+    :return: dict name -> stats
+    """
+    with _METERS_LOCK:
+        meters = list(_METERS.values())
+    return {m.name: m.get_stats() for m in meters}
@@ -6,9 +6,11 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.31 23:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
+import time
+
 from pygpt_net.core.events import RealtimeEvent
 
 def build_rt_input_delta_event(
@@ -35,6 +37,7 @@ def build_rt_input_delta_event(
                 "rate": int(rate),
                 "channels": int(channels),
                 "final": bool(final),
+                "ts": time.monotonic(),  # capture time, for mic-to-socket latency
             }
         }
     )
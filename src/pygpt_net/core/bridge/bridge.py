@@ -6,12 +6,10 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.04 00:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
-import time
 import weakref
-from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 
 from pygpt_net.core.types import (
@@ -25,6 +23,7 @@ from pygpt_net.core.types import (
     MODE_RESEARCH,
 )
 
+from .cache import Cache
 from .context import BridgeContext
 from .worker import BridgeWorker
 
@@ -36,7 +35,6 @@ class Bridge:
         :param window: Window instance
         """
         self.window = window
-        self.last_call = None  # last API call time, for throttling
         self.last_context = None  # last context
         self.last_context_quick = None  # last context for quick call
         self.sync_modes = (
@@ -44,6 +42,7 @@ class Bridge:
             MODE_EXPERT,
         )
         self.worker = None
+        self.cache = Cache(window)  # quick call response cache
 
     def request(
             self,
@@ -129,7 +128,7 @@ class Bridge:
                 debug = {k: str(v) for k, v in context.to_dict().items()}
                 self.window.core.debug.debug(str(debug))
 
-        self.apply_rate_limit()  # apply RPM limit
+        self.apply_rate_limit(context)  # apply RPM/TPM limit
 
         if extra is None:
             extra = {}
@@ -201,6 +200,30 @@ class Bridge:
                 debug = {k: str(v) for k, v in context.to_dict().items()}
                 self.window.core.debug.debug(str(debug))
 
+        # response cache
+        keys = self.cache.get_keys(context, extra)
+        if keys is not None:
+            output = self.cache.get(keys, context)
+            if output is not None:
+                return output
+
+        output = self.call_provider(context, extra)
+        if keys is not None:
+            self.cache.set(keys, context, output)
+        return output
+
+    def call_provider(
+            self,
+            context: BridgeContext,
+            extra: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Make quick call to provider (without response cache)
+
+        :param context: Bridge context
+        :param extra: extra data
+        :return: response content
+        """
         if context.model is not None:
             # check if model is supported by OpenAI API, if not then try to use llama-index or langchain call
             if not context.model.is_supported(MODE_CHAT):
@@ -267,19 +290,59 @@ class Bridge:
         worker.rt_signals = self.window.controller.realtime.signals  # Realtime signals
         return worker
 
-    def apply_rate_limit(self):
-        """Apply API calls RPM limit"""
-        max_per_minute = 60
-        if self.window.core.config.has("max_requests_limit"):
-            max_per_minute = int(self.window.core.config.get("max_requests_limit")) # per minute
-        if max_per_minute <= 0:
+    def apply_rate_limit(self, context: Optional[BridgeContext] = None):
+        """
+        Apply API calls RPM/TPM limit (shared token bucket per provider and model)
+
+        :param context: Bridge context
+        """
+        config = self.window.core.config
+        rpm = 60
+        if config.has("max_requests_limit"):
+            rpm = int(config.get("max_requests_limit") or 0)  # per minute
+        tpm = int(config.get("max_requests_limit.tpm") or 0)  # per minute
+        if rpm <= 0 and tpm <= 0:
             return
-        interval = timedelta(minutes=1) / max_per_minute
-        now = datetime.now()
-        if self.last_call is not None:
-            time_since_last_call = now - self.last_call
-            if time_since_last_call < interval:
-                sleep_time = (interval - time_since_last_call).total_seconds()
-                self.window.core.debug.debug("RPM limit: sleep for {} seconds".format(sleep_time))
-                time.sleep(sleep_time)
-        self.last_call = now
+        burst = int(config.get("max_requests_limit.burst") or 1)
+        tokens = 0
+        if tpm > 0 and context is not None:
+            texts = [context.system_prompt, context.prompt]
+            for item in context.history or []:
+                texts.append(item.final_input)
+                texts.append(item.final_output)
+            tokens = self.window.core.limiter.estimate_tokens(*texts)
+        self.window.core.limiter.wait(
+            key=self.get_limit_key(context),
+            tokens=tokens,
+            rpm=rpm,
+            tpm=tpm,
+            burst=burst,
+            stopped=self.window.controller.kernel.stopped,
+            log=self.window.core.debug.debug,
+        )
+
+    def get_limit_key(self, context: Optional[BridgeContext] = None) -> str:
+        """
+        Get rate limiter key for context
+
+        :param context: Bridge context
+        :return: limiter key
+        """
+        model = context.model if context is not None else None
+        if model is None:
+            return self.window.core.limiter.get_key(None)
+        return self.window.core.limiter.get_key(model.provider, model.id)
+
+    def report_error(
+            self,
+            context: Optional[BridgeContext],
+            error: Any
+    ):
+        """
+        Report provider error to rate limiter (429 / Retry-After)
+
+        :param context: Bridge context
+        :param error: exception
+        """
+        if isinstance(error, Exception):
+            self.window.core.limiter.handle_error(self.get_limit_key(context), error)
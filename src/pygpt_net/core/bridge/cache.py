@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.19 00:00:00                  #
+# ================================================== #
+
+import hashlib
+import json
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple
+
+from .context import BridgeContext
+
+
+class Cache:
+    def __init__(self, window=None):
+        """
+        Response cache for quick calls (opt-in)
+
+        Exact match on (model, mode, system prompt, prompt, params hash),
+        optional semantic match on prompt embeddings within the same
+        (model, mode, system prompt, params) group.
+
+        :param window: Window instance
+        """
+        self.window = window
+        self.items = OrderedDict()  # key -> entry (LRU order)
+        self.embeddings = OrderedDict()  # text hash -> embedding vector (LRU order)
+        self.embed_model = None
+        self.lock = threading.Lock()
+        self.stats = {
+            "hits": 0,
+            "semantic_hits": 0,
+            "misses": 0,
+            "bypass": 0,
+            "stored": 0,
+            "evicted": 0,
+            "expired": 0,
+        }
+
+    def is_enabled(self) -> bool:
+        """
+        Check if response cache is enabled
+
+        :return: True if enabled
+        """
+        return bool(self.window.core.config.get("bridge.cache", False))
+
+    def is_semantic(self) -> bool:
+        """
+        Check if semantic match is enabled
+
+        :return: True if enabled
+        """
+        return bool(self.window.core.config.get("bridge.cache.semantic", False))
+
+    def is_cacheable(self, context: BridgeContext) -> bool:
+        """
+        Check if quick call can be cached
+
+        :param context: Bridge context
+        :return: True if cacheable
+        """
+        if getattr(context, "cache_bypass", False):
+            return False
+        if getattr(context, "request", False):
+            return False  # full request updates ctx, not only output
+        if getattr(context, "attachments", None) or getattr(context, "external_functions", None):
+            return False  # tool calls and attachments are not stored
+        multimodal_ctx = getattr(context, "multimodal_ctx", None)
+        if multimodal_ctx is not None and getattr(multimodal_ctx, "is_audio_input", False):
+            return False
+        return True
+
+    def get_keys(
+            self,
+            context: BridgeContext,
+            extra: Optional[Dict[str, Any]] = None
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Get cache keys for quick call
+
+        :param context: Bridge context
+        :param extra: extra data
+        :return: (exact key, group key) or None if call is not cacheable
+        """
+        if not self.is_enabled():
+            return None
+        if not self.is_cacheable(context):
+            self.stats["bypass"] += 1
+            return None
+
+        model = getattr(context, "model", None)
+        history = []
+        for item in getattr(context, "history", None) or []:
+            history.append([
+                getattr(item, "final_input", None),
+                getattr(item, "final_output", None),
+            ])
+        params = {
+            "model": getattr(model, "id", None),
+            "mode": getattr(context, "mode", None),
+            "system_prompt": getattr(context, "system_prompt", ""),
+            "temperature": getattr(context, "temperature", None),
+            "max_tokens": getattr(context, "max_tokens", None),
+            "idx": getattr(context, "idx", None),
+            "history": history,
+            "extra": extra or {},
+        }
+        group = self.hash(params)
+        key = self.hash([group, getattr(context, "prompt", "")])
+        return key, group
+
+    def get(
+            self,
+            keys: Tuple[str, str],
+            context: BridgeContext
+    ) -> Optional[str]:
+        """
+        Get cached response
+
+        :param keys: (exact key, group key)
+        :param context: Bridge context
+        :return: cached output or None
+        """
+        key, group = keys
+        now = time.time()
+        with self.lock:
+            entry = self.items.get(key)
+            if entry is not None:
+                if entry["expires"] > now:
+                    self.items.move_to_end(key)
+                    self.stats["hits"] += 1
+                    self.window.core.debug.info("[bridge] Cache hit (exact)")
+                    return entry["output"]
+                del self.items[key]
+                self.stats["expired"] += 1
+
+        if self.is_semantic():
+            output = self.find_similar(group, context.prompt, now)
+            if output is not None:
+                with self.lock:
+                    self.stats["semantic_hits"] += 1
+                self.window.core.debug.info("[bridge] Cache hit (semantic)")
+                return output
+
+        with self.lock:
+            self.stats["misses"] += 1
+        return None
+
+    def set(
+            self,
+            keys: Tuple[str, str],
+            context: BridgeContext,
+            output: Optional[str]
+    ):
+        """
+        Store response in cache
+
+        :param keys: (exact key, group key)
+        :param context: Bridge context
+        :param output: response output
+        """
+        if not output:
+            return  # do not cache empty or failed responses
+        ttl = getattr(context, "cache_ttl", None)
+        if ttl is None:
+            ttl = int(self.window.core.config.get("bridge.cache.ttl", 3600) or 0)
+        if ttl <= 0:
+            return
+
+        embedding = None
+        if self.is_semantic():
+            embedding = self.embed(context.prompt)
+
+        key, group = keys
+        max_items = int(self.window.core.config.get("bridge.cache.max_items", 500) or 500)
+        with self.lock:
+            self.items[key] = {
+                "group": group,
+                "output": output,
+                "expires": time.time() + ttl,
+                "embedding": embedding,
+            }
+            self.items.move_to_end(key)
+            self.stats["stored"] += 1
+            while len(self.items) > max_items:
+                self.items.popitem(last=False)
+                self.stats["evicted"] += 1
+
+    def find_similar(
+            self,
+            group: str,
+            prompt: str,
+            now: float
+    ) -> Optional[str]:
+        """
+        Find semantically similar cached response in the same group
+
+        :param group: group key (model, mode, system prompt, params)
+        :param prompt: prompt
+        :param now: current timestamp
+        :return: cached output or None
+        """
+        with self.lock:
+            candidates = [
+                (key, entry) for key, entry in self.items.items()
+                if entry["group"] == group and entry["embedding"] is not None and entry["expires"] > now
+            ]
+        if not candidates:
+            return None
+
+        vector = self.embed(prompt)
+        if vector is None:
+            return None
+
+        threshold = float(self.window.core.config.get("bridge.cache.semantic.threshold", 0.95) or 0.95)
+        best_key = None
+        best_output = None
+        best_score = threshold
+        for key, entry in candidates:
+            score = self.cosine(vector, entry["embedding"])
+            if score >= best_score:
+                best_key = key
+                best_score = score
+                best_output = entry["output"]
+        if best_key is not None:
+            with self.lock:
+                if best_key in self.items:
+                    self.items.move_to_end(best_key)
+        return best_output
+
+    def embed(self, text: str) -> Optional[List[float]]:
+        """
+        Get prompt embedding (cached)
+
+        :param text: text to embed
+        :return: embedding vector or None
+        """
+        key = self.hash(text)
+        with self.lock:
+            vector = self.embeddings.get(key)
+            if vector is not None:
+                self.embeddings.move_to_end(key)
+                return vector
+        try:
+            if self.embed_model is None:
+                self.embed_model = self.window.core.idx.llm.get_embeddings_provider()
+            vector = self.embed_model.get_text_embedding(text)
+        except Exception as e:
+            self.window.core.debug.log(e)
+            return None
+
+        max_items = int(self.window.core.config.get("bridge.cache.max_items", 500) or 500)
+        with self.lock:
+            self.embeddings[key] = vector
+            while len(self.embeddings) > max_items:
+                self.embeddings.popitem(last=False)
+        return vector
+
+    def clear(self):
+        """Clear cache"""
+        with self.lock:
+            self.items.clear()
+            self.embeddings.clear()
+        self.embed_model = None  # reload on embeddings provider change
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache stats
+
+        :return: stats dict
+        """
+        with self.lock:
+            stats = dict(self.stats)
+            stats["items"] = len(self.items)
+            stats["embeddings"] = len(self.embeddings)
+        lookups = stats["hits"] + stats["semantic_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["hits"] + stats["semantic_hits"]) / lookups, 3) if lookups else 0.0
+        return stats
+
+    @staticmethod
+    def cosine(a: List[float], b: List[float]) -> float:
+        """
+        Cosine similarity
+
+        :param a: vector A
+        :param b: vector B
+        :return: similarity
+        """
+        if not a or not b or len(a) != len(b):
+            return 0.0
+        dot = sum(x * y for x, y in zip(a, b))
+        norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+        return dot / norm if norm else 0.0
+
+    @staticmethod
+    def hash(data: Any) -> str:
+        """
+        Hash data
+
+        :param data: JSON-serializable data
+        :return: hex digest
+        """
+        raw = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.04 00:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 import json
@@ -61,6 +61,8 @@ class BridgeContext:
     """
     assistant_id: str = "" # OpenAI Assistant ID
     attachments: dict = field(default_factory=dict) # id -> AttachmentItem
+    cache_bypass: bool = False  # bypass quick call response cache
+    cache_ttl: Optional[int] = None  # quick call response cache TTL (seconds), None = default
     ctx: Optional[CtxItem] = None # CtxItem instance
     external_functions: list = field(default_factory=list) # list of tools definitions
     file_ids: list = field(default_factory=list)  # list of uploaded file IDs
@@ -95,6 +97,8 @@ class BridgeContext:
         # Assign with defaults
         self.assistant_id = kwargs.get("assistant_id", "")
         self.attachments = dict(kwargs.get("attachments", []))
+        self.cache_bypass = kwargs.get("cache_bypass", False)
+        self.cache_ttl = kwargs.get("cache_ttl", None)
         self.ctx = kwargs.get("ctx", None)
         self.external_functions = list(kwargs.get("external_functions", []))
         self.file_ids = list(kwargs.get("file_ids", []))
@@ -135,6 +139,8 @@ class BridgeContext:
         data = {
             "assistant_id": self.assistant_id,
             "attachments": self.attachments,
+            "cache_bypass": self.cache_bypass,
+            "cache_ttl": self.cache_ttl,
             "ctx": self.ctx,
             "external_functions": self.external_functions,
             "file_ids": self.file_ids,
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.20 09:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import copy
@@ -110,7 +110,8 @@ class Command:
                 data[cmd_name] = data_cmd
 
         self.window.core.ctx.current_cmd_schema = data
-        return json.dumps(data)
+        # sorted keys keep the syntax byte-identical between turns (provider prompt caching)
+        return json.dumps(data, sort_keys=bool(self.window.core.config.get("prompt.cache", True)))
 
     def has_cmds(self, text: str) -> bool:
         """
@@ -402,7 +403,10 @@ class Command:
             func = self.as_native_functions(all=False, parent_id=parent_id)
         if func_user is None:
             func_user = []
-        return func + func_user
+        func = func + func_user
+        if self.window.core.config.get("prompt.cache", True):
+            func.sort(key=lambda f: str(f.get("name", "")))  # stable order for prompt caching
+        return func
 
     def as_native_functions(
             self,
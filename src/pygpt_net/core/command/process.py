@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+
+import codecs
+import os
+import queue
+import signal
+import subprocess
+import threading
+import time
+from collections import deque
+from typing import Optional, Callable, Union, List
+
+
+class OutputBuffer:
+    def __init__(self, limit: int = 0):
+        """
+        Bounded text buffer, keeps only head and tail of very large output
+
+        :param limit: max number of chars kept (half head, half tail), 0 = unlimited
+        """
+        self.limit = max(0, int(limit or 0))
+        self.head_limit = self.limit // 2
+        self.tail_limit = self.limit - self.head_limit
+        self.head = []
+        self.head_len = 0
+        self.tail = deque()
+        self.tail_len = 0
+        self.total = 0  # total number of chars written
+
+    def write(self, text: str):
+        """
+        Append text
+
+        :param text: text chunk
+        """
+        if not text:
+            return
+        self.total += len(text)
+        if self.limit == 0:
+            self.head.append(text)
+            self.head_len += len(text)
+            return
+        if self.head_len < self.head_limit:
+            part = text[:self.head_limit - self.head_len]
+            self.head.append(part)
+            self.head_len += len(part)
+            text = text[len(part):]
+            if not text:
+                return
+        self.tail.append(text)
+        self.tail_len += len(text)
+        while self.tail_len > self.tail_limit:
+            over = self.tail_len - self.tail_limit
+            first = self.tail[0]
+            if len(first) <= over:
+                self.tail.popleft()
+                self.tail_len -= len(first)
+            else:
+                self.tail[0] = first[over:]
+                self.tail_len -= over
+
+    @property
+    def truncated(self) -> int:
+        """
+        Number of dropped chars
+
+        :return: dropped chars
+        """
+        return self.total - self.head_len - self.tail_len
+
+    def get(self) -> str:
+        """
+        Get kept text (head + truncation marker + tail)
+
+        :return: text
+        """
+        head = "".join(self.head)
+        tail = "".join(self.tail)
+        if self.truncated > 0:
+            return "{}\n\n... [{} chars truncated] ...\n\n{}".format(head, self.truncated, tail)
+        return head + tail
+
+    def __len__(self) -> int:
+        """
+        Total number of written chars
+
+        :return: chars
+        """
+        return self.total
+
+
+class StreamProcess:
+
+    STDOUT = "stdout"
+    STDERR = "stderr"
+    READ_SIZE = 65536
+    FLUSH_INTERVAL = 0.05  # seconds, coalesce chunks before callback
+
+    def __init__(
+            self,
+            cmd: Union[str, List[str]],
+            on_output: Optional[Callable[[str, str], None]] = None,
+            timeout: float = 0,
+            max_output: int = 0,
+            keep: int = 0,
+            shell: bool = True,
+            cwd: Optional[str] = None,
+    ):
+        """
+        Subprocess with streamed stdout/stderr and time/size limits
+
+        :param cmd: command
+        :param on_output: callback(text, type) called with output chunks (type: stdout/stderr)
+        :param timeout: wall-clock limit in seconds, 0 = no limit
+        :param max_output: total output limit in bytes, 0 = no limit
+        :param keep: max number of chars kept per stream (head + tail), 0 = unlimited
+        :param shell: run in shell
+        :param cwd: working directory
+        """
+        self.cmd = cmd
+        self.on_output = on_output
+        self.timeout = max(0.0, float(timeout or 0))
+        self.max_output = max(0, int(max_output or 0))
+        self.shell = shell
+        self.cwd = cwd
+        self.stdout = OutputBuffer(keep)
+        self.stderr = OutputBuffer(keep)
+        self.returncode = None
+        self.timed_out = False
+        self.size_exceeded = False
+        self.size = 0  # total bytes read
+        self.process = None
+        self.queue = queue.Queue()
+
+    def run(self) -> "StreamProcess":
+        """
+        Run process and stream output until exit or limit
+
+        :return: self
+        """
+        kwargs = {}
+        if os.name == "nt":
+            kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+        else:
+            kwargs["start_new_session"] = True  # own process group, killed as a whole
+        self.process = subprocess.Popen(
+            self.cmd,
+            shell=self.shell,
+            cwd=self.cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            **kwargs
+        )
+        readers = [
+            threading.Thread(target=self._read, args=(self.process.stdout, self.STDOUT), daemon=True),
+            threading.Thread(target=self._read, args=(self.process.stderr, self.STDERR), daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
+
+        deadline = time.monotonic() + self.timeout if self.timeout else None
+        open_streams = len(readers)
+        while open_streams > 0:
+            wait = self.FLUSH_INTERVAL
+            if deadline is not None:
+                wait = min(wait, max(0.0, deadline - time.monotonic()))
+            open_streams -= self._drain(wait)
+            if deadline is not None and time.monotonic() >= deadline:
+                self.timed_out = True
+                break
+            if self.max_output and self.size > self.max_output:
+                self.size_exceeded = True
+                break
+
+        if self.timed_out or self.size_exceeded:
+            self.kill()
+        try:
+            self.returncode = self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.returncode = self.process.wait()
+        for reader in readers:
+            reader.join(timeout=1)  # child processes may still hold the pipes
+        self._drain(0)
+        return self
+
+    def kill(self):
+        """Terminate process with its children (SIGTERM, then SIGKILL after grace period)"""
+        if self.process is None or self.process.poll() is not None:
+            return
+        try:
+            if os.name == "nt":
+                subprocess.run(
+                    ["taskkill", "/F", "/T", "/PID", str(self.process.pid)],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+            else:
+                os.killpg(self.process.pid, signal.SIGTERM)
+                try:
+                    self.process.wait(timeout=2)
+                except subprocess.TimeoutExpired:
+                    os.killpg(self.process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError, OSError):
+            self.process.kill()
+
+    def get_status(self) -> Optional[str]:
+        """
+        Get limit status message
+
+        :return: message if process was killed, None otherwise
+        """
+        if self.timed_out:
+            return "Process killed: timeout after {} s".format(int(self.timeout))
+        if self.size_exceeded:
+            return "Process killed: output exceeded {} bytes".format(self.max_output)
+        return None
+
+    def _read(self, pipe, type: str):
+        """
+        Read pipe in chunks (reader thread)
+
+        :param pipe: pipe
+        :param type: stdout/stderr
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        try:
+            while True:
+                data = pipe.read1(self.READ_SIZE)
+                if not data:
+                    break
+                self.queue.put((type, len(data), decoder.decode(data)))
+            rest = decoder.decode(b"", final=True)
+            if rest:
+                self.queue.put((type, 0, rest))
+        except (OSError, ValueError):
+            pass
+        finally:
+            try:
+                pipe.close()
+            except Exception:
+                pass
+            self.queue.put((type, None, None))  # EOF
+
+    def _drain(self, wait: float) -> int:
+        """
+        Move queued chunks to buffers and callback
+
+        :param wait: max time to wait for first chunk
+        :return: number of closed streams
+        """
+        closed = 0
+        chunks = {self.STDOUT: [], self.STDERR: []}
+        try:
+            item = self.queue.get(timeout=wait) if wait > 0 else self.queue.get_nowait()
+            while True:
+                type, size, text = item
+                if size is None:
+                    closed += 1
+                else:
+                    self.size += size
+                    chunks[type].append(text)
+                item = self.queue.get_nowait()
+        except queue.Empty:
+            pass
+        for type, parts in chunks.items():
+            if not parts:
+                continue
+            text = "".join(parts)
+            buffer = self.stdout if type == self.STDOUT else self.stderr
+            buffer.write(text)
+            if self.on_output is not None and text:
+                self.on_output(text, type)
+        return closed
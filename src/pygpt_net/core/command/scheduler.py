@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Callable, List, Dict, Any
+
+
+class Scheduler:
+
+    def __init__(self, max_workers: int = 4):
+        """
+        Tool calls scheduler
+
+        Independent calls run concurrently (up to max_workers), calls marked as
+        side-effecting run alone, after all previous calls and before all next
+        calls. Results are returned in call order.
+
+        :param max_workers: max concurrent calls
+        """
+        self.max_workers = max(1, int(max_workers or 1))
+
+    @staticmethod
+    def get_stages(
+            calls: List[Dict[str, Any]],
+            side_effect: Optional[Callable[[Dict[str, Any]], bool]] = None
+    ) -> List[List[int]]:
+        """
+        Split calls into stages executed one after another
+
+        :param calls: calls list
+        :param side_effect: returns True if call changes state (ordering hint)
+        :return: list of stages (call indexes), calls in the same stage are independent
+        """
+        stages = []
+        current = []
+        for i, call in enumerate(calls):
+            if side_effect is not None and side_effect(call):
+                if current:
+                    stages.append(current)
+                    current = []
+                stages.append([i])
+            else:
+                current.append(i)
+        if current:
+            stages.append(current)
+        return stages
+
+    def run(
+            self,
+            calls: List[Dict[str, Any]],
+            handler: Callable[[Dict[str, Any]], Any],
+            side_effect: Optional[Callable[[Dict[str, Any]], bool]] = None,
+            stopped: Optional[Callable[[], bool]] = None
+    ) -> List[Any]:
+        """
+        Execute calls
+
+        :param calls: calls list
+        :param handler: call handler, returns call result
+        :param side_effect: returns True if call changes state (ordering hint)
+        :param stopped: returns True if execution is stopped (next stages are skipped)
+        :return: results in call order (None for skipped calls)
+        """
+        results = [None] * len(calls)
+        for stage in self.get_stages(calls, side_effect):
+            if stopped is not None and stopped():
+                break
+            if len(stage) == 1 or self.max_workers == 1:
+                for i in stage:
+                    if stopped is not None and stopped():
+                        break
+                    results[i] = handler(calls[i])
+                continue
+            with ThreadPoolExecutor(
+                    max_workers=min(self.max_workers, len(stage)),
+                    thread_name_prefix="tool_call",
+            ) as pool:
+                futures = [(i, pool.submit(handler, calls[i])) for i in stage]
+                for i, future in futures:
+                    results[i] = future.result()
+        return results
+
+
+def sort_results(
+        calls: List[Dict[str, Any]],
+        results: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Sort tool results in call order (results matched by command name, in order of occurrence)
+
+    :param calls: calls list
+    :param results: results list (with "request": {"cmd": ...})
+    :return: sorted results, unmatched results at the end
+    """
+    if not calls or len(results) < 2:
+        return results
+    positions = {}
+    for i, call in enumerate(calls):
+        positions.setdefault(call.get("cmd"), []).append(i)
+    used = {}
+    keyed = []
+    for n, result in enumerate(results):
+        cmd = None
+        if isinstance(result, dict) and isinstance(result.get("request"), dict):
+            cmd = result["request"].get("cmd")
+        idx = positions.get(cmd)
+        pos = len(calls)
+        if idx:
+            k = used.get(cmd, 0)
+            used[cmd] = k + 1
+            pos = idx[min(k, len(idx) - 1)]
+        keyed.append((pos, n, result))
+    keyed.sort(key=lambda x: (x[0], x[1]))
+    return [result for _, _, result in keyed]
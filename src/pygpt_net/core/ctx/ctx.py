@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.15 22:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 import copy
@@ -40,6 +40,8 @@ from pygpt_net.utils import trans
 from .idx import Idx
 from .container import Container
 from .output import Output
+from .prefetch import Prefetch
+from .summary import Summary
 
 
 class Ctx:
@@ -54,6 +56,9 @@ class Ctx:
         self.container = Container(window)  # context container
         self.output = Output(window)  # context render output
         self.idx = Idx(window)  # context indexing core
+        self.summary = Summary(window)  # rolling summary (compaction)
+        self.prefetch = Prefetch(window)  # background prefetch of next likely contexts
+        self.buffer = None  # run-scoped write buffer, attached by kernel
         self.meta = {}
         self.current = None
         self.last_item = None
@@ -410,7 +415,10 @@ class Ctx:
                         and self.window.core.models.has_model(self.mode, ctx.model):
                     self.model = ctx.model
 
-            self.set_items(self.load(id))
+            items = self.prefetch.take(id)
+            if items is None:
+                items = self.load(id)
+            self.set_items(items)
 
     def new(
             self,
@@ -518,6 +526,7 @@ class Ctx:
         else:
             meta = self.provider.get_meta_by_id(meta_id)
         if meta is not None:
+            self.prefetch.invalidate(meta.id)
             self.provider.append_item(meta, item)
 
     def update_item(self, item: CtxItem):
@@ -526,6 +535,9 @@ class Ctx:
 
         :param item: CtxItem to update
         """
+        self.prefetch.invalidate(item.meta_id)
+        if self.buffer is not None and self.buffer.update_item(item):
+            return  # written at step end
         self.provider.update_item(item)
 
     def update_indexed_ts_by_id(self, id: int, ts: int):
@@ -832,6 +844,7 @@ class Ctx:
 
         :param id: ctx id
         """
+        self.prefetch.invalidate(id)
         if id in self.meta:
             del self.meta[id]
             self.provider.remove(id)
@@ -860,6 +873,7 @@ class Ctx:
         :param meta_id: meta_id
         :param item_id: item_id
         """
+        self.prefetch.invalidate(meta_id)
         items = [item for item in self.get_items() if item.id < item_id]
         self.set_items(items)
         return self.provider.remove_items_from(meta_id, item_id)
@@ -867,6 +881,7 @@ class Ctx:
     def truncate(self):
         """Delete all ctx"""
         self.meta = {}
+        self.prefetch.invalidate()
         self.provider.truncate()
 
     def clear(self):
@@ -1000,6 +1015,7 @@ class Ctx:
         i = 0
         tokens = used_tokens
         context_tokens = 0
+        costs = []
         from_ctx = self.window.core.tokens.from_ctx
         for item in reversed(history_items):
             num = from_ctx(item, mode, model)
@@ -1008,8 +1024,19 @@ class Ctx:
                 break
             tokens = new_total
             context_tokens += num
+            costs.append(num)
             i += 1
 
+        skipped = len(history_items) - i
+        if skipped > 0 and i > 0 and self.window.core.prompt.prefix.is_history_aligned(model) is True:
+            # the same alignment as in get_history(), oldest items are dropped in steps
+            items = history_items[len(history_items) - i:]
+            aligned = self.window.core.prompt.prefix.align_history(items, skipped)
+            dropped = len(items) - len(aligned)
+            if dropped > 0:
+                context_tokens -= sum(costs[-dropped:])  # costs are in reversed order
+                i -= dropped
+
         return i, context_tokens
 
     def get_history(
@@ -1032,6 +1059,19 @@ class Ctx:
         :param ignore_first: ignore current item (provided by user)
         :return: ctx items list
         """
+        # long thread: summary + recent items
+        if self.window.core.config.get("ctx.summary", False) is True:
+            compacted = self.summary.compact(
+                history_items,
+                model,
+                mode,
+                used_tokens,
+                max_tokens,
+                ignore_first,
+            )
+            if compacted is not None:
+                return compacted
+
         items = []
         tokens = used_tokens
         is_first = True
@@ -1048,6 +1088,10 @@ class Ctx:
             items.append(item)
 
         items.reverse()
+        skipped = len(history_items) - (1 if ignore_first and history_items else 0) - len(items)
+        if skipped > 0 and self.window.core.prompt.prefix.is_history_aligned(model) is True:
+            # keep the oldest history item stable between turns (provider prefix caching)
+            items = self.window.core.prompt.prefix.align_history(items, skipped)
         return items
 
     def count_prompt_items(
@@ -1514,7 +1558,7 @@ class Ctx:
         :param id: ctx id
         :return: ctx items list
         """
-        items = self.provider.load(id)
+        items = self.provider.load(id, columns=["input", "output"])  # skip JSON columns
         data = []
         for item in items:
             data.append("Human: " + str(item.input) + "\n" + "Assistant: " + str(item.output) + "\n")
@@ -1563,6 +1607,8 @@ class Ctx:
 
         :param id: ctx id
         """
+        if self.buffer is not None and self.buffer.save(id):
+            return  # written at step end
         self.provider.save(id, self.meta[id], self.get_items())
 
     def store(self):
@@ -6,11 +6,11 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 08:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import time
-from typing import Optional
+from typing import Optional, List
 
 from pygpt_net.item.ctx import CtxMeta
 from pygpt_net.provider.core.ctx.base import BaseProvider
@@ -178,6 +178,46 @@ class Idx:
         self.get_provider().update_meta_indexes_by_id(id, meta)
         return True
 
+    def set_items_as_indexed(
+            self,
+            id: int,
+            idx: str,
+            doc_ids: List[str],
+            removed: Optional[List[str]] = None
+    ) -> bool:
+        """
+        Set ctx meta as indexed after item level indexing (records in index db are stored per item)
+
+        :param id: ctx meta ID
+        :param idx: index name
+        :param doc_ids: inserted document IDs
+        :param removed: removed (replaced) document IDs
+        :return: True if updated
+        """
+        meta = self.window.core.ctx.get_meta_by_id(id)
+        if meta is None:
+            return False
+
+        ts = int(time.time())
+        store = self.window.core.idx.get_current_store()
+
+        # update ctx meta indexed timestamp
+        self.get_provider().set_meta_indexed_by_id(id, ts)
+        self.window.core.ctx.update_indexed_ts_by_id(id, ts)
+
+        # update index data in ctx meta object
+        if removed and isinstance(meta.indexes, dict):
+            docs = meta.indexes.get(store, {}).get(idx)
+            if isinstance(docs, dict):
+                for doc_id in removed:
+                    docs.pop(doc_id, None)
+        for doc_id in doc_ids:
+            self.store_idx_data_in_meta(meta, store, idx, doc_id)
+
+        # update ctx meta indexes data in db (once per indexing)
+        self.get_provider().update_meta_indexes_by_id(id, meta)
+        return True
+
     def store_idx_data_in_meta(
             self,
             ctx: CtxMeta,
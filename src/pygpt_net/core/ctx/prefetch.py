@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+
+import threading
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any
+
+from pygpt_net.core.worker import Worker
+from pygpt_net.item.ctx import CtxItem, CtxMeta
+
+
+class Prefetch:
+
+    MAX_PINNED = 4  # max pinned contexts prefetched on single selection
+
+    def __init__(self, window=None):
+        """
+        Background prefetch of context items and render payloads
+
+        When context is selected, items of its neighbors on the list and of
+        pinned contexts are loaded and prepared for output in background, so
+        next selection is a cache hit and single payload push to the output.
+
+        :param window: Window instance
+        """
+        self.window = window
+        self.cache = OrderedDict()  # meta ID -> entry (LRU)
+        self.running = set()  # meta IDs with prefetch in progress
+        self.dropped = set()  # meta IDs selected or changed during prefetch (result is discarded)
+        self.selected = None  # entry used by last selection (payload not used yet)
+        self.lock = threading.Lock()
+        self.worker = None
+        self.hits = 0
+        self.misses = 0
+
+    def is_enabled(self) -> bool:
+        """
+        Check if prefetch is enabled
+
+        :return: True if enabled
+        """
+        return bool(self.window.core.config.get("ctx.prefetch", True)) and self.get_size() > 0
+
+    def get_size(self) -> int:
+        """
+        Get max number of prefetched contexts
+
+        :return: cache size
+        """
+        return max(0, int(self.window.core.config.get("ctx.prefetch.size", 6) or 0))
+
+    def get_signature(self) -> tuple:
+        """
+        Get render config signature (payload is not used if rendering options changed)
+
+        :return: signature
+        """
+        config = self.window.core.config
+        return (
+            config.get("lang"),
+            config.get("agent.output.render.all", False),
+            config.get("ctx.sources"),
+            config.get("ctx.reasoning.show_realtime", True),
+            config.get("render.plain"),
+        )
+
+    def get_ids(self, id: int) -> List[int]:
+        """
+        Get IDs of contexts likely selected next
+
+        :param id: selected context ID
+        :return: list of context IDs (most likely first)
+        """
+        ctx = self.window.core.ctx
+        ids = []
+        for next_id in (ctx.get_next(), ctx.get_prev()):
+            if next_id is not None and next_id != id and next_id not in ids:
+                ids.append(next_id)
+        pinned = 0
+        for meta_id, meta in list(ctx.meta.items()):
+            if pinned >= self.MAX_PINNED:
+                break
+            if meta.important and meta_id != id and meta_id not in ids:
+                ids.append(meta_id)
+                pinned += 1
+        return ids[:self.get_size()]
+
+    def schedule(self, id: int):
+        """
+        Start prefetch of contexts around selected one in background
+
+        :param id: selected context ID
+        """
+        if not self.is_enabled():
+            return
+        ids = []
+        with self.lock:
+            for meta_id in self.get_ids(id):
+                if meta_id in self.cache:
+                    self.cache.move_to_end(meta_id)
+                elif meta_id not in self.running:
+                    ids.append(meta_id)
+            self.running.update(ids)
+        if not ids:
+            return
+        renderer = self.window.controller.chat.render.instance()
+        signature = self.get_signature()
+        self.worker = Worker(self.prefetch, ids, renderer, signature)
+        self.window.threadpool.start(self.worker)
+
+    def prefetch(self, ids: List[int], renderer, signature: tuple):
+        """
+        Load items and build render payloads (worker callback)
+
+        :param ids: context IDs
+        :param renderer: current renderer
+        :param signature: render config signature
+        """
+        for id in ids:
+            try:
+                entry = self.build(id, renderer, signature)
+                if entry is not None:
+                    self.put(id, entry)
+            except Exception as e:
+                self.window.core.debug.log(e)
+            finally:
+                with self.lock:
+                    self.running.discard(id)
+                    self.dropped.discard(id)
+
+    def build(self, id: int, renderer, signature: tuple) -> Optional[Dict[str, Any]]:
+        """
+        Build cache entry
+
+        :param id: context ID
+        :param renderer: current renderer
+        :param signature: render config signature
+        :return: entry or None
+        """
+        meta = self.window.core.ctx.get_meta_by_id(id)
+        if meta is None:
+            return
+        updated = meta.updated
+        items = self.window.core.ctx.load(id)
+        payload = None
+        if renderer is not None:
+            payload = renderer.build_context_payload(meta, items)
+        return {
+            "id": id,
+            "items": items,
+            "count": len(items),
+            "payload": payload,
+            "updated": updated,
+            "signature": signature,
+        }
+
+    def put(self, id: int, entry: Dict[str, Any]):
+        """
+        Store entry in cache (oldest entries are evicted)
+
+        :param id: context ID
+        :param entry: cache entry
+        """
+        with self.lock:
+            if id in self.dropped or id == self.window.core.ctx.get_current():
+                return  # selected or changed in the meantime
+            self.cache[id] = entry
+            self.cache.move_to_end(id)
+            while len(self.cache) > self.get_size():
+                self.cache.popitem(last=False)
+
+    def take(self, id: int) -> Optional[List[CtxItem]]:
+        """
+        Get prefetched items of selected context (entry is removed from cache)
+
+        :param id: context ID
+        :return: context items or None if not prefetched
+        """
+        with self.lock:
+            entry = self.cache.pop(id, None)
+            if id in self.running:
+                self.dropped.add(id)
+        self.selected = None
+        meta = self.window.core.ctx.get_meta_by_id(id)
+        if entry is None or meta is None or entry["updated"] != meta.updated:
+            self.misses += 1
+            return
+        self.hits += 1
+        self.selected = entry
+        return entry["items"]
+
+    def get_payload(self, meta: CtxMeta, items: List[CtxItem]) -> Optional[str]:
+        """
+        Get prefetched render payload of selected context (used once)
+
+        :param meta: context meta
+        :param items: current context items
+        :return: JSON payload or None
+        """
+        entry = self.selected
+        self.selected = None
+        if entry is None or meta is None or entry["id"] != meta.id:
+            return
+        if entry["items"] is not items or entry["count"] != len(items):
+            return  # items changed after selection
+        if entry["signature"] != self.get_signature():
+            return
+        return entry["payload"]
+
+    def invalidate(self, id: Optional[int] = None):
+        """
+        Remove prefetched context (all if ID is not given)
+
+        :param id: context ID
+        """
+        with self.lock:
+            if id is None:
+                self.cache.clear()
+                self.dropped.update(self.running)
+            else:
+                self.cache.pop(id, None)
+                if id in self.running:
+                    self.dropped.add(id)
+        if self.selected is not None and (id is None or self.selected["id"] == id):
+            self.selected = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get prefetch stats
+
+        :return: stats dict
+        """
+        with self.lock:
+            cached = list(self.cache.keys())
+            running = len(self.running)
+        total = self.hits + self.misses
+        return {
+            "cached": cached,
+            "running": running,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else None,
+        }
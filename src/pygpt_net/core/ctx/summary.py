@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.19 00:00:00                  #
+# ================================================== #
+
+
+import threading
+import time
+from typing import Optional, List, Dict, Any
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+from pygpt_net.core.bridge.context import BridgeContext
+from pygpt_net.core.types import MODE_CHAT
+from pygpt_net.core.worker import Worker
+from pygpt_net.item.ctx import CtxItem, CtxMeta
+
+
+class SummarySignals(QObject):
+    updated = Signal(object, object, str)  # meta, folded items, summary
+
+
+class Summary:
+
+    MAX_FOLD_CHARS = 24000  # max history chars sent in one summary update
+    MAX_ITEM_CHARS = 4000  # max chars of single input / output in summary update
+
+    def __init__(self, window=None):
+        """
+        Rolling summary of long threads (context compaction)
+
+        When thread history exceeds the threshold, older items are folded into
+        a summary stored in CtxMeta, in background and with cheap model. The
+        summary is updated incrementally and the prompt gets: summary + recent items.
+
+        :param window: Window instance
+        """
+        self.window = window
+        self.running = set()  # meta IDs with summary update in progress
+        self.turns = {}  # meta ID -> last counted turn (for savings stats)
+        self.lock = threading.Lock()
+        self.worker = None
+        self.signals = SummarySignals()
+        self.signals.updated.connect(self.handle_update)
+
+    def get_threshold(self) -> int:
+        """
+        Get compaction threshold
+
+        :return: percentage of max prompt tokens
+        """
+        return min(100, max(1, int(self.window.core.config.get("ctx.summary.threshold", 50) or 50)))
+
+    def get_keep(self) -> int:
+        """
+        Get number of recent items never folded into summary
+
+        :return: number of items
+        """
+        return max(1, int(self.window.core.config.get("ctx.summary.keep", 6) or 6))
+
+    def compact(
+            self,
+            history_items: List[CtxItem],
+            model: str,
+            mode: str = MODE_CHAT,
+            used_tokens: int = 100,
+            max_tokens: int = 1000,
+            ignore_first: bool = True
+    ) -> Optional[List[CtxItem]]:
+        """
+        Return summary + recent items if history exceeds threshold
+
+        :param history_items: history items list
+        :param model: model
+        :param mode: mode
+        :param used_tokens: used tokens
+        :param max_tokens: max tokens
+        :param ignore_first: ignore current item (provided by user)
+        :return: ctx items list or None to use regular history
+        """
+        items = list(history_items[:-1] if ignore_first else history_items)
+        if not items:
+            return None
+        meta = self.get_meta(items)
+        if meta is None:
+            return None
+
+        limit = max_tokens
+        if limit <= 0:
+            limit = self.window.core.models.get_num_ctx(model)
+        from_ctx = self.window.core.tokens.from_ctx
+        costs = [from_ctx(item, mode, model) for item in items]
+        if used_tokens + sum(costs) <= limit * self.get_threshold() / 100:
+            return None
+
+        with self.lock:
+            summary = dict(meta.summary or {})
+        start = self.find_start(items, summary.get("until"))
+        pending = items[start:]
+        keep = self.get_keep()
+        if len(pending) >= keep * 2:
+            self.schedule(meta, pending[:-keep], summary.get("text", ""))
+
+        text = summary.get("text")
+        if not text:
+            return None  # no summary yet, drop oldest items until summary is ready
+
+        summary_item = self.build_item(meta, text)
+        tokens = used_tokens + from_ctx(summary_item, mode, model)
+        recent = []
+        for item, cost in zip(reversed(pending), reversed(costs[start:])):
+            if 0 < max_tokens < tokens + cost:
+                break
+            tokens += cost
+            recent.append(item)
+        recent.reverse()
+
+        # regular history (without summary), for savings stats
+        regular = used_tokens
+        for cost in reversed(costs):
+            if 0 < max_tokens < regular + cost:
+                break
+            regular += cost
+        self.add_stats(meta, regular - tokens, (len(history_items), id(history_items[-1])))
+        return [summary_item] + recent
+
+    def get_meta(self, items: List[CtxItem]) -> Optional[CtxMeta]:
+        """
+        Get ctx meta of history items
+
+        :param items: history items
+        :return: CtxMeta or None
+        """
+        meta_id = items[-1].meta_id
+        if meta_id is None:
+            return None
+        meta = self.window.core.ctx.get_meta_by_id(meta_id)
+        if meta is None:
+            meta = self.window.core.ctx.meta.get(meta_id)  # loaded as tmp meta
+        if meta is None or meta.id is None:
+            return None
+        return meta
+
+    def find_start(self, items: List[CtxItem], until: Optional[int]) -> int:
+        """
+        Find first item not folded into summary yet
+
+        :param items: history items
+        :param until: ID of last item folded into summary
+        :return: item index
+        """
+        if until is None:
+            return 0
+        for i, item in enumerate(items):
+            if item.id is None or item.id > until:
+                return i
+        return len(items)
+
+    def build_item(self, meta: CtxMeta, text: str) -> CtxItem:
+        """
+        Build history item with summary
+
+        :param meta: CtxMeta
+        :param text: summary text
+        :return: CtxItem
+        """
+        item = CtxItem()
+        item.meta_id = meta.id
+        item.internal = True
+        item.input = self.get_prompt("ctx.summary.input")
+        item.output = text
+        item.extra = {
+            "summary": True,
+            "agent_input": True,
+            "agent_output": True,
+        }
+        return item
+
+    def get_prompt(self, key: str) -> str:
+        """
+        Get summary prompt (with fallback to base config)
+
+        :param key: prompt key
+        :return: prompt
+        """
+        prompt = self.window.core.prompt.get(key)
+        if not prompt:
+            prompt = self.window.core.config.get_base("prompt." + key) or ""
+        return prompt
+
+    def schedule(self, meta: CtxMeta, items: List[CtxItem], text: str):
+        """
+        Start summary update in background (one per thread)
+
+        :param meta: CtxMeta
+        :param items: items to fold into summary
+        :param text: current summary
+        """
+        batch = []
+        chars = 0
+        for item in items:
+            if item.id is None:
+                break
+            chars += len(self.format_item(item))
+            if batch and chars > self.MAX_FOLD_CHARS:
+                break  # rest is folded in next update
+            batch.append(item)
+        if not batch:
+            return
+        with self.lock:
+            if meta.id in self.running:
+                return
+            self.running.add(meta.id)
+
+        self.worker = Worker(self.update, meta, batch, text)
+        self.window.threadpool.start(self.worker)
+
+    def update(self, meta: CtxMeta, items: List[CtxItem], text: str) -> bool:
+        """
+        Fold items into summary (worker callback), result is stored in main thread
+
+        :param meta: CtxMeta
+        :param items: items to fold
+        :param text: current summary
+        :return: True if summary was generated
+        """
+        summary = None
+        try:
+            summary = self.summarize(text, items)
+        except Exception as e:
+            self.window.core.debug.log(e)
+        if not summary:
+            with self.lock:
+                self.running.discard(meta.id)
+            return False
+        self.signals.updated.emit(meta, items, summary)
+        return True
+
+    @Slot(object, object, str)
+    def handle_update(self, meta: CtxMeta, items: List[CtxItem], summary: str):
+        """
+        Store updated summary with compaction stats
+
+        :param meta: CtxMeta
+        :param items: folded items
+        :param summary: updated summary
+        """
+        try:
+            with self.lock:
+                data = meta.summary if isinstance(meta.summary, dict) else {}
+                data["text"] = summary
+                data["until"] = items[-1].id
+                data["folded"] = data.get("folded", 0) + len(items)
+                data["updated"] = int(time.time())
+                meta.summary = data
+            self.window.core.ctx.get_provider().update_meta_summary_by_id(meta.id, meta)
+            self.window.core.debug.info(
+                "[ctx] Summary updated: ctx={}, folded={}, until={}".format(meta.id, data["folded"], data["until"])
+            )
+        except Exception as e:
+            self.window.core.debug.log(e)
+        finally:
+            with self.lock:
+                self.running.discard(meta.id)
+
+    def summarize(self, text: str, items: List[CtxItem]) -> str:
+        """
+        Update summary with new items (quick call)
+
+        :param text: current summary
+        :param items: items to fold
+        :return: updated summary
+        """
+        history = "\n\n".join(self.format_item(item) for item in items)
+        prompt = (self.get_prompt("ctx.summary.user").
+                  replace("{summary}", text or "-").
+                  replace("{history}", history))
+
+        model = self.window.core.models.from_defaults()
+        tmp_model = self.window.core.config.get("ctx.summary.model")
+        if tmp_model and self.window.core.models.has(tmp_model):
+            model = self.window.core.models.get(tmp_model)
+
+        bridge_context = BridgeContext(
+            ctx=CtxItem(),
+            prompt=prompt,
+            system_prompt=self.get_prompt("ctx.summary.system"),
+            model=model,
+            max_tokens=1500,
+            temperature=0.0,
+            force=True,  # even if kernel stopped!
+            cache_ttl=86400,  # same history gives the same summary
+        )
+        response = self.window.core.bridge.call(
+            context=bridge_context,
+            extra={"disable_tools": True},
+        )  # called directly, events are not dispatched from worker thread
+        return str(response).strip() if response else ""
+
+    def format_item(self, item: CtxItem) -> str:
+        """
+        Format item for summary update
+
+        :param item: CtxItem
+        :return: formatted messages
+        """
+        parts = []
+        for name, value in (("User", item.final_input), ("Assistant", item.final_output)):
+            if value:
+                value = str(value)
+                if len(value) > self.MAX_ITEM_CHARS:
+                    value = value[:self.MAX_ITEM_CHARS] + "..."
+                parts.append("{}: {}".format(name, value))
+        return "\n".join(parts)
+
+    def add_stats(self, meta: CtxMeta, saved: int, turn: Any = None):
+        """
+        Add prompt tokens saved by compaction to thread stats
+
+        Stats are kept in meta and stored with the next summary update.
+        History may be built more than once per turn, the turn is counted once.
+
+        :param meta: CtxMeta
+        :param saved: prompt tokens saved (regular history - compacted history)
+        :param turn: turn key
+        """
+        with self.lock:
+            data = meta.summary if isinstance(meta.summary, dict) else {}
+            if turn is not None and self.turns.get(meta.id) == turn:
+                data["saved"] = data.get("saved", 0) - data.get("last_saved", 0) + saved
+            else:
+                data["saved"] = data.get("saved", 0) + saved
+                data["prompts"] = data.get("prompts", 0) + 1
+                self.turns[meta.id] = turn
+            data["last_saved"] = saved
+            meta.summary = data
+
+    def get_stats(self, meta: CtxMeta) -> Dict[str, Any]:
+        """
+        Get compaction stats of thread
+
+        :param meta: CtxMeta
+        :return: dict with folded items, compacted prompts and saved prompt tokens
+        """
+        data = meta.summary if isinstance(meta.summary, dict) else {}
+        return {
+            "folded": data.get("folded", 0),
+            "prompts": data.get("prompts", 0),
+            "saved": data.get("saved", 0),
+            "last_saved": data.get("last_saved", 0),
+        }
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.22 16:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import os
@@ -17,6 +17,7 @@ from typing import Optional, Any, Dict
 from sqlalchemy import create_engine, text
 
 from pygpt_net.migrations import Migrations
+from .transfer import Transfer
 from .viewer import Viewer
 
 
@@ -317,6 +318,7 @@ class Database:
         }
         self.migrations = Migrations()
         self.viewer = Viewer(self)
+        self.transfer = Transfer(self)
 
     def init(self, force: bool = False):
         """
@@ -0,0 +1,570 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.19 00:00:00                  #
+# ================================================== #
+
+import gzip
+import io
+import json
+import os
+import time
+from typing import Optional, List, Dict, Any, Callable, Iterator, IO
+
+from sqlalchemy import text
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+MAGIC_ZSTD = b"\x28\xb5\x2f\xfd"
+MAGIC_GZIP = b"\x1f\x8b"
+
+
+class Transfer:
+    FORMAT = "pygpt-ctx"
+    VERSION = 1
+
+    def __init__(self, database):
+        """
+        Streaming export / import of contexts (archive)
+
+        Archive is a JSON-lines stream written in independently compressed chunks
+        (zstd frames or gzip members): header, groups, then every ctx meta followed
+        by its items and index records, and the end record. Memory usage does not
+        depend on the history size.
+
+        :param database: Database instance
+        """
+        self.database = database
+        self.chunk_size = 1024 * 1024  # bytes of JSON-lines per compressed chunk
+        self.batch_size = 1000  # rows per import transaction
+        self.page_size = 500  # ctx metas fetched per query on export
+
+    def get_compression(self, compression: Optional[str] = None) -> str:
+        """
+        Get compression method
+
+        :param compression: zstd, gzip, none or None (zstd if available, gzip otherwise)
+        :return: compression method
+        """
+        if compression is None:
+            return "zstd" if zstandard is not None else "gzip"
+        if compression == "zstd" and zstandard is None:
+            raise ImportError("zstandard package is required for zstd compression")
+        if compression not in ("zstd", "gzip", "none"):
+            raise ValueError("Unknown compression: {}".format(compression))
+        return compression
+
+    def export_ctx(
+            self,
+            path: str,
+            date_from: Optional[int] = None,
+            date_to: Optional[int] = None,
+            group_ids: Optional[List[int]] = None,
+            compression: Optional[str] = None,
+            resume: bool = True,
+            callback: Optional[Callable[[Dict[str, int]], None]] = None,
+    ) -> Dict[str, int]:
+        """
+        Export contexts to archive
+
+        Progress is stored in <path>.state after every chunk, interrupted export
+        is continued from the last completed ctx meta if called again with the same arguments.
+
+        :param path: archive path
+        :param date_from: export only contexts updated since timestamp
+        :param date_to: export only contexts updated until timestamp
+        :param group_ids: export only contexts in these groups
+        :param compression: zstd, gzip, none or None (auto)
+        :param resume: continue interrupted export
+        :param callback: progress callback, receives stats
+        :return: stats (groups, metas, items, idx)
+        """
+        filters = {
+            "date_from": date_from,
+            "date_to": date_to,
+            "group_ids": sorted(int(i) for i in group_ids) if group_ids else None,
+        }
+        state_path = path + ".state"
+        state = self.load_state(state_path) if resume else None
+        if state is not None and (
+                state.get("filters") != filters
+                or (compression is not None and state.get("compression") != compression)
+                or not os.path.exists(path)
+        ):
+            state = None  # different export, start from scratch
+
+        if state is None:
+            state = {
+                "filters": filters,
+                "compression": self.get_compression(compression),
+                "last_meta_id": 0,
+                "offset": 0,
+                "stats": {"groups": 0, "metas": 0, "items": 0, "idx": 0},
+            }
+        stats = state["stats"]
+        writer = ChunkWriter(path, state["compression"], state["offset"])
+        db = self.database.get_db()
+        try:
+            with db.connect() as conn:
+                if state["offset"] == 0:
+                    writer.add({
+                        "type": "header",
+                        "format": self.FORMAT,
+                        "version": self.VERSION,
+                        "db_version": self.database.get_version(),
+                        "created_ts": int(time.time()),
+                        "filters": filters,
+                    })
+                    for row in self.fetch_groups(conn, filters["group_ids"]):
+                        writer.add({"type": "ctx_group", "row": row})
+                        stats["groups"] += 1
+                    self.commit_chunk(writer, state, state_path, callback)
+
+                while True:
+                    metas = self.fetch_metas(conn, state["last_meta_id"], filters)
+                    if not metas:
+                        break
+                    for meta in metas:
+                        writer.add({"type": "ctx_meta", "row": meta})
+                        for row in self.iter_rows(conn, "ctx_item", meta["id"]):
+                            writer.add({"type": "ctx_item", "row": row})
+                            stats["items"] += 1
+                            if writer.size() >= self.chunk_size * 4:
+                                writer.flush()  # large meta, progress is stored after whole meta only
+                        for row in self.iter_rows(conn, "idx_ctx", meta["id"]):
+                            writer.add({"type": "idx_ctx", "row": row})
+                            stats["idx"] += 1
+                        stats["metas"] += 1
+                        state["last_meta_id"] = meta["id"]
+                        if writer.size() >= self.chunk_size:
+                            self.commit_chunk(writer, state, state_path, callback)
+
+                writer.add({"type": "end", "stats": stats})
+                writer.flush()
+        finally:
+            writer.close()
+        if os.path.exists(state_path):
+            os.remove(state_path)
+        if callback is not None:
+            callback(stats)
+        print("[DB] Exported contexts to: {} ({})".format(path, stats))
+        return stats
+
+    def import_ctx(
+            self,
+            path: str,
+            callback: Optional[Callable[[Dict[str, int]], None]] = None,
+    ) -> Dict[str, int]:
+        """
+        Import contexts from archive
+
+        Rows are inserted in batches (one transaction per batch), new IDs are assigned.
+        Contexts and groups with UUID already present in database are skipped, so
+        interrupted import is continued by importing the same archive again.
+        Root and parent IDs are remapped in every batch, also for skipped contexts.
+
+        :param path: archive path
+        :param callback: progress callback, receives stats
+        :return: stats (groups, metas, items, idx, skipped)
+        """
+        stats = {"groups": 0, "metas": 0, "items": 0, "idx": 0, "skipped": 0}
+        db = self.database.get_db()
+        with db.connect() as conn:
+            columns = {
+                table: self.get_columns(conn, table)
+                for table in ("ctx_group", "ctx_meta", "ctx_item", "idx_ctx")
+            }
+            group_ids = {}  # uuid -> id
+            for row in conn.execute(text("SELECT id, uuid FROM ctx_group")):
+                if row.uuid:
+                    group_ids[row.uuid] = row.id
+            meta_ids = {}  # uuid -> id
+            for row in conn.execute(text("SELECT id, uuid FROM ctx_meta")):
+                if row.uuid:
+                    meta_ids[row.uuid] = row.id
+            group_map = {}  # old id -> new id
+            meta_map = {}  # old id -> new id
+            item_map = {}  # old id -> new id, current meta only
+            parents = []  # (new id, old root_id, old parent_id), not remapped yet
+            items = []
+            idx = []
+            meta_id = None
+            skip = False
+            next_item_id = None
+            pending = 0
+            complete = False
+
+            def flush():
+                if items:
+                    self.insert_rows(conn, "ctx_item", columns["ctx_item"], items)
+                    items.clear()
+                if idx:
+                    self.insert_rows(conn, "idx_ctx", columns["idx_ctx"], idx)
+                    idx.clear()
+
+            for i, record in enumerate(read_archive(path)):
+                kind = record.get("type")
+                if i == 0:
+                    if kind != "header" or record.get("format") != self.FORMAT:
+                        raise ValueError("Not a context archive: {}".format(path))
+                    if int(record.get("version", 0)) > self.VERSION:
+                        raise ValueError("Unsupported archive version: {}".format(record.get("version")))
+                    continue
+                row = record.get("row") or {}
+                if kind == "ctx_group":
+                    uuid = row.get("uuid")
+                    if uuid and uuid in group_ids:
+                        group_map[row.get("id")] = group_ids[uuid]
+                        continue
+                    new_id = self.insert_row(conn, "ctx_group", columns["ctx_group"], row)
+                    group_map[row.get("id")] = new_id
+                    if uuid:
+                        group_ids[uuid] = new_id
+                    stats["groups"] += 1
+                elif kind == "ctx_meta":
+                    flush()
+                    if pending >= self.batch_size:
+                        parents = self.update_parents(conn, parents, meta_map)
+                        conn.commit()  # next statement begins new transaction
+                        pending = 0
+                        next_item_id = None
+                        if callback is not None:
+                            callback(stats)
+                    item_map.clear()
+                    uuid = row.get("uuid")
+                    old_id = row.get("id")
+                    skip = bool(uuid) and uuid in meta_ids
+                    if skip:
+                        meta_map[old_id] = meta_ids[uuid]
+                        if row.get("root_id") or row.get("parent_id"):  # may be left unmapped by interrupted import
+                            parents.append((meta_ids[uuid], row.get("root_id"), row.get("parent_id")))
+                        stats["skipped"] += 1
+                        meta_id = None
+                        continue
+                    row = dict(row)
+                    row["group_id"] = group_map.get(row.get("group_id"), 0) if row.get("group_id") else 0
+                    meta_id = self.insert_row(conn, "ctx_meta", columns["ctx_meta"], row)
+                    meta_map[old_id] = meta_id
+                    if uuid:
+                        meta_ids[uuid] = meta_id
+                    if row.get("root_id") or row.get("parent_id"):
+                        parents.append((meta_id, row.get("root_id"), row.get("parent_id")))
+                    stats["metas"] += 1
+                    pending += 1
+                elif kind == "ctx_item":
+                    if skip or meta_id is None:
+                        continue
+                    if next_item_id is None:  # write lock is held after meta insert
+                        next_item_id = conn.execute(
+                            text("SELECT COALESCE(MAX(id), 0) + 1 FROM ctx_item")
+                        ).scalar()
+                    row = dict(row)
+                    item_map[row.get("id")] = next_item_id
+                    row["id"] = next_item_id
+                    row["meta_id"] = meta_id
+                    next_item_id += 1
+                    items.append(row)
+                    stats["items"] += 1
+                    pending += 1
+                    if len(items) >= self.batch_size:
+                        flush()
+                elif kind == "idx_ctx":
+                    if skip or meta_id is None:
+                        continue
+                    row = dict(row)
+                    row.pop("id", None)
+                    row["meta_id"] = meta_id
+                    if row.get("item_id"):
+                        row["item_id"] = item_map.get(row["item_id"], 0)
+                    idx.append(row)
+                    stats["idx"] += 1
+                    pending += 1
+                elif kind == "end":
+                    complete = True
+            flush()
+            self.update_parents(conn, parents, meta_map, final=True)
+            conn.commit()
+        if not complete:
+            print("[DB] Archive is incomplete (no end record): {}".format(path))
+        if callback is not None:
+            callback(stats)
+        print("[DB] Imported contexts from: {} ({})".format(path, stats))
+        return stats
+
+    def fetch_groups(self, conn, group_ids: Optional[List[int]] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch ctx groups
+
+        :param conn: database connection
+        :param group_ids: only these groups
+        :return: list of rows
+        """
+        sql = "SELECT * FROM ctx_group"
+        if group_ids:
+            sql += " WHERE id IN ({})".format(", ".join(str(int(i)) for i in group_ids))
+        return [row._asdict() for row in conn.execute(text(sql + " ORDER BY id ASC"))]
+
+    def fetch_metas(self, conn, last_id: int, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Fetch next page of ctx metas (keyset pagination)
+
+        :param conn: database connection
+        :param last_id: last exported meta ID
+        :param filters: filters (date_from, date_to, group_ids)
+        :return: list of rows
+        """
+        where = ["id > :last_id"]
+        params = {"last_id": int(last_id), "limit": self.page_size}
+        if filters.get("date_from") is not None:
+            where.append("updated_ts >= :date_from")
+            params["date_from"] = int(filters["date_from"])
+        if filters.get("date_to") is not None:
+            where.append("updated_ts <= :date_to")
+            params["date_to"] = int(filters["date_to"])
+        if filters.get("group_ids"):
+            where.append("group_id IN ({})".format(", ".join(str(int(i)) for i in filters["group_ids"])))
+        stmt = text("SELECT * FROM ctx_meta WHERE {} ORDER BY id ASC LIMIT :limit".format(
+            " AND ".join(where)
+        )).bindparams(**params)
+        return [row._asdict() for row in conn.execute(stmt)]
+
+    def iter_rows(self, conn, table: str, meta_id: int) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate rows of ctx meta (ctx_item or idx_ctx)
+
+        :param conn: database connection
+        :param table: table name
+        :param meta_id: ctx meta ID
+        :return: rows iterator
+        """
+        stmt = text("SELECT * FROM {} WHERE meta_id = :meta_id ORDER BY id ASC".format(table)).bindparams(
+            meta_id=meta_id
+        )
+        for row in conn.execute(stmt):
+            yield row._asdict()
+
+    def get_columns(self, conn, table: str) -> List[str]:
+        """
+        Get table columns in current database
+
+        :param conn: database connection
+        :param table: table name
+        :return: column names
+        """
+        return [row[1] for row in conn.execute(text("PRAGMA table_info({})".format(table)))]
+
+    def insert_row(self, conn, table: str, columns: List[str], row: Dict[str, Any]) -> int:
+        """
+        Insert single row with new ID
+
+        :param conn: database connection
+        :param table: table name
+        :param columns: table columns
+        :param row: row data (columns missing in table are ignored)
+        :return: new row ID
+        """
+        keys = [k for k in row if k in columns and k != "id"]
+        stmt = text("INSERT INTO {} ({}) VALUES ({})".format(
+            table,
+            ", ".join(keys),
+            ", ".join(":" + k for k in keys),
+        ))
+        result = conn.execute(stmt, {k: row[k] for k in keys})
+        return result.lastrowid
+
+    def insert_rows(self, conn, table: str, columns: List[str], rows: List[Dict[str, Any]]):
+        """
+        Insert rows in batch (executemany)
+
+        :param conn: database connection
+        :param table: table name
+        :param columns: table columns
+        :param rows: rows data with the same keys
+        """
+        keys = [k for k in rows[0] if k in columns]
+        stmt = text("INSERT INTO {} ({}) VALUES ({})".format(
+            table,
+            ", ".join(keys),
+            ", ".join(":" + k for k in keys),
+        ))
+        conn.execute(stmt, [{k: row.get(k) for k in keys} for row in rows])
+
+    def update_parents(
+            self,
+            conn,
+            parents: list,
+            meta_map: Dict[int, int],
+            final: bool = False,
+    ) -> list:
+        """
+        Remap root_id and parent_id of imported metas to new IDs
+
+        :param conn: database connection
+        :param parents: list of (new id, old root_id, old parent_id)
+        :param meta_map: old meta ID -> new meta ID
+        :param final: remap all, parents not found in archive are set to 0
+        :return: list of metas with parents not imported yet (later in archive)
+        """
+        ready = []
+        pending = []
+        for entry in parents:
+            _, root_id, parent_id = entry
+            if final or all(not old_id or old_id in meta_map for old_id in (root_id, parent_id)):
+                ready.append(entry)
+            else:
+                pending.append(entry)
+        if ready:
+            stmt = text("UPDATE ctx_meta SET root_id = :root_id, parent_id = :parent_id WHERE id = :id")
+            conn.execute(stmt, [{
+                "id": id,
+                "root_id": meta_map.get(root_id, 0) if root_id else root_id,
+                "parent_id": meta_map.get(parent_id, 0) if parent_id else parent_id,
+            } for id, root_id, parent_id in ready])
+        return pending
+
+    def commit_chunk(
+            self,
+            writer: "ChunkWriter",
+            state: Dict[str, Any],
+            state_path: str,
+            callback: Optional[Callable[[Dict[str, int]], None]] = None,
+    ):
+        """
+        Write pending chunk and store export progress
+
+        :param writer: chunk writer
+        :param state: export state
+        :param state_path: state file path
+        :param callback: progress callback
+        """
+        state["offset"] = writer.flush()
+        self.save_state(state_path, state)
+        if callback is not None:
+            callback(state["stats"])
+
+    def load_state(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        Load export state
+
+        :param path: state file path
+        :return: state or None
+        """
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            print("[DB] Error while loading export state: {}".format(e))
+        return None
+
+    def save_state(self, path: str, state: Dict[str, Any]):
+        """
+        Save export state (atomic replace)
+
+        :param path: state file path
+        :param state: state
+        """
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, path)
+
+
+class ChunkWriter:
+    def __init__(self, path: str, compression: str, offset: int = 0):
+        """
+        Archive writer, every flush writes one compressed chunk
+
+        :param path: archive path
+        :param compression: zstd, gzip or none
+        :param offset: continue at offset (data after offset is truncated)
+        """
+        self.compression = compression
+        self.buffer = io.StringIO()
+        if offset > 0:
+            self.file = open(path, "r+b")
+            self.file.truncate(offset)
+            self.file.seek(offset)
+        else:
+            self.file = open(path, "wb")
+        self.compressor = zstandard.ZstdCompressor() if compression == "zstd" else None
+
+    def add(self, record: Dict[str, Any]):
+        """
+        Add record to current chunk
+
+        :param record: record
+        """
+        self.buffer.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+        self.buffer.write("\n")
+
+    def size(self) -> int:
+        """
+        Get current chunk size
+
+        :return: size in characters
+        """
+        return self.buffer.tell()
+
+    def flush(self) -> int:
+        """
+        Compress and write current chunk
+
+        :return: file offset after chunk
+        """
+        data = self.buffer.getvalue().encode("utf-8")
+        self.buffer = io.StringIO()
+        if data:
+            if self.compression == "zstd":
+                data = self.compressor.compress(data)
+            elif self.compression == "gzip":
+                data = gzip.compress(data, compresslevel=6)
+            self.file.write(data)
+            self.file.flush()
+            os.fsync(self.file.fileno())
+        return self.file.tell()
+
+    def close(self):
+        """Close file"""
+        self.file.close()
+
+
+def open_archive(path: str) -> IO[str]:
+    """
+    Open archive for reading (compression detected from file header)
+
+    :param path: archive path
+    :return: text stream
+    """
+    with open(path, "rb") as f:
+        magic = f.read(4)
+    if magic.startswith(MAGIC_GZIP):
+        return gzip.open(path, "rt", encoding="utf-8")
+    if magic == MAGIC_ZSTD:
+        if zstandard is None:
+            raise ImportError("zstandard package is required to read zstd archive")
+        reader = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), read_across_frames=True, closefd=True)
+        return io.TextIOWrapper(reader, encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def read_archive(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Read archive records (streaming)
+
+    :param path: archive path
+    :return: records iterator
+    """
+    with open_archive(path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
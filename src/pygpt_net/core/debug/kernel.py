@@ -6,9 +6,12 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.14 20:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
+from pygpt_net.core.audio.backend.shared.ring import get_latency_stats
+
+
 class KernelDebug:
     def __init__(self, window=None):
         """
@@ -30,4 +33,7 @@ class KernelDebug:
         debug.add(self.id, 'Status:', str(kernel_controller.status))
         debug.add(self.id, 'State:', str(kernel_controller.state))
         debug.add(self.id, 'Stack:', str(kernel_controller.last_stack))
+        debug.add(self.id, 'Bridge cache:', str(self.window.core.bridge.cache.get_stats()))
+        debug.add(self.id, 'Rate limits:', str(self.window.core.limiter.get_headroom()))
+        debug.add(self.id, 'Realtime audio latency (ms):', str(get_latency_stats()))
         debug.end(self.id)
\ No newline at end of file
@@ -6,13 +6,18 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.06 01:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
-from typing import Optional, Any
+from typing import Optional, Any, Callable
+import codecs
 import os
 import io
+import queue
 import tarfile
+import threading
+import time
+import uuid
 
 class Docker:
     def __init__(self, plugin = None):
@@ -341,12 +346,21 @@ class Docker:
         """
         return self.plugin.get_option_value('docker_entrypoint')
 
-    def execute(self, cmd: str) -> Optional[bytes]:
+    def execute(
+            self,
+            cmd: str,
+            on_output: Optional[Callable[[str, str], None]] = None,
+            timeout: float = 0,
+            max_output: int = 0
+    ) -> Optional[bytes]:
         """
         Execute command in Docker container.
 
         :param cmd: Command to execute
-        :return: Response
+        :param on_output: Stream output chunks to callback(text, type) instead of returning them
+        :param timeout: Wall-clock limit in seconds for streamed command, 0 = no limit
+        :param max_output: Output limit in bytes for streamed command, 0 = no limit
+        :return: Response (empty if streamed, error or limit message otherwise)
         """
         client = self.get_docker_client()
         name = self.get_container_name()
@@ -359,6 +373,8 @@ class Docker:
         try:
             self.create_container(name)
             container = client.containers.get(name)
+            if on_output is not None:
+                return self.execute_stream(container, cmd, on_output, timeout, max_output)
             result = container.exec_run(
                 cmd,
                 stdout=True,
@@ -371,6 +387,105 @@ class Docker:
             response = str(e).encode("utf-8")
         return response
 
+    def execute_stream(
+            self,
+            container,
+            cmd: str,
+            on_output: Callable[[str, str], None],
+            timeout: float = 0,
+            max_output: int = 0
+    ) -> bytes:
+        """
+        Execute command in container and stream stdout/stderr chunks.
+
+        Command is killed (with its child processes) when time or output limit is exceeded.
+
+        :param container: Docker container
+        :param cmd: Command to execute
+        :param on_output: Callback(text, type)
+        :param timeout: Wall-clock limit in seconds, 0 = no limit
+        :param max_output: Output limit in bytes, 0 = no limit
+        :return: Empty response or limit message
+        """
+        timeout = max(0.0, float(timeout or 0))
+        max_output = max(0, int(max_output or 0))
+        exec_id = uuid.uuid4().hex
+        result = container.exec_run(
+            cmd,
+            stdout=True,
+            stderr=True,
+            stream=True,
+            demux=True,
+            environment={"PYGPT_EXEC_ID": exec_id},  # inherited by child processes, used to kill them
+        )
+        chunks = queue.Queue()
+
+        def read():
+            try:
+                for item in result.output:
+                    chunks.put(item)
+            except Exception:
+                pass
+            finally:
+                chunks.put(None)  # EOF
+
+        reader = threading.Thread(target=read, daemon=True)
+        reader.start()
+
+        decoders = {
+            "stdout": codecs.getincrementaldecoder("utf-8")(errors="replace"),
+            "stderr": codecs.getincrementaldecoder("utf-8")(errors="replace"),
+        }
+        deadline = time.monotonic() + timeout if timeout else None
+        size = 0
+        status = None
+        while True:
+            wait = 0.5
+            if deadline is not None:
+                wait = min(wait, max(0.0, deadline - time.monotonic()))
+            try:
+                item = chunks.get(timeout=wait) if wait > 0 else chunks.get_nowait()
+            except queue.Empty:
+                item = False
+            if item is None:
+                break
+            if item:
+                for type, data in zip(("stdout", "stderr"), item):
+                    if data:
+                        size += len(data)
+                        text = decoders[type].decode(data)
+                        if text:
+                            on_output(text, type)
+            if deadline is not None and time.monotonic() >= deadline:
+                status = "Process killed: timeout after {} s".format(int(timeout))
+                break
+            if max_output and size > max_output:
+                status = "Process killed: output exceeded {} bytes".format(max_output)
+                break
+
+        if status is None:
+            return b""
+        self.kill_exec(container, exec_id)
+        reader.join(timeout=1)
+        return status.encode("utf-8")
+
+    def kill_exec(self, container, exec_id: str):
+        """
+        Kill processes started by streamed command in container.
+
+        :param container: Docker container
+        :param exec_id: Execution ID (PYGPT_EXEC_ID environment variable)
+        """
+        script = (
+            'for p in /proc/[0-9]*; do '
+            'grep -q "PYGPT_EXEC_ID=$0" "$p/environ" 2>/dev/null && kill -9 "${p#/proc/}" 2>/dev/null; '
+            'done; true'
+        )
+        try:
+            container.exec_run(["sh", "-c", script, exec_id])
+        except Exception as e:
+            self.log(f"Error killing process: {e}")
+
     def get_local_data_dir(self) -> str:
         """
         Get the local data directory.
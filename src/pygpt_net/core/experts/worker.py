@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.23 15:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 from typing import List, Optional
@@ -56,6 +56,8 @@ class ExpertWorker(QRunnable):
         master_ctx = self.master_ctx
         expert_id = self.expert_id
         query = self.query
+        buffer = self.window.controller.kernel.buffer
+        buffer.begin()  # batch ctx writes until worker end
 
         try:
             # get or create children (slave) meta
@@ -300,6 +302,7 @@ class ExpertWorker(QRunnable):
             self.signals.error.emit(str(e))
 
         finally:
+            buffer.end()
             self.signals.finished.emit()
             self.cleanup()
 
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.19 00:00:00                  #
+# ================================================== #
+
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Callable
+
+from llama_index.core.base.base_retriever import BaseRetriever
+from llama_index.core.schema import NodeWithScore, QueryBundle, QueryType
+
+
+class CachedRetriever(BaseRetriever):
+    def __init__(
+            self,
+            cache: "Cache",
+            retriever: BaseRetriever,
+            idx: str,
+            generation: Any,
+            embed_model: Optional[Any] = None,
+            params: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Retriever wrapper with results cache
+
+        :param cache: Cache instance
+        :param retriever: wrapped retriever
+        :param idx: index name or path (cache scope)
+        :param generation: index generation
+        :param embed_model: embedding model (used to embed query once)
+        :param params: retriever params (top_k, filters), part of cache key
+        """
+        super().__init__()
+        self.cache = cache
+        self.retriever = retriever
+        self.idx = idx
+        self.generation = generation
+        self.embed_model = embed_model
+        self.params = params or {}
+
+    def retrieve(self, str_or_query_bundle: QueryType) -> List[NodeWithScore]:
+        """
+        Retrieve nodes (events are dispatched by wrapped retriever)
+
+        :param str_or_query_bundle: query string or bundle
+        :return: list of nodes
+        """
+        if isinstance(str_or_query_bundle, str):
+            str_or_query_bundle = QueryBundle(str_or_query_bundle)
+        return self._retrieve(str_or_query_bundle)
+
+    def _retrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        """
+        Retrieve nodes (from cache if possible)
+
+        :param query_bundle: query bundle
+        :return: list of nodes
+        """
+        return self.cache.retrieve(
+            retriever=self.retriever,
+            query_bundle=query_bundle,
+            idx=self.idx,
+            generation=self.generation,
+            embed_model=self.embed_model,
+            params=self.params,
+        )
+
+
+class Cache:
+    MAX_RESULTS = 256  # max cached retrieval results
+    MAX_EMBEDDINGS = 1024  # max cached query embeddings
+    PRECISION = 3  # query embedding rounding (decimal places) for result keys
+
+    def __init__(self, window=None):
+        """
+        Query results, indexes and query engines cache (per index generation)
+
+        :param window: Window instance
+        """
+        self.window = window
+        self.lock = threading.RLock()
+        self.objects = {}  # (kind, idx, key) -> (generation, time, object)
+        self.embeddings = OrderedDict()  # (embed key, query) -> embedding
+        self.results = OrderedDict()  # result key -> (time, nodes)
+        self.stats = {"hits": 0, "misses": 0}
+
+    def is_enabled(self) -> bool:
+        """
+        Check if cache is enabled
+
+        :return: True if enabled
+        """
+        return bool(self.window.core.config.get("llama.idx.cache", True))
+
+    def get_ttl(self) -> int:
+        """
+        Get TTL in seconds
+
+        :return: TTL
+        """
+        return max(0, int(self.window.core.config.get("llama.idx.cache.ttl", 600) or 0))
+
+    def is_fresh(self, ts: float) -> bool:
+        """
+        Check if entry is not expired
+
+        :param ts: entry time
+        :return: True if fresh
+        """
+        return time.time() - ts < self.get_ttl()
+
+    def get_object(
+            self,
+            kind: str,
+            idx: Optional[str],
+            generation: Any,
+            key: str,
+            factory: Callable[[], Any]
+    ) -> Any:
+        """
+        Get object (index, query engine) reused while index generation is unchanged
+
+        :param kind: object kind
+        :param idx: index name or path
+        :param generation: index generation
+        :param key: object key
+        :param factory: function creating object
+        :return: object
+        """
+        if not self.is_enabled() or idx is None:
+            return factory()
+        with self.lock:
+            entry = self.objects.get((kind, idx, key))
+            if entry is not None and entry[0] == generation and self.is_fresh(entry[1]):
+                return entry[2]
+        obj = factory()
+        with self.lock:
+            # drop objects from previous generations and expired objects
+            for k in [k for k, v in self.objects.items()
+                      if (k[1] == idx and v[0] != generation) or not self.is_fresh(v[1])]:
+                del self.objects[k]
+            self.objects[(kind, idx, key)] = (generation, time.time(), obj)
+        return obj
+
+    def get_signature(self, obj: Any) -> str:
+        """
+        Get config signature of model instance (LLM, embedding model)
+
+        Instances created again with the same config have the same signature.
+
+        :param obj: model instance
+        :return: signature
+        """
+        if obj is None:
+            return ""
+        try:
+            data = obj.to_dict()
+        except Exception:
+            data = {"model": getattr(obj, "model", None) or getattr(obj, "model_name", None)}
+        raw = json.dumps(data, sort_keys=True, default=lambda v: type(v).__name__)
+        return "{}:{}".format(type(obj).__name__, hashlib.sha1(raw.encode("utf-8")).hexdigest())
+
+    def get_embed_key(self, embed_model: Any) -> str:
+        """
+        Get embedding model key
+
+        :param embed_model: embedding model
+        :return: key
+        """
+        return "{}:{}".format(type(embed_model).__name__, getattr(embed_model, "model_name", ""))
+
+    def get_embedding(self, embed_model: Any, queries: List[str]) -> List[float]:
+        """
+        Get query embedding (cached by normalized query)
+
+        :param embed_model: embedding model
+        :param queries: query strings
+        :return: embedding
+        """
+        query = "\n".join(" ".join(q.split()).lower() for q in queries)
+        key = (self.get_embed_key(embed_model), query)
+        with self.lock:
+            if key in self.embeddings:
+                self.embeddings.move_to_end(key)
+                return self.embeddings[key]
+        embedding = embed_model.get_agg_embedding_from_queries(queries)
+        with self.lock:
+            self.embeddings[key] = embedding
+            while len(self.embeddings) > self.MAX_EMBEDDINGS:
+                self.embeddings.popitem(last=False)
+        return embedding
+
+    def hash_embedding(self, embedding: List[float]) -> str:
+        """
+        Hash rounded embedding (near-identical queries share the key)
+
+        :param embedding: embedding
+        :return: hash
+        """
+        fmt = "{:.%df}" % self.PRECISION
+        data = ",".join(fmt.format(x) for x in embedding)
+        return hashlib.sha1(data.encode("ascii")).hexdigest()
+
+    def wrap(
+            self,
+            retriever: BaseRetriever,
+            idx: str,
+            generation: Any,
+            embed_model: Optional[Any] = None,
+            params: Optional[Dict[str, Any]] = None
+    ) -> BaseRetriever:
+        """
+        Wrap retriever with results cache
+
+        :param retriever: retriever
+        :param idx: index name or path
+        :param generation: index generation
+        :param embed_model: embedding model
+        :param params: retriever params (top_k, filters)
+        :return: cached retriever
+        """
+        return CachedRetriever(self, retriever, idx, generation, embed_model, params)
+
+    def retrieve(
+            self,
+            retriever: BaseRetriever,
+            query_bundle: QueryBundle,
+            idx: str,
+            generation: Any,
+            embed_model: Optional[Any] = None,
+            params: Optional[Dict[str, Any]] = None
+    ) -> List[NodeWithScore]:
+        """
+        Retrieve nodes using cache
+
+        :param retriever: retriever
+        :param query_bundle: query bundle
+        :param idx: index name or path
+        :param generation: index generation
+        :param embed_model: embedding model
+        :param params: retriever params (top_k, filters)
+        :return: list of nodes
+        """
+        if not self.is_enabled():
+            return retriever.retrieve(query_bundle)
+
+        if query_bundle.embedding is None and embed_model is not None and query_bundle.embedding_strs:
+            query_bundle.embedding = self.get_embedding(embed_model, query_bundle.embedding_strs)
+        if query_bundle.embedding is not None:
+            query_key = self.hash_embedding(query_bundle.embedding)
+        else:
+            query_key = " ".join(query_bundle.query_str.split()).lower()
+        key = (
+            idx,
+            generation,
+            query_key,
+            json.dumps(params or {}, sort_keys=True, default=repr),
+        )
+        with self.lock:
+            entry = self.results.get(key)
+            if entry is not None and self.is_fresh(entry[0]):
+                self.results.move_to_end(key)
+                self.stats["hits"] += 1
+                return [copy.copy(node) for node in entry[1]]
+
+        nodes = retriever.retrieve(query_bundle)
+        with self.lock:
+            self.stats["misses"] += 1
+            self.results[key] = (time.time(), [copy.copy(node) for node in nodes])
+            while len(self.results) > self.MAX_RESULTS:
+                self.results.popitem(last=False)
+        return nodes
+
+    def clear(self, idx: Optional[str] = None):
+        """
+        Clear cache
+
+        :param idx: index name or path, None = all
+        """
+        with self.lock:
+            if idx is None:
+                self.objects.clear()
+                self.embeddings.clear()
+                self.results.clear()
+                return
+            for k in [k for k in self.objects if k[1] == idx]:
+                del self.objects[k]
+            for k in [k for k in self.results if k[0] == idx]:
+                del self.results[k]
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get stats counters
+
+        :return: copy of stats
+        """
+        with self.lock:
+            return dict(self.stats)
@@ -6,15 +6,21 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.21 07:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 import json
 from typing import Optional, Dict, Any, List
 
+from llama_index.core.base.base_retriever import BaseRetriever
+from llama_index.core.base.embeddings.base import BaseEmbedding
+from llama_index.core.chat_engine import ContextChatEngine, CondensePlusContextChatEngine
+from llama_index.core.constants import DEFAULT_SIMILARITY_TOP_K
+from llama_index.core.indices.base import BaseIndex
 from llama_index.core.llms import ChatMessage, MessageRole
 from llama_index.core.prompts import ChatPromptTemplate
 from llama_index.core.memory import ChatMemoryBuffer
+from llama_index.core.query_engine import RetrieverQueryEngine
 from llama_index.core.tools import QueryEngineTool
 
 from pygpt_net.core.types import (
@@ -29,8 +35,16 @@ from pygpt_net.core.bridge.context import BridgeContext
 from pygpt_net.item.model import ModelItem
 from pygpt_net.item.ctx import CtxItem
 
+from .cache import Cache
 from .context import Context
 from .response import Response
+from .retriever import (
+    KeywordRetriever,
+    HybridRetriever,
+    RETRIEVAL_VECTOR,
+    RETRIEVAL_HYBRID,
+    RETRIEVAL_KEYWORD,
+)
 
 class Chat:
     def __init__(self, window=None, storage=None):
@@ -43,6 +57,7 @@ class Chat:
         self.storage = storage
         self.context = Context(window)
         self.response = Response(window)
+        self.cache = Cache(window)  # query results, indexes and query engines
         self.prev_message = None  # previous message, used in chat mode
 
     def call(
@@ -136,14 +151,18 @@ class Chat:
         tpl = self.get_custom_prompt(system_prompt)
         if tpl is not None:
             self.log(f"Query index with custom prompt: {system_prompt}...")
-            response = index.as_query_engine(
+            response = self.get_query_engine(
+                idx,
+                index,
                 llm=llm,
                 streaming=stream,
                 text_qa_template=tpl,
                 verbose=verbose,
             ).query(query)  # query with custom sys prompt
         else:
-            response = index.as_query_engine(
+            response = self.get_query_engine(
+                idx,
+                index,
                 llm=llm,
                 streaming=stream,
                 verbose=verbose,
@@ -190,7 +209,7 @@ class Chat:
         self.log(f"Idx: {idx}, retrieve only: {query}")
 
         index, llm = self.get_index(idx, model, stream=stream)
-        retriever = index.as_retriever()
+        retriever = self.get_retriever(idx, index)
         nodes = retriever.retrieve(query)
         outputs = []
         self.log(f"Retrieved {len(nodes)} nodes...")
@@ -334,7 +353,9 @@ class Chat:
                     use_index = False # fallback to LLM if tools enabled but not using ReAct
             else:
                 # 2) if tools disabled, use index as chat engine
-                chat_engine = index.as_chat_engine(
+                chat_engine = self.get_chat_engine(
+                    idx,
+                    index,
                     llm=llm,
                     chat_mode=chat_mode,
                     memory=memory,
@@ -476,7 +497,9 @@ class Chat:
         :return: True if success, False otherwise
         """
         if index:
-            query_engine = index.as_query_engine(
+            query_engine = self.get_query_engine(
+                context.idx,
+                index,
                 llm=llm,
                 chat_mode=chat_mode,
                 verbose=verbose,
@@ -657,10 +680,16 @@ class Chat:
         if model is None:
             model = self.window.core.models.from_defaults()
         llm, embed_model = self.window.core.idx.llm.get_service_context(model=model, stream=False, auto_embed=True)
-        index = self.storage.get_ctx_idx(path, llm, embed_model)
+        index = self.cache.get_object(
+            "index",
+            path,
+            self.storage.get_generation(path),
+            self.cache.get_signature(embed_model),
+            lambda: self.storage.get_ctx_idx(path, llm, embed_model),
+        )
 
         # 1. try to retrieve directly from index
-        retriever = index.as_retriever()
+        retriever = self.get_retriever(path, index)
         nodes = retriever.retrieve(query)
         response = ""
         score = 0
@@ -709,7 +738,7 @@ class Chat:
         if model is None:
             model = self.window.core.models.from_defaults()
         index, llm = self.get_index(idx, model, stream=False)
-        retriever = index.as_retriever()
+        retriever = self.get_retriever(idx, index)
         nodes = retriever.retrieve(query)
         response = ""
         for node in nodes:
@@ -793,9 +822,150 @@ class Chat:
             # raise Exception("Index not prepared")
 
         llm, embed_model = self.window.core.idx.llm.get_service_context(model=model, stream=stream)
-        index = self.storage.get(idx, llm, embed_model)  # get index
+        index = self.cache.get_object(
+            "index",
+            idx,
+            self.storage.get_generation(idx),
+            self.cache.get_signature(embed_model),
+            lambda: self.storage.get(idx, llm, embed_model),
+        )  # get index, reused until index is updated
         return index, llm
 
+    def get_retrieval_mode(self, idx: Optional[str]) -> str:
+        """
+        Get retrieval mode for index (vector if keyword index is not built)
+
+        :param idx: idx name (id) or path to index
+        :return: retrieval mode (vector, hybrid, keyword)
+        """
+        if idx is None:
+            return RETRIEVAL_VECTOR
+        mode = self.window.core.idx.get_retrieval_mode(idx)
+        if mode not in (RETRIEVAL_HYBRID, RETRIEVAL_KEYWORD):
+            return RETRIEVAL_VECTOR
+        exists = self.cache.get_object(
+            "keyword",
+            idx,
+            self.storage.get_generation(idx),
+            "",
+            lambda: self.storage.keyword.exists(idx),
+        )  # checked again when index is updated
+        return mode if exists else RETRIEVAL_VECTOR
+
+    def get_retriever(
+            self,
+            idx: Optional[str],
+            index: BaseIndex,
+            **kwargs
+    ) -> BaseRetriever:
+        """
+        Get index retriever (vector, hybrid or keyword) with query results cache
+
+        :param idx: idx name (id) or path to index
+        :param index: index instance
+        :param kwargs: retriever keyword arguments (similarity_top_k, filters, etc.)
+        :return: retriever
+        """
+        if idx is None:
+            return index.as_retriever(**kwargs)  # in-memory empty index
+        mode = self.get_retrieval_mode(idx)
+        params = dict(kwargs)
+        embed_model = getattr(index, "_embed_model", None)
+        if not isinstance(embed_model, BaseEmbedding):
+            embed_model = None  # cache by query text only
+        if mode == RETRIEVAL_VECTOR:
+            retriever = index.as_retriever(**kwargs)
+        else:
+            top_k = kwargs.get("similarity_top_k", DEFAULT_SIMILARITY_TOP_K)
+            params["retrieval"] = mode
+            if mode == RETRIEVAL_KEYWORD:
+                retriever = KeywordRetriever(self.storage.keyword, idx, top_k)
+                embed_model = None  # no embedding call
+            else:
+                args = dict(kwargs)
+                args["similarity_top_k"] = top_k * 2  # more candidates for fusion
+                retriever = HybridRetriever(
+                    index.as_retriever(**args),
+                    KeywordRetriever(self.storage.keyword, idx, top_k * 2),
+                    top_k,
+                )
+        return self.cache.wrap(
+            retriever,
+            idx,
+            self.storage.get_generation(idx),
+            embed_model=embed_model,
+            params=params,
+        )
+
+    def get_chat_engine(
+            self,
+            idx: Optional[str],
+            index: BaseIndex,
+            llm=None,
+            chat_mode: Optional[str] = None,
+            **kwargs
+    ):
+        """
+        Get chat engine, context modes use retriever selected for index
+
+        :param idx: idx name (id)
+        :param index: index instance
+        :param llm: LLM instance
+        :param chat_mode: chat mode
+        :param kwargs: chat engine keyword arguments (memory, system_prompt, etc.)
+        :return: chat engine
+        """
+        engines = {
+            "context": ContextChatEngine,
+            "condense_plus_context": CondensePlusContextChatEngine,
+        }
+        if chat_mode in engines and self.get_retrieval_mode(idx) != RETRIEVAL_VECTOR:
+            return engines[chat_mode].from_defaults(
+                retriever=self.get_retriever(idx, index),
+                llm=llm,
+                **kwargs
+            )
+        return index.as_chat_engine(
+            llm=llm,
+            chat_mode=chat_mode,
+            **kwargs
+        )
+
+    def get_query_engine(
+            self,
+            idx: Optional[str],
+            index: BaseIndex,
+            llm=None,
+            **kwargs
+    ) -> RetrieverQueryEngine:
+        """
+        Get query engine, reused until index is updated
+
+        :param idx: idx name (id) or path to index
+        :param index: index instance
+        :param llm: LLM instance
+        :param kwargs: query engine keyword arguments (similarity_top_k, streaming, etc.)
+        :return: query engine
+        """
+        def create() -> RetrieverQueryEngine:
+            args = dict(kwargs)
+            retriever_args = {}
+            for key in ("similarity_top_k", "filters"):
+                if key in args:
+                    retriever_args[key] = args.pop(key)
+            return RetrieverQueryEngine.from_args(
+                self.get_retriever(idx, index, **retriever_args),
+                llm=llm,
+                **args
+            )
+
+        key = "{}:{}:{}".format(
+            self.cache.get_signature(getattr(index, "_embed_model", None)),
+            self.cache.get_signature(llm),
+            json.dumps(kwargs, sort_keys=True, default=repr),
+        )
+        return self.cache.get_object("engine", idx, self.storage.get_generation(idx), key, create)
+
     def get_metadata(
             self,
             source_nodes: Optional[list]
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.12.27 17:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 import datetime
@@ -163,13 +163,14 @@ class Idx:
             llm=llm,
             embed_model=embed_model,
         )  # get or create index
-        files, errors = self.indexing.index_files(
-            idx=idx,
-            index=index,
-            path=path,
-            replace=replace,
-            recursive=recursive,
-        )  # index files
+        with self.storage.keyword.batch(idx):  # one keyword index connection for all documents
+            files, errors = self.indexing.index_files(
+                idx=idx,
+                index=index,
+                path=path,
+                replace=replace,
+                recursive=recursive,
+            )  # index files
         if len(files) > 0:
             self.storage.store(
                 id=idx,
@@ -200,12 +201,13 @@ class Idx:
             llm=llm,
             embed_model=embed_model,
         )  # get or create index
-        num, errors = self.indexing.index_db_by_meta_id(
-            idx=idx,
-            index=index,
-            id=id,
-            from_ts=from_ts,
-        )  # index db records
+        with self.storage.keyword.batch(idx):
+            num, errors = self.indexing.index_db_by_meta_id(
+                idx=idx,
+                index=index,
+                id=id,
+                from_ts=from_ts,
+            )  # index db records
         if num > 0:
             self.storage.store(
                 id=idx,
@@ -234,11 +236,12 @@ class Idx:
             llm=llm,
             embed_model=embed_model,
         )  # get or create index
-        num, errors = self.indexing.index_db_from_updated_ts(
-            idx=idx,
-            index=index,
-            from_ts=from_ts,
-        )  # index db records
+        with self.storage.keyword.batch(idx):
+            num, errors = self.indexing.index_db_from_updated_ts(
+                idx=idx,
+                index=index,
+                from_ts=from_ts,
+            )  # index db records
         if num > 0:
             self.storage.store(
                 id=idx,
@@ -271,13 +274,14 @@ class Idx:
             llm=llm,
             embed_model=embed_model,
         )  # get or create index
-        n, errors = self.indexing.index_urls(
-            idx=idx,
-            index=index,
-            urls=urls,
-            type=type,
-            extra_args=extra_args,
-        )  # index urls
+        with self.storage.keyword.batch(idx):
+            n, errors = self.indexing.index_urls(
+                idx=idx,
+                index=index,
+                urls=urls,
+                type=type,
+                extra_args=extra_args,
+            )  # index urls
         if n > 0:
             self.storage.store(
                 id=idx,
@@ -315,15 +319,16 @@ class Idx:
             llm=llm,
             embed_model=embed_model,
         )  # get or create index
-        n, errors = self.indexing.index_url(
-            idx=idx,
-            index=index,
-            url="",
-            type=type,
-            extra_args=params,
-            is_tmp=False,
-            replace=replace,
-        )
+        with self.storage.keyword.batch(idx):
+            n, errors = self.indexing.index_url(
+                idx=idx,
+                index=index,
+                url="",
+                type=type,
+                extra_args=params,
+                is_tmp=False,
+                replace=replace,
+            )
         if n > 0:
             self.storage.store(
                 id=idx,
@@ -487,7 +492,7 @@ class Idx:
         :param idx: index name (id)
         :param doc_id: document ID (in storage)
         """
-        self.llm.get_service_context(stream=False)  # init environment only (ENV API keys, etc.)
+        self.llm.create_service_context(stream=False)  # init environment only (ENV API keys, etc.)
         if self.storage.remove_document(idx, doc_id):
             self.log(f"Removed document from index: {idx} - {doc_id}")
 
@@ -502,7 +507,7 @@ class Idx:
         :param idx: index name
         :param file: file ID
         """
-        self.llm.get_service_context(stream=False)  # init environment only (ENV API keys, etc.)
+        self.llm.create_service_context(stream=False)  # init environment only (ENV API keys, etc.)
         store_id = self.get_current_store()
         if store_id in self.items and idx in self.items[store_id]:
             for basename in list(self.items[store_id][idx].items.keys()):
@@ -564,6 +569,35 @@ class Idx:
                 ids.append({item['id']: name})
         return ids
 
+    def get_retrieval_mode(self, idx: str) -> str:
+        """
+        Get retrieval mode selected for index
+
+        :param idx: index name/id
+        :return: retrieval mode (vector, hybrid, keyword)
+        """
+        items = self.window.core.config.get('llama.idx.list')
+        if items is not None:
+            for item in items:
+                if item['id'] == idx:
+                    return item.get('retrieval') or "vector"
+        return "vector"
+
+    def set_retrieval_mode(self, idx: str, mode: str):
+        """
+        Set retrieval mode for index
+
+        :param idx: index name/id
+        :param mode: retrieval mode (vector, hybrid, keyword)
+        """
+        items = self.window.core.config.get('llama.idx.list')
+        if items is not None:
+            for item in items:
+                if item['id'] == idx:
+                    item['retrieval'] = mode
+                    self.window.core.config.save()
+                    return
+
     def clear(self, idx: str):
         """
         Clear index items
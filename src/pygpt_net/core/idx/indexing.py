@@ -6,21 +6,24 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.21 07:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 import datetime
 import os
-import time
+from concurrent.futures import ThreadPoolExecutor
 
 from pathlib import Path
-from typing import Optional, Tuple, List, Dict, Any
+from typing import Optional, Tuple, List, Dict, Any, Iterator, Union, Callable
 
 from sqlalchemy import text
 
 from llama_index.core.indices.base import BaseIndex
+from llama_index.core.readers.base import BaseReader
 from llama_index.core.schema import Document
-from llama_index.core import SimpleDirectoryReader
+from llama_index.core import SimpleDirectoryReader, Settings
+from llama_index.core.indices.utils import embed_nodes
+from llama_index.core.ingestion import run_transformations
 
 from pygpt_net.item.model import ModelItem
 from pygpt_net.provider.loaders.base import BaseLoader
@@ -42,7 +45,6 @@ class Indexing:
         self.data_providers = {}  # data providers (loaders)
         self.external_instructions = {}
         self.external_config = {}
-        self.last_call = None
 
     def register_loader(self, loader: BaseLoader):
         """
@@ -297,7 +299,8 @@ class Indexing:
             force: bool = False,
             silent: bool = False,
             loader_kwargs: Optional[Dict[str, Any]] = None,
-    ) -> List[Document]:
+            stream: bool = False,
+    ) -> Union[List[Document], Iterator[Document]]:
         """
         Get documents from path using data loaders
 
@@ -305,7 +308,8 @@ class Indexing:
         :param force: force reading
         :param silent: disable logging
         :param loader_kwargs: additional keyword arguments for loader
-        :return: list of documents
+        :param stream: return iterator if loader supports streaming (parsed in chunks)
+        :return: list of documents (or iterator if stream)
         """
         # TODO: if .zip then unpack here, and return path to /tmp
         if not silent:
@@ -337,7 +341,13 @@ class Indexing:
             if self.window.core.filesystem.packer.is_archive(path):
                 tmp_path = self.window.core.filesystem.packer.unpack(path)
                 if tmp_path:
-                    return self.get_documents(tmp_path, force=force, silent=silent, loader_kwargs=loader_kwargs)
+                    return self.get_documents(
+                        tmp_path,
+                        force=force,
+                        silent=silent,
+                        loader_kwargs=loader_kwargs,
+                        stream=stream,
+                    )
 
             if ext in self.loaders["file"]:
                 if not silent:
@@ -347,6 +357,8 @@ class Indexing:
                 # use custom loader method if available
                 if hasattr(reader, "load_data_custom") and loader_kwargs:
                     documents = reader.load_data_custom(file=Path(path), **loader_kwargs)
+                elif stream and getattr(reader, "streaming", False):
+                    return self.stream_documents(reader, path)
                 else:
                     documents = reader.load_data(file=Path(path))
             else:
@@ -359,6 +371,18 @@ class Indexing:
         self.window.core.idx.metadata.append_file_metadata(documents, path)
         return documents
 
+    def stream_documents(self, reader: BaseReader, path: str) -> Iterator[Document]:
+        """
+        Read documents from streaming loader (parsed in chunks, yielded when ready)
+
+        :param reader: data reader instance
+        :param path: path to file
+        :return: documents iterator
+        """
+        for doc in reader.lazy_load_data(file=Path(path)):
+            self.window.core.idx.metadata.append_file_metadata([doc], path)
+            yield doc
+
     def read_text_content(
             self,
             path: str,
@@ -434,13 +458,27 @@ class Indexing:
             args = self.data_providers[type].prepare_args(**extra_args)
 
             # get documents from external resource
+            stats = self.window.core.web.cache.get_stats()
             documents = self.loaders["web"][type].get().load_data(
                 **args
             )
+            self.log_web_cache(stats)
         except Exception as e:
             self.window.core.debug.log(e)
         return documents
 
+    def log_web_cache(self, since: Dict[str, int]):
+        """
+        Log web cache hit rate and save cache index
+
+        :param since: web cache stats snapshot taken before loading
+        """
+        cache = self.window.core.web.cache
+        cache.flush()
+        msg = cache.format_stats(since)
+        if msg:
+            self.window.core.idx.log(msg)
+
     def prepare_document(self, doc: Document):
         """
         Prepare document to store
@@ -489,6 +527,7 @@ class Indexing:
             files = [path]
 
         for file in files:   # per file to allow use of multiple loaders
+            doc_ids = []  # inserted documents, removed if file fails in the middle
             try:
                 if self.is_stopped():  # force stop
                     break
@@ -505,19 +544,22 @@ class Indexing:
                         self.remove_old_file(idx, file_id)
 
                 # index new version of file
-                documents = self.get_documents(file)
+                documents = self.get_documents(file, stream=True)
                 for d in documents:
                     if self.is_stopped():  # force stop
                         break
 
                     self.prepare_document(d)
-                    self.index_document(index, d)
+                    self.index_document(index, d, None if is_tmp else idx)
+                    doc_ids.append(d.id_)
                     indexed[file] = d.id_  # add to index
                     self.window.core.idx.log(f"Inserted document: {d.id_}, metadata: {d.metadata}")
             except Exception as e:
                 errors.append(str(e))
                 print(f"Error while indexing file: {file}")
                 self.window.core.debug.log(e)
+                indexed.pop(file, None)
+                self.remove_documents(index, doc_ids, None if is_tmp else idx)
                 if self.stop_enabled():
                     break  # break loop if error
 
@@ -550,6 +592,7 @@ class Indexing:
             for root, dirs, files in os.walk(path):
                 for file in files:
                     file_path = os.path.join(root, file)
+                    doc_ids = []  # inserted documents, removed if file fails in the middle
                     try:
                         # remove old file from index if exists
                         file_id = self.window.core.idx.files.get_id(file_path)
@@ -567,19 +610,22 @@ class Indexing:
                                 self.remove_old_file(idx, file_id)
 
                         # index new version of file
-                        documents = self.get_documents(file_path)
+                        documents = self.get_documents(file_path, stream=True)
                         for d in documents:
                             if self.is_stopped():  # force stop
                                 break
 
                             self.prepare_document(d)
-                            self.index_document(index, d)
+                            self.index_document(index, d, None if is_tmp else idx)
+                            doc_ids.append(d.id_)
                             indexed[file_path] = d.id_  # add to index
                             self.window.core.idx.log(f"Inserted document: {d.id_}, metadata: {d.metadata}")
                     except Exception as e:
                         errors.append(str(e))
                         print(f"Error while indexing file: {file_path}")
                         self.window.core.debug.log(e)
+                        indexed.pop(file_path, None)
+                        self.remove_documents(index, doc_ids, None if is_tmp else idx)
                         if self.stop_enabled():
                             is_break = True
                             break  # break loop if error
@@ -603,13 +649,13 @@ class Indexing:
                         self.remove_old_file(idx, file_id)
 
                 # index new version of file
-                documents = self.get_documents(path)
+                documents = self.get_documents(path, stream=True)
                 for d in documents:
                     if self.is_stopped():  # force stop
                         break
 
                     self.prepare_document(d)
-                    self.index_document(index, d)
+                    self.index_document(index, d, None if is_tmp else idx)
                     indexed[path] = d.id_  # add to index
                     self.window.core.idx.log(f"Inserted document: {d.id_}, metadata: {d.metadata}")
             except Exception as e:
@@ -689,16 +735,41 @@ class Indexing:
                 ids.append(data["id"])
         return ids
 
+    def get_db_items_ts(self, id: int = 0) -> Dict[int, int]:
+        """
+        Get last update timestamps of ctx items by meta id (without content)
+
+        :param id: ctx meta id
+        :return: dict: item id -> last input / output timestamp
+        """
+        db = self.window.core.db.get_db()
+        items = {}
+        query = f"""
+        SELECT
+            id,
+            MAX(COALESCE(input_ts, 0), COALESCE(output_ts, 0)) AS ts
+        FROM ctx_item
+        WHERE meta_id = {int(id)}
+        """
+        with db.connect() as connection:
+            result = connection.execute(text(query))
+            for row in result.fetchall():
+                data = row._asdict()
+                items[int(data["id"])] = int(data["ts"] or 0)
+        return items
+
     def get_db_data_by_id(
             self,
             id: int = 0,
-            updated_ts: int = 0
+            updated_ts: int = 0,
+            item_ids: Optional[List[int]] = None
     ) -> List[Document]:
         """
         Get data from database by meta id
 
         :param id: ctx meta id
         :param updated_ts: timestamp from which to get data
+        :param item_ids: restrict to ctx items with these ids
         :return: list of documents
         """
         db = self.window.core.db.get_db()
@@ -715,6 +786,8 @@ class Indexing:
         # restrict to updated data if from timestamp is given
         if updated_ts > 0:
             query += f" AND (input_ts > {updated_ts} OR output_ts > {updated_ts})"
+        if item_ids is not None:
+            query += " AND id IN ({})".format(", ".join(str(int(i)) for i in item_ids) or "NULL")
         with db.connect() as connection:
             result = connection.execute(text(query))
             for item in result.fetchall():
@@ -739,40 +812,109 @@ class Indexing:
             from_ts: int = 0
     ) -> Tuple[int, List[str]]:
         """
-        Index data from database by meta id
+        Index data from database by meta id (item granularity)
+
+        Only new or changed ctx items are embedded, every item is stored as separate
+        record in index db, so document of changed item is replaced and not duplicated.
 
         :param idx: index name
         :param index: index instance
         :param id: ctx meta id
-        :param from_ts: timestamp from which to index
+        :param from_ts: timestamp from which to index (0 = reindex all items)
         :return: number of indexed documents, errors
         """
         errors = []
         n = 0
+        doc_ids = []
+        removed = []
         try:
-            # remove old document from index if indexing by ID only and not from timestamp
+            store = self.window.core.idx.get_current_store()
+            indexed = self.window.core.idx.ctx.get_items(store, idx, id)
+            legacy = indexed.pop(0, None)  # whole meta record (indexed before item granularity)
+
             if from_ts == 0:
                 self.window.core.idx.log(f"Indexing documents from database by meta id: {id}")
-                self.remove_old_meta_id(idx, id)
-            elif from_ts > 0:
+                if legacy is not None and self.window.core.config.get("llama.idx.replace_old"):
+                    removed.append(self.remove_ctx_item_doc(idx, legacy["doc_id"]))
+                    self.window.core.idx.ctx.remove_items([legacy["id"]])
+            else:
                 self.window.core.idx.log(f"Indexing documents from database by meta id: {id} from timestamp: {from_ts}")
 
+            # find new or changed items
+            items_ts = self.get_db_items_ts(id)
+            to_index = []
+            for item_id, ts in items_ts.items():
+                record = indexed.get(item_id)
+                if record is None:
+                    if legacy is not None and 0 < ts <= from_ts:
+                        continue  # already indexed with whole meta
+                    to_index.append(item_id)
+                elif from_ts == 0 or ts > record["updated_ts"]:
+                    to_index.append(item_id)
+
+            # remove documents of deleted items
+            stale = [item_id for item_id in indexed if item_id not in items_ts]
+            for item_id in stale:
+                removed.append(self.remove_ctx_item_doc(idx, indexed[item_id]["doc_id"]))
+            if stale:
+                self.window.core.idx.ctx.remove_items([indexed[item_id]["id"] for item_id in stale])
+
+            if not to_index:
+                return n, errors
+
             # get items from database
-            documents = self.get_db_data_by_id(id, from_ts)
+            documents = self.get_db_data_by_id(id, item_ids=to_index)
             for d in documents:
                 if self.is_stopped():  # force stop
                     break
 
-                self.index_document(index, d)
+                item_id = d.metadata.get("item_id")
+                record = indexed.get(item_id)
+                if record is not None:
+                    removed.append(self.remove_ctx_item_doc(idx, record["doc_id"]))  # replace old version
+                self.index_document(index, d, idx)
                 doc_id = d.id_
+                if record is not None:
+                    self.window.core.idx.ctx.update_item(record["id"], doc_id)
+                else:
+                    self.window.core.idx.ctx.append(
+                        store_id=store,
+                        idx=idx,
+                        meta_id=id,
+                        doc_id=doc_id,
+                        item_id=item_id,
+                    )
+                doc_ids.append(doc_id)
                 self.window.core.idx.log(f"Inserted ctx DB document: {n+1} / {len(documents)}, id: {d.id_}, metadata: {d.metadata}")
-                self.window.core.ctx.idx.set_meta_as_indexed(id, idx, doc_id)  # update ctx
                 n += 1
         except Exception as e:
             errors.append(str(e))
             self.window.core.debug.log(e)
+        finally:
+            if doc_ids or removed:
+                self.window.core.ctx.idx.set_items_as_indexed(id, idx, doc_ids, [d for d in removed if d])  # update ctx
         return n, errors
 
+    def remove_ctx_item_doc(self, idx: str, doc_id: Optional[str]) -> Optional[str]:
+        """
+        Remove document of indexed ctx item from index
+
+        :param idx: index name
+        :param doc_id: document id
+        :return: removed document id
+        """
+        if not doc_id:
+            return None
+        self.window.core.idx.log(f"Removing old document id: {doc_id}")
+        try:
+            self.window.core.idx.storage.remove_document(
+                id=idx,
+                doc_id=doc_id,
+            )
+        except Exception as e:
+            self.window.core.debug.log(e)
+        return doc_id
+
     def index_db_from_updated_ts(
             self,
             idx: str,
@@ -859,9 +1001,11 @@ class Indexing:
             args = self.data_providers[type].prepare_args(**extra_args)
 
             # get documents from external resource
+            stats = self.window.core.web.cache.get_stats()
             documents = loader.load_data(
                 **args
             )
+            self.log_web_cache(stats)
 
             # append custom metadata
             self.window.core.idx.metadata.append_web_metadata(documents, type, args)
@@ -870,7 +1014,7 @@ class Indexing:
                 if self.is_stopped():  # force stop
                     break
 
-                self.index_document(index, d)
+                self.index_document(index, d, None if is_tmp else idx)
                 doc_id = d.id_  # URL is used as document ID
                 if not is_tmp:
                     self.window.core.idx.external.set_indexed(
@@ -916,6 +1060,12 @@ class Indexing:
             self.window.core.debug.log(msg)
             return n, errors
 
+        # fetch all pages in parallel first, loader will read them from web cache
+        provider = self.data_providers[type]
+        if provider.prefetch and len(urls) > 1 and provider.get_cache() is not None:
+            self.window.core.idx.log(f"Prefetching URLs: {len(urls)}")
+            provider.get_cache().fetch_many(urls, ttl=provider.get_cache_ttl())
+
         for url in urls:
             if self.is_stopped():  # force stop
                 break
@@ -1036,15 +1186,17 @@ class Indexing:
     def index_document(
             self,
             index: BaseIndex,
-            doc: Document
+            doc: Document,
+            idx: Optional[str] = None
     ):
         """
         Index document
 
         :param index: index instance
         :param doc: document
+        :param idx: index name (if set, document nodes are also added to keyword index)
         """
-        self.apply_rate_limit()  # apply RPM limit
+        self.apply_rate_limit(doc.text)  # apply RPM/TPM limit
         """
         try:
             # display embedding model info
@@ -1053,7 +1205,40 @@ class Indexing:
         except Exception as e:
             self.window.core.debug.log(e)
         """
-        index.insert(document=doc)
+        keyword = idx is not None and self.window.core.config.get("llama.idx.keyword")
+        try:
+            if keyword:
+                # same as index.insert(), but nodes are kept for keyword index
+                transformations = getattr(index, "_transformations", None) or Settings.transformations
+                nodes = run_transformations([doc], transformations)
+                index.insert_nodes(nodes)
+                index.docstore.set_document_hash(doc.get_doc_id(), doc.hash)
+            else:
+                index.insert(document=doc)
+        except Exception as e:
+            self.window.core.limiter.handle_error(self.get_limit_key(), e)  # slow down on 429
+            raise e
+        if keyword:
+            try:
+                self.window.core.idx.storage.keyword.add(idx, nodes)
+            except Exception as e:
+                self.window.core.debug.log(e)
+
+    def rebuild_keyword(self, idx: str, index: BaseIndex) -> int:
+        """
+        Rebuild keyword index from nodes stored in index docstore
+
+        :param idx: index name
+        :param index: index instance
+        :return: number of indexed nodes
+        """
+        keyword = self.window.core.idx.storage.keyword
+        nodes = list(index.docstore.docs.values())  # empty if vector store keeps text
+        keyword.remove(idx)
+        keyword.add(idx, nodes)
+        self.window.core.idx.storage.touch(idx)
+        self.window.core.idx.log(f"Keyword index rebuilt: {idx}, nodes: {len(nodes)}")
+        return len(nodes)
 
     def index_attachment(
             self,
@@ -1086,7 +1271,7 @@ class Indexing:
 
         doc_ids = []
         if documents is None:
-            documents = self.get_documents(file_path)
+            documents = self.get_documents(file_path, stream=True)
         for d in documents:
             if self.is_stopped():  # force stop
                 break
@@ -1140,6 +1325,126 @@ class Indexing:
         self.window.core.idx.storage.store_ctx_idx(index_path, index)
         return doc_ids
 
+    def index_attachments(
+            self,
+            items: List[Dict[str, Any]],
+            index_path: str,
+            model: Optional[ModelItem] = None,
+            prepare: Optional[Callable[[Dict[str, Any], List[Document]], None]] = None,
+    ) -> List[Optional[list]]:
+        """
+        Index many context attachments at once
+
+        Documents are loaded, split and embedded in parallel, then inserted into
+        the resident context index in one batch and persisted once.
+
+        :param items: list of items: {"source": path or URL, "web": bool, "documents": optional list}
+        :param index_path: index path
+        :param model: model
+        :param prepare: callback called with (item, documents) before indexing
+        :return: list of doc IDs per item (None if item failed)
+        """
+        if model is None:
+            model = self.window.core.models.from_defaults()
+        if not items:
+            return []
+
+        llm, embed_model = self.window.core.idx.llm.get_service_context(model=model, stream=False, auto_embed=True)
+        storage = self.window.core.idx.storage
+        index = storage.get_ctx_idx(index_path, llm, embed_model)  # resident if context in use
+        transformations = getattr(index, "_transformations", None) or Settings.transformations
+
+        idx = f"tmp:{index_path}"  # tmp index id
+        self.window.core.idx.log(f"Indexing {len(items)} attachment(s) to context index: {idx}... using model: {model.id}")
+
+        workers = max(1, int(self.window.core.config.get("ctx.attachment.index.workers", 4) or 1))
+        args = (embed_model, transformations, prepare)
+        if workers > 1 and len(items) > 1:
+            with ThreadPoolExecutor(max_workers=min(workers, len(items))) as pool:
+                batches = list(pool.map(lambda item: self.try_embed_attachment(item, *args), items))
+        else:
+            batches = [self.try_embed_attachment(item, *args) for item in items]
+
+        results = []
+        with storage.ctx_lock:
+            try:
+                for batch in batches:
+                    if batch is None:
+                        results.append(None)
+                        continue
+                    doc_ids = []
+                    for d, nodes in batch:
+                        index.insert_nodes(nodes)  # already embedded, no API calls here
+                        index.docstore.set_document_hash(d.get_doc_id(), d.hash)
+                        doc_ids.append(d.id_)
+                    results.append(doc_ids)
+            finally:
+                storage.store_ctx_idx(index_path, index)  # async persist
+        return results
+
+    def try_embed_attachment(self, item: Dict[str, Any], *args) -> Optional[List[Tuple[Document, list]]]:
+        """
+        Embed attachment, log error instead of raising (one failed file does not stop the batch)
+
+        :param item: attachment item
+        :param args: embed_attachment() args
+        :return: list of (document, nodes) or None on error
+        """
+        try:
+            return self.embed_attachment(item, *args)
+        except Exception as e:
+            self.window.core.debug.log(e)
+            self.window.core.idx.log(f"Error indexing attachment: {item.get('source')}: {e}")
+            return None
+
+    def embed_attachment(
+            self,
+            item: Dict[str, Any],
+            embed_model,
+            transformations: list,
+            prepare: Optional[Callable[[Dict[str, Any], List[Document]], None]] = None,
+    ) -> List[Tuple[Document, list]]:
+        """
+        Load, split and embed attachment (runs in worker thread)
+
+        :param item: attachment item
+        :param embed_model: embedding model
+        :param transformations: node transformations (splitter)
+        :param prepare: callback called with (item, documents)
+        :return: list of (document, embedded nodes)
+        """
+        source = item["source"]
+        documents = item.get("documents")
+        if documents is None:
+            if item.get("web"):
+                documents = self.read_web(
+                    url=source,
+                    type=self.get_webtype(source),
+                    extra_args={},
+                )
+            else:
+                documents = self.get_documents(source)
+        documents = list(documents)
+        if prepare is not None:
+            prepare(item, documents)
+
+        result = []
+        for d in documents:
+            if self.is_stopped():  # force stop
+                break
+            self.prepare_document(d)
+            nodes = run_transformations([d], transformations)
+            self.apply_rate_limit(d.text)  # apply RPM/TPM limit
+            try:
+                embeddings = embed_nodes(nodes, embed_model)
+            except Exception as e:
+                self.window.core.limiter.handle_error(self.get_limit_key(), e)  # slow down on 429
+                raise e
+            for node in nodes:
+                node.embedding = embeddings[node.node_id]
+            result.append((d, nodes))
+        return result
+
     def get_webtype(self, url: str) -> str:
         """
         Get web loader type by URL
@@ -1176,22 +1481,64 @@ class Indexing:
         self.window.core.idx.storage.store_ctx_idx(index_path, index)
         return True
 
-    def apply_rate_limit(self):
-        """Apply API calls RPM limit"""
-        max_per_minute = 60
-        if self.window.core.config.has("llama.idx.embeddings.limit.rpm"):
-            max_per_minute = int(self.window.core.config.get("llama.idx.embeddings.limit.rpm")) # per minute
-        if max_per_minute <= 0:
+    def remove_documents(
+            self,
+            index: BaseIndex,
+            doc_ids: List[str],
+            idx: Optional[str] = None
+    ):
+        """
+        Remove documents inserted from partially indexed file
+
+        :param index: index instance
+        :param doc_ids: document IDs
+        :param idx: index name (if set, documents are also removed from keyword index)
+        """
+        for doc_id in doc_ids:
+            try:
+                index.delete_ref_doc(doc_id, delete_from_docstore=True)
+                if idx is not None:
+                    self.window.core.idx.storage.keyword.remove_document(idx, doc_id)
+            except Exception as e:
+                self.window.core.debug.log(e)
+        if doc_ids:
+            self.window.core.idx.log(f"Removed documents of failed file: {len(doc_ids)}")
+
+    def apply_rate_limit(self, text: Optional[str] = None):
+        """
+        Apply embeddings API calls RPM/TPM limit (shared token bucket)
+
+        :param text: text to embed (for TPM limit)
+        """
+        config = self.window.core.config
+        rpm = 60
+        if config.has("llama.idx.embeddings.limit.rpm"):
+            rpm = int(config.get("llama.idx.embeddings.limit.rpm") or 0)  # per minute
+        tpm = 0
+        if config.has("llama.idx.embeddings.limit.tpm"):
+            tpm = int(config.get("llama.idx.embeddings.limit.tpm") or 0)  # per minute
+        if rpm <= 0 and tpm <= 0:
             return
-        interval = datetime.timedelta(minutes=1) / max_per_minute
-        now = datetime.datetime.now()
-        if self.last_call is not None:
-            time_since_last_call = now - self.last_call
-            if time_since_last_call < interval:
-                sleep_time = (interval - time_since_last_call).total_seconds()
-                self.window.core.idx.log(f"RPM limit: sleep for {sleep_time} seconds")
-                time.sleep(sleep_time)
-        self.last_call = now
+        limiter = self.window.core.limiter
+        limiter.wait(
+            key=self.get_limit_key(),
+            tokens=limiter.estimate_tokens(text) if tpm > 0 else 0,
+            rpm=rpm,
+            tpm=tpm,
+            burst=1,
+            stopped=self.is_stopped,
+            log=self.window.core.idx.log,
+        )
+
+    def get_limit_key(self) -> str:
+        """
+        Get rate limiter key for embeddings API calls
+
+        :return: limiter key
+        """
+        return self.window.core.limiter.get_key(
+            "embeddings." + str(self.window.core.config.get("llama.idx.embeddings.provider")),
+        )
 
     def stop_enabled(self) -> bool:
         """
@@ -6,10 +6,13 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.08.12 12:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
+import hashlib
+import json
 import os.path
+import time
 from typing import Optional, Union, List, Dict
 
 from llama_index.core.llms.llm import BaseLLM
@@ -35,6 +38,7 @@ class Llm:
         self.default_model = MODEL_DEFAULT_MINI
         self.default_embed = "openai"
         self.initialized = False
+        self.contexts = {}  # cache key -> (time, llm, embed_model)
 
     def init(self):
         """Init base ENV vars"""
@@ -124,6 +128,62 @@ class Llm:
         """
         Get service context + embeddings provider
 
+        :param model: Model item (for query)
+        :param stream: Stream mode (True to enable streaming)
+        :param auto_embed: Auto-detect embeddings provider based on model capabilities
+        :return: Service context instance
+        """
+        if not self.window.core.config.get("llama.idx.cache", True):
+            return self.create_service_context(model, stream, auto_embed)
+
+        # reuse LLM and embeddings provider instances while model and embeddings config are unchanged
+        key = self.get_context_key(model, stream, auto_embed)
+        ttl = int(self.window.core.config.get("llama.idx.cache.ttl", 600) or 0)
+        entry = self.contexts.get(key)
+        if entry is not None and time.time() - entry[0] < ttl:
+            return entry[1], entry[2]
+        llm, embed_model = self.create_service_context(model, stream, auto_embed)
+        self.contexts[key] = (time.time(), llm, embed_model)
+        return llm, embed_model
+
+    def get_context_key(
+            self,
+            model: Optional[ModelItem] = None,
+            stream: bool = False,
+            auto_embed: bool = False,
+    ) -> str:
+        """
+        Get service context cache key
+
+        :param model: Model item
+        :param stream: Stream mode
+        :param auto_embed: Auto-detect embeddings provider
+        :return: cache key
+        """
+        data = [
+            model.dump() if model is not None else None,
+            stream,
+            auto_embed,
+            self.window.core.config.get("llama.idx.embeddings.provider"),
+            self.window.core.config.get("llama.idx.embeddings.args"),
+            self.window.core.config.get("llama.idx.embeddings.env"),
+            self.window.core.config.get("llama.idx.embeddings.default"),
+        ]
+        return hashlib.md5(json.dumps(data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def clear_cache(self):
+        """Clear cached service contexts"""
+        self.contexts = {}
+
+    def create_service_context(
+            self,
+            model: Optional[ModelItem] = None,
+            stream: bool = False,
+            auto_embed: bool = False,
+    ):
+        """
+        Create service context + embeddings provider
+
         :param model: Model item (for query)
         :param stream: Stream mode (True to enable streaming)
         :param auto_embed: Auto-detect embeddings provider based on model capabilities
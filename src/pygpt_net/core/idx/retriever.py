@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+from typing import List, Dict
+
+from llama_index.core.base.base_retriever import BaseRetriever
+from llama_index.core.schema import NodeWithScore, QueryBundle, QueryType
+
+RETRIEVAL_VECTOR = "vector"
+RETRIEVAL_HYBRID = "hybrid"
+RETRIEVAL_KEYWORD = "keyword"
+
+
+class KeywordRetriever(BaseRetriever):
+    def __init__(self, keyword, idx: str, similarity_top_k: int = 2):
+        """
+        BM25 keyword retriever (no embedding call)
+
+        :param keyword: KeywordStore instance
+        :param idx: index name
+        :param similarity_top_k: max number of nodes
+        """
+        super().__init__()
+        self.keyword = keyword
+        self.idx = idx
+        self.similarity_top_k = similarity_top_k
+
+    def retrieve(self, str_or_query_bundle: QueryType) -> List[NodeWithScore]:
+        """
+        Retrieve nodes
+
+        :param str_or_query_bundle: query string or bundle
+        :return: list of nodes
+        """
+        if isinstance(str_or_query_bundle, str):
+            str_or_query_bundle = QueryBundle(str_or_query_bundle)
+        return self._retrieve(str_or_query_bundle)
+
+    def _retrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        """
+        Retrieve nodes, scores normalized to 0-1 (relative to best match)
+
+        :param query_bundle: query bundle
+        :return: list of nodes
+        """
+        nodes = self.keyword.search(self.idx, query_bundle.query_str, self.similarity_top_k)
+        best = max([n.score for n in nodes] + [0.0])
+        for node in nodes:
+            node.score = node.score / best if best > 0 else 1.0
+        return nodes
+
+
+class HybridRetriever(BaseRetriever):
+    K = 60  # reciprocal rank fusion constant
+
+    def __init__(
+            self,
+            vector: BaseRetriever,
+            keyword: BaseRetriever,
+            similarity_top_k: int = 2
+    ):
+        """
+        Hybrid retriever, vector and keyword results merged with reciprocal rank fusion
+
+        :param vector: vector retriever
+        :param keyword: keyword retriever
+        :param similarity_top_k: max number of nodes
+        """
+        super().__init__()
+        self.vector = vector
+        self.keyword = keyword
+        self.similarity_top_k = similarity_top_k
+
+    def _retrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        """
+        Retrieve nodes
+
+        :param query_bundle: query bundle
+        :return: list of nodes, scores normalized to 0-1 (1 = first in both lists)
+        """
+        return self.fuse([
+            self.vector.retrieve(query_bundle),
+            self.keyword.retrieve(query_bundle),
+        ])
+
+    def fuse(self, results: List[List[NodeWithScore]]) -> List[NodeWithScore]:
+        """
+        Reciprocal rank fusion
+
+        :param results: ranked lists of nodes
+        :return: fused list of nodes
+        """
+        scores: Dict[str, float] = {}
+        nodes: Dict[str, NodeWithScore] = {}
+        for ranked in results:
+            for rank, node in enumerate(ranked):
+                id = node.node.node_id
+                scores[id] = scores.get(id, 0.0) + 1.0 / (self.K + rank + 1)
+                if id not in nodes:
+                    nodes[id] = node  # first list (vector) has full node
+        best = len(results) / (self.K + 1)
+        fused = []
+        for id in sorted(scores, key=scores.get, reverse=True)[:self.similarity_top_k]:
+            fused.append(NodeWithScore(node=nodes[id].node, score=scores[id] / best))
+        return fused
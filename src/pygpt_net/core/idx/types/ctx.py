@@ -6,10 +6,10 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 00:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
-from typing import Optional
+from typing import Optional, Dict, Any, List
 
 
 class Ctx:
@@ -28,7 +28,8 @@ class Ctx:
             store_id: str,
             idx: str,
             meta_id: int,
-            doc_id: str
+            doc_id: str,
+            item_id: int = 0
     ) -> int:
         """
         Append ctx meta to index db
@@ -37,6 +38,7 @@ class Ctx:
         :param idx: index name
         :param meta_id: meta id
         :param doc_id: document id
+        :param item_id: ctx item id (0 = whole meta)
         :return: ID of appended ctx meta
         """
         return self.provider.append_ctx_meta(
@@ -44,6 +46,7 @@ class Ctx:
             idx=idx,
             meta_id=meta_id,
             doc_id=doc_id,
+            item_id=item_id,
         )
 
     def exists(
@@ -86,6 +89,26 @@ class Ctx:
             meta_id=meta_id,
         )
 
+    def get_items(
+            self,
+            store_id: str,
+            idx: str,
+            meta_id: int
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Get indexed ctx items by meta id
+
+        :param store_id: store id
+        :param idx: index name
+        :param meta_id: meta id
+        :return: dict: item_id -> {id, doc_id, updated_ts}, item_id = 0 for whole meta records
+        """
+        return self.provider.get_ctx_items(
+            store_id=store_id,
+            idx=idx,
+            meta_id=meta_id,
+        )
+
     def update(
             self,
             meta_id: int,
@@ -103,6 +126,23 @@ class Ctx:
             doc_id=doc_id,
         )
 
+    def update_item(
+            self,
+            id: int,
+            doc_id: str
+    ) -> bool:
+        """
+        Update document id and timestamp of indexed ctx item
+
+        :param id: record id
+        :param doc_id: document id
+        :return: True if updated
+        """
+        return self.provider.update_ctx_item(
+            id=id,
+            doc_id=doc_id,
+        )
+
     def remove(
             self,
             store_id: str,
@@ -122,6 +162,14 @@ class Ctx:
             meta_id=meta_id,
         )
 
+    def remove_items(self, ids: List[int]):
+        """
+        Remove indexed ctx items records
+
+        :param ids: record ids
+        """
+        self.provider.remove_ctx_items(ids)
+
     def truncate(
             self,
             store_id: Optional[str] = None,
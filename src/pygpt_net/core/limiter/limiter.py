@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional, Dict, Any, Callable
+
+
+class Bucket:
+    MIN_FACTOR = 0.25  # min rate factor after repeated 429 responses
+    RECOVERY_STEP = 0.05  # rate factor recovery per successful acquire
+
+    def __init__(
+            self,
+            rpm: int = 0,
+            tpm: int = 0,
+            burst: int = 1,
+            now: float = 0.0
+    ):
+        """
+        Token bucket for requests (RPM) and tokens (TPM)
+
+        :param rpm: requests per minute, 0 = no limit
+        :param tpm: tokens per minute, 0 = no limit
+        :param burst: max number of requests sent at once
+        :param now: current time (monotonic)
+        """
+        self.rpm = 0
+        self.tpm = 0
+        self.burst = 1
+        self.requests = 0.0  # available requests
+        self.tokens = 0.0  # available tokens
+        self.factor = 1.0  # rate factor, lowered after 429 responses
+        self.blocked_until = 0.0  # Retry-After deadline
+        self.updated = now
+        self.configure(rpm, tpm, burst)
+        self.requests = float(self.burst)
+        self.tokens = float(self.tpm)
+
+    def configure(self, rpm: int, tpm: int, burst: int):
+        """
+        Update limits (levels are clamped to new capacity)
+
+        :param rpm: requests per minute
+        :param tpm: tokens per minute
+        :param burst: max number of requests sent at once
+        """
+        self.rpm = max(0, int(rpm or 0))
+        self.tpm = max(0, int(tpm or 0))
+        self.burst = max(1, int(burst or 1))
+        self.requests = min(self.requests, float(self.burst))
+        self.tokens = min(self.tokens, float(self.tpm))
+
+    def refill(self, now: float):
+        """
+        Refill bucket
+
+        :param now: current time (monotonic)
+        """
+        elapsed = max(0.0, now - self.updated)
+        self.updated = now
+        if self.rpm > 0:
+            rate = self.rpm / 60.0 * self.factor
+            self.requests = min(float(self.burst), self.requests + elapsed * rate)
+        if self.tpm > 0:
+            rate = self.tpm / 60.0 * self.factor
+            self.tokens = min(float(self.tpm), self.tokens + elapsed * rate)
+
+    def get_delay(self, tokens: int, now: float) -> float:
+        """
+        Get time to wait before request can be sent
+
+        :param tokens: number of tokens in request
+        :param now: current time (monotonic)
+        :return: delay in seconds, 0 = can be sent now
+        """
+        delay = max(0.0, self.blocked_until - now)
+        if self.rpm > 0 and self.requests < 1.0:
+            rate = self.rpm / 60.0 * self.factor
+            delay = max(delay, (1.0 - self.requests) / rate)
+        if self.tpm > 0 and tokens > 0:
+            need = min(float(tokens), float(self.tpm))  # larger requests wait for a full bucket
+            if self.tokens < need:
+                rate = self.tpm / 60.0 * self.factor
+                delay = max(delay, (need - self.tokens) / rate)
+        return delay
+
+    def consume(self, tokens: int):
+        """
+        Consume request and tokens
+
+        :param tokens: number of tokens in request
+        """
+        if self.rpm > 0:
+            self.requests -= 1.0
+        if self.tpm > 0 and tokens > 0:
+            self.tokens -= min(float(tokens), float(self.tpm))
+        if self.factor < 1.0:
+            self.factor = min(1.0, self.factor + self.RECOVERY_STEP)
+
+    def penalize(self, retry_after: float, now: float):
+        """
+        Slow down after 429 response
+
+        :param retry_after: seconds to wait
+        :param now: current time (monotonic)
+        """
+        self.blocked_until = max(self.blocked_until, now + retry_after)
+        self.factor = max(self.MIN_FACTOR, self.factor * 0.5)
+        self.requests = min(self.requests, 0.0)
+
+
+class Limiter:
+    DEFAULT_RETRY_AFTER = 5.0  # seconds, if 429 response has no Retry-After header
+    MAX_SLEEP = 0.5  # max single sleep in wait(), to check stop flag
+
+    def __init__(self, window=None):
+        """
+        Process-wide rate limiter (token buckets keyed by provider and model)
+
+        :param window: Window instance
+        """
+        self.window = window
+        self.buckets = {}  # key -> Bucket
+        self.lock = threading.Lock()
+        self.clock = time.monotonic
+        self.sleep = time.sleep
+
+    def get_key(self, provider: Optional[str], model: Optional[str] = None) -> str:
+        """
+        Get bucket key
+
+        :param provider: provider ID
+        :param model: model ID
+        :return: bucket key
+        """
+        return "{}/{}".format(provider or "default", model or "*")
+
+    def acquire(
+            self,
+            key: str,
+            tokens: int = 0,
+            rpm: int = 0,
+            tpm: int = 0,
+            burst: int = 1
+    ) -> float:
+        """
+        Try to acquire request slot (non-blocking)
+
+        :param key: bucket key
+        :param tokens: estimated number of tokens in request
+        :param rpm: requests per minute, 0 = no limit
+        :param tpm: tokens per minute, 0 = no limit
+        :param burst: max number of requests sent at once
+        :return: 0 if acquired, otherwise seconds to wait before next try
+        """
+        with self.lock:
+            now = self.clock()
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                bucket = Bucket(rpm, tpm, burst, now)
+                self.buckets[key] = bucket
+            else:
+                bucket.refill(now)
+                bucket.configure(rpm, tpm, burst)
+            delay = bucket.get_delay(tokens, now)
+            if delay > 0:
+                return delay
+            bucket.consume(tokens)
+            return 0.0
+
+    def wait(
+            self,
+            key: str,
+            tokens: int = 0,
+            rpm: int = 0,
+            tpm: int = 0,
+            burst: int = 1,
+            stopped: Optional[Callable[[], bool]] = None,
+            log: Optional[Callable[[str], Any]] = None
+    ) -> float:
+        """
+        Acquire request slot, sleep in current thread if needed
+
+        :param key: bucket key
+        :param tokens: estimated number of tokens in request
+        :param rpm: requests per minute, 0 = no limit
+        :param tpm: tokens per minute, 0 = no limit
+        :param burst: max number of requests sent at once
+        :param stopped: callable returning True if waiting should be aborted
+        :param log: log callable
+        :return: total time slept in seconds
+        """
+        slept = 0.0
+        logged = False
+        while True:
+            delay = self.acquire(key, tokens, rpm, tpm, burst)
+            if delay <= 0:
+                return slept
+            if stopped is not None and stopped():
+                return slept
+            if log is not None and not logged:
+                log("Rate limit [{}]: wait for {:.2f} seconds".format(key, delay))
+                logged = True
+            delay = min(delay, self.MAX_SLEEP)
+            self.sleep(delay)
+            slept += delay
+
+    def report(self, key: str, retry_after: Optional[float] = None):
+        """
+        Report rate limit response (HTTP 429) from provider
+
+        :param key: bucket key
+        :param retry_after: seconds from Retry-After header
+        """
+        if retry_after is None or retry_after < 0:
+            retry_after = self.DEFAULT_RETRY_AFTER
+        with self.lock:
+            now = self.clock()
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                bucket = Bucket(now=now)
+                self.buckets[key] = bucket
+            bucket.refill(now)
+            bucket.penalize(retry_after, now)
+
+    def handle_error(self, key: str, error: Exception) -> bool:
+        """
+        Check if exception is a rate limit error and report it
+
+        :param key: bucket key
+        :param error: exception from provider SDK
+        :return: True if rate limit error
+        """
+        response = getattr(error, "response", None)
+        status = getattr(error, "status_code", None) or getattr(error, "code", None)
+        if status is None and response is not None:
+            status = getattr(response, "status_code", None)
+        if str(status) != "429" and type(error).__name__ != "RateLimitError":
+            return False
+        retry_after = None
+        headers = getattr(response, "headers", None)
+        if headers is not None:
+            try:
+                ms = headers.get("retry-after-ms")
+                retry_after = self.parse_retry_after(float(ms) / 1000.0 if ms else headers.get("retry-after"))
+            except Exception:
+                retry_after = None
+        self.report(key, retry_after)
+        self.window.core.debug.info("[limiter] Rate limit response for {}, retry after: {}".format(key, retry_after))
+        return True
+
+    def get_headroom(self, key: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get current headroom
+
+        :param key: bucket key, None = all buckets
+        :return: headroom dict (or dict of key -> headroom)
+        """
+        with self.lock:
+            now = self.clock()
+            keys = [key] if key is not None else list(self.buckets.keys())
+            result = {}
+            for k in keys:
+                bucket = self.buckets.get(k)
+                if bucket is None:
+                    continue
+                bucket.refill(now)
+                result[k] = {
+                    "requests": int(bucket.requests) if bucket.rpm > 0 else None,
+                    "tokens": int(bucket.tokens) if bucket.tpm > 0 else None,
+                    "rpm": bucket.rpm,
+                    "tpm": bucket.tpm,
+                    "factor": round(bucket.factor, 2),
+                    "blocked": round(max(0.0, bucket.blocked_until - now), 2),
+                }
+        if key is not None:
+            return result.get(key, {})
+        return result
+
+    def reset(self):
+        """Reset all buckets"""
+        with self.lock:
+            self.buckets.clear()
+
+    @staticmethod
+    def estimate_tokens(*texts: Optional[str]) -> int:
+        """
+        Estimate number of tokens (fast, without tokenizer)
+
+        :param texts: texts
+        :return: estimated number of tokens
+        """
+        return sum(len(t) for t in texts if t) // 4
+
+    @staticmethod
+    def parse_retry_after(value: Any) -> Optional[float]:
+        """
+        Parse Retry-After value (seconds or HTTP date)
+
+        :param value: header value
+        :return: seconds or None
+        """
+        if value is None or value == "":
+            return None
+        try:
+            return max(0.0, float(value))
+        except (TypeError, ValueError):
+            pass
+        try:
+            dt = parsedate_to_datetime(str(value))
+            return max(0.0, dt.timestamp() - time.time())
+        except Exception:
+            return None
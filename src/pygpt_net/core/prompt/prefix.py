@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.19 00:00:00                  #
+# ================================================== #
+
+import copy
+import hashlib
+import json
+import re
+import time
+from typing import Optional, List, Dict, Any, Tuple
+
+from pygpt_net.item.ctx import CtxItem
+
+
+class Prefix:
+    RE_TRAILING_WS = re.compile(r'[ \t]+$', re.MULTILINE)
+    RE_MULTI_NL = re.compile(r'\n{3,}')
+    MAX_ANTHROPIC_BREAKPOINTS = 4  # API limit for cache_control blocks per request
+    CACHING_PROVIDERS = (  # providers with prefix caching (automatic or cache_control)
+        "anthropic",
+        "azure_openai",
+        "deepseek_api",
+        "google",
+        "openai",
+        "x_ai",
+    )
+
+    def __init__(self, window=None):
+        """
+        Stable prompt prefix builder (provider-side prompt caching)
+
+        Keeps system prompt, tool definitions and older history byte-identical
+        between turns, so provider prefix caches (Anthropic cache_control,
+        OpenAI automatic prefix caching, Gemini context caching) can be hit.
+
+        :param window: Window instance
+        """
+        self.window = window
+        self.google_caches = {}  # prefix hash -> (cache name, expire timestamp)
+
+    def is_enabled(self) -> bool:
+        """
+        Check if stable prefix building is enabled
+
+        :return: True if enabled
+        """
+        return bool(self.window.core.config.get("prompt.cache", True))
+
+    def is_history_aligned(self, model: Optional[str]) -> bool:
+        """
+        Check if truncated history should be aligned for model
+
+        Alignment drops up to (step - 1) more history items that would fit,
+        so it is used only if the model provider caches prompt prefixes.
+
+        :param model: model ID
+        :return: True if provider of the model does prefix caching
+        """
+        if not model or not self.is_enabled():
+            return False
+        models = self.window.core.models
+        if not models.has(model):
+            return False
+        provider = models.get(model).provider
+        if provider == "anthropic" and not self.window.core.config.get("prompt.cache.anthropic", True):
+            return False  # no cache breakpoints, nothing is cached
+        return provider in self.CACHING_PROVIDERS
+
+    def get_history_step(self) -> int:
+        """
+        Get history window alignment step (number of items)
+
+        :return: step
+        """
+        try:
+            step = int(self.window.core.config.get("prompt.cache.history_step", 8))
+        except (TypeError, ValueError):
+            step = 8
+        return max(1, step)
+
+    def normalize(self, text: Optional[str]) -> Optional[str]:
+        """
+        Normalize whitespace in prompt text (trailing spaces, blank lines)
+
+        :param text: prompt text
+        :return: normalized text
+        """
+        if not text or not self.is_enabled():
+            return text
+        text = self.RE_TRAILING_WS.sub('', text)
+        text = self.RE_MULTI_NL.sub('\n\n', text)
+        return text.strip()
+
+    def align_history(
+            self,
+            items: List[CtxItem],
+            skipped: int
+    ) -> List[CtxItem]:
+        """
+        Align the start of truncated history to a fixed step
+
+        Without alignment the oldest item moves by one on every turn once
+        the token limit is reached, so the whole prefix changes every turn.
+        Dropping items in fixed-size steps keeps the prefix stable for up to
+        `step` turns.
+
+        :param items: fitted history items (oldest first)
+        :param skipped: number of older items already dropped to fit the limit
+        :return: aligned history items
+        """
+        if skipped <= 0 or not items or not self.is_enabled():
+            return items
+        step = self.get_history_step()
+        remainder = skipped % step
+        if remainder == 0:
+            return items
+        extra = step - remainder
+        if extra >= len(items):
+            return items
+        return items[extra:]
+
+    def get_hash(self, *parts: Any) -> str:
+        """
+        Get hash of prefix parts
+
+        :param parts: prefix parts (strings or JSON-serializable)
+        :return: hex digest
+        """
+        h = hashlib.sha256()
+        for part in parts:
+            if not isinstance(part, str):
+                try:
+                    part = json.dumps(part, sort_keys=True, default=str)
+                except Exception:
+                    part = str(part)
+            h.update(part.encode("utf-8", "ignore"))
+            h.update(b"\x00")
+        return h.hexdigest()
+
+    def apply_anthropic(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Mark cache breakpoints in Anthropic Messages API params
+
+        Breakpoints: last tool definition, system prompt and the last message
+        of the older history (before the current user message).
+
+        :param params: request params (model, system, tools, messages)
+        :return: params with cache_control markers
+        """
+        if not self.is_enabled() or not self.window.core.config.get("prompt.cache.anthropic", True):
+            return params
+        marker = {"type": "ephemeral"}
+        ttl = str(self.window.core.config.get("prompt.cache.anthropic.ttl", "5m") or "5m")
+        if ttl == "1h":
+            marker["ttl"] = "1h"
+        used = 0
+
+        tools = params.get("tools")
+        if tools:
+            # only client tools with name, server tools are not cacheable blocks
+            for i in range(len(tools) - 1, -1, -1):
+                if isinstance(tools[i], dict) and tools[i].get("name") and "input_schema" in tools[i]:
+                    tools[i] = dict(tools[i])
+                    tools[i]["cache_control"] = dict(marker)
+                    used += 1
+                    break
+
+        system = params.get("system")
+        if system:
+            if isinstance(system, str):
+                params["system"] = [{"type": "text", "text": system, "cache_control": dict(marker)}]
+                used += 1
+            elif isinstance(system, list) and system and isinstance(system[-1], dict):
+                system[-1] = dict(system[-1])
+                system[-1]["cache_control"] = dict(marker)
+                used += 1
+
+        messages = params.get("messages") or []
+        if len(messages) > 1 and used < self.MAX_ANTHROPIC_BREAKPOINTS:
+            msg = messages[-2]  # last history message
+            content = msg.get("content")
+            if isinstance(content, str) and content:
+                msg["content"] = [{"type": "text", "text": content, "cache_control": dict(marker)}]
+            elif isinstance(content, list) and content and isinstance(content[-1], dict):
+                content[-1] = dict(content[-1])
+                content[-1]["cache_control"] = dict(marker)
+        return params
+
+    def apply_google(
+            self,
+            client,
+            model_id: str,
+            system_prompt: Optional[str],
+            tools: Optional[list],
+            contents: list
+    ) -> Tuple[Optional[str], list]:
+        """
+        Get (or create) Gemini explicit context cache for stable prefix
+
+        Gemini 2.5+ models use implicit caching for stable prefixes; explicit
+        caching is opt-in and used only when the prefix is large enough.
+        Only a step-aligned part of older history is cached, so the same cache
+        is reused for several turns while new messages are appended.
+
+        :param client: google genai client
+        :param model_id: model ID
+        :param system_prompt: system instruction
+        :param tools: tools list
+        :param contents: input contents (current user message is the last one)
+        :return: (cached content name or None, contents to send)
+        """
+        if not self.is_enabled() or not self.window.core.config.get("prompt.cache.google.explicit", False):
+            return None, contents
+        if not contents or len(contents) < 2:
+            return None, contents
+
+        history = contents[:-1]
+        step = self.get_history_step() * 2  # user + model content per ctx item
+        size = len(history) - (len(history) % step)
+        if size <= 0:
+            return None, contents
+        prefix = history[:size]
+
+        min_tokens = int(self.window.core.config.get("prompt.cache.google.min_tokens", 4096) or 4096)
+        estimate = len(str(system_prompt or "")) // 4
+        for content in prefix:
+            for part in getattr(content, "parts", None) or []:
+                estimate += len(str(getattr(part, "text", "") or "")) // 4
+        if estimate < min_tokens:
+            return None, contents
+
+        key = self.get_hash(
+            model_id,
+            system_prompt or "",
+            [self._dump_obj(t) for t in (tools or [])],
+            [self._dump_obj(c) for c in prefix],
+        )
+        now = time.time()
+        cached = self.google_caches.get(key)
+        if cached and cached[1] > now + 10:
+            return cached[0], contents[size:]
+
+        ttl = int(self.window.core.config.get("prompt.cache.google.ttl", 300) or 300)
+        try:
+            from google.genai import types as gtypes
+            cfg = gtypes.CreateCachedContentConfig(
+                contents=prefix,
+                system_instruction=system_prompt if system_prompt else None,
+                tools=tools if tools else None,
+                ttl=f"{ttl}s",
+            )
+            cache = client.caches.create(model=model_id, config=cfg)
+            name = getattr(cache, "name", None)
+            if name:
+                self.clear_expired()
+                self.google_caches[key] = (name, now + ttl)
+                self.window.core.debug.info("[prompt] Google context cache created: {}".format(name))
+                return name, contents[size:]
+        except Exception as e:
+            self.window.core.debug.info("[prompt] Google context cache not created: {}".format(e))
+        return None, contents
+
+    def clear_expired(self):
+        """Remove expired Gemini cache references"""
+        now = time.time()
+        for key in [k for k, v in self.google_caches.items() if v[1] <= now]:
+            del self.google_caches[key]
+
+    def record_usage(
+            self,
+            ctx: CtxItem,
+            cached: Optional[int] = 0,
+            written: Optional[int] = 0
+    ):
+        """
+        Record cached prompt tokens in ctx usage counters
+
+        :param ctx: context item
+        :param cached: prompt tokens read from provider cache
+        :param written: prompt tokens written to provider cache
+        """
+        if ctx is None:
+            return
+        if not isinstance(ctx.extra, dict):
+            ctx.extra = {}
+        usage = ctx.extra.get("usage")
+        if not isinstance(usage, dict):
+            usage = {}
+            ctx.extra["usage"] = usage
+        usage["cached_tokens"] = int(cached or 0)
+        if written:
+            usage["cache_write_tokens"] = int(written)
+        if cached:
+            self.window.core.debug.info("[prompt] Cached prompt tokens: {}".format(cached))
+
+    def _dump_obj(self, obj: Any) -> Any:
+        """
+        Dump SDK object to plain data for hashing
+
+        :param obj: SDK object
+        :return: plain data
+        """
+        try:
+            if hasattr(obj, "model_dump"):
+                return obj.model_dump(exclude_none=True)
+        except Exception:
+            pass
+        if isinstance(obj, (dict, list, str, int, float, bool)) or obj is None:
+            return copy.deepcopy(obj)
+        return str(obj)
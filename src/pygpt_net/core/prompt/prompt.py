@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.09 19:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from pygpt_net.core.events import Event
@@ -16,6 +16,7 @@ from pygpt_net.item.model import ModelItem
 
 from .base import Base
 from .custom import Custom
+from .prefix import Prefix
 from .template import Template
 
 class Prompt:
@@ -28,6 +29,7 @@ class Prompt:
         self.window = window
         self.base = Base(window)
         self.custom = Custom(window)
+        self.prefix = Prefix(window)
         self.template = Template(window)
 
     def get(
@@ -78,7 +80,7 @@ class Prompt:
 
             # abort if native func call enabled
             if self.window.core.command.is_native_enabled():
-                return prompt
+                return self.prefix.normalize(prompt)
 
             # abort if model not supported
             # if not self.window.core.command.is_model_supports_tools(mode, model):
@@ -116,7 +118,7 @@ class Prompt:
                         model=model,
                     )
 
-        return prompt
+        return self.prefix.normalize(prompt)
 
     def prepare_sys_prompt(
             self,
@@ -182,7 +184,7 @@ class Prompt:
         # event: tools syntax apply (if tools enabled or inline plugin then append tools prompt)
         if self.window.core.config.get('cmd') or self.window.controller.plugins.is_type_enabled("cmd.inline"):
             if self.window.core.command.is_native_enabled(force=force_native_tools) and not force_syntax_tools:
-                return sys_prompt  # abort syntax if native func calls enabled
+                return self.prefix.normalize(sys_prompt)  # abort syntax if native func calls enabled
 
             data = {
                 'mode': mode,
@@ -214,4 +216,4 @@ class Prompt:
                         model=model,
                     )
 
-        return sys_prompt
+        return self.prefix.normalize(sys_prompt)
@@ -6,9 +6,10 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.31 23:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
+import base64
 import io
 import math
 import os
@@ -183,6 +184,17 @@ def iter_pcm_chunks(pcm: bytes, sr: int, ms: int = 50) -> List[bytes]:
     n = max(b_per_ms * ms, 1)
     return [pcm[i:i + n] for i in range(0, len(pcm), n)]
 
+def packet_bytes(sr: int, ms: int) -> int:
+    """Size in bytes of ~ms PCM16 mono packet."""
+    return max(2, int(sr * 2 / 1000) * max(1, int(ms)))
+
+def build_append_message(pcm) -> str:
+    """
+    Build input_audio_buffer.append message (OpenAI-compatible) without
+    intermediate dict / json.dumps, base64 output is JSON-safe.
+    """
+    return '{"type":"input_audio_buffer.append","audio":"' + base64.b64encode(pcm).decode("ascii") + '"}'
+
 def dump_wav(path: str, sample_rate: int, pcm16_mono: bytes):
     try:
         os.makedirs(os.path.dirname(path), exist_ok=True)
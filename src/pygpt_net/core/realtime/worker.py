@@ -6,10 +6,11 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.06 20:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import asyncio
+import time
 from typing import Optional
 
 from PySide6.QtCore import Slot, QRunnable, QObject, Signal
@@ -112,6 +113,7 @@ class RealtimeWorker(QRunnable):
                             "rate": int(rate) if rate is not None else None,
                             "channels": int(channels) if channels is not None else None,
                             "final": bool(final),
+                            "ts": time.monotonic(),  # socket receive time, for socket-to-speaker latency
                             "provider": self.opts.provider,
                             "model": self.opts.model,
                         }
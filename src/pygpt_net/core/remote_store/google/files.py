@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.02 20:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from typing import Optional, List, Dict, Union
@@ -117,6 +117,9 @@ class Files:
     def get_all_by_file_id(self, file_id: str) -> dict:
         return self.provider.get_all_by_file_id(file_id)
 
+    def get_hashes(self, store_id: str) -> Dict[str, str]:
+        return self.provider.get_hashes(self.PROVIDER_NAME, store_id)
+
     def delete(self, file: Union[RemoteFileItem, list]) -> bool:
         files = file if isinstance(file, list) else [file]
         for f in files:
@@ -185,12 +188,13 @@ class Files:
             pass
         return True
 
-    def insert(self, store_id: str, data) -> RemoteFileItem:
+    def insert(self, store_id: str, data, hash: str = "") -> RemoteFileItem:
         """
         Insert a Document into local DB
 
         :param store_id: store name ('fileSearchStores/...').
         :param data: document object from API
+        :param hash: content hash
         """
         file = RemoteFileItem()
         # Use document name as unique id and file_id
@@ -206,6 +210,7 @@ class Files:
         except Exception:
             file.size = 0
         file.store_id = store_id
+        file.hash = hash or ""
         file.record_id = self.provider.create(file)
         self.items[file.id] = file
         return file
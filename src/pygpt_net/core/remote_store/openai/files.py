@@ -6,9 +6,10 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.02 19:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
+import os
 from typing import Optional, List, Dict, Union
 
 from packaging.version import Version
@@ -237,6 +238,15 @@ class Files:
         """
         return self.provider.get_all_by_file_id(file_id)
 
+    def get_hashes(self, store_id: str) -> Dict[str, str]:
+        """
+        Get content hashes of files in store
+
+        :param store_id: store ID
+        :return: dict hash -> file ID
+        """
+        return self.provider.get_hashes(self.PROVIDER_NAME, store_id)
+
     def delete(self, file: Union[RemoteFileItem, list]) -> bool:
         """
         Delete file and remove from vector stores if exists
@@ -347,12 +357,13 @@ class Files:
             self.create(file.assistant, file.thread_id, file.file_id, file.name, file.path, file.size)
         return True
 
-    def insert(self, store_id: str, data) -> RemoteFileItem:
+    def insert(self, store_id: str, data, hash: str = "") -> RemoteFileItem:
         """
         Insert file object
 
         :param store_id: store ID
         :param data: file data from API
+        :param hash: content hash
         """
         file = RemoteFileItem()
         file.id = data.id
@@ -363,6 +374,37 @@ class Files:
         file.path = data.filename
         file.size = data.bytes
         file.store_id = store_id
+        file.hash = hash or ""
+        file.record_id = self.provider.create(file)
+        self.items[file.id] = file
+        return file
+
+    def add(
+            self,
+            store_id: str,
+            file_id: str,
+            path: str,
+            hash: str = ""
+    ) -> RemoteFileItem:
+        """
+        Insert uploaded local file (without fetching file info from API)
+
+        :param store_id: store ID
+        :param file_id: file ID
+        :param path: local file path
+        :param hash: content hash
+        :return: file item
+        """
+        file = RemoteFileItem()
+        file.id = file_id
+        file.file_id = file_id
+        file.thread_id = ""
+        file.name = os.path.basename(path)
+        file.provider = self.PROVIDER_NAME
+        file.path = file.name
+        file.size = os.path.getsize(path) if os.path.exists(path) else 0
+        file.store_id = store_id
+        file.hash = hash or ""
         file.record_id = self.provider.create(file)
         self.items[file.id] = file
         return file
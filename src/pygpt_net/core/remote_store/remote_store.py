@@ -6,13 +6,14 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.02 20:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from .openai import Store as OpenAIStore
 from .google import Store as GoogleStore
 from .anthropic import Store as AnthropicStore
 from .xai import Store as XAIStore
+from .sync import Sync
 
 class RemoteStore:
     def __init__(self, window=None):
@@ -25,4 +26,5 @@ class RemoteStore:
         self.openai = OpenAIStore(self.window)
         self.google = GoogleStore(self.window)
         self.anthropic = AnthropicStore(self.window)
-        self.xai = XAIStore(self.window)
\ No newline at end of file
+        self.xai = XAIStore(self.window)
+        self.sync = Sync(self.window)
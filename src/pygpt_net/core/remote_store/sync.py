@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.19 00:00:00                  #
+# ================================================== #
+
+import hashlib
+import json
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, List, Dict, Any, Callable, Iterable, Tuple
+
+from pygpt_net.core.limiter import Limiter
+
+
+class SyncError(Exception):
+    def __init__(self, msg: str, done: int = 0, failed: int = 0):
+        """
+        Raised when some of remote items were not processed
+
+        :param msg: message
+        :param done: number of processed items
+        :param failed: number of failed items
+        """
+        super(SyncError, self).__init__(msg)
+        self.done = done
+        self.failed = failed
+
+
+class Sync:
+    DEFAULT_WORKERS = 8  # max parallel requests
+    DEFAULT_RETRIES = 3  # retries per request (after first attempt)
+    BATCH_SIZE = 100  # max files attached in one batch request
+    BACKOFF_BASE = 0.5  # first retry delay in seconds
+    BACKOFF_MAX = 30.0  # max retry delay in seconds
+    HASH_CHUNK = 1024 * 1024  # bytes read at once when hashing
+    JOURNAL_DIR = "remote_sync"
+
+    def __init__(self, window=None):
+        """
+        Remote files sync engine (parallel upload and delete)
+
+        :param window: Window instance
+        """
+        self.window = window
+        self.sleep = time.sleep
+
+    def get_workers(self) -> int:
+        """
+        Get max number of parallel requests
+
+        :return: number of workers
+        """
+        value = self.DEFAULT_WORKERS
+        if self.window is not None:
+            value = self.window.core.config.get("remote_store.sync.workers", self.DEFAULT_WORKERS)
+        return max(1, int(value or 1))
+
+    def get_retries(self) -> int:
+        """
+        Get max number of retries
+
+        :return: number of retries
+        """
+        value = self.DEFAULT_RETRIES
+        if self.window is not None:
+            value = self.window.core.config.get("remote_store.sync.retries", self.DEFAULT_RETRIES)
+        return max(0, int(value or 0))
+
+    @staticmethod
+    def hash_file(path: str) -> str:
+        """
+        Get content hash of file
+
+        :param path: file path
+        :return: sha256 hex digest
+        """
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            while True:
+                chunk = f.read(Sync.HASH_CHUNK)
+                if not chunk:
+                    break
+                h.update(chunk)
+        return h.hexdigest()
+
+    @staticmethod
+    def get_status(err: Exception) -> Optional[int]:
+        """
+        Get HTTP status code from exception
+
+        :param err: exception from provider SDK
+        :return: status code or None
+        """
+        status = getattr(err, "status_code", None) or getattr(err, "code", None)
+        if status is None:
+            response = getattr(err, "response", None)
+            status = getattr(response, "status_code", None)
+        try:
+            return int(status)
+        except (TypeError, ValueError):
+            return None
+
+    def is_retryable(self, err: Exception) -> bool:
+        """
+        Check if failed request can be retried
+
+        :param err: exception
+        :return: True if retryable (rate limit, server or connection error)
+        """
+        if isinstance(err, (FileNotFoundError, PermissionError, IsADirectoryError)):
+            return False
+        status = self.get_status(err)
+        if status is None:
+            return True  # connection error, timeout
+        return status == 429 or status == 408 or status >= 500
+
+    def get_delay(self, err: Exception, attempt: int) -> float:
+        """
+        Get delay before next retry (Retry-After or exponential backoff with jitter)
+
+        :param err: exception
+        :param attempt: retry number, starting from 0
+        :return: delay in seconds
+        """
+        headers = getattr(getattr(err, "response", None), "headers", None)
+        if headers is not None:
+            try:
+                ms = headers.get("retry-after-ms")
+                delay = Limiter.parse_retry_after(float(ms) / 1000.0 if ms else headers.get("retry-after"))
+                if delay is not None:
+                    return min(delay, self.BACKOFF_MAX)
+            except Exception:
+                pass
+        delay = min(self.BACKOFF_MAX, self.BACKOFF_BASE * (2 ** attempt))
+        return delay * (0.5 + random.random() * 0.5)
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Call function with retry and backoff
+
+        :param func: function
+        :param args: positional arguments
+        :param kwargs: keyword arguments
+        :return: function result
+        """
+        retries = self.get_retries()
+        attempt = 0
+        while True:
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if attempt >= retries or not self.is_retryable(e):
+                    raise
+                self.sleep(self.get_delay(e, attempt))
+                attempt += 1
+
+    def run(
+            self,
+            func: Callable[[Any], Any],
+            items: Iterable[Any],
+    ) -> Iterable[Tuple[Any, Any, Optional[Exception]]]:
+        """
+        Run function for all items in parallel (with retry)
+
+        Results are yielded in the calling thread, in completion order.
+
+        :param func: function called with item
+        :param items: items
+        :return: generator of (item, result, error)
+        """
+        items = list(items)
+        if not items:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.get_workers(), len(items))) as pool:
+            futures = {}
+            for item in items:
+                futures[pool.submit(self.call, func, item)] = item
+            try:
+                for future in as_completed(futures):
+                    item = futures[future]
+                    try:
+                        yield item, future.result(), None
+                    except Exception as e:
+                        yield item, None, e
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def get_journal_path(self, provider: str, store_id: str) -> str:
+        """
+        Get path of upload journal (uploaded, but not attached files)
+
+        :param provider: provider name
+        :param store_id: store ID
+        :return: journal file path
+        """
+        key = hashlib.md5("{}:{}".format(provider, store_id).encode("utf-8")).hexdigest()
+        return os.path.join(
+            self.window.core.config.get_user_path(),
+            self.JOURNAL_DIR,
+            "{}_{}.json".format(provider, key),
+        )
+
+    def load_journal(self, path: str) -> Dict[str, str]:
+        """
+        Load upload journal
+
+        :param path: journal file path
+        :return: dict hash -> file ID
+        """
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                return data
+        except Exception as e:
+            self.window.core.debug.log(e)
+        return {}
+
+    def save_journal(self, path: str, data: Dict[str, str]):
+        """
+        Save upload journal (removed if empty)
+
+        :param path: journal file path
+        :param data: dict hash -> file ID
+        """
+        if not data:
+            if os.path.exists(path):
+                os.remove(path)
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+
+    def upload(
+            self,
+            provider: str,
+            store_id: str,
+            paths: List[str],
+            existing: Dict[str, str],
+            upload: Callable[[str], Any],
+            commit: Callable[[str, Any, str], Any],
+            attach_batch: Optional[Callable[[List[str]], Any]] = None,
+            callback: Optional[Callable[[str], Any]] = None,
+            progress: Optional[Callable[[int, int], Any]] = None,
+    ) -> Dict[str, int]:
+        """
+        Upload files to remote store
+
+        Files with content already present in store (by hash) are skipped.
+        If attach_batch is given, upload() must return file ID and files are attached
+        to store in batches; uploaded but not yet attached files are kept in journal,
+        so interrupted sync continues without uploading them again.
+        Commit is always called in the calling thread.
+
+        :param provider: provider name
+        :param store_id: store ID
+        :param paths: local file paths
+        :param existing: content hashes of files already in store (hash -> file ID)
+        :param upload: upload function: path -> result (file ID if attach_batch is used)
+        :param commit: commit function: (path, result, hash), e.g. insert to DB
+        :param attach_batch: batch attach function: file IDs -> any
+        :param callback: log callback
+        :param progress: progress callback: (done, total)
+        :return: stats dict: uploaded, skipped, failed
+        """
+        stats = {"uploaded": 0, "skipped": 0, "failed": 0}
+        total = len(paths)
+        done = 0
+
+        def log(msg: str):
+            if callback is not None:
+                callback(msg)
+
+        def step(n: int = 1):
+            nonlocal done
+            done += n
+            if progress is not None:
+                progress(done, total)
+
+        # hash files in parallel
+        hashes = {}
+        for path, digest, err in self.run(self.hash_file, paths):
+            if err is not None:
+                log("Failed to read file {}: {}".format(path, err))
+                stats["failed"] += 1
+                step()
+            else:
+                hashes[path] = digest
+
+        # skip unchanged and duplicated files
+        journal_path = None
+        journal = {}
+        if attach_batch is not None:
+            journal_path = self.get_journal_path(provider, store_id)
+            journal = {k: v for k, v in self.load_journal(journal_path).items() if k not in existing}
+        pending = []  # paths to upload
+        resumed = []  # (path, file ID) uploaded in previous run
+        seen = set()
+        for path in paths:
+            digest = hashes.get(path)
+            if digest is None:
+                continue
+            if digest in existing or digest in seen:
+                stats["skipped"] += 1
+                step()
+                continue
+            seen.add(digest)
+            if digest in journal:
+                resumed.append((path, journal[digest]))
+            else:
+                pending.append(path)
+        if stats["skipped"] > 0:
+            log("Skipped unchanged files: {}".format(stats["skipped"]))
+
+        # single step upload
+        if attach_batch is None:
+            for path, result, err in self.run(upload, pending):
+                if err is None and result is not None:
+                    try:
+                        commit(path, result, hashes[path])
+                        stats["uploaded"] += 1
+                    except Exception as e:
+                        err = e
+                else:
+                    err = err or ValueError("Empty response")
+                if err is not None:
+                    stats["failed"] += 1
+                    log("Failed to upload file {}: {}".format(os.path.basename(path), err))
+                step()
+            return stats
+
+        # upload, then attach in batches
+        batch = list(resumed)
+
+        def flush():
+            if not batch:
+                return
+            ids = [file_id for _, file_id in batch]
+            try:
+                self.call(attach_batch, ids)
+                for p, file_id in batch:
+                    digest = hashes[p]
+                    commit(p, file_id, digest)
+                    journal.pop(digest, None)
+                    stats["uploaded"] += 1
+                log("Attached files to store {}: {}".format(store_id, len(ids)))
+            except Exception as e:
+                stats["failed"] += len(batch)
+                log("Failed to attach files to store {}: {}".format(store_id, e))
+            self.save_journal(journal_path, journal)
+            step(len(batch))
+            batch.clear()
+
+        for path, file_id, err in self.run(upload, pending):
+            if err is not None or not file_id:
+                stats["failed"] += 1
+                log("Failed to upload file {}: {}".format(os.path.basename(path), err or "Empty response"))
+                step()
+                continue
+            journal[hashes[path]] = file_id
+            self.save_journal(journal_path, journal)
+            batch.append((path, file_id))
+            if len(batch) >= self.BATCH_SIZE:
+                flush()
+        flush()
+        return stats
+
+    def delete(
+            self,
+            func: Callable[..., Any],
+            items: List[Any],
+            callback: Optional[Callable[[str], Any]] = None,
+            raise_errors: bool = False,
+    ) -> int:
+        """
+        Delete remote items in parallel
+
+        Failed items are logged and skipped, all other items are deleted anyway.
+
+        :param func: delete function, called with item (or *item if tuple)
+        :param items: items to delete (IDs or tuples of arguments)
+        :param callback: log callback
+        :param raise_errors: raise SyncError with failure count if any item was not deleted
+        :return: number of deleted items
+        """
+        num = 0
+        failed = 0
+
+        def remove(item):
+            if isinstance(item, tuple):
+                return func(*item)
+            return func(item)
+
+        for item, _, err in self.run(remove, items):
+            if err is not None:
+                failed += 1
+                if callback is not None:
+                    callback("Error removing {}: {}".format(item, err))
+                continue
+            num += 1
+        if failed > 0 and raise_errors:
+            raise SyncError(
+                "Failed to remove {} of {} items (removed: {})".format(failed, len(items), num),
+                done=num,
+                failed=failed,
+            )
+        return num
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.06 06:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from typing import Optional, List, Dict, Union
@@ -114,6 +114,9 @@ class Files:
     def get_all_by_file_id(self, file_id: str) -> dict:
         return self.provider.get_all_by_file_id(file_id)
 
+    def get_hashes(self, store_id: str) -> Dict[str, str]:
+        return self.provider.get_hashes(self.PROVIDER_NAME, store_id)
+
     def delete(self, file: Union[RemoteFileItem, list]) -> bool:
         """
         Delete a file entry and remove from its collections if possible.
@@ -185,12 +188,13 @@ class Files:
         self.window.core.api.xai.store.import_collection_files_collections(store_id, [])
         return True
 
-    def insert(self, store_id: str, data) -> RemoteFileItem:
+    def insert(self, store_id: str, data, hash: str = "") -> RemoteFileItem:
         """
         Insert a File into local DB, linked to given collection (store_id).
 
         :param store_id: collection id
         :param data: file/document object from API (Files metadata)
+        :param hash: content hash
         """
         file = RemoteFileItem()
         file.id = getattr(data, "id", None) or getattr(data, "name", None)
@@ -207,6 +211,7 @@ class Files:
         except Exception:
             file.size = 0
         file.store_id = store_id
+        file.hash = hash or ""
         file.record_id = self.provider.create(file)
         self.items[file.id] = file
         return file
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.11 08:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from typing import Optional, List
@@ -173,7 +173,8 @@ class BaseRenderer:
             self,
             meta: CtxMeta,
             items: List[CtxItem],
-            clear: bool = True
+            clear: bool = True,
+            payload: Optional[str] = None
     ):
         """
         Append all context to output
@@ -181,6 +182,21 @@ class BaseRenderer:
         :param meta: context meta
         :param items: context items
         :param clear: True if clear all output before append
+        :param payload: prepared payload (prefetched, used by web renderer only)
+        """
+        pass
+
+    def build_context_payload(
+            self,
+            meta: CtxMeta,
+            items: List[CtxItem]
+    ) -> Optional[str]:
+        """
+        Build context payload in background (prefetch)
+
+        :param meta: context meta
+        :param items: context items
+        :return: prepared payload or None if not supported
         """
         pass
 
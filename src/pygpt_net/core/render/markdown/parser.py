@@ -6,18 +6,68 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.05 23:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
+import hashlib
+import re
+from collections import OrderedDict
+from typing import List
+
 import markdown
 from bs4 import BeautifulSoup
 from bs4.element import NavigableString
 
 from pygpt_net.utils import trans
 
+FENCE_RE = re.compile(r"^(`{3,}|~{3,})")
+MERGE_RE = re.compile(r"^(?:[*+-][ \t]|\d+[.)][ \t]|>)")  # list items and quotes continue previous block
+REFERENCE_RE = re.compile(r"^ {0,3}\[[^\]\n]+\]:[ \t]*\S", re.MULTILINE)
+
+
+def split_blocks(text: str) -> List[str]:
+    """
+    Split Markdown text into top-level blocks at stable boundaries
+
+    Boundary is a blank line outside of fenced code followed by not indented line
+    which does not continue previous block (list item, quote). Text with raw HTML
+    blocks or reference links is not split.
+
+    :param text: Markdown text
+    :return: blocks, last one may be still open (streaming)
+    """
+    if REFERENCE_RE.search(text):
+        return [text]
+    blocks = []
+    lines = []
+    fence = None
+    blank = False
+    for line in text.split("\n"):
+        if fence is not None:
+            if line.rstrip(" ") == fence:
+                fence = None
+        elif not line.strip():
+            blank = True
+        else:
+            if line.startswith("<"):
+                return [text]
+            if blank and lines and not line[0].isspace() and not MERGE_RE.match(line):
+                blocks.append("\n".join(lines).rstrip())
+                lines = []
+            blank = False
+            match = FENCE_RE.match(line)
+            if match:
+                fence = match.group(1)
+        lines.append(line)
+    if lines:
+        blocks.append("\n".join(lines).rstrip())
+    return blocks
+
 
 class Parser:
 
+    MAX_BLOCKS = 256  # max cached HTML of completed blocks
+
     def __init__(self, window=None):
         """
         Markdown parser core
@@ -27,6 +77,7 @@ class Parser:
         self.window = window
         self.md = None
         self.code_blocks = {}
+        self.blocks = OrderedDict()  # block hash -> HTML, completed blocks (LRU)
         self.block_idx = 1
 
     def init(self):
@@ -41,6 +92,7 @@ class Parser:
         Reset parser
         """
         self.code_blocks = {}
+        self.blocks.clear()  # cached blocks have code block indexes
         self.block_idx = 1
 
     def get_code_blocks(self):
@@ -53,24 +105,51 @@ class Parser:
 
     def parse(self, text: str) -> str:
         """
-        Parse markdown text
+        Parse markdown text (when streaming, only last open block is parsed again)
 
         :param text: markdown text
         :return: html formatted text
         """
         self.init()
         try:
-            html = self.md.convert(text.strip())
-            soup = BeautifulSoup(html, 'html.parser')
-            self.strip_whitespace_lists(soup)  # strip whitespace from codeblocks
-            self.strip_whitespace_codeblocks(soup)  # strip whitespace from codeblocks
-            self.parse_code_blocks(soup)  # parse code blocks
-            self.format_images(soup)  # add width to img tags
-            text = " " + str(soup) + " "
+            blocks = split_blocks(text.strip())
+            last = len(blocks) - 1
+            result = []
+            for i, block in enumerate(blocks):
+                if i < last:  # completed block
+                    key = hashlib.sha1(block.encode("utf-8", "surrogatepass")).hexdigest()
+                    if key in self.blocks:
+                        self.blocks.move_to_end(key)
+                    else:
+                        self.blocks[key] = self.parse_block(block)
+                        while len(self.blocks) > self.MAX_BLOCKS:
+                            self.blocks.popitem(last=False)
+                    result.append(self.blocks[key])
+                else:
+                    result.append(self.parse_block(block))
+            text = " " + "\n".join(result) + " "
         except Exception as e:
             pass
         return text
 
+    def parse_block(self, text: str) -> str:
+        """
+        Parse markdown block
+
+        :param text: markdown block
+        :return: html formatted block
+        """
+        html = self.md.convert(text)
+        self.md.reset()
+        soup = BeautifulSoup(html, 'html.parser')
+        self.strip_whitespace_lists(soup)  # strip whitespace from codeblocks
+        self.strip_whitespace_codeblocks(soup)  # strip whitespace from codeblocks
+        self.parse_code_blocks(soup)  # parse code blocks
+        self.format_images(soup)  # add width to img tags
+        result = str(soup)
+        soup.decompose()
+        return result
+
     def strip_whitespace_lists(self, soup):
         """
         Strip whitespace from lists
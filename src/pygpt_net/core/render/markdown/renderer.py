@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.07.17 19:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import re
@@ -163,7 +163,8 @@ class Renderer(BaseRenderer):
             self,
             meta: CtxMeta,
             items: List[CtxItem],
-            clear: bool = True
+            clear: bool = True,
+            payload: Optional[str] = None
     ):
         """
         Append all context to output
@@ -171,6 +172,7 @@ class Renderer(BaseRenderer):
         :param meta: context meta
         :param items: context items
         :param clear: True if clear all output before append
+        :param payload: prepared payload (prefetched, used by web renderer only)
         """
         if clear:
             self.clear_output(meta)
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.08.16 21:25:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import json
@@ -521,16 +521,23 @@ class Renderer(BaseRenderer):
         except Exception:
             pass
 
-    def append_context(self, meta: CtxMeta, items: List[CtxItem], clear: bool = True):
+    def append_context(
+            self,
+            meta: CtxMeta,
+            items: List[CtxItem],
+            clear: bool = True,
+            payload: Optional[str] = None
+    ):
         """
         Append all context items to output
 
         :param meta: context meta
         :param items: list of context items
         :param clear: clear previous content
+        :param payload: prepared JSON payload (prefetched)
         """
         self.tool_output_end()
-        self.append_context_all(meta, items, clear=clear)
+        self.append_context_all(meta, items, clear=clear, payload=payload)
 
     def append_context_partial(self, meta: CtxMeta, items: List[CtxItem], clear: bool = True):
         """
@@ -591,13 +598,20 @@ class Renderer(BaseRenderer):
         if self.pids[pid].html != "":
             self.append(pid, self.pids[pid].html, flush=True)
 
-    def append_context_all(self, meta: CtxMeta, items: List[CtxItem], clear: bool = True):
+    def append_context_all(
+            self,
+            meta: CtxMeta,
+            items: List[CtxItem],
+            clear: bool = True,
+            payload: Optional[str] = None
+    ):
         """
         Append whole context at once, using JSON nodes
 
         :param meta: context meta
         :param items: list of context items
         :param clear: clear previous content
+        :param payload: prepared JSON payload (prefetched), built from items if not given
         """
         if len(items) == 0:
             if meta is None:
@@ -612,13 +626,40 @@ class Renderer(BaseRenderer):
 
         self.pids[pid].use_buffer = True
         self.pids[pid].html = ""
+
+        if payload is None:
+            nodes = self.build_context_nodes(meta, items, self.pids[pid])
+            if nodes:
+                payload = json.dumps({"nodes": nodes}, ensure_ascii=False, separators=(',', ':'))
+        else:
+            for item in items:
+                self.update_names(meta, item)
+
+        if payload:
+            self.append(pid, payload, replace=True)
+
+        self.pids[pid].use_buffer = False
+        if self.pids[pid].html != "":
+            self.append(pid, self.pids[pid].html, flush=True, replace=True)
+
+    def build_context_nodes(self, meta: CtxMeta, items: List[CtxItem], state: PidData) -> List[dict]:
+        """
+        Build render nodes for whole context
+
+        :param meta: context meta
+        :param items: list of context items
+        :param state: PID data (names are updated while building)
+        :return: list of nodes
+        """
         prev_ctx = None
-        next_ctx = None
         total = len(items)
         nodes: List[dict] = []
 
         for i, item in enumerate(items):
-            self.update_names(meta, item)
+            if item.input_name is not None and item.input_name != "":
+                state.name_user = item.input_name
+            if item.output_name is not None and item.output_name != "":
+                state.name_bot = item.output_name
             item.idx = i
             if i == 0:
                 item.first = True
@@ -639,21 +680,36 @@ class Renderer(BaseRenderer):
                 prev_ctx=prev_ctx,
                 next_ctx=next_ctx,
                 action_state=action_state,
+                state=state,
+                hidden_keys=(
+                    self._get_hidden_tool_chain_image_keys(items, i),
+                    self._get_hidden_tool_chain_file_keys(items, i),
+                    self._get_hidden_tool_chain_url_keys(items, i),
+                ),
             )
             if block:
                 nodes.append(block.to_dict())
 
             prev_ctx = item
 
-        if nodes:
-            payload = json.dumps({"nodes": nodes}, ensure_ascii=False, separators=(',', ':'))
-            self.append(pid, payload, replace=True)
+        return nodes
 
-        prev_ctx = None
-        next_ctx = None
-        self.pids[pid].use_buffer = False
-        if self.pids[pid].html != "":
-            self.append(pid, self.pids[pid].html, flush=True, replace=True)
+    def build_context_payload(self, meta: CtxMeta, items: List[CtxItem]) -> Optional[str]:
+        """
+        Build whole context JSON payload without touching output state (used in background by prefetch)
+
+        :param meta: context meta
+        :param items: list of context items
+        :return: JSON payload or None if context cannot be prepared in background
+        """
+        if meta is None or not items or self.is_debug():
+            return
+        for item in items:
+            if isinstance(item.extra, dict) and ("plugin" in item.extra or "tool_output" in item.extra):
+                return  # plugin-rendered extras are dispatched on main thread only
+        nodes = self.build_context_nodes(meta, items, PidData(None, meta))
+        if nodes:
+            return json.dumps({"nodes": nodes}, ensure_ascii=False, separators=(',', ':'))
 
     def prepare_input(self, meta: CtxMeta, ctx: CtxItem, flush: bool = True, append: bool = False) -> Optional[str]:
         """
@@ -2017,11 +2073,16 @@ class Renderer(BaseRenderer):
             pass
         return None
 
-    def _output_identity(self, ctx: CtxItem) -> Tuple[str, Optional[str], bool]:
+    def _output_identity(
+            self,
+            ctx: CtxItem,
+            default_name: Optional[str] = None
+    ) -> Tuple[str, Optional[str], bool]:
         """
         Resolve output identity (name, avatar file:// path) based on preset or ctx-provided agent name.
 
         :param ctx: context item
+        :param default_name: default bot name (current PID name if not given)
         :return: (name, avatar, personalize)
         """
         # 1) Agent-provided name override -> force personalize, optionally default avatar
@@ -2041,8 +2102,9 @@ class Renderer(BaseRenderer):
         if meta is None:
             return "", None, False
 
-        pid = self.get_or_create_pid(meta)
-        default_name = self.pids[pid].name_bot if pid in self.pids else ""
+        if default_name is None:
+            pid = self.get_or_create_pid(meta)
+            default_name = self.pids[pid].name_bot if pid in self.pids else ""
 
         preset_id = meta.preset
         if not preset_id:
@@ -2377,7 +2439,9 @@ class Renderer(BaseRenderer):
             output_text: Optional[str],
             prev_ctx: Optional[CtxItem] = None,
             next_ctx: Optional[CtxItem] = None,
-            action_state: Optional[dict] = None
+            action_state: Optional[dict] = None,
+            state: Optional[PidData] = None,
+            hidden_keys: Optional[Tuple[set, set, set]] = None
     ) -> Optional[RenderBlock]:
         """
         Build RenderBlock for given ctx and payloads (input/output).
@@ -2393,11 +2457,16 @@ class Renderer(BaseRenderer):
         :param prev_ctx: Previous CtxItem (for context, optional)
         :param next_ctx: Next CtxItem (for context, optional)
         :param action_state: Optional footer/action routing state
+        :param state: Optional PID data with names (current PID data if not given)
+        :param hidden_keys: Optional de-duplicated image/file/URL keys (resolved from current items if not given)
         :return: RenderBlock object or None
         """
-        pid = self.get_or_create_pid(meta)
-        if pid is None:
-            return
+        if state is None:
+            pid = self.get_or_create_pid(meta)
+            if pid is None:
+                return
+            state = self.pids[pid]
+        pid = state.pid
 
         if action_state is None:
             action_state = self._get_action_state_for_ctx(ctx)
@@ -2409,7 +2478,7 @@ class Renderer(BaseRenderer):
             # Keep raw; formatting is a template duty (escape/BR etc.)
             block.input = {
                 "type": "user",
-                "name": self.pids[pid].name_user,
+                "name": state.name_user,
                 "avatar_img": None,  # no user avatar by default
                 "text": str(input_text),
                 "timestamp": ctx.input_timestamp if hasattr(ctx, "input_timestamp") else None,
@@ -2425,7 +2494,7 @@ class Renderer(BaseRenderer):
             # Pre/post format raw markdown via Helpers to preserve placeholders ([!cmd], think) and workdir tokens.
             md_src = self.helpers.pre_format_text(visible_output_text)
             md_text = self.helpers.post_format_text(md_src)
-            name, avatar, personalize = self._output_identity(ctx)
+            name, avatar, personalize = self._output_identity(ctx, state.name_bot)
             show_output_identity = self._show_output_identity(ctx, prev_ctx)
 
             # tool output visibility (agent step / commands)
@@ -2467,7 +2536,7 @@ class Renderer(BaseRenderer):
 
             block.output = {
                 "type": "bot",
-                "name": name or self.pids[pid].name_bot,
+                "name": name or state.name_bot,
                 "avatar_img": avatar,
                 "text": md_text,
                 "timestamp": ctx.output_timestamp if hasattr(ctx, "output_timestamp") else None,
@@ -2485,8 +2554,9 @@ class Renderer(BaseRenderer):
             # Extras carried forward through a tool-call chain are rendered only
             # at their last occurrence (the response-side item). The original
             # CtxItems remain untouched; only duplicate visual extras are filtered.
-            hidden_image_keys, hidden_file_keys, hidden_url_keys = \
-                self._get_hidden_tool_chain_extra_keys_for_ctx(ctx)
+            if hidden_keys is None:
+                hidden_keys = self._get_hidden_tool_chain_extra_keys_for_ctx(ctx)
+            hidden_image_keys, hidden_file_keys, hidden_url_keys = hidden_keys
 
             if hidden_image_keys and images:
                 images = {
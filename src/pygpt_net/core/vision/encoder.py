@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.19 00:00:00                  #
+# ================================================== #
+
+
+import base64
+import io
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple, Dict, Any, List
+
+
+class EncodedImage:
+    def __init__(
+            self,
+            path: str,
+            data: bytes,
+            mime: str,
+            original_size: int,
+            width: int = 0,
+            height: int = 0,
+            optimized: bool = False,
+    ):
+        """
+        Encoded image payload
+
+        :param path: source path
+        :param data: encoded bytes
+        :param mime: MIME type of encoded bytes
+        :param original_size: source file size in bytes
+        :param width: encoded width
+        :param height: encoded height
+        :param optimized: True if image was re-encoded
+        """
+        self.path = path
+        self.data = data
+        self.mime = mime
+        self.original_size = original_size
+        self.width = width
+        self.height = height
+        self.optimized = optimized
+        self._b64 = None
+
+    @property
+    def size(self) -> int:
+        """
+        Encoded size in bytes
+
+        :return: size
+        """
+        return len(self.data)
+
+    @property
+    def saved(self) -> int:
+        """
+        Bytes saved vs source file
+
+        :return: saved bytes
+        """
+        return max(0, self.original_size - self.size)
+
+    @property
+    def b64(self) -> str:
+        """
+        Base64 encoded payload (cached)
+
+        :return: base64 string
+        """
+        if self._b64 is None:
+            self._b64 = base64.b64encode(self.data).decode("utf-8")
+        return self._b64
+
+    @property
+    def data_url(self) -> str:
+        """
+        Payload as data: URL
+
+        :return: data URL
+        """
+        return "data:{};base64,{}".format(self.mime, self.b64)
+
+
+class Encoder:
+
+    # effective max input resolution per provider (larger images are downscaled server-side)
+    PROFILES = {
+        "openai": {"max_side": 2048, "max_short": 768},  # high detail: fit 2048x2048, shortest side 768
+        "anthropic": {"max_side": 1568, "max_pixels": 1_150_000},
+        "google": {"max_side": 3072},
+        "xai": {"max_side": 2048},
+        "default": {"max_side": 2048},
+    }
+    MIMES = {
+        "JPEG": "image/jpeg",
+        "PNG": "image/png",
+        "GIF": "image/gif",
+        "WEBP": "image/webp",
+        "BMP": "image/bmp",
+        "TIFF": "image/tiff",
+    }
+
+    def __init__(self, window=None):
+        """
+        Image preprocessing pipeline for vision inputs (resize, re-encode, cache)
+
+        :param window: Window instance
+        """
+        self.window = window
+        self.cache = OrderedDict()  # key -> EncodedImage
+        self.cache_bytes = 0
+        self.lock = threading.Lock()
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "original_bytes": 0,
+            "sent_bytes": 0,
+        }
+
+    def is_enabled(self) -> bool:
+        """
+        Check if images optimization is enabled
+
+        :return: True if enabled
+        """
+        return bool(self.window.core.config.get("vision.images.optimize", True))
+
+    def get_quality(self) -> int:
+        """
+        Get JPEG quality
+
+        :return: quality (1-100)
+        """
+        return min(100, max(1, int(self.window.core.config.get("vision.images.quality", 85) or 85)))
+
+    def get_cache_limit(self) -> int:
+        """
+        Get cache limit in bytes
+
+        :return: limit in bytes
+        """
+        return max(0, int(self.window.core.config.get("vision.images.cache_mb", 64) or 0)) * 1024 * 1024
+
+    def encode(self, path: str, profile: str = "default") -> EncodedImage:
+        """
+        Get image payload for provider profile (cached by path, mtime and profile)
+
+        :param path: image path
+        :param profile: provider profile (openai, anthropic, google, xai)
+        :return: EncodedImage
+        """
+        st = os.stat(path)
+        optimize = self.is_enabled()
+        quality = self.get_quality()
+        key = (os.path.abspath(path), st.st_mtime_ns, st.st_size, profile, optimize, quality)
+        with self.lock:
+            image = self.cache.get(key)
+            if image is not None:
+                self.cache.move_to_end(key)
+                self.stats["hits"] += 1
+                return image
+            self.stats["misses"] += 1
+
+        image = None
+        if optimize:
+            try:
+                image = self.process(path, profile, quality)
+            except Exception as e:
+                self.window.core.debug.log(e)
+        if image is None:
+            image = self.read(path)
+        self.store(key, image)
+        return image
+
+    def encode_many(self, paths: List[str], profile: str = "default") -> List[EncodedImage]:
+        """
+        Encode images and report bytes saved
+
+        :param paths: image paths
+        :param profile: provider profile
+        :return: list of EncodedImage
+        """
+        images = [self.encode(path, profile) for path in paths]
+        self.report(images, profile)
+        return images
+
+    def read(self, path: str) -> EncodedImage:
+        """
+        Read image without processing
+
+        :param path: image path
+        :return: EncodedImage
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+        return EncodedImage(path, data, self.guess_mime(path), len(data))
+
+    def process(self, path: str, profile: str, quality: int) -> EncodedImage:
+        """
+        Downscale to profile max resolution, re-encode and strip metadata
+
+        :param path: image path
+        :param profile: provider profile
+        :param quality: JPEG quality
+        :return: EncodedImage
+        """
+        from PIL import Image, ImageOps
+
+        with open(path, "rb") as f:
+            raw = f.read()
+        with Image.open(io.BytesIO(raw)) as src:
+            fmt = (src.format or "").upper()
+            has_meta = len(src.getexif()) > 0
+            img = ImageOps.exif_transpose(src)
+            width, height = img.size
+            scale = self.get_scale(width, height, profile)
+            if scale < 1.0:
+                width = max(1, int(width * scale))  # round down, must stay within profile limits
+                height = max(1, int(height * scale))
+                img = img.resize((width, height), Image.LANCZOS)
+
+            has_alpha = img.mode in ("RGBA", "LA", "PA") or (img.mode == "P" and "transparency" in img.info)
+            buf = io.BytesIO()
+            if has_alpha:
+                img.convert("RGBA").save(buf, "PNG", optimize=True)
+                mime = "image/png"
+            else:
+                img.convert("RGB").save(buf, "JPEG", quality=quality, optimize=True, progressive=True)
+                mime = "image/jpeg"
+            data = buf.getvalue()
+
+        # keep source if it is already smaller, not resized, metadata-free and accepted by all providers
+        if scale >= 1.0 and not has_meta and fmt in ("JPEG", "PNG") and len(raw) <= len(data):
+            return EncodedImage(path, raw, self.MIMES[fmt], len(raw), width, height, False)
+        return EncodedImage(path, data, mime, len(raw), width, height, True)
+
+    def get_scale(self, width: int, height: int, profile: str) -> float:
+        """
+        Get downscale factor for profile
+
+        :param width: image width
+        :param height: image height
+        :param profile: provider profile
+        :return: scale factor (<= 1.0)
+        """
+        limits = self.PROFILES.get(profile, self.PROFILES["default"])
+        scale = 1.0
+        long_side = max(width, height)
+        short_side = min(width, height)
+        if limits.get("max_side") and long_side > 0:
+            scale = min(scale, limits["max_side"] / long_side)
+        if limits.get("max_short") and short_side > 0:
+            scale = min(scale, limits["max_short"] / short_side)
+        if limits.get("max_pixels") and width * height > 0:
+            scale = min(scale, (limits["max_pixels"] / (width * height)) ** 0.5)
+        return scale
+
+    def store(self, key: Tuple, image: EncodedImage):
+        """
+        Store payload in LRU cache
+
+        :param key: cache key
+        :param image: EncodedImage
+        """
+        limit = self.get_cache_limit()
+        if limit == 0 or image.size > limit:
+            return
+        with self.lock:
+            old = self.cache.pop(key, None)
+            if old is not None:
+                self.cache_bytes -= old.size
+            self.cache[key] = image
+            self.cache_bytes += image.size
+            while self.cache_bytes > limit and self.cache:
+                _, removed = self.cache.popitem(last=False)
+                self.cache_bytes -= removed.size
+
+    def report(self, images: List[EncodedImage], profile: str):
+        """
+        Report bytes saved for request
+
+        :param images: encoded images
+        :param profile: provider profile
+        """
+        if not images:
+            return
+        original = sum(image.original_size for image in images)
+        sent = sum(image.size for image in images)
+        with self.lock:
+            self.stats["original_bytes"] += original
+            self.stats["sent_bytes"] += sent
+        self.window.core.debug.info(
+            "[vision] {}: {} image(s), {} -> {} bytes, saved {} bytes".format(
+                profile, len(images), original, sent, original - sent
+            )
+        )
+
+    def guess_mime(self, path: str) -> str:
+        """
+        Guess MIME type from file extension
+
+        :param path: file path
+        :return: MIME type
+        """
+        ext = os.path.splitext(path)[1].lower().lstrip(".")
+        if ext == "jpg":
+            ext = "jpeg"
+        elif ext == "tif":
+            ext = "tiff"
+        return self.MIMES.get(ext.upper(), "image/jpeg")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get encoder stats
+
+        :return: stats dict
+        """
+        with self.lock:
+            stats = dict(self.stats)
+            stats["cached"] = len(self.cache)
+            stats["cache_bytes"] = self.cache_bytes
+        stats["saved_bytes"] = stats["original_bytes"] - stats["sent_bytes"]
+        return stats
+
+    def clear(self):
+        """Clear cache"""
+        with self.lock:
+            self.cache.clear()
+            self.cache_bytes = 0
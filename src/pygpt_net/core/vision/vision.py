@@ -6,10 +6,11 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.18 00:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from .analyzer import Analyzer
+from .encoder import Encoder
 
 class Vision:
     def __init__(self, window=None):
@@ -19,4 +20,5 @@ class Vision:
         :param window: Window instance
         """
         self.window = window
-        self.analyzer = Analyzer(window)
\ No newline at end of file
+        self.analyzer = Analyzer(window)
+        self.encoder = Encoder(window)
\ No newline at end of file
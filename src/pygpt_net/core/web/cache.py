@@ -0,0 +1,495 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.19 00:00:00                  #
+# ================================================== #
+
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any
+from urllib.parse import urlparse
+
+import requests
+
+
+class CachedResponse:
+    def __init__(
+            self,
+            url: str,
+            status: int,
+            content: bytes,
+            headers: Optional[Dict[str, str]] = None,
+            from_cache: bool = False
+    ):
+        """
+        HTTP response (fetched or read from cache)
+
+        :param url: URL
+        :param status: HTTP status code
+        :param content: response body
+        :param headers: response headers
+        :param from_cache: True if read from cache
+        """
+        self.url = url
+        self.status_code = status
+        self.content = content
+        self.headers = headers or {}
+        self.from_cache = from_cache
+
+    @property
+    def text(self) -> str:
+        """
+        Get response body as text
+
+        :return: decoded body
+        """
+        encoding = "utf-8"
+        content_type = self.headers.get("content-type", "")
+        if "charset=" in content_type:
+            encoding = content_type.split("charset=")[-1].split(";")[0].strip() or encoding
+        try:
+            return self.content.decode(encoding, errors="replace")
+        except LookupError:
+            return self.content.decode("utf-8", errors="replace")
+
+
+class Cache:
+    DIR = "web_cache"
+    INDEX_FILE = "index.json"
+    STORED_HEADERS = ("content-type", "etag", "last-modified")
+    SAVE_EVERY = 50  # save index after N changes
+
+    def __init__(self, window=None):
+        """
+        On-disk HTTP cache for web loaders and URL fetches (LRU, conditional GET)
+
+        :param window: Window instance
+        """
+        self.window = window
+        self.lock = threading.RLock()
+        self.index = None  # key -> entry meta, loaded on first use
+        self.size = 0  # total size of cached bodies
+        self.changes = 0
+        self.host_locks = {}  # (host, limit) -> semaphore
+        self.stats = {"hits": 0, "misses": 0, "revalidated": 0, "errors": 0}
+        self.get = requests.get
+
+    def get_option(self, key: str, default: Any = None) -> Any:
+        """
+        Get config option
+
+        :param key: option key
+        :param default: default value
+        :return: option value
+        """
+        return self.window.core.config.get(key, default)
+
+    def is_enabled(self) -> bool:
+        """
+        Check if cache is enabled
+
+        :return: True if enabled
+        """
+        return bool(self.get_option("web.cache", True))
+
+    def is_offline(self) -> bool:
+        """
+        Check if cache-only (offline) mode is enabled
+
+        :return: True if no network requests should be made
+        """
+        return self.is_enabled() and bool(self.get_option("web.cache.offline", False))
+
+    def get_ttl(self, ttl: Optional[int] = None) -> int:
+        """
+        Get TTL in seconds
+
+        :param ttl: TTL for request, None or < 0 = default from config
+        :return: TTL in seconds (0 = always revalidate)
+        """
+        if ttl is None or int(ttl) < 0:
+            ttl = self.get_option("web.cache.ttl", 3600)
+        return max(0, int(ttl or 0))
+
+    def get_max_size(self) -> int:
+        """
+        Get max cache size in bytes
+
+        :return: max size
+        """
+        return max(1, int(self.get_option("web.cache.max_size", 200) or 1)) * 1024 * 1024
+
+    def get_dir(self) -> str:
+        """
+        Get cache directory
+
+        :return: directory path
+        """
+        path = os.path.join(self.window.core.config.get_user_path(), self.DIR)
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def get_key(self, url: str) -> str:
+        """
+        Get cache key for URL
+
+        :param url: URL
+        :return: cache key
+        """
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def get_host_lock(self, url: str, limit: Optional[int] = None) -> threading.Semaphore:
+        """
+        Get per-host concurrency limiter
+
+        :param url: URL
+        :param limit: max parallel requests per host, None = from config
+        :return: semaphore
+        """
+        if limit is None:
+            limit = self.get_option("web.cache.host_limit", 4)
+        key = (urlparse(url).netloc.lower(), max(1, int(limit or 1)))
+        with self.lock:
+            if key not in self.host_locks:
+                self.host_locks[key] = threading.BoundedSemaphore(key[1])
+            return self.host_locks[key]
+
+    def load_index(self):
+        """Load index from disk"""
+        with self.lock:
+            if self.index is not None:
+                return
+            self.index = {}
+            path = os.path.join(self.get_dir(), self.INDEX_FILE)
+            if os.path.exists(path):
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                    if isinstance(data, dict):
+                        self.index = data
+                except Exception as e:
+                    self.window.core.debug.log(e)
+            self.reconcile()
+            self.size = sum(int(e.get("size", 0)) for e in self.index.values())
+
+    def reconcile(self):
+        """Remove files not in index (stored after the last index save) and entries without files"""
+        with self.lock:
+            path = self.get_dir()
+            files = set()
+            for name in os.listdir(path):
+                if name == self.INDEX_FILE:
+                    continue
+                if name in self.index:
+                    files.add(name)
+                    continue
+                try:
+                    os.remove(os.path.join(path, name))
+                except Exception as e:
+                    self.window.core.debug.log(e)
+            missing = [key for key in self.index if key not in files]
+            for key in missing:
+                del self.index[key]
+            if missing:
+                self.save_index()
+
+    def save_index(self):
+        """Save index to disk"""
+        with self.lock:
+            if self.index is None:
+                return
+            path = os.path.join(self.get_dir(), self.INDEX_FILE)
+            tmp = path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.index, f)
+            os.replace(tmp, path)
+            self.changes = 0
+
+    def touch(self):
+        """Mark index as changed, save every N changes"""
+        self.changes += 1
+        if self.changes >= self.SAVE_EVERY:
+            self.save_index()
+
+    def flush(self):
+        """Save pending index changes"""
+        with self.lock:
+            if self.changes > 0:
+                self.save_index()
+
+    def read(self, key: str) -> Optional[bytes]:
+        """
+        Read cached body
+
+        :param key: cache key
+        :return: body or None if missing
+        """
+        path = os.path.join(self.get_dir(), key)
+        if not os.path.exists(path):
+            return None
+        with open(path, "rb") as f:
+            return f.read()
+
+    def store(self, key: str, url: str, response: requests.Response):
+        """
+        Store response in cache
+
+        :param key: cache key
+        :param url: URL
+        :param response: HTTP response
+        """
+        content = response.content or b""
+        size = len(content)
+        max_size = self.get_max_size()
+        if size > max_size // 4:
+            return  # too large, would evict most of the cache
+        if "no-store" in (response.headers.get("cache-control") or "").lower():
+            return
+        path = os.path.join(self.get_dir(), key)
+        tmp = path + ".tmp{}".format(threading.get_ident())
+        with open(tmp, "wb") as f:
+            f.write(content)
+        os.replace(tmp, path)
+        headers = {}
+        for name in self.STORED_HEADERS:
+            value = response.headers.get(name)
+            if value:
+                headers[name] = value
+        now = time.time()
+        with self.lock:
+            old = self.index.get(key)
+            if old is not None:
+                self.size -= int(old.get("size", 0))
+            self.index[key] = {
+                "url": url,
+                "status": response.status_code,
+                "headers": headers,
+                "size": size,
+                "fetched": now,
+                "accessed": now,
+            }
+            self.size += size
+            if self.size > max_size:
+                self.evict(int(max_size * 0.9))
+            self.touch()
+
+    def evict(self, target: int):
+        """
+        Remove least recently used entries
+
+        :param target: max total size after eviction
+        """
+        with self.lock:
+            entries = sorted(self.index.items(), key=lambda item: item[1].get("accessed", 0))
+            for key, entry in entries:
+                if self.size <= target:
+                    break
+                self.remove(key)
+
+    def remove(self, key: str):
+        """
+        Remove entry from cache
+
+        :param key: cache key
+        """
+        with self.lock:
+            entry = self.index.pop(key, None)
+            if entry is not None:
+                self.size -= int(entry.get("size", 0))
+            path = os.path.join(self.get_dir(), key)
+            if os.path.exists(path):
+                os.remove(path)
+            self.touch()
+
+    def clear(self):
+        """Remove all cached entries"""
+        self.load_index()
+        with self.lock:
+            for key in list(self.index.keys()):
+                self.remove(key)
+            self.save_index()
+
+    def count(self, name: str):
+        """
+        Increment stats counter
+
+        :param name: counter name
+        """
+        with self.lock:
+            self.stats[name] += 1
+
+    def fetch(
+            self,
+            url: str,
+            ttl: Optional[int] = None,
+            headers: Optional[Dict[str, str]] = None,
+            timeout: int = 10,
+            host_limit: Optional[int] = None
+    ) -> CachedResponse:
+        """
+        GET URL using cache (index is saved after fetch)
+
+        :param url: URL
+        :param ttl: TTL in seconds, None = default
+        :param headers: request headers
+        :param timeout: request timeout
+        :param host_limit: max parallel requests per host, None = from config
+        :return: response
+        """
+        try:
+            return self._fetch(url, ttl, headers, timeout, host_limit)
+        finally:
+            self.flush()
+
+    def _fetch(
+            self,
+            url: str,
+            ttl: Optional[int] = None,
+            headers: Optional[Dict[str, str]] = None,
+            timeout: int = 10,
+            host_limit: Optional[int] = None
+    ) -> CachedResponse:
+        """
+        GET URL using cache
+
+        Fresh entries (younger than TTL) are returned without request, stale entries
+        are revalidated with conditional GET (ETag / Last-Modified).
+        In offline mode only cached entries are returned.
+
+        :param url: URL
+        :param ttl: TTL in seconds, None = default
+        :param headers: request headers
+        :param timeout: request timeout
+        :param host_limit: max parallel requests per host, None = from config
+        :return: response
+        """
+        if not self.is_enabled():
+            with self.get_host_lock(url, host_limit):
+                response = self.get(url, headers=headers, timeout=timeout)
+            self.count("misses")
+            return CachedResponse(url, response.status_code, response.content, dict(response.headers))
+
+        self.load_index()
+        key = self.get_key(url)
+        with self.lock:
+            entry = self.index.get(key)
+            entry = dict(entry) if entry is not None else None
+        content = self.read(key) if entry is not None else None
+        if entry is not None and content is None:
+            self.remove(key)  # body removed from disk
+            entry = None
+
+        now = time.time()
+        if entry is not None and (self.is_offline() or now - entry["fetched"] < self.get_ttl(ttl)):
+            self.count("hits")
+            with self.lock:
+                if key in self.index:
+                    self.index[key]["accessed"] = now
+            return CachedResponse(url, entry["status"], content, entry["headers"], from_cache=True)
+
+        if self.is_offline():
+            self.count("misses")
+            raise ValueError("URL not in web cache (offline mode): {}".format(url))
+
+        args = dict(headers or {})
+        if entry is not None:
+            if "etag" in entry["headers"]:
+                args["If-None-Match"] = entry["headers"]["etag"]
+            if "last-modified" in entry["headers"]:
+                args["If-Modified-Since"] = entry["headers"]["last-modified"]
+        try:
+            with self.get_host_lock(url, host_limit):
+                response = self.get(url, headers=args, timeout=timeout)
+        except Exception:
+            self.count("errors")
+            raise
+
+        if response.status_code == 304 and entry is not None:
+            self.count("revalidated")
+            with self.lock:
+                if key in self.index:
+                    self.index[key]["fetched"] = now
+                    self.index[key]["accessed"] = now
+                    self.touch()
+            return CachedResponse(url, entry["status"], content, entry["headers"], from_cache=True)
+
+        self.count("misses")
+        if response.status_code == 200:
+            self.store(key, url, response)
+        return CachedResponse(url, response.status_code, response.content, dict(response.headers))
+
+    def fetch_many(
+            self,
+            urls: List[str],
+            ttl: Optional[int] = None,
+            headers: Optional[Dict[str, str]] = None,
+            timeout: int = 10,
+            host_limit: Optional[int] = None
+    ) -> Dict[str, Optional[CachedResponse]]:
+        """
+        GET URLs in parallel using cache (limited per host)
+
+        :param urls: URLs
+        :param ttl: TTL in seconds, None = default
+        :param headers: request headers
+        :param timeout: request timeout
+        :param host_limit: max parallel requests per host, None = from config
+        :return: dict URL -> response (None if failed)
+        """
+        results = {}
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return results
+
+        def fetch(url: str) -> Optional[CachedResponse]:
+            try:
+                return self._fetch(url, ttl, headers, timeout, host_limit)
+            except Exception as e:
+                self.window.core.debug.log("Failed to fetch {}: {}".format(url, e))
+                return None
+
+        workers = max(1, int(self.get_option("web.cache.workers", 8) or 1))
+        with ThreadPoolExecutor(max_workers=min(workers, len(urls))) as pool:
+            for url, response in zip(urls, pool.map(fetch, urls)):
+                results[url] = response
+        self.flush()
+        return results
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get stats counters
+
+        :return: copy of stats
+        """
+        with self.lock:
+            return dict(self.stats)
+
+    def format_stats(self, since: Optional[Dict[str, int]] = None) -> Optional[str]:
+        """
+        Format hit rate (for logs)
+
+        :param since: stats snapshot to compare with, None = total
+        :return: formatted stats or None if no requests
+        """
+        stats = self.get_stats()
+        if since is not None:
+            stats = {k: stats[k] - since.get(k, 0) for k in stats}
+        hits = stats["hits"] + stats["revalidated"]
+        total = hits + stats["misses"]
+        if total == 0:
+            return None
+        return "Web cache: {} hits ({} revalidated), {} misses, hit rate: {:.1f}%".format(
+            hits,
+            stats["revalidated"],
+            stats["misses"],
+            hits / total * 100.0,
+        )
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.06 19:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 import os
@@ -124,7 +124,7 @@ class Helpers:
         :return: image URL
         """
         from bs4 import BeautifulSoup
-        response = requests.get(url)
+        response = self.window.core.web.cache.fetch(url)
         soup = BeautifulSoup(response.content, 'html.parser')
 
         og_image = soup.find('meta', property='og:image')
@@ -174,7 +174,7 @@ class Helpers:
         :return: links list
         """
         from bs4 import BeautifulSoup
-        response = requests.get(url)
+        response = requests.get(url)  # not cached, always current (cmd_web)
         soup = BeautifulSoup(response.content, 'html.parser')
         links = []
         urls = []
@@ -206,7 +206,7 @@ class Helpers:
         :return: images list
         """
         from bs4 import BeautifulSoup
-        response = requests.get(url)
+        response = requests.get(url)  # not cached, always current (cmd_web)
         soup = BeautifulSoup(response.content, 'html.parser')
         images = []
         for img in soup.find_all('img'):
@@ -6,13 +6,14 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 19:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from typing import Optional, List, Dict
 
 from pygpt_net.provider.web.base import BaseProvider
 
+from .cache import Cache
 from .helpers import Helpers
 
 
@@ -28,6 +29,7 @@ class Web:
         """
         self.window = window
         self.helpers = Helpers(window)
+        self.cache = Cache(window)
         self.providers = {
             self.PROVIDER_SEARCH_ENGINE: {},
         }
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.02.06 01:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import copy
@@ -158,6 +158,7 @@ class CtxItem:
     urls_before: list = field(default_factory=list)
     use_agent_final_response: bool = False
     ai_name: Optional[str] = None
+    lazy: Optional[dict] = field(default=None, repr=False, compare=False)
 
     def __init__(self, mode: Optional[str] = None):
         """
@@ -165,6 +166,7 @@ class CtxItem:
 
         :param mode: Mode
         """
+        self.lazy = None  # raw JSON columns not decoded yet (loaded from DB)
         self.additional_ctx = []
         self.agent_call = False  # prevents plugin reply if True
         self.agent_final_response = ""
@@ -593,6 +595,58 @@ class CtxItem:
         return self.dump(True)
 
 
+class LazyJson:
+    def __init__(self, name: str, slot, default: type):
+        """
+        Context item attribute decoded from raw JSON on first access
+
+        :param name: attribute name
+        :param slot: original slot descriptor
+        :param default: default value factory (used if decoded value is None)
+        """
+        self.name = name
+        self.slot = slot
+        self.default = default
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        lazy = getattr(obj, "lazy", None)
+        if lazy and self.name in lazy:
+            raw = lazy.pop(self.name)
+            if not lazy:
+                obj.lazy = None
+            try:
+                value = json.loads(raw)
+            except Exception:
+                value = raw
+            if value is None:
+                value = self.default()
+            self.slot.__set__(obj, value)
+            return value
+        return self.slot.__get__(obj, objtype)
+
+    def __set__(self, obj, value):
+        lazy = getattr(obj, "lazy", None)
+        if lazy:
+            lazy.pop(self.name, None)
+        self.slot.__set__(obj, value)
+
+
+for _name, _default in (
+        ("additional_ctx", list),
+        ("attachments", list),
+        ("cmds", list),
+        ("doc_ids", list),
+        ("extra", dict),
+        ("files", list),
+        ("images", list),
+        ("results", list),
+        ("urls", list),
+):
+    setattr(CtxItem, _name, LazyJson(_name, CtxItem.__dict__[_name], _default))
+
+
 @dataclass(slots=True)
 class CtxMeta:
     id: Optional[int] = None
@@ -623,6 +677,7 @@ class CtxMeta:
     root_id: Optional[object] = None
     run: Optional[object] = None
     status: Optional[object] = None
+    summary: dict = field(default_factory=dict)
     thread: Optional[object] = None
     updated: int = field(default_factory=lambda: int(time.time()))
     uuid: Optional[object] = None
@@ -661,6 +716,7 @@ class CtxMeta:
         self.root_id = None
         self.run = None
         self.status = None
+        self.summary = {}  # rolling summary of older items (compaction)
         self.thread = None
         self.updated = int(time.time())
         self.uuid = None
@@ -753,6 +809,7 @@ class CtxMeta:
             "root_id": self.root_id,
             "run": self.run,
             "status": self.status,
+            "summary": self.summary,
             "thread": self.thread,
             "updated": self.updated,
             "uuid": self.uuid,
@@ -794,6 +851,7 @@ class CtxMeta:
         self.root_id = g("root_id", None)
         self.run = g("run", None)
         self.status = g("status", None)
+        self.summary = g("summary", {})
         self.thread = g("thread", None)
         self.updated = g("updated", None)
         self.uuid = g("uuid", None)
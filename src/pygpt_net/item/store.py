@@ -150,6 +150,7 @@ class RemoteFileItem:
     thread_id: Optional[object] = None
     uuid: Optional[object] = None
     size: int = 0
+    hash: str = ""
     created: int = 0
     updated: int = 0
 
@@ -165,6 +166,7 @@ class RemoteFileItem:
         self.thread_id = None
         self.uuid = None
         self.size = 0
+        self.hash = ""
         self.created = 0
         self.updated = 0
 
@@ -180,6 +182,7 @@ class RemoteFileItem:
         self.thread_id = None
         self.uuid = None
         self.size = 0
+        self.hash = ""
         self.created = 0
         self.updated = 0
 
@@ -199,6 +202,7 @@ class RemoteFileItem:
             "thread_id": self.thread_id,
             "uuid": self.uuid,
             "size": self.size,
+            "hash": self.hash,
             "created": self.created,
             "updated": self.updated,
         }
@@ -218,6 +222,7 @@ class RemoteFileItem:
         self.thread_id = data.get('thread_id', None)
         self.uuid = data.get('uuid', None)
         self.size = data.get('size', 0)
+        self.hash = data.get('hash', "")
         self.created = data.get('created', 0)
         self.updated = data.get('updated', 0)
 
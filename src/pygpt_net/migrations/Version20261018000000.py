@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+
+from sqlalchemy import text
+
+from .base import BaseMigration
+
+
+class Version20261018000000(BaseMigration):
+    def __init__(self, window=None):
+        super(Version20261018000000, self).__init__(window)
+        self.window = window
+
+    def up(self, conn):
+        conn.execute(text("""
+        ALTER TABLE ctx_meta ADD COLUMN summary_json TEXT;
+        """))
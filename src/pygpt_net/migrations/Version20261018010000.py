@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+
+
+from sqlalchemy import text
+
+from .base import BaseMigration
+
+
+class Version20261018010000(BaseMigration):
+    def __init__(self, window=None):
+        super(Version20261018010000, self).__init__(window)
+        self.window = window
+
+    def up(self, conn):
+        conn.execute(text("""
+        ALTER TABLE idx_ctx ADD COLUMN item_id INTEGER NOT NULL DEFAULT 0;
+        """))
+        conn.execute(text("""
+        CREATE INDEX IF NOT EXISTS idx_ctx_meta_id ON idx_ctx (meta_id, store, idx);
+        """))
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.22 16:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from .Version20231227152900 import Version20231227152900  # 2.0.59
@@ -26,6 +26,9 @@ from .Version20241215110000 import Version20241215110000  # 2.4.43
 from .Version20260102190000 import Version20260102190000  # 2.7.5
 from .Version20260121190000 import Version20260121190000  # 2.7.10
 from .Version20260122140000 import Version20260122140000  # 2.7.10
+from .Version20261018000000 import Version20261018000000  # 2.8.4
+from .Version20261018010000 import Version20261018010000  # 2.8.4
+from .Version20261018020000 import Version20261018020000  # 2.8.4
 
 class Migrations:
     def __init__(self):
@@ -56,4 +59,7 @@ class Migrations:
             Version20260102190000(),  # 2.7.5
             Version20260121190000(),  # 2.7.10
             Version20260122140000(),  # 2.7.10
+            Version20261018000000(),  # 2.8.4
+            Version20261018010000(),  # 2.8.4
+            Version20261018020000(),  # 2.8.4
         ]
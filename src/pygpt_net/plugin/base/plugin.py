@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.22 19:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import copy
@@ -53,6 +53,7 @@ class BasePlugin(QObject):
         self.options = {}
         self.initial_options = {}
         self.allowed_cmds = []
+        self.side_effect_cmds = []  # commands changing state, never run in parallel with other commands
         self.tabs = {}
         self.parent = None
         self.enabled = False
@@ -157,6 +158,29 @@ class BasePlugin(QObject):
         """
         return cmd in self.allowed_cmds
 
+    def is_side_effect(
+            self,
+            cmd: str
+    ) -> bool:
+        """
+        Check if command changes state (ordering hint for parallel execution)
+
+        :param cmd: command name
+        :return: True if command has side effects
+        """
+        return cmd in self.side_effect_cmds
+
+    def get_max_parallel(self) -> int:
+        """
+        Get max number of commands executed in parallel by plugin worker
+
+        :return: max concurrent commands (1 = sequential)
+        """
+        config = self.window.core.config
+        if not config.get("cmd.parallel", True):
+            return 1
+        return max(1, int(config.get("cmd.parallel.max", 4) or 1))
+
     def cmd_exe(self) -> bool:
         """
         Check if command enabled
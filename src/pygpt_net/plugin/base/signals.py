@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.16 05:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from PySide6.QtCore import QObject, Signal
@@ -16,6 +16,7 @@ class BaseSignals(QObject):
     finished_more = Signal(list, object, dict)  # responses list, ctx, extra_data
     debug = Signal(object)
     destroyed = Signal()
+    done = Signal()  # worker finished (after reply)
     error = Signal(object)
     log = Signal(object)
     started = Signal()
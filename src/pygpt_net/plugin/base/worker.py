@@ -6,14 +6,16 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.11 14:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
-from typing import Optional, Any, Dict, List
+from typing import Optional, Any, Dict, List, Callable
 
 from PySide6.QtCore import QRunnable
 from typing_extensions import deprecated
 
+from pygpt_net.core.command.scheduler import Scheduler
+
 from .plugin import BasePlugin
 from .signals import BaseSignals
 
@@ -40,6 +42,8 @@ class BaseWorker(QRunnable):
         self.signals = None
         if sig is not None:
             try:
+                if hasattr(sig, "done"):
+                    sig.done.emit()
                 sig.deleteLater()
             except RuntimeError:
                 pass
@@ -284,6 +288,39 @@ class BaseWorker(QRunnable):
             return item["params"][param]
         return default
 
+    def run_cmds(
+            self,
+            handler: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute commands, independent ones in parallel (up to plugin limit)
+
+        Commands marked by plugin as side-effecting are executed alone, in call order.
+
+        :param handler: command handler, returns response item
+        :return: responses in call order
+        """
+        def call(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            if self.is_stopped():
+                return None
+            try:
+                return handler(item)
+            except Exception as e:
+                return self.make_response(item, self.throw_error(e))
+
+        side_effect = None
+        max_workers = 1
+        if self.plugin is not None:
+            side_effect = lambda item: self.plugin.is_side_effect(item.get("cmd"))
+            max_workers = self.plugin.get_max_parallel()
+        results = Scheduler(max_workers).run(
+            self.cmds or [],
+            call,
+            side_effect=side_effect,
+            stopped=self.is_stopped,
+        )
+        return [response for response in results if response]
+
     def is_stopped(self) -> bool:
         """
         Check if worker is stopped
@@ -301,6 +338,11 @@ class BaseWorker(QRunnable):
     def run_async(self):
         """Run asynchronous"""
         if self.window:
+            if self.cmds and self.ctx is not None and self.signals is not None and hasattr(self.signals, "done"):
+                # replies from all async command workers are sent back together
+                replies = self.window.controller.kernel.replies
+                replies.wait()
+                self.signals.done.connect(replies.release)
             self.window.threadpool.start(self)
         else:
             self.run()
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.07.14 18:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from pygpt_net.plugin.base.config import BaseConfig, BasePlugin
@@ -209,6 +209,39 @@ class Config(BaseConfig):
             tab="ipython",
             advanced=True,
         )
+        plugin.add_option(
+            "ipython_pool_local",
+            type="int",
+            value=1,
+            label="Warm kernels pool: local",
+            description="Number of pre-started local kernels used for executions in a new kernel, 0 = disabled",
+            min=0,
+            max=8,
+            tab="ipython",
+            advanced=True,
+        )
+        plugin.add_option(
+            "ipython_pool_docker",
+            type="int",
+            value=0,
+            label="Warm kernels pool: Docker",
+            description="Number of pre-started kernel containers used for executions in a new kernel, 0 = disabled. "
+                        "Each container uses own host ports: configured ports + 10 * slot number",
+            min=0,
+            max=8,
+            tab="ipython",
+            advanced=True,
+        )
+        plugin.add_option(
+            "ipython_timeout",
+            type="int",
+            value=600,
+            label="Execution timeout",
+            description="Max execution time in seconds, execution is interrupted after timeout, 0 = no limit",
+            min=0,
+            tab="ipython",
+            advanced=True,
+        )
         plugin.add_option(
             "sandbox_docker",
             type="bool",
@@ -226,6 +259,36 @@ class Config(BaseConfig):
             description="Python command template to execute, use {filename} for filename placeholder",
             tab="python_legacy",
         )
+        plugin.add_option(
+            "exec_timeout",
+            type="int",
+            value=600,
+            label="Execution timeout",
+            description="Max execution time in seconds, process is killed after timeout, 0 = no limit",
+            min=0,
+            tab="python_legacy",
+            advanced=True,
+        )
+        plugin.add_option(
+            "exec_max_output",
+            type="int",
+            value=10240,
+            label="Max output size (KB)",
+            description="Process is killed when its output exceeds this size, 0 = no limit",
+            min=0,
+            tab="python_legacy",
+            advanced=True,
+        )
+        plugin.add_option(
+            "exec_output_keep",
+            type="int",
+            value=20000,
+            label="Output kept in context (chars)",
+            description="Max number of output chars returned to the model, only head and tail of larger outputs are kept, 0 = no limit",
+            min=0,
+            tab="python_legacy",
+            advanced=True,
+        )
         plugin.add_option(
             "dockerfile",
             type="textarea",
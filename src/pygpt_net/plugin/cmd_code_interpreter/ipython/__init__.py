@@ -6,8 +6,9 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.25 02:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from .local_kernel import LocalKernel
-from .docker_kernel import DockerKernel
\ No newline at end of file
+from .docker_kernel import DockerKernel
+from .pool import KernelPool
\ No newline at end of file
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.06 01:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 import base64
@@ -16,10 +16,15 @@ import re
 import time
 import io
 import tarfile
+from typing import Optional, Tuple, Any
+
+from .pool import KernelPool
 
 class DockerKernel:
 
     NOT_READY_MSG = "IPython kernel is not initialized... try to restart the kernel with: /restart"
+    OUTPUT_TYPES = ('stream', 'display_data', 'execute_result', 'error')
+    SLOT_PORT_STEP = 10  # host ports offset per pool slot
 
     def __init__(self, plugin = None):
         self.plugin = plugin
@@ -41,6 +46,8 @@ class DockerKernel:
         self.signals = None
         self.restarting = False
         self.allow_auto_restart = True
+        self.slot = 0  # pool slot of the current kernel, 0 = configured container and ports
+        self.pool = None
 
     def get_dockerfile(self) -> str:
         """
@@ -66,13 +73,18 @@ class DockerKernel:
         """
         return self.plugin.get_option_value('ipython_image_name')
 
-    def get_container_name(self) -> str:
+    def get_container_name(self, slot: Optional[int] = None) -> str:
         """
         Get the container name for the IPython kernel.
 
+        :param slot: Pool slot (default: current).
         :return: Container name.
         """
-        return self.plugin.get_option_value('ipython_container_name')
+        name = self.plugin.get_option_value('ipython_container_name')
+        slot = self.slot if slot is None else slot
+        if slot:
+            name = "{}_{}".format(name, slot)
+        return name
 
     def create_docker_context(self, dockerfile: str) -> io.BytesIO:
         """
@@ -129,16 +141,13 @@ class DockerKernel:
         :param force: Force reinitialization.
         :param auto_init: Automatically initialize the kernel if not initialized after error.
         """
-        from jupyter_client import BlockingKernelClient
         if self.initialized and not force:
             return
 
         self.prepare_local_data_dir()
         self.start_container(self.get_container_name())
         self.prepare_conn()
-        self.client = BlockingKernelClient(connection_file=self.get_kernel_file_path())
-        self.client.load_connection_file()
-        self.client.start_channels()
+        self.client = self.create_client()
 
         try:
             self.client.wait_for_ready()
@@ -160,6 +169,113 @@ class DockerKernel:
         self.initialized = True
         self.log("IPython kernel is ready.")
         self.allow_auto_restart = True  # Re-enable auto-restart after successful connection
+        self.get_pool().configure(self.get_pool_size())
+
+    def create_client(self, slot: Optional[int] = None):
+        """
+        Create and connect the kernel client.
+
+        :param slot: Pool slot (default: current).
+        :return: BlockingKernelClient instance.
+        """
+        from jupyter_client import BlockingKernelClient
+        client = BlockingKernelClient(connection_file=self.get_kernel_file_path(slot))
+        client.load_connection_file()
+        client.start_channels()
+        return client
+
+    def swap_kernel(self) -> bool:
+        """
+        Switch to a fresh kernel: take a warm one from the pool or restart the current one.
+
+        :return: True if successful.
+        """
+        if not self.initialized or self.restarting:
+            return self.restart_kernel()
+
+        pool = self.get_pool()
+        pool.configure(self.get_pool_size())
+        kernel = pool.acquire(timeout=10)  # kernel already warming is faster than restart
+        if kernel is None:
+            return self.restart_kernel()
+
+        old = (self.slot, self.client)
+        self.slot, self.client = kernel
+        pool.recycle(old)  # recreate old container in background
+        self.log("Switched to warm IPython kernel.")
+        return True
+
+    def get_pool(self) -> KernelPool:
+        """
+        Get the warm kernels pool.
+
+        :return: KernelPool instance.
+        """
+        if self.pool is None:
+            self.pool = KernelPool(
+                start=self.start_pooled,
+                reset=self.reset_pooled,
+                stop=self.stop_pooled,
+                log=self.log,
+            )
+        return self.pool
+
+    def get_pool_size(self) -> int:
+        """
+        Get the number of warm kernels (containers) to keep.
+
+        :return: Pool size.
+        """
+        try:
+            return max(0, int(self.plugin.get_option_value('ipython_pool_docker') or 0))
+        except Exception:
+            return 0
+
+    def start_pooled(self, slot: int) -> Tuple[int, Any]:
+        """
+        Start a new kernel container for the pool.
+
+        :param slot: Pool slot.
+        :return: Slot and kernel client.
+        """
+        self.restart_container(self.get_container_name(slot), slot)  # always fresh container
+        client = self.create_client(slot)
+        client.wait_for_ready(timeout=60)
+        return slot, client
+
+    def reset_pooled(self, kernel: Tuple[int, Any]) -> Tuple[int, Any]:
+        """
+        Recreate used kernel container before returning it to the pool.
+
+        :param kernel: Slot and kernel client.
+        :return: Slot and kernel client.
+        """
+        slot, client = kernel
+        client.stop_channels()
+        return self.start_pooled(slot)
+
+    def stop_pooled(self, kernel: Tuple[int, Any]):
+        """
+        Stop pooled kernel container.
+
+        :param kernel: Slot and kernel client.
+        """
+        slot, client = kernel
+        client.stop_channels()
+        self.stop_container(self.get_container_name(slot))
+        self.get_pool().release_slot(slot)
+
+    def get_timeout(self) -> Optional[float]:
+        """
+        Get the execution timeout.
+
+        :return: Timeout in seconds or None if unlimited.
+        """
+        try:
+            timeout = float(self.plugin.get_option_value('ipython_timeout') or 0)
+        except Exception:
+            timeout = 0
+        return timeout if timeout > 0 else None
 
     def prepare_local_data_dir(self):
         """
@@ -180,9 +296,13 @@ class DockerKernel:
         import docker
         return docker.from_env()
 
-    def prepare_conn(self):
-        """Prepare the connection file."""
-        ports = self.get_ports()
+    def prepare_conn(self, slot: Optional[int] = None):
+        """
+        Prepare the connection file.
+
+        :param slot: Pool slot (default: current).
+        """
+        ports = self.get_ports(slot)
         conn = {
             "shell_port": int(ports["shell"]),
             "iopub_port": int(ports["iopub"]),
@@ -194,7 +314,7 @@ class DockerKernel:
             "transport": "tcp",
             "signature_scheme": "hmac-sha256"
         }
-        with open(self.get_kernel_file_path(), "w") as f:
+        with open(self.get_kernel_file_path(slot), "w") as f:
             json.dump(conn, f)
 
     def process_message(self, msg: dict) -> str:
@@ -232,6 +352,8 @@ class DockerKernel:
         """
         self.client.stop_channels()  # stop the client
         if all:
+            if self.pool is not None:
+                self.pool.shutdown()
             self.stop_container(self.get_container_name())
 
     def stop_container(self, name: str):
@@ -249,16 +371,17 @@ class DockerKernel:
         except docker.errors.NotFound:
             self.log(f"Container '{name}' not found.")
 
-    def run_container(self, name: str) -> bool:
+    def run_container(self, name: str, slot: Optional[int] = None) -> bool:
         """
         Run the Docker container.
 
         :param name: Container name.
+        :param slot: Pool slot (default: current).
         :return: True if the container was started successfully, False otherwise.
         """
         import docker.errors
         client = self.get_docker_client()
-        ports = self.get_ports()
+        ports = self.get_ports(slot)
         # at first, check for image
         if not self.is_image():
             self.build_image()
@@ -266,7 +389,7 @@ class DockerKernel:
         # run the container
         try:
             print("Running container {}...".format(name))
-            self.prepare_conn()
+            self.prepare_conn(slot)
             local_data_dir = self.get_local_data_dir()
             client.containers.run(
                 self.get_image_name(),
@@ -308,11 +431,12 @@ class DockerKernel:
             self.run_container(name)
             self.log("Container has been started.")
 
-    def restart_container(self, name: str):
+    def restart_container(self, name: str, slot: Optional[int] = None):
         """
         Restart the Docker container.
 
         :param name: Container name.
+        :param slot: Pool slot (default: current).
         """
         import docker.errors
         client = self.get_docker_client()
@@ -326,7 +450,7 @@ class DockerKernel:
             self.log(f"Container '{name}' not found. Nothing stopped.")
 
         self.log(f"Creating a new container: '{name}'...")
-        self.run_container(name)
+        self.run_container(name, slot)
         self.log("Container has been started.")
 
     def get_conn_address(self) -> str:
@@ -345,27 +469,35 @@ class DockerKernel:
         """
         return self.bind_address
 
-    def get_ports(self) -> dict:
+    def get_ports(self, slot: Optional[int] = None) -> dict:
         """
         Get the ports.
 
+        :param slot: Pool slot (default: current), host ports are shifted by slot * SLOT_PORT_STEP
         :return: Ports.
         """
+        slot = self.slot if slot is None else slot
+        offset = slot * self.SLOT_PORT_STEP
         ports = {}
-        ports['shell'] = int(self.plugin.get_option_value('ipython_port_shell'))
-        ports['iopub'] = int(self.plugin.get_option_value('ipython_port_iopub'))
-        ports['stdin'] = int(self.plugin.get_option_value('ipython_port_stdin'))
-        ports['control'] = int(self.plugin.get_option_value('ipython_port_control'))
-        ports['hb'] = int(self.plugin.get_option_value('ipython_port_hb'))
+        ports['shell'] = int(self.plugin.get_option_value('ipython_port_shell')) + offset
+        ports['iopub'] = int(self.plugin.get_option_value('ipython_port_iopub')) + offset
+        ports['stdin'] = int(self.plugin.get_option_value('ipython_port_stdin')) + offset
+        ports['control'] = int(self.plugin.get_option_value('ipython_port_control')) + offset
+        ports['hb'] = int(self.plugin.get_option_value('ipython_port_hb')) + offset
         return ports
 
-    def get_kernel_file_path(self) -> str:
+    def get_kernel_file_path(self, slot: Optional[int] = None) -> str:
         """
         Get the kernel file path.
 
+        :param slot: Pool slot (default: current).
         :return: Kernel file path.
         """
-        return os.path.join(self.plugin.window.core.config.get_user_dir("tmp"), self.kernel_file)
+        slot = self.slot if slot is None else slot
+        kernel_file = self.kernel_file
+        if slot:
+            kernel_file = ".interpreter.kernel.{}.json".format(slot)
+        return os.path.join(self.plugin.window.core.config.get_user_dir("tmp"), kernel_file)
 
     def get_local_data_dir(self) -> str:
         """
@@ -412,8 +544,7 @@ class DockerKernel:
             return self.NOT_READY_MSG
 
         if not current:
-            self.restart_kernel()
-            time.sleep(1)
+            self.swap_kernel()
 
         if not self.check_ready():
             self.log("IPython kernel is not ready.")
@@ -421,52 +552,98 @@ class DockerKernel:
             return self.NOT_READY_MSG
 
         self.log("Executing code: " + str(code)[:100] + "...")
+        return self.read_output(code)
 
-        msg_id = self.client.execute(code)
-        output = ""
-        while True:
-            try:
-                msg = self.client.get_iopub_msg(timeout=1)
-            except:
-                break
+    def read_output(self, code: str) -> str:
+        """
+        Execute the code and collect output until the kernel is idle or the deadline is reached.
+
+        :param code: Python code to execute.
+        :return: Output from the kernel (or saved image path).
+        """
+        timeout = self.get_timeout()
+        output = []
+        result = {}
+        start = time.monotonic()
 
-            if msg['parent_header'].get('msg_id') != msg_id:
-                continue
+        def hook(msg: dict):
+            msg_type = msg['msg_type']
+            if msg_type in self.OUTPUT_TYPES and 'ttfo' not in result:
+                result['ttfo'] = time.monotonic() - start
+            if 'image' in result:
+                return  # image is the result, skip the rest
 
             # receive binary image data
-            if msg['msg_type'] in ['display_data', 'execute_result']:
+            if msg_type in ['display_data', 'execute_result']:
                 data = msg['content'].get('data', {})
                 if 'image/png' in data:
-                    b64_image = data['image/png']
-                    binary_image = base64.b64decode(b64_image)
+                    binary_image = base64.b64decode(data['image/png'])
                     self.log("Received binary image data.")
                     if binary_image:
-                        path_to_save = self.plugin.make_temp_file_path('png')
-                        try:
-                            with open(path_to_save, 'wb') as f:
-                                f.write(binary_image)
-                            self.log(f"Image saved to: {path_to_save}")
-                            self.send_output(path_to_save)
-                            return str(path_to_save)
-                        except Exception as e:
-                            self.log(f"Error saving image: {e}")
-                            self.send_output(f"Error saving image: {e}")
-                            return f"Error saving image: {e}"
+                        result['image'] = self.save_image(binary_image)
+                        return
 
             chunk = str(self.process_message(msg))
             if chunk.strip() != "":
-                output += chunk
+                output.append(chunk)
                 self.send_output(chunk)
 
-            if (msg['msg_type'] == 'status' and
-                    msg['content']['execution_state'] == 'idle'):
-                break
+        try:
+            self.client.execute_interactive(
+                code,
+                timeout=timeout,
+                output_hook=hook,
+                allow_stdin=False,
+            )
+        except TimeoutError:
+            self.interrupt_kernel()
+            msg = "Execution timed out after {} s.".format(int(timeout))
+            self.log(msg)
+            output.append("\n" + msg)
+            self.send_output(msg)
+
+        if 'ttfo' in result:
+            pool = self.get_pool()
+            pool.add_ttfo(result['ttfo'])
+            stats = pool.get_stats()
+            self.plugin.window.core.debug.info("[ipython] Time to first output: {} ms (p50: {} ms, p95: {} ms)".format(
+                round(result['ttfo'] * 1000.0, 1),
+                stats['ttfo_p50_ms'],
+                stats['ttfo_p95_ms'],
+            ))
+        if 'image' in result:
+            return result['image']
+        return self.remove_ansi("".join(output)).strip()
+
+    def save_image(self, binary_image: bytes) -> str:
+        """
+        Save image received from the kernel.
+
+        :param binary_image: PNG data.
+        :return: Path to saved image or error message.
+        """
+        path_to_save = self.plugin.make_temp_file_path('png')
+        try:
+            with open(path_to_save, 'wb') as f:
+                f.write(binary_image)
+            self.log(f"Image saved to: {path_to_save}")
+            self.send_output(path_to_save)
+            return str(path_to_save)
+        except Exception as e:
+            self.log(f"Error saving image: {e}")
+            self.send_output(f"Error saving image: {e}")
+            return f"Error saving image: {e}"
 
-        return self.remove_ansi(output).strip()
+    def interrupt_kernel(self):
+        """Interrupt the running execution (interrupt request on control channel)."""
+        try:
+            msg = self.client.session.msg("interrupt_request", {})
+            self.client.control_channel.send(msg)
+        except Exception as e:
+            self.log(f"Error interrupting IPython kernel: {e}")
 
     def restart_kernel(self) -> bool:
         """Restart kernel"""
-        from jupyter_client import BlockingKernelClient
         if self.restarting:
             self.log("Kernel is already restarting.")
             return False
@@ -482,9 +659,7 @@ class DockerKernel:
             except Exception as e:
                 pass
 
-        self.client = BlockingKernelClient(connection_file=self.get_kernel_file_path())
-        self.client.load_connection_file()
-        self.client.start_channels()
+        self.client = self.create_client()
         self.client.wait_for_ready()
         self.log("Connected to IPython kernel.")
         self.send_output("Restarted.")
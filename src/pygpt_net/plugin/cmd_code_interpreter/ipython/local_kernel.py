@@ -6,16 +6,20 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.06 01:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import base64
 import re
 import time
+from typing import Optional, Tuple, Any
+
+from .pool import KernelPool
 
 class LocalKernel:
 
     NOT_READY_MSG = "IPython kernel is not initialized... try to restart the kernel with: /restart"
+    OUTPUT_TYPES = ('stream', 'display_data', 'execute_result', 'error')
 
     def __init__(self, plugin = None):
         self.plugin = plugin
@@ -24,6 +28,7 @@ class LocalKernel:
         self.initialized = False
         self.signals = None
         self.restarting = False
+        self.pool = None
 
     def restart_kernel(self) -> bool:
         """
@@ -49,6 +54,105 @@ class LocalKernel:
         self.restarting = False
         return True
 
+    def swap_kernel(self) -> bool:
+        """
+        Switch to a fresh kernel: take a warm one from the pool or restart the current one.
+
+        :return: True if successful.
+        """
+        if not self.initialized or self.restarting:
+            return self.restart_kernel()
+
+        pool = self.get_pool()
+        pool.configure(self.get_pool_size())
+        kernel = pool.acquire(timeout=10)  # kernel already warming is faster than restart
+        if kernel is None:
+            return self.restart_kernel()
+
+        old = (self.manager, self.client)
+        self.manager, self.client = kernel
+        pool.recycle(old)  # reset old kernel in background
+        self.log("Switched to warm IPython kernel.")
+        return True
+
+    def get_pool(self) -> KernelPool:
+        """
+        Get the warm kernels pool.
+
+        :return: KernelPool instance.
+        """
+        if self.pool is None:
+            self.pool = KernelPool(
+                start=self.start_pooled,
+                reset=self.reset_pooled,
+                stop=self.stop_pooled,
+                log=self.log,
+            )
+        return self.pool
+
+    def get_pool_size(self) -> int:
+        """
+        Get the number of warm kernels to keep.
+
+        :return: Pool size.
+        """
+        try:
+            return max(0, int(self.plugin.get_option_value('ipython_pool_local') or 0))
+        except Exception:
+            return 0
+
+    def start_pooled(self, slot: int) -> Tuple[Any, Any]:
+        """
+        Start a new kernel for the pool.
+
+        :param slot: Pool slot number.
+        :return: Kernel manager and client.
+        """
+        from jupyter_client import KernelManager
+        manager = KernelManager()
+        manager.start_kernel()
+        client = manager.client()
+        client.start_channels()
+        client.wait_for_ready(timeout=60)
+        return manager, client
+
+    def reset_pooled(self, kernel: Tuple[Any, Any]) -> Tuple[Any, Any]:
+        """
+        Restart used kernel before returning it to the pool.
+
+        :param kernel: Kernel manager and client.
+        :return: Kernel manager and client.
+        """
+        manager, client = kernel
+        client.stop_channels()
+        manager.restart_kernel(now=True)
+        client = manager.client()
+        client.start_channels()
+        client.wait_for_ready(timeout=60)
+        return manager, client
+
+    def stop_pooled(self, kernel: Tuple[Any, Any]):
+        """
+        Stop pooled kernel.
+
+        :param kernel: Kernel manager and client.
+        """
+        manager, client = kernel
+        client.stop_channels()
+        manager.shutdown_kernel(now=True)
+
+    def get_timeout(self) -> Optional[float]:
+        """
+        Get the execution timeout.
+
+        :return: Timeout in seconds or None if unlimited.
+        """
+        try:
+            timeout = float(self.plugin.get_option_value('ipython_timeout') or 0)
+        except Exception:
+            timeout = 0
+        return timeout if timeout > 0 else None
+
     def shutdown_kernel(self):
         """Shutdown the IPython kernel."""
         self.client.stop_channels()
@@ -71,6 +175,7 @@ class LocalKernel:
         self.log("Connected to local IPython kernel.")
         self.initialized = True
         self.log("IPython kernel is ready.")
+        self.get_pool().configure(self.get_pool_size())
 
     def process_message(self, msg: dict) -> str:
         """
@@ -105,6 +210,8 @@ class LocalKernel:
 
         :param all: Stop the container as well.
         """
+        if self.pool is not None:
+            self.pool.shutdown()
         self.client.stop_channels()  # stop the client
         self.manager.shutdown_kernel()
 
@@ -143,8 +250,7 @@ class LocalKernel:
             return self.NOT_READY_MSG
 
         if not current:
-            self.restart_kernel()
-            time.sleep(1)
+            self.swap_kernel()
 
         self.log("Executing code: " + str(code)[:100] + "...")
 
@@ -153,47 +259,94 @@ class LocalKernel:
             self.send_output(self.NOT_READY_MSG)
             return self.NOT_READY_MSG
 
-        msg_id = self.client.execute(code)
-        output = ""
-        while True:
-            try:
-                msg = self.client.get_iopub_msg(timeout=1)
-            except:
-                break
+        return self.read_output(code)
 
-            if msg['parent_header'].get('msg_id') != msg_id:
-                continue
+    def read_output(self, code: str) -> str:
+        """
+        Execute the code and collect output until the kernel is idle or the deadline is reached.
+
+        :param code: Python code to execute.
+        :return: Output from the kernel (or saved image path).
+        """
+        timeout = self.get_timeout()
+        output = []
+        result = {}
+        start = time.monotonic()
+
+        def hook(msg: dict):
+            msg_type = msg['msg_type']
+            if msg_type in self.OUTPUT_TYPES and 'ttfo' not in result:
+                result['ttfo'] = time.monotonic() - start
+            if 'image' in result:
+                return  # image is the result, skip the rest
 
             # receive binary image data
-            if msg['msg_type'] in ['display_data', 'execute_result']:
+            if msg_type in ['display_data', 'execute_result']:
                 data = msg['content'].get('data', {})
                 if 'image/png' in data:
-                    b64_image = data['image/png']
-                    binary_image = base64.b64decode(b64_image)
+                    binary_image = base64.b64decode(data['image/png'])
                     self.log("Received binary image data.")
                     if binary_image:
-                        path_to_save = self.plugin.make_temp_file_path('png')
-                        try:
-                            with open(path_to_save, 'wb') as f:
-                                f.write(binary_image)
-                            self.log(f"Image saved to: {path_to_save}")
-                            self.send_output(path_to_save)
-                            return str(path_to_save)
-                        except Exception as e:
-                            self.log(f"Error saving image: {e}")
-                            self.send_output(f"Error saving image: {e}")
-                            return f"Error saving image: {e}"
+                        result['image'] = self.save_image(binary_image)
+                        return
 
             chunk = str(self.process_message(msg))
             if chunk.strip() != "":
-                output += chunk
+                output.append(chunk)
                 self.send_output(chunk)
 
-            if (msg['msg_type'] == 'status' and
-                    msg['content']['execution_state'] == 'idle'):
-                break
+        try:
+            self.client.execute_interactive(
+                code,
+                timeout=timeout,
+                output_hook=hook,
+                allow_stdin=False,
+            )
+        except TimeoutError:
+            self.interrupt_kernel()
+            msg = "Execution timed out after {} s.".format(int(timeout))
+            self.log(msg)
+            output.append("\n" + msg)
+            self.send_output(msg)
+
+        if 'ttfo' in result:
+            pool = self.get_pool()
+            pool.add_ttfo(result['ttfo'])
+            stats = pool.get_stats()
+            self.log("Time to first output: {} ms (p50: {} ms, p95: {} ms)".format(
+                round(result['ttfo'] * 1000.0, 1),
+                stats['ttfo_p50_ms'],
+                stats['ttfo_p95_ms'],
+            ))
+        if 'image' in result:
+            return result['image']
+        return self.remove_ansi("".join(output)).strip()
+
+    def save_image(self, binary_image: bytes) -> str:
+        """
+        Save image received from the kernel.
 
-        return self.remove_ansi(output).strip()
+        :param binary_image: PNG data.
+        :return: Path to saved image or error message.
+        """
+        path_to_save = self.plugin.make_temp_file_path('png')
+        try:
+            with open(path_to_save, 'wb') as f:
+                f.write(binary_image)
+            self.log(f"Image saved to: {path_to_save}")
+            self.send_output(path_to_save)
+            return str(path_to_save)
+        except Exception as e:
+            self.log(f"Error saving image: {e}")
+            self.send_output(f"Error saving image: {e}")
+            return f"Error saving image: {e}"
+
+    def interrupt_kernel(self):
+        """Interrupt the running execution."""
+        try:
+            self.manager.interrupt_kernel()
+        except Exception as e:
+            self.log(f"Error interrupting IPython kernel: {e}")
 
     def send_output(self, output: str):
         """
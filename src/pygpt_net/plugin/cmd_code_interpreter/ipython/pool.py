@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+import threading
+import time
+from collections import deque
+from typing import Optional, Callable, Any, Dict
+
+
+class KernelPool:
+
+    def __init__(
+            self,
+            start: Callable[[int], Any],
+            reset: Callable[[Any], Any],
+            stop: Callable[[Any], None],
+            log: Optional[Callable[[str], None]] = None,
+    ):
+        """
+        Pool of pre-started (warm) kernels
+
+        A fresh execution takes an idle kernel from the pool instead of restarting
+        the current one. The previous kernel is reset in background and returned
+        to the pool as a replacement, missing kernels are started on configure().
+
+        :param start: start new kernel for slot number, returns ready kernel
+        :param reset: reset kernel to fresh state, returns ready kernel
+        :param stop: stop kernel
+        :param log: log callable
+        """
+        self.start = start
+        self.reset = reset
+        self.stop = stop
+        self.log = log or (lambda msg: None)
+        self.size = 0
+        self.idle = deque()
+        self.warming = 0
+        self.slots = set()  # used slot numbers
+        self.cond = threading.Condition()
+        self.closed = False
+        self.ttfo = deque(maxlen=200)  # time to first output samples (seconds)
+
+    def configure(self, size: int):
+        """
+        Set pool size and start warming missing kernels
+
+        :param size: number of idle kernels to keep
+        """
+        with self.cond:
+            self.size = max(0, int(size or 0))
+            self.closed = False
+            extra = []
+            while len(self.idle) > self.size:
+                extra.append(self.idle.pop())
+        for kernel in extra:
+            self._stop(kernel)
+        self.fill()
+
+    def fill(self):
+        """Start warming kernels in background until pool is full"""
+        while True:
+            with self.cond:
+                if self.closed or len(self.idle) + self.warming >= self.size:
+                    return
+                self.warming += 1
+                slot = self._next_slot()
+            threading.Thread(target=self._warm, args=(slot,), daemon=True).start()
+
+    def acquire(self, timeout: float = 0.0) -> Optional[Any]:
+        """
+        Take idle kernel from pool (replacement comes from recycle() or next configure())
+
+        :param timeout: max time to wait for kernel which is warming up
+        :return: ready kernel or None if pool is empty
+        """
+        deadline = time.monotonic() + max(0.0, timeout)
+        with self.cond:
+            while not self.idle:
+                remaining = deadline - time.monotonic()
+                if self.closed or self.warming == 0 or remaining <= 0:
+                    return None
+                self.cond.wait(remaining)
+            return self.idle.popleft()
+
+    def recycle(self, kernel: Any):
+        """
+        Reset used kernel in background and return it to pool (or stop it if pool is full)
+
+        :param kernel: used kernel
+        """
+        if kernel is None:
+            return
+        with self.cond:
+            if self.closed or len(self.idle) + self.warming >= self.size:
+                full = True
+            else:
+                full = False
+                self.warming += 1
+        if full:
+            threading.Thread(target=self._stop, args=(kernel,), daemon=True).start()
+            return
+        threading.Thread(target=self._recycle, args=(kernel,), daemon=True).start()
+
+    def shutdown(self):
+        """Stop all idle kernels"""
+        with self.cond:
+            self.closed = True
+            kernels = list(self.idle)
+            self.idle.clear()
+            self.cond.notify_all()
+        for kernel in kernels:
+            self._stop(kernel)
+
+    def add_ttfo(self, seconds: float):
+        """
+        Add time to first output sample
+
+        :param seconds: time from execute request to first output
+        """
+        self.ttfo.append(seconds)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool stats
+
+        :return: stats dict (time to first output in ms)
+        """
+        with self.cond:
+            idle = len(self.idle)
+            warming = self.warming
+        data = sorted(self.ttfo)
+        p50 = p95 = None
+        if data:
+            p50 = round(data[int(0.50 * (len(data) - 1))] * 1000.0, 1)
+            p95 = round(data[int(0.95 * (len(data) - 1))] * 1000.0, 1)
+        return {
+            "size": self.size,
+            "idle": idle,
+            "warming": warming,
+            "ttfo_count": len(data),
+            "ttfo_p50_ms": p50,
+            "ttfo_p95_ms": p95,
+        }
+
+    def _next_slot(self) -> int:
+        """
+        Get first free slot number (lock must be held), slot 0 is reserved for main kernel
+
+        :return: slot number
+        """
+        slot = 1
+        while slot in self.slots:
+            slot += 1
+        self.slots.add(slot)
+        return slot
+
+    def release_slot(self, slot: int):
+        """
+        Release slot number
+
+        :param slot: slot number
+        """
+        with self.cond:
+            self.slots.discard(slot)
+
+    def _warm(self, slot: int):
+        """
+        Start new kernel (background)
+
+        :param slot: slot number
+        """
+        kernel = None
+        try:
+            kernel = self.start(slot)
+        except Exception as e:
+            self.log("Error starting pooled IPython kernel: {}".format(e))
+            self.release_slot(slot)
+        self._put(kernel)
+
+    def _recycle(self, kernel: Any):
+        """
+        Reset used kernel (background)
+
+        :param kernel: used kernel
+        """
+        try:
+            kernel = self.reset(kernel)
+        except Exception as e:
+            self.log("Error resetting pooled IPython kernel: {}".format(e))
+            self._stop(kernel)
+            kernel = None
+        self._put(kernel)
+
+    def _put(self, kernel: Optional[Any]):
+        """
+        Put ready kernel to pool
+
+        :param kernel: ready kernel or None on error
+        """
+        with self.cond:
+            self.warming -= 1
+            if kernel is not None and not self.closed and len(self.idle) < self.size:
+                self.idle.append(kernel)
+                kernel = None
+            self.cond.notify_all()
+        if kernel is not None:
+            self._stop(kernel)
+
+    def _stop(self, kernel: Any):
+        """
+        Stop kernel, ignore errors
+
+        :param kernel: kernel
+        """
+        try:
+            self.stop(kernel)
+        except Exception as e:
+            self.log("Error stopping pooled IPython kernel: {}".format(e))
@@ -6,11 +6,10 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.15 23:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import os
-import time
 import uuid
 
 from PySide6.QtCore import Slot
@@ -316,8 +315,7 @@ class Plugin(BasePlugin):
         if self.window.tools.get("interpreter").is_ipython():
             cmd = "ipython_execute"
             if self.get_option_value("fresh_kernel"):
-                self.get_interpreter().restart_kernel()
-                time.sleep(1)
+                self.get_interpreter().swap_kernel()
         self.window.tools.get("interpreter").clear_output()
         commands = [
             {
@@ -6,14 +6,14 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.07.17 19:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 import os.path
 import re
-import subprocess
 import docker
 
+from pygpt_net.core.command.process import StreamProcess, OutputBuffer
 from pygpt_net.item.ctx import CtxItem
 
 
@@ -106,17 +106,72 @@ class Runner:
             self.log(result)
         return result
 
-    def handle_result_docker(self, response) -> str:
+    def handle_process(self, process: StreamProcess) -> str:
         """
-        Handle result from docker container
+        Handle result from streamed subprocess (output already sent to interpreter)
 
-        :param response: response
+        :param process: finished process
         :return: result
         """
         result = None
+        stdout = process.stdout.get()
+        stderr = process.stderr.get()
+        if stdout:
+            result = stdout
+            self.log("STDOUT: {}".format(result))
+        if stderr:
+            result = stderr
+            self.log("STDERR: {}".format(result))
+        status = process.get_status()
+        if status:
+            self.send_interpreter_output(status, "stderr")
+            self.log(status)
+            result = status if result is None else result + "\n" + status
+        if result is None:
+            result = "No result (STDOUT/STDERR empty)"
+            self.log(result)
+        return result
+
+    def run_host(self, cmd: str) -> str:
+        """
+        Run command on host machine, stream output to interpreter
+
+        :param cmd: command to run
+        :return: result
+        """
+        try:
+            process = StreamProcess(
+                cmd,
+                on_output=self.send_interpreter_output,
+                timeout=self.plugin.get_option_value('exec_timeout'),
+                max_output=int(self.plugin.get_option_value('exec_max_output') or 0) * 1024,
+                keep=self.plugin.get_option_value('exec_output_keep'),
+            ).run()
+        except Exception as e:
+            self.error(e)
+            self.send_interpreter_output(str(e), "stderr")
+            return str(e)
+        return self.handle_process(process)
+
+    def run_docker_stream(self, cmd: str) -> str:
+        """
+        Run command in docker container, stream output to interpreter
+
+        :param cmd: command to run
+        :return: result
+        """
+        buffer = OutputBuffer(self.plugin.get_option_value('exec_output_keep'))
+
+        def on_output(text: str, type: str):
+            buffer.write(text)
+            self.send_interpreter_output(text, type)
+
+        response = self.run_docker(cmd, on_output)
         if response:
-            result = response.decode('utf-8')
-        self.send_interpreter_output(result, "stdout")
+            error = response.decode('utf-8', errors="replace")
+            buffer.write(error)
+            self.send_interpreter_output(error, "stderr")
+        result = buffer.get()
         self.log(
             "Result: {}".format(result),
             sandbox=True,
@@ -182,15 +237,21 @@ class Runner:
         }
         return mapping
 
-    def run_docker(self, cmd: str) -> bytes or None:
+    def run_docker(self, cmd: str, on_output=None) -> bytes or None:
         """
         Run docker container with command and return response
 
         :param cmd: command to run
+        :param on_output: stream output to callback(text, type)
         :return: response
         """
         try:
-            response = self.plugin.docker.execute(cmd)
+            response = self.plugin.docker.execute(
+                cmd,
+                on_output,
+                timeout=self.plugin.get_option_value('exec_timeout'),
+                max_output=int(self.plugin.get_option_value('exec_max_output') or 0) * 1024,
+            )
         except Exception as e:
             # self.error(e)
             response = str(e).encode("utf-8")
@@ -230,20 +291,8 @@ class Runner:
         cmd = self.plugin.get_option_value('python_cmd_tpl').format(filename=path)
         self.plugin.window.core.security.ensure_command(cmd, sandbox=False)
         self.log("Running command: {}".format(cmd))
-        try:
-            self.send_interpreter_output_begin("stdout")
-            process = subprocess.Popen(
-                cmd,
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
-            stdout, stderr = process.communicate()
-        except Exception as e:
-            self.error(e)
-            stdout = None
-            stderr = str(e).encode("utf-8")
-        result = self.handle_result(stdout, stderr)
+        self.send_interpreter_output_begin("stdout")
+        result = self.run_host(cmd)
         self.send_interpreter_output_end("stdout")
         return {
             "request": request,
@@ -278,8 +327,7 @@ class Runner:
 
         self.log("Running command: {}".format(cmd), sandbox=True)
         self.send_interpreter_output_begin("stdout")
-        response = self.run_docker(cmd)
-        result = self.handle_result_docker(response)
+        result = self.run_docker_stream(cmd)
         self.send_interpreter_output_end("stdout")
         return {
             "request": request,
@@ -320,20 +368,8 @@ class Runner:
         cmd = self.plugin.get_option_value('python_cmd_tpl').format(filename=path)
         self.plugin.window.core.security.ensure_command(cmd, sandbox=False)
         self.log("Running command: {}".format(cmd))
-        try:
-            self.send_interpreter_output_begin("stdout")
-            process = subprocess.Popen(
-                cmd,
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
-            stdout, stderr = process.communicate()
-        except Exception as e:
-            self.error(e)
-            stdout = None
-            stderr = str(e).encode("utf-8")
-        result = self.handle_result(stdout, stderr)
+        self.send_interpreter_output_begin("stdout")
+        result = self.run_host(cmd)
         self.send_interpreter_output_end("stdout")
         return {
             "request": request,
@@ -375,8 +411,7 @@ class Runner:
         )
         self.log("Running command: {}".format(cmd), sandbox=True)
         self.send_interpreter_output_begin("stdout")
-        response = self.run_docker(cmd)
-        result = self.handle_result_docker(response)
+        result = self.run_docker_stream(cmd)
         self.send_interpreter_output_end("stdout")
         return {
             "request": request,
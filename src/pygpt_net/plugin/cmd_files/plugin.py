@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.05 18:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import os
@@ -51,6 +51,19 @@ class Plugin(BasePlugin):
             "cwd",
             "file_index",
         ]
+        self.side_effect_cmds = [
+            "save_file",
+            "append_file",
+            "delete_file",
+            "mkdir",
+            "download_file",
+            "rmdir",
+            "copy_file",
+            "copy_dir",
+            "move",
+            "send_file",
+            "file_index",
+        ]
         self.use_locale = True
         self.worker = None
         self.output = Output(self)
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.14 01:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import fnmatch
@@ -15,7 +15,7 @@ import os.path
 import shutil
 import ssl
 
-from typing import Tuple, List, Dict
+from typing import Tuple, List, Dict, Optional
 from urllib.request import Request, urlopen
 from PySide6.QtCore import Slot
 
@@ -40,125 +40,119 @@ class Worker(BaseWorker):
     @Slot()
     def run(self):
         try:
-            responses = []
-            for item in self.cmds:
-                if self.is_stopped():
-                    break
-                try:
-                    response = None
-                    if item["cmd"] in self.plugin.allowed_cmds and self.plugin.has_cmd(item["cmd"]):
-                        self.check_security(item)
+            responses = self.run_cmds(self.handle_cmd)
+
+            if len(responses) > 0:
+                self.reply_more(responses) # send response
 
-                        # save file
-                        if item["cmd"] == "save_file":
-                            response = self.cmd_save_file(item)
+            if self.msg is not None:
+                self.status(self.msg)
 
-                        # append to file
-                        elif item["cmd"] == "append_file":
-                            response = self.cmd_append_file(item)
+        except Exception as e:
+            self.error(e)
+        finally:
+            self.cleanup()
 
-                        # read file
-                        elif item["cmd"] == "read_file":
-                            response = self.cmd_read_file(item)
+    def handle_cmd(self, item: dict) -> Optional[dict]:
+        """
+        Execute single command
 
-                        # query file
-                        elif item["cmd"] == "query_file":
-                            response = self.cmd_query_file(item)
+        :param item: command item
+        :return: response item
+        """
+        response = None
+        if item["cmd"] in self.plugin.allowed_cmds and self.plugin.has_cmd(item["cmd"]):
+            self.check_security(item)
 
-                        # delete file
-                        elif item["cmd"] == "delete_file":
-                            response = self.cmd_delete_file(item)
+            # save file
+            if item["cmd"] == "save_file":
+                response = self.cmd_save_file(item)
 
-                        # list files
-                        elif item["cmd"] == "list_dir":
-                            response = self.cmd_list_dir(item)
+            # append to file
+            elif item["cmd"] == "append_file":
+                response = self.cmd_append_file(item)
 
-                        # tree
-                        elif item["cmd"] == "tree":
-                            response = self.cmd_tree(item)
+            # read file
+            elif item["cmd"] == "read_file":
+                response = self.cmd_read_file(item)
 
-                        # mkdir
-                        elif item["cmd"] == "mkdir":
-                            response = self.cmd_mkdir(item)
+            # query file
+            elif item["cmd"] == "query_file":
+                response = self.cmd_query_file(item)
 
-                        # rmdir
-                        elif item["cmd"] == "rmdir":
-                            response = self.cmd_rmdir(item)
+            # delete file
+            elif item["cmd"] == "delete_file":
+                response = self.cmd_delete_file(item)
 
-                        # download
-                        elif item["cmd"] == "download_file":
-                            response = self.cmd_download_file(item)
+            # list files
+            elif item["cmd"] == "list_dir":
+                response = self.cmd_list_dir(item)
 
-                        # copy file
-                        elif item["cmd"] == "copy_file":
-                            response = self.cmd_copy_file(item)
+            # tree
+            elif item["cmd"] == "tree":
+                response = self.cmd_tree(item)
 
-                        # copy dir
-                        elif item["cmd"] == "copy_dir":
-                            response = self.cmd_copy_dir(item)
+            # mkdir
+            elif item["cmd"] == "mkdir":
+                response = self.cmd_mkdir(item)
 
-                        # move
-                        elif item["cmd"] == "move":
-                            response = self.cmd_move(item)
+            # rmdir
+            elif item["cmd"] == "rmdir":
+                response = self.cmd_rmdir(item)
 
-                        # is dir
-                        elif item["cmd"] == "is_dir":
-                            response = self.cmd_is_dir(item)
+            # download
+            elif item["cmd"] == "download_file":
+                response = self.cmd_download_file(item)
 
-                        # is file
-                        elif item["cmd"] == "is_file":
-                            response = self.cmd_is_file(item)
+            # copy file
+            elif item["cmd"] == "copy_file":
+                response = self.cmd_copy_file(item)
 
-                        # file exists
-                        elif item["cmd"] == "file_exists":
-                            response = self.cmd_file_exists(item)
+            # copy dir
+            elif item["cmd"] == "copy_dir":
+                response = self.cmd_copy_dir(item)
 
-                        # file size
-                        elif item["cmd"] == "file_size":
-                            response = self.cmd_file_size(item)
+            # move
+            elif item["cmd"] == "move":
+                response = self.cmd_move(item)
 
-                        # file info
-                        elif item["cmd"] == "file_info":
-                            response = self.cmd_file_info(item)
+            # is dir
+            elif item["cmd"] == "is_dir":
+                response = self.cmd_is_dir(item)
 
-                        # cwd
-                        elif item["cmd"] == "cwd":
-                            response = self.cmd_cwd(item)
+            # is file
+            elif item["cmd"] == "is_file":
+                response = self.cmd_is_file(item)
 
-                        # get file as attachment
-                        elif item["cmd"] == "send_file":
-                            response = self.cmd_send_file(item)
+            # file exists
+            elif item["cmd"] == "file_exists":
+                response = self.cmd_file_exists(item)
 
-                        # index file or directory
-                        elif item["cmd"] == "file_index":
-                            response = self.cmd_file_index(item)
+            # file size
+            elif item["cmd"] == "file_size":
+                response = self.cmd_file_size(item)
 
-                        # find file or directory
-                        elif item["cmd"] == "find":
-                            response = self.cmd_find(item)
+            # file info
+            elif item["cmd"] == "file_info":
+                response = self.cmd_file_info(item)
 
-                        # store response
-                        if response:
-                            responses.append(response)
+            # cwd
+            elif item["cmd"] == "cwd":
+                response = self.cmd_cwd(item)
 
-                except Exception as e:
-                    responses.append(
-                        self.make_response(
-                            item,
-                            self.throw_error(e)
-                        )
-                    )
+            # get file as attachment
+            elif item["cmd"] == "send_file":
+                response = self.cmd_send_file(item)
 
-            if len(responses) > 0:
-                self.reply_more(responses) # send response
+            # index file or directory
+            elif item["cmd"] == "file_index":
+                response = self.cmd_file_index(item)
 
-            if self.msg is not None:
-                self.status(self.msg)
+            # find file or directory
+            elif item["cmd"] == "find":
+                response = self.cmd_find(item)
 
-        except Exception as e:
-            self.error(e)
-        finally:
-            self.cleanup()
+        return response
 
     def check_security(self, item: dict):
         """Validate host filesystem access requested by a Files I/O command."""
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.23 07:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from pygpt_net.plugin.base.config import BaseConfig, BasePlugin
@@ -120,6 +120,36 @@ class Config(BaseConfig):
             description="Automatically append current working directory to sys_exec command",
             tab="general",
         )
+        plugin.add_option(
+            "exec_timeout",
+            type="int",
+            value=0,
+            label="Execution timeout",
+            description="Max execution time in seconds, process is killed after timeout, 0 = no limit",
+            min=0,
+            tab="general",
+            advanced=True,
+        )
+        plugin.add_option(
+            "exec_max_output",
+            type="int",
+            value=10240,
+            label="Max output size (KB)",
+            description="Process is killed when its output exceeds this size, 0 = no limit",
+            min=0,
+            tab="general",
+            advanced=True,
+        )
+        plugin.add_option(
+            "exec_output_keep",
+            type="int",
+            value=20000,
+            label="Output kept in context (chars)",
+            description="Max number of output chars returned to the model, only head and tail of larger outputs are kept, 0 = no limit",
+            min=0,
+            tab="general",
+            advanced=True,
+        )
         plugin.add_cmd(
             "sys_exec",
             instruction="execute ANY system command, script or app in user's environment. "
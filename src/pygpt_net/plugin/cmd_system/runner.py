@@ -6,12 +6,11 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.23 07:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 import os.path
 import re
-import subprocess
 import json
 import os
 import platform
@@ -21,6 +20,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from PySide6.QtGui import QGuiApplication
 from PySide6.QtCore import QRect
 
+from pygpt_net.core.command.process import StreamProcess, OutputBuffer
 from pygpt_net.item.ctx import CtxItem
 
 
@@ -69,25 +69,35 @@ class Runner:
             self.log(result)
         return result
 
-    def handle_result_docker(self, response) -> str:
+    def handle_process(self, process: StreamProcess) -> str:
         """
-        Handle result from docker container
+        Handle result from streamed subprocess
 
-        :param response: response
+        :param process: finished process
         :return: result
         """
-        result = None
-        if response:
-            try:
-                result = response.decode('utf-8', errors="replace")
-            except Exception:
-                result = str(response)
-        self.log(
-            "Result: {}".format(result),
-            sandbox=True,
-        )
+        result = process.stdout.get() or None
+        err = process.stderr.get()
+        # Prefer stderr if non-empty
+        result = err if err else result
+        status = process.get_status()
+        if status:
+            self.log(status)
+            result = status if result is None else result + "\n" + status
+        if result is None:
+            result = "No result (STDOUT/STDERR empty)"
+            self.log(result)
         return result
 
+    def handle_output(self, data: str, type: str):
+        """
+        Handle streamed output chunk
+
+        :param data: output text
+        :param type: output type (stdout/stderr)
+        """
+        self.log("{}: {}".format(type.upper(), data))
+
     def is_sandbox(self) -> bool:
         """
         Check if sandbox is enabled
@@ -119,17 +129,23 @@ class Runner:
         }
         return mapping
 
-    def run_docker(self, cmd: str) -> bytes or None:
+    def run_docker(self, cmd: str, on_output=None) -> bytes or None:
         """
         Run docker container with command and return response
 
         :param cmd: command to run
+        :param on_output: stream output to callback(text, type)
         :return: response
         """
         client = self.get_docker()
         mapping = self.get_volumes()
         try:
-            response = self.plugin.docker.execute(cmd)
+            response = self.plugin.docker.execute(
+                cmd,
+                on_output,
+                timeout=self.plugin.get_option_value('exec_timeout'),
+                max_output=int(self.plugin.get_option_value('exec_max_output') or 0) * 1024,
+            )
         except Exception as e:
             response = str(e).encode("utf-8")
         return response
@@ -143,18 +159,17 @@ class Runner:
         self.log(msg)
         self.log("Running command: {}".format(item["params"]['command']))
         try:
-            process = subprocess.Popen(
+            process = StreamProcess(
                 item["params"]['command'],
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
-            stdout, stderr = process.communicate()
+                on_output=self.handle_output,
+                timeout=self.plugin.get_option_value('exec_timeout'),
+                max_output=int(self.plugin.get_option_value('exec_max_output') or 0) * 1024,
+                keep=self.plugin.get_option_value('exec_output_keep'),
+            ).run()
+            result = self.handle_process(process)
         except Exception as e:
             self.error(e)
-            stdout = None
-            stderr = str(e).encode("utf-8")
-        result = self.handle_result(stdout, stderr)
+            result = self.handle_result(None, str(e).encode("utf-8"))
         return {
             "request": request,
             "result": str(result),
@@ -171,8 +186,16 @@ class Runner:
             "Running command: {}".format(item["params"]['command']),
             sandbox=True,
         )
-        response = self.run_docker(item["params"]['command'])
-        result = self.handle_result_docker(response)
+        buffer = OutputBuffer(self.plugin.get_option_value('exec_output_keep'))
+
+        def on_output(text: str, type: str):
+            buffer.write(text)
+            self.handle_output(text, type)
+
+        response = self.run_docker(item["params"]['command'], on_output)
+        if response:
+            buffer.write(response.decode('utf-8', errors="replace"))
+        result = buffer.get() or None
         return {
             "request": request,
             "result": str(result),
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.15 23:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import ssl
@@ -41,6 +41,10 @@ class Plugin(BasePlugin):
             "web_extract_links",
             "web_extract_images",
         ]
+        self.side_effect_cmds = [
+            "web_request",
+            "web_index",
+        ]
         self.order = 100
         self.use_locale = True
         self.worker = None
@@ -6,11 +6,12 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.22 15:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import json
 import os
+from typing import Optional
 
 from PySide6.QtCore import Slot
 
@@ -110,61 +111,56 @@ class Worker(BaseWorker):
     @Slot()
     def run(self):
         try:
-            responses = []
-            for item in self.cmds:
-                if self.is_stopped():
-                    break
-                response = None
-                try:
-                    if item["cmd"] == "web_search":
-                        response = self.cmd_web_urls(item)  # return URLs
+            responses = self.run_cmds(self.handle_cmd)
 
-                    elif item["cmd"] == "web_url_open":
-                        response = self.cmd_web_url_open(item)
+            if len(responses) > 0:
+                self.reply_more(responses) # send response
 
-                    elif item["cmd"] == "web_url_raw":
-                        response = self.cmd_web_url_raw(item)
+            if self.msg is not None:
+                self.log(self.msg)
+                self.status(self.msg)
 
-                    elif item["cmd"] == "web_urls":
-                        response = self.cmd_web_urls(item)
+        except Exception as e:
+            self.error(e)
+        finally:
+            self.cleanup()
 
-                    elif item["cmd"] == "web_index":
-                        response = self.cmd_web_index(item)
+    def handle_cmd(self, item: dict) -> Optional[dict]:
+        """
+        Execute single command
 
-                    elif item["cmd"] == "web_index_query":
-                        response = self.cmd_web_index_query(item)
+        :param item: command item
+        :return: response item
+        """
+        response = None
+        if item["cmd"] == "web_search":
+            response = self.cmd_web_urls(item)  # return URLs
 
-                    elif item["cmd"] == "web_extract_links":
-                        response = self.cmd_web_extract_links(item)
+        elif item["cmd"] == "web_url_open":
+            response = self.cmd_web_url_open(item)
 
-                    elif item["cmd"] == "web_extract_images":
-                        response = self.cmd_web_extract_images(item)
+        elif item["cmd"] == "web_url_raw":
+            response = self.cmd_web_url_raw(item)
 
-                    elif item["cmd"] == "web_request":
-                        response = self.cmd_web_request(item)
+        elif item["cmd"] == "web_urls":
+            response = self.cmd_web_urls(item)
 
-                    if response:
-                        responses.append(response)
+        elif item["cmd"] == "web_index":
+            response = self.cmd_web_index(item)
 
-                except Exception as e:
-                    responses.append(
-                        self.make_response(
-                            item,
-                            self.throw_error(e)
-                        )
-                    )
+        elif item["cmd"] == "web_index_query":
+            response = self.cmd_web_index_query(item)
 
-            if len(responses) > 0:
-                self.reply_more(responses) # send response
+        elif item["cmd"] == "web_extract_links":
+            response = self.cmd_web_extract_links(item)
 
-            if self.msg is not None:
-                self.log(self.msg)
-                self.status(self.msg)
+        elif item["cmd"] == "web_extract_images":
+            response = self.cmd_web_extract_images(item)
 
-        except Exception as e:
-            self.error(e)
-        finally:
-            self.cleanup()
+        elif item["cmd"] == "web_request":
+            response = self.cmd_web_request(item)
+
+        return response
 
     def cmd_web_search(self, item: dict) -> dict:
         """
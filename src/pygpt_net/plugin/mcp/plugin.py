@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.16 22:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import asyncio
@@ -103,6 +103,7 @@ class Plugin(BasePlugin):
             tool_name = getattr(tool, "name", None) or tool.get("name")
             description = getattr(tool, "description", None) or tool.get("description")
             input_schema = getattr(tool, "inputSchema", None) or tool.get("inputSchema")
+            read_only = self._is_read_only(tool)
 
             # Human-friendly display name
             display_name = tool_name
@@ -148,8 +149,18 @@ class Plugin(BasePlugin):
                 "schema": input_schema,
                 "description": description,
                 "display_name": display_name,
+                "read_only": read_only,
             }
 
+    def is_side_effect(self, cmd: str) -> bool:
+        """
+        Check if tool changes state (tools without readOnlyHint annotation are treated as side-effecting)
+
+        :param cmd: command name
+        :return: True if tool has side effects
+        """
+        return not self.tools_index.get(cmd, {}).get("read_only", False)
+
     def cmd(self, ctx: CtxItem, cmds: list):
         """
         Event: CMD_EXECUTE
@@ -370,6 +381,22 @@ class Plugin(BasePlugin):
         items = [x for x in items if x]
         return set(items) if items else None
 
+    def _is_read_only(self, tool: Any) -> bool:
+        """
+        Check readOnlyHint tool annotation (tool object or cached dict)
+
+        :param tool: discovered tool
+        :return: True if tool is declared as read-only
+        """
+        annotations = getattr(tool, "annotations", None)
+        if annotations is None and isinstance(tool, dict):
+            annotations = tool.get("annotations")
+        if annotations is None:
+            return False
+        if isinstance(annotations, dict):
+            return bool(annotations.get("readOnlyHint", False))
+        return bool(getattr(annotations, "readOnlyHint", False))
+
     def _detect_transport(self, address: str) -> str:
         """
         Detect transport from address:
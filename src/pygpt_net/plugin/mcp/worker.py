@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.16 22:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import asyncio
@@ -18,6 +18,7 @@ from urllib.parse import urlparse
 
 from PySide6.QtCore import Slot
 
+from pygpt_net.core.command.scheduler import Scheduler
 from pygpt_net.plugin.base.worker import BaseWorker, BaseSignals
 
 
@@ -70,54 +71,94 @@ class Worker(BaseWorker):
                 responses.append(self.make_response(item, f"MCP SDK not installed: {e}"))
             return responses
 
-        # Group by server
-        grouped: Dict[str, List[dict]] = {}
-        for item in self.cmds or []:
+        # Group by server (keep call index for ordering)
+        grouped: Dict[str, List[Tuple[int, dict]]] = {}
+        for i, item in enumerate(self.cmds or []):
             meta = self.tools_index.get(item["cmd"])
             if not meta:
                 continue
             server_key = self._server_key(meta["server"])
-            grouped.setdefault(server_key, []).append(item)
+            grouped.setdefault(server_key, []).append((i, item))
+
+        results: Dict[int, dict] = {}
+        max_parallel = self.plugin.get_max_parallel() if self.plugin is not None else 1
+        side_effect = any(
+            self._is_side_effect(item)
+            for calls in grouped.values()
+            for _, item in calls
+        )
+
+        # Servers run concurrently only if there are no side-effecting tools in this turn
+        if side_effect or max_parallel <= 1:
+            for calls in grouped.values():
+                await self._run_server(calls, results, max_parallel)
+        else:
+            await asyncio.gather(*[
+                self._run_server(calls, results, max_parallel) for calls in grouped.values()
+            ])
 
-        # Execute per server
-        for server_key, items in grouped.items():
-            meta0 = self.tools_index.get(items[0]["cmd"])
-            if not meta0:
-                continue
-            server_cfg = meta0["server"]
-            address = (server_cfg.get("server_address") or "").strip()
-            transport = meta0["transport"]
-            headers = self._build_headers(server_cfg)
+        responses.extend(results[i] for i in sorted(results))
+        return responses
 
-            try:
-                async with self._open_session(address, transport, headers=headers) as session:
-                    for item in items:
-                        if self.is_stopped():
-                            break
+    async def _run_server(self, calls: List[Tuple[int, dict]], results: Dict[int, dict], max_parallel: int):
+        """
+        Open session on server and call its tools, read-only tools in parallel
+
+        :param calls: list of (call index, command item)
+        :param results: results dict (call index -> response), filled in place
+        :param max_parallel: max concurrent tool calls
+        """
+        meta0 = self.tools_index.get(calls[0][1]["cmd"])
+        if not meta0:
+            return
+        server_cfg = meta0["server"]
+        address = (server_cfg.get("server_address") or "").strip()
+        transport = meta0["transport"]
+        headers = self._build_headers(server_cfg)
+        semaphore = asyncio.Semaphore(max(1, max_parallel))
 
+        try:
+            async with self._open_session(address, transport, headers=headers) as session:
+                async def call(i: int, item: dict):
+                    async with semaphore:
+                        if self.is_stopped():
+                            return
                         meta = self.tools_index.get(item["cmd"])
                         if not meta:
-                            continue
-
+                            return
                         tool_name = meta["tool_name"]
                         schema = meta.get("schema")
                         arguments = self._coerce_arguments(item.get("params", {}), schema)
-
                         try:
                             result = await session.call_tool(tool_name, arguments=arguments)
                             text = self._extract_text_result(result)
-                            responses.append(self.make_response(item, text))
+                            results[i] = self.make_response(item, text)
                         except Exception as e:
-                            responses.append(self.make_response(item, self.throw_error(e)))
+                            results[i] = self.make_response(item, self.throw_error(e))
 
-            except Exception as e:
-                msg = f"MCP server error ({address}): {e}"
-                self.log(msg)
-                self.status(msg)
-                for item in items:
-                    responses.append(self.make_response(item, self.throw_error(e)))
+                for stage in Scheduler.get_stages(calls, lambda call_: self._is_side_effect(call_[1])):
+                    if self.is_stopped():
+                        break
+                    await asyncio.gather(*[call(*calls[n]) for n in stage])
 
-        return responses
+        except Exception as e:
+            msg = f"MCP server error ({address}): {e}"
+            self.log(msg)
+            self.status(msg)
+            for i, item in calls:
+                if i not in results:
+                    results[i] = self.make_response(item, self.throw_error(e))
+
+    def _is_side_effect(self, item: dict) -> bool:
+        """
+        Check if tool call has side effects
+
+        :param item: command item
+        :return: True if side-effecting
+        """
+        if self.plugin is None:
+            return True
+        return self.plugin.is_side_effect(item.get("cmd"))
 
     # ---------------------------
     # Session / transport helpers
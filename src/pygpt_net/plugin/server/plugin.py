@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.22 10:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from pygpt_net.plugin.base.plugin import BasePlugin
@@ -34,6 +34,14 @@ class Plugin(BasePlugin):
             "srv_stat",
             "smtp_send"
         ]
+        self.side_effect_cmds = [
+            "srv_exec",
+            "srv_get",
+            "srv_put",
+            "srv_rm",
+            "srv_mkdir",
+            "smtp_send",
+        ]
         self.use_locale = False
         self.worker = None
         self.config = Config(self)
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.22 10:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from __future__ import annotations
@@ -20,6 +20,7 @@ import time
 import stat as pystat
 
 from email.message import EmailMessage
+from typing import Optional
 from PySide6.QtCore import Slot
 
 from pygpt_net.plugin.base.worker import BaseWorker, BaseSignals
@@ -62,40 +63,7 @@ class Worker(BaseWorker):
     @Slot()
     def run(self):
         try:
-            responses = []
-            for item in self.cmds:
-                if self.is_stopped():
-                    break
-                try:
-                    response = None
-                    if item["cmd"] in self.plugin.allowed_cmds and self.plugin.has_cmd(item["cmd"]):
-
-                        # -------- Core FS / Exec --------
-                        if item["cmd"] == "srv_exec":
-                            response = self.cmd_srv_exec(item)
-                        elif item["cmd"] == "srv_ls":
-                            response = self.cmd_srv_ls(item)
-                        elif item["cmd"] == "srv_get":
-                            response = self.cmd_srv_get(item)
-                        elif item["cmd"] == "srv_put":
-                            response = self.cmd_srv_put(item)
-                        elif item["cmd"] == "srv_rm":
-                            response = self.cmd_srv_rm(item)
-                        elif item["cmd"] == "srv_mkdir":
-                            response = self.cmd_srv_mkdir(item)
-                        elif item["cmd"] == "srv_stat":
-                            response = self.cmd_srv_stat(item)
-
-                        # -------- SMTP --------
-                        elif item["cmd"] == "smtp_send":
-                            response = self.cmd_smtp_send(item)
-
-                        if response:
-                            responses.append(response)
-
-                except Exception as e:
-                    responses.append(self.make_response(item, self.throw_error(e)))
-
+            responses = self.run_cmds(self.handle_cmd)
             if responses:
                 self.reply_more(responses)
             if self.msg is not None:
@@ -105,6 +73,38 @@ class Worker(BaseWorker):
         finally:
             self.cleanup()
 
+    def handle_cmd(self, item: dict) -> Optional[dict]:
+        """
+        Execute single command
+
+        :param item: command item
+        :return: response item
+        """
+        response = None
+        if item["cmd"] in self.plugin.allowed_cmds and self.plugin.has_cmd(item["cmd"]):
+
+            # -------- Core FS / Exec --------
+            if item["cmd"] == "srv_exec":
+                response = self.cmd_srv_exec(item)
+            elif item["cmd"] == "srv_ls":
+                response = self.cmd_srv_ls(item)
+            elif item["cmd"] == "srv_get":
+                response = self.cmd_srv_get(item)
+            elif item["cmd"] == "srv_put":
+                response = self.cmd_srv_put(item)
+            elif item["cmd"] == "srv_rm":
+                response = self.cmd_srv_rm(item)
+            elif item["cmd"] == "srv_mkdir":
+                response = self.cmd_srv_mkdir(item)
+            elif item["cmd"] == "srv_stat":
+                response = self.cmd_srv_stat(item)
+
+            # -------- SMTP --------
+            elif item["cmd"] == "smtp_send":
+                response = self.cmd_smtp_send(item)
+
+        return response
+
     # ---------------------- Common helpers ----------------------
 
     def _timeout(self) -> int:
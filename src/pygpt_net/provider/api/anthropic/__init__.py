@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.21 13:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from typing import Optional, Dict, Any
@@ -223,6 +223,7 @@ class ApiAnthropic:
                 params["temperature"] = temperature
             if tools:  # only include when non-empty list
                 params["tools"] = tools
+            params = self.window.core.prompt.prefix.apply_anthropic(params)
 
             resp = client.messages.create(**params)
 
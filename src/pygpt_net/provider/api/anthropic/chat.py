@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.08.12 12:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import json
@@ -154,6 +154,9 @@ class Chat:
         # Decide whether to call stable or beta endpoint
         use_beta = len(betas) > 0
 
+        # Prompt caching: mark stable prefix (tools, system, older history) with cache breakpoints
+        params = self.window.core.prompt.prefix.apply_anthropic(params)
+
         if stream:
             if use_beta:
                 return client.beta.messages.create(stream=True, betas=list(betas), **params)
@@ -192,7 +195,9 @@ class Chat:
         try:
             usage = getattr(response, "usage", None)
             if usage:
-                p = getattr(usage, "input_tokens", 0) or 0
+                cached = getattr(usage, "cache_read_input_tokens", 0) or 0
+                written = getattr(usage, "cache_creation_input_tokens", 0) or 0
+                p = (getattr(usage, "input_tokens", 0) or 0) + cached + written  # input_tokens excludes cache
                 c = getattr(usage, "output_tokens", 0) or 0
                 ctx.set_tokens(p, c)
                 if not isinstance(ctx.extra, dict):
@@ -213,6 +218,7 @@ class Chat:
                     "reasoning_tokens": thinking_tokens or 0,
                     "server_tool_use": server_tool_use,
                 }
+                self.window.core.prompt.prefix.record_usage(ctx, cached, written)
                 ensure_reasoning_metadata(ctx, "anthropic", thinking_tokens)
         except Exception:
             pass
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.05 20:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import os
@@ -233,18 +233,13 @@ class Store:
         """
         Remove all files from remote storage. Returns number of successfully removed files.
         """
-        num = 0
         files = self.get_files_ids()
-        for file_id in files:
-            self.log("Removing file: " + file_id, callback)
-            try:
-                res = self.delete_file(file_id)
-                if res:
-                    num += 1
-            except Exception as e:
-                msg = "Error removing file {}: {}".format(file_id, str(e))
-                self.log(msg, callback)
-        return num
+        self.log("Removing files: {}".format(len(files)), callback)
+        return self.window.core.remote_store.sync.delete(
+            self.delete_file,
+            files,
+            callback=callback,
+        )
 
     def remove_file(self, file_id: str, callback: Optional[callable] = None) -> bool:
         """
@@ -259,6 +254,34 @@ class Store:
             self.log(msg, callback)
             raise
 
+    def upload_files(
+            self,
+            store_id: str,
+            paths: List[str],
+            callback: Optional[callable] = None,
+            progress: Optional[callable] = None
+    ) -> dict:
+        """
+        Upload files (parallel, skip unchanged files)
+
+        :param store_id: store id
+        :param paths: local file paths
+        :param callback: callback function for logging
+        :param progress: progress callback: (done, total)
+        :return: stats dict: uploaded, skipped, failed
+        """
+        files = self.window.core.remote_store.anthropic.files
+        return self.window.core.remote_store.sync.upload(
+            provider=files.PROVIDER_NAME,
+            store_id=files.DEFAULT_STORE_ID,
+            paths=paths,
+            existing=files.get_hashes(files.DEFAULT_STORE_ID),
+            upload=self.upload,
+            commit=lambda path, data, hash: files.insert(files.DEFAULT_STORE_ID, data, hash),
+            callback=callback,
+            progress=progress,
+        )
+
     def import_files(self, callback: Optional[callable] = None) -> int:
         """
         Import all files from Anthropic Files API into local DB.
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.05 20:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import io
@@ -160,8 +160,12 @@ def process_anthropic_chunk(ctx, core, state, chunk) -> Optional[str]:
             um = getattr(msg, "usage", None) if msg else None
             if um:
                 inp = as_int(getattr(um, "input_tokens", None))
+                cached = as_int(getattr(um, "cache_read_input_tokens", None)) or 0
+                written = as_int(getattr(um, "cache_creation_input_tokens", None)) or 0
                 if inp is not None:
-                    state.usage_payload["in"] = inp
+                    state.usage_payload["in"] = inp + cached + written  # input_tokens excludes cache
+                state.usage_payload["cached"] = cached
+                state.usage_payload["cache_write"] = written
         except Exception:
             pass
         return None
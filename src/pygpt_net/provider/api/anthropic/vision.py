@@ -6,10 +6,9 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.05 01:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
-import base64
 import os
 from typing import Optional, Dict, List, Union
 
@@ -45,24 +44,24 @@ class Vision:
         self.attachments = {}
         self.urls = []
 
+        images = []
         if attachments:
             for id_, attachment in attachments.items():
                 if attachment.path and os.path.exists(attachment.path):
                     if self.is_image(attachment.path):
-                        mime = self._guess_mime(attachment.path)
-                        with open(attachment.path, "rb") as f:
-                            data = f.read()
-                        b64 = base64.b64encode(data).decode("utf-8")
+                        image = self.window.core.vision.encoder.encode(attachment.path, "anthropic")
+                        images.append(image)
                         blocks.append({
                             "type": "image",
                             "source": {
                                 "type": "base64",
-                                "media_type": mime,
-                                "data": b64,
+                                "media_type": image.mime,
+                                "data": image.b64,
                             }
                         })
                         self.attachments[id_] = attachment.path
                         attachment.consumed = True
+        self.window.core.vision.encoder.report(images, "anthropic")
 
         return blocks
 
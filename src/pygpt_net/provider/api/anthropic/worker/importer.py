@@ -6,11 +6,9 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.05 17:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
-import os
-
 from PySide6.QtCore import QObject, Signal, QRunnable, Slot
 
 
@@ -224,23 +222,18 @@ class ImportWorker(QRunnable):
             return False
 
     def upload_files(self, silent: bool = False) -> bool:
-        num = 0
         try:
             self.log("Uploading files to Anthropic Files API...")
-            for path in self.files:
-                try:
-                    f = self.window.core.api.anthropic.store.upload(path)
-                    if f is not None:
-                        self.window.core.remote_store.anthropic.files.insert("files", f)
-                        num += 1
-                        msg = "Uploaded file: {}/{}".format(num, len(self.files))
-                        self.signals.status.emit("upload_files", msg)
-                        self.log(msg)
-                    else:
-                        self.signals.status.emit("upload_files", "Failed to upload: {}".format(os.path.basename(path)))
-                except Exception as e:
-                    self.window.core.debug.log(e)
-                    self.signals.status.emit("upload_files", "Failed to upload: {}".format(os.path.basename(path)))
+            stats = self.window.core.api.anthropic.store.upload_files(
+                self.store_id,
+                self.files,
+                callback=self.callback,
+                progress=self.progress,
+            )
+            num = stats["uploaded"]
+            self.log("Uploaded: {}, skipped (unchanged): {}, failed: {}".format(
+                num, stats["skipped"], stats["failed"]
+            ))
             if not silent:
                 self.signals.finished.emit("upload_files", self.store_id, num)
             return True
@@ -262,6 +255,9 @@ class ImportWorker(QRunnable):
             self.signals.error.emit("import_files", e)
             return False
 
+    def progress(self, done: int, total: int):
+        self.signals.status.emit("upload_files", "Uploaded file: {}/{}".format(done, total))
+
     def callback(self, msg: str):
         self.log(msg)
 
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.05 20:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import os
@@ -184,6 +184,16 @@ class Chat:
                 # retain the existing request rather than breaking compatibility.
                 pass
 
+        # Prompt caching: move stable prefix (system, tools, older history) to explicit context cache
+        if mode == MODE_CHAT:
+            cache_name, inputs = self.window.core.prompt.prefix.apply_google(
+                client, model.id, system_prompt, cfg_kwargs.get("tools"), inputs,
+            )
+            if cache_name:
+                cfg_kwargs["cached_content"] = cache_name
+                cfg_kwargs.pop("system_instruction", None)  # already in cache
+                cfg_kwargs.pop("tools", None)
+
         cfg = gtypes.GenerateContentConfig(**cfg_kwargs)
         params = dict(model=model.id, contents=inputs, config=cfg)
 
@@ -371,6 +381,9 @@ class Chat:
                 p = getattr(usage, "prompt_token_count", 0) or 0
                 c = getattr(usage, "candidates_token_count", 0) or 0
                 ctx.set_tokens(p, c)
+                self.window.core.prompt.prefix.record_usage(
+                    ctx, getattr(usage, "cached_content_token_count", 0) or 0,
+                )
                 reasoning_tokens = (
                     getattr(usage, "thoughts_token_count", None)
                     or getattr(usage, "candidates_reasoning_token_count", None)
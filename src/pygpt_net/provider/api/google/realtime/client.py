@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.07 23:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import asyncio
@@ -23,7 +23,8 @@ from pygpt_net.core.text.utils import has_unclosed_code_tag
 
 # shared
 from pygpt_net.core.realtime.shared.loop import BackgroundLoop
-from pygpt_net.core.realtime.shared.audio import to_pcm16_mono
+from pygpt_net.core.realtime.shared.audio import to_pcm16_mono, packet_bytes
+from pygpt_net.core.audio.backend.shared.ring import PacketBatcher, get_latency_meter
 from pygpt_net.core.realtime.shared.tools import build_function_responses_payload
 from pygpt_net.core.realtime.shared.text import coalesce_text
 from pygpt_net.core.realtime.shared.turn import TurnMode, apply_turn_mode_google
@@ -87,10 +88,13 @@ class GoogleLiveClient:
         self._IN_RATE = 16000     # input (LINEAR16 mono)
         self._OUT_RATE = 24000    # output (model audio PCM16@24kHz)
 
-        # Output audio jitter buffer
-        self._audio_buf = bytearray()
+        # Output audio jitter buffer (preallocated ring, fixed-size packets)
         self._OUT_CHUNK_MS = 60
         self._OUT_BYTES_PER_MS = int(self._OUT_RATE * 2 / 1000)  # PCM16 mono (2 bytes/sample)
+        self._audio_buf = PacketBatcher(self._OUT_BYTES_PER_MS * self._OUT_CHUNK_MS, frame_bytes=2)
+
+        # Live input batching (small mic frames -> fixed-size packets)
+        self._in_batcher: Optional[PacketBatcher] = None
         self._saw_data_stream = False  # prefer response.data over inline_data to avoid duplicates
 
         # Per-turn extraction state
@@ -401,6 +405,8 @@ class GoogleLiveClient:
         self._turn_text_parts = []
         self._last_out_tr = ""
         self._audio_buf.clear()
+        if self._in_batcher is not None:
+            self._in_batcher.clear()
         self._saw_data_stream = False
         self._rt_state = None
         self._last_tool_calls = []
@@ -715,12 +721,18 @@ class GoogleLiveClient:
             self._send_lock = asyncio.Lock()
 
         async with self._send_lock:
-            try:
-                await self._session.send_realtime_input(
-                    audio=gtypes.Blob(data=pcm, mime_type=f"audio/pcm;rate={int(norm_rate)}")
-                )
-            except Exception:
-                return
+            # Batch small mic frames into fixed-size packets, flush rest on final chunk
+            batcher = self._get_in_batcher(norm_rate)
+            packets = batcher.push(pcm, payload.get("ts"))
+            if is_final:
+                packets.extend(batcher.flush())
+            for chunk in packets:
+                try:
+                    await self._session.send_realtime_input(
+                        audio=gtypes.Blob(data=chunk, mime_type=f"audio/pcm;rate={int(norm_rate)}")
+                    )
+                except Exception:
+                    return
 
             # If stream end is flagged, flush server-side VAD buffer
             if is_final:
@@ -762,11 +774,29 @@ class GoogleLiveClient:
             self._send_lock = asyncio.Lock()
         async with self._send_lock:
             try:
+                if self._in_batcher is not None:
+                    for chunk in self._in_batcher.flush():
+                        await self._session.send_realtime_input(
+                            audio=gtypes.Blob(data=chunk, mime_type=f"audio/pcm;rate={int(self._IN_RATE)}")
+                        )
                 await self._session.send_realtime_input(audio_stream_end=True)
                 self._emit_audio_commit_signal()  # fire once for explicit flush
             except Exception:
                 pass
 
+    def _get_in_batcher(self, sr: int) -> PacketBatcher:
+        """
+        Get live input packet batcher (PCM16 mono), packet size from config.
+        """
+        try:
+            ms = int(self.window.core.config.get("audio.input.packet_ms", 50) or 50)
+        except Exception:
+            ms = 50
+        size = packet_bytes(sr, ms)
+        if self._in_batcher is None or self._in_batcher.packet_bytes != size:
+            self._in_batcher = PacketBatcher(size, frame_bytes=2, meter=get_latency_meter("mic_to_socket"))
+        return self._in_batcher
+
     def force_response_now_sync(self, timeout: float = 5.0):
         """
         Synchronously force the model to create a response from current input buffer (auto-turn).
@@ -1346,23 +1376,15 @@ class GoogleLiveClient:
         """
         if not self._on_audio:
             return
-        if data:
-            self._audio_buf.extend(data)
-        threshold = self._OUT_BYTES_PER_MS * self._OUT_CHUNK_MS
-        while len(self._audio_buf) >= threshold:
-            chunk = self._audio_buf[:threshold]
-            del self._audio_buf[:threshold]
+        packets = self._audio_buf.push(data)
+        if final:
+            packets.extend(self._audio_buf.flush())
+        for chunk in packets:
             try:
-                await self._on_audio(bytes(chunk), "audio/pcm", self._OUT_RATE, 1, False)
+                await self._on_audio(chunk, "audio/pcm", self._OUT_RATE, 1, False)
             except Exception:
                 pass
         if final:
-            if self._audio_buf:
-                try:
-                    await self._on_audio(bytes(self._audio_buf), "audio/pcm", self._OUT_RATE, 1, False)
-                except Exception:
-                    pass
-                self._audio_buf.clear()
             try:
                 await self._on_audio(b"", "audio/pcm", self._OUT_RATE, 1, True)
             except Exception:
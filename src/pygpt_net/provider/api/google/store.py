@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.06 06:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 import os
@@ -279,18 +279,13 @@ class Store:
         :param callback: callback function
         :return: number of deleted files
         """
-        num = 0
         files = self.get_files_ids()
-        for file_name in files:
-            self.log("Removing file: " + file_name, callback)
-            try:
-                res = self.delete_file(file_name)
-                if res:
-                    num += 1
-            except Exception as e:
-                msg = "Error removing file {}: {}".format(file_name, str(e))
-                self.log(msg, callback)
-        return num
+        self.log("Removing files: {}".format(len(files)), callback)
+        return self.window.core.remote_store.sync.delete(
+            self.delete_file,
+            files,
+            callback=callback,
+        )
 
     def remove_file(self, file_name: str, callback: Optional[callable] = None) -> bool:
         """
@@ -477,14 +472,17 @@ class Store:
         :return: number of deleted documents
         """
         stores = self.get_stores_ids([])
-        num = 0
+        items = []
         for store_id in stores:
             files = self.get_store_files_ids(store_id, [])
-            for doc_name in files:
-                self.log("Removing document from store [{}]:{} ".format(store_id, doc_name))
-                self.delete_store_file(store_id, doc_name)
-                num += 1
-        return num
+            items.extend([(store_id, doc_name) for doc_name in files])
+        self.log("Removing documents from stores: {}".format(len(items)))
+        return self.window.core.remote_store.sync.delete(
+            self.delete_store_file,
+            items,
+            callback=self.log,
+            raise_errors=True,
+        )
 
     def remove_from_store(self, store_id: str) -> int:
         """
@@ -494,12 +492,13 @@ class Store:
         :return: number of deleted documents
         """
         files = self.get_store_files_ids(store_id, [])
-        num = 0
-        for doc_name in files:
-            self.log("Removing document from store [{}]:{} ".format(store_id, doc_name))
-            self.delete_store_file(store_id, doc_name)
-            num += 1        
-        return num
+        self.log("Removing documents from store [{}]: {}".format(store_id, len(files)))
+        return self.window.core.remote_store.sync.delete(
+            self.delete_store_file,
+            [(store_id, doc_name) for doc_name in files],
+            callback=self.log,
+            raise_errors=True,
+        )
 
     def remove_all(self, callback: Optional[callable] = None) -> int:
         """
@@ -508,17 +507,13 @@ class Store:
         :param callback: callback function
         :return: number of deleted stores
         """
-        num = 0
         stores = self.get_stores_ids([])
-        for store_id in stores:
-            self.log("Removing file search store: " + store_id, callback)
-            try:
-                self.remove_store(store_id)
-                num += 1
-            except Exception as e:
-                msg = "Error removing file search store {}: {}".format(store_id, str(e))
-                self.log(msg, callback)
-        return num
+        self.log("Removing file search stores: {}".format(len(stores)), callback)
+        return self.window.core.remote_store.sync.delete(
+            self.remove_store,
+            stores,
+            callback=callback,
+        )
 
     def add_file(self, store_id: str, file_name: str):
         """
@@ -652,6 +647,11 @@ class Store:
             time.sleep(2)
             op = client.operations.get(op)
 
+        # created document name is returned in operation response
+        doc_name = getattr(getattr(op, "response", None), "document_name", None)
+        if doc_name:
+            return client.file_search_stores.documents.get(name=doc_name)
+
         try:
             docs = self.get_store_files_ids(store_id, [])
             for doc_name in docs:
@@ -664,4 +664,32 @@ class Store:
         except Exception:
             pass
 
-        return None
\ No newline at end of file
+        return None
+
+    def upload_files(
+            self,
+            store_id: str,
+            paths: List[str],
+            callback: Optional[callable] = None,
+            progress: Optional[callable] = None
+    ) -> dict:
+        """
+        Upload files (parallel, skip unchanged files)
+
+        :param store_id: store id
+        :param paths: local file paths
+        :param callback: callback function for logging
+        :param progress: progress callback: (done, total)
+        :return: stats dict: uploaded, skipped, failed
+        """
+        files = self.window.core.remote_store.google.files
+        return self.window.core.remote_store.sync.upload(
+            provider=files.PROVIDER_NAME,
+            store_id=store_id,
+            paths=paths,
+            existing=files.get_hashes(store_id),
+            upload=lambda path: self.upload_to_store(store_id, path),
+            commit=lambda path, doc, hash: files.insert(store_id, doc, hash),
+            callback=callback,
+            progress=progress,
+        )
\ No newline at end of file
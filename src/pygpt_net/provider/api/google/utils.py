@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.05 20:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from typing import Any, Optional
@@ -83,11 +83,18 @@ def capture_google_usage(state, um_obj: Any):
         as_int(safe_get(um_obj, "candidates_reasoning_token_count")) or
         as_int(safe_get(um_obj, "reasoning_tokens")) or 0
     )
+    cached = as_int(safe_get(um_obj, "cached_content_token_count")) or 0
     if total is not None and prompt is not None:
         out_total = max(0, total - prompt)
     else:
         out_total = candidates
-    state.usage_payload = {"in": prompt, "out": out_total, "reasoning": reasoning or 0, "total": total}
+    state.usage_payload = {
+        "in": prompt,
+        "out": out_total,
+        "reasoning": reasoning or 0,
+        "total": total,
+        "cached": cached,
+    }
 
 
 def collect_google_citations(ctx, state, chunk: Any):
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.28 20:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import os
@@ -46,16 +46,17 @@ class Vision:
         self.attachments = {}
         self.urls = []
 
+        images = []
         if attachments:
             for id_, attachment in attachments.items():
                 if attachment.path and os.path.exists(attachment.path):
                     if self.is_image(attachment.path):
-                        mime = self._guess_mime(attachment.path)
-                        with open(attachment.path, "rb") as f:
-                            data = f.read()
-                        parts.append(Part.from_bytes(data=data, mime_type=mime))
+                        image = self.window.core.vision.encoder.encode(attachment.path, "google")
+                        images.append(image)
+                        parts.append(Part.from_bytes(data=image.data, mime_type=image.mime))
                         self.attachments[id_] = attachment.path
                         attachment.consumed = True
+        self.window.core.vision.encoder.report(images, "google")
 
         return parts
 
@@ -6,11 +6,9 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.06 06:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
-import os
-
 from PySide6.QtCore import QObject, Signal, QRunnable, Slot
 
 
@@ -312,23 +310,18 @@ class ImportWorker(QRunnable):
 
         :param silent: silent mode
         """
-        num = 0
         try:
             self.log("Uploading files to File Search store...")
-            for file in self.files:
-                try:
-                    doc = self.window.core.api.google.store.upload_to_store(self.store_id, file)
-                    if doc is not None:
-                        self.window.core.remote_store.google.files.insert(self.store_id, doc)
-                        msg = "Uploaded file: {}/{}".format((num + 1), len(self.files))
-                        self.signals.status.emit("upload_files", msg)
-                        self.log(msg)
-                        num += 1
-                    else:
-                        self.signals.status.emit("upload_files", "Failed to upload file: {}".format(os.path.basename(file)))
-                except Exception as e:
-                    self.window.core.debug.log(e)
-                    self.signals.status.emit("upload_files", "Failed to upload file: {}".format(os.path.basename(file)))
+            stats = self.window.core.api.google.store.upload_files(
+                self.store_id,
+                self.files,
+                callback=self.callback,
+                progress=self.progress,
+            )
+            num = stats["uploaded"]
+            self.log("Uploaded: {}, skipped (unchanged): {}, failed: {}".format(
+                num, stats["skipped"], stats["failed"]
+            ))
             if not silent:
                 self.signals.finished.emit("upload_files", self.store_id, num)
             return True
@@ -361,6 +354,10 @@ class ImportWorker(QRunnable):
             self.signals.error.emit("import_files", e)
             return False
 
+    def progress(self, done: int, total: int):
+        """Upload progress callback"""
+        self.signals.status.emit("upload_files", "Uploaded file: {}/{}".format(done, total))
+
     def callback(self, msg: str):
         """Log callback"""
         self.log(msg)
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.08.16 17:40:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import json
@@ -453,3 +453,9 @@ class Chat:
             response.usage.prompt_tokens,
             response.usage.completion_tokens,
         )
+        try:
+            details = getattr(response.usage, "prompt_tokens_details", None)
+            cached = getattr(details, "cached_tokens", 0) if details else 0
+            self.window.core.prompt.prefix.record_usage(ctx, cached)
+        except Exception:
+            pass
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.08.16 13:09:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import base64
@@ -489,6 +489,9 @@ class Responses:
             details = getattr(response.usage, "output_tokens_details", None)
             reasoning_tokens = getattr(details, "reasoning_tokens", 0) if details else 0
             ensure_reasoning_metadata(ctx, "openai", reasoning_tokens)
+            input_details = getattr(response.usage, "input_tokens_details", None)
+            cached = getattr(input_details, "cached_tokens", 0) if input_details else 0
+            self.window.core.prompt.prefix.record_usage(ctx, cached)
         except Exception:
             pass
 
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.05 17:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 import os
@@ -77,10 +77,11 @@ class Store:
         if not os.path.exists(path):
             return None
 
-        result = client.files.create(
-            file=open(path, "rb"),
-            purpose=purpose,
-        )
+        with open(path, "rb") as f:
+            result = client.files.create(
+                file=f,
+                purpose=purpose,
+            )
         if result is not None:
             return result.id
 
@@ -166,17 +167,13 @@ class Store:
         :param callback: callback function
         :return: number of deleted files
         """
-        num = 0
         files = self.get_files_ids()
-        for file_id in files:
-            self.log("Removing file: " + file_id, callback)
-            try:
-                self.delete_file(file_id)
-                num += 1
-            except Exception as e:
-                msg = "Error removing file {}: {}".format(file_id, str(e))
-                self.log(msg, callback)
-        return num
+        self.log("Removing files: {}".format(len(files)), callback)
+        return self.window.core.remote_store.sync.delete(
+            self.delete_file,
+            files,
+            callback=callback,
+        )
 
     def remove_file(
             self,
@@ -234,17 +231,13 @@ class Store:
         :param callback: callback function
         :return: number of deleted files
         """
-        num = 0
         files = self.get_store_files_ids(store_id, [])
-        for file_id in files:
-            self.log("Removing file: " + file_id, callback)
-            try:
-                self.delete_store_file(store_id, file_id)
-                num += 1
-            except Exception as e:
-                msg = "Error removing file {}: {}".format(file_id, str(e))
-                self.log(msg, callback)
-        return num
+        self.log("Removing files from vector store [{}]: {}".format(store_id, len(files)), callback)
+        return self.window.core.remote_store.sync.delete(
+            self.delete_store_file,
+            [(store_id, file_id) for file_id in files],
+            callback=callback,
+        )
 
     def import_stores(
             self,
@@ -470,14 +463,17 @@ class Store:
         :return: number of deleted files
         """
         stores = self.get_stores_ids([])
-        num = 0
+        items = []
         for store_id in stores:
             files = self.get_store_files_ids(store_id, [])
-            for file_id in files:
-                self.log("Removing file from vector store [{}]:{} ".format(store_id, file_id))
-                self.delete_store_file(store_id, file_id)
-                num += 1
-        return num
+            items.extend([(store_id, file_id) for file_id in files])
+        self.log("Removing files from vector stores: {}".format(len(items)))
+        return self.window.core.remote_store.sync.delete(
+            self.delete_store_file,
+            items,
+            callback=self.log,
+            raise_errors=True,
+        )
 
     def remove_from_store(self, store_id: str) -> int:
         """
@@ -487,12 +483,13 @@ class Store:
         :return: number of deleted files
         """
         files = self.get_store_files_ids(store_id, [])
-        num = 0
-        for file_id in files:
-            self.log("Removing file from vector store [{}]:{} ".format(store_id, file_id))
-            self.delete_store_file(store_id, file_id)
-            num += 1
-        return num
+        self.log("Removing files from vector store [{}]: {}".format(store_id, len(files)))
+        return self.window.core.remote_store.sync.delete(
+            self.delete_store_file,
+            [(store_id, file_id) for file_id in files],
+            callback=self.log,
+            raise_errors=True,
+        )
 
     def remove_all(
             self,
@@ -504,17 +501,13 @@ class Store:
         :param callback: callback function
         :return: number of deleted stores
         """
-        num = 0
         stores = self.get_stores_ids([])
-        for store_id in stores:
-            self.log("Removing vector store: " + store_id, callback)
-            try:
-                self.remove_store(store_id)
-                num += 1
-            except Exception as e:
-                msg = "Error removing vector store {}: {}".format(store_id, str(e))
-                self.log(msg, callback)
-        return num
+        self.log("Removing vector stores: {}".format(len(stores)), callback)
+        return self.window.core.remote_store.sync.delete(
+            self.remove_store,
+            stores,
+            callback=callback,
+        )
 
     def add_file(
             self,
@@ -536,6 +529,55 @@ class Store:
         if vector_store_file is not None:
             return vector_store_file
 
+    def add_files_batch(
+            self,
+            store_id: str,
+            file_ids: List[str]
+    ):
+        """
+        Add files to vector store in one batch request
+
+        :param store_id: store id
+        :param file_ids: file ids
+        :return: vector store file batch
+        """
+        client = self.get_client()
+        batch = client.vector_stores.file_batches.create(
+            vector_store_id=store_id,
+            file_ids=file_ids,
+        )
+        if batch is not None:
+            return batch
+
+    def upload_files(
+            self,
+            store_id: str,
+            paths: List[str],
+            callback: Optional[callable] = None,
+            progress: Optional[callable] = None
+    ) -> dict:
+        """
+        Upload files to vector store (parallel, skip unchanged files)
+
+        :param store_id: store id
+        :param paths: local file paths
+        :param callback: callback function for logging
+        :param progress: progress callback: (done, total)
+        :return: stats dict: uploaded, skipped, failed
+        """
+        files = self.window.core.remote_store.openai.files
+        return self.window.core.remote_store.sync.upload(
+            provider=files.PROVIDER_NAME,
+            store_id=store_id,
+            paths=paths,
+            existing=files.get_hashes(store_id),
+            upload=self.upload,
+            commit=lambda path, file_id, hash: files.add(store_id, file_id, path, hash),
+            attach_batch=lambda file_ids: self.add_files_batch(store_id, file_ids),
+            callback=callback,
+            progress=progress,
+        )
+
     def delete_file(
             self,
             file_id: str
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.08 05:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 from pygpt_net.core.events import KernelEvent
@@ -64,6 +64,7 @@ class Summarizer:
             max_tokens=500,
             temperature=0.0,
             force=True,  # even if kernel stopped!
+            cache_ttl=86400,  # title of the same exchange does not change
         )
         event = KernelEvent(KernelEvent.FORCE_CALL, {
             'context': bridge_context,
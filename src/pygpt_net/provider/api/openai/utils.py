@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.08.16 13:09:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import re
@@ -46,8 +46,19 @@ def capture_openai_usage(state, u_obj: Any):
         as_int(safe_get(u_obj, "reasoning_tokens")) or
         0
     )
+    cached = (
+        as_int(safe_get(u_obj, "input_tokens_details.cached_tokens")) or
+        as_int(safe_get(u_obj, "prompt_tokens_details.cached_tokens")) or
+        0
+    )
     out_with_reason = (out_tok or 0) + (reasoning or 0)
-    state.usage_payload = {"in": in_tok, "out": out_with_reason, "reasoning": reasoning or 0, "total": total}
+    state.usage_payload = {
+        "in": in_tok,
+        "out": out_with_reason,
+        "reasoning": reasoning or 0,
+        "total": total,
+        "cached": cached,
+    }
 
 def safe_get(obj: Any, path: str) -> Any:
     """
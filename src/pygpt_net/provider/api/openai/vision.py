@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.07.30 00:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import base64
@@ -220,19 +220,21 @@ class Vision:
                 self.urls.append(url)
 
         # local images (attachments)
+        images = []
         if attachments is not None and len(attachments) > 0:
             for id in attachments:
                 attachment = attachments[id]
                 if os.path.exists(attachment.path):
                     # check if it's an image
                     if self.is_image(attachment.path):
-                        base64_image = self.encode_image(attachment.path)
+                        image = self.window.core.vision.encoder.encode(attachment.path, "openai")
+                        images.append(image)
                         if not responses_api:
                             content.append(
                                 {
                                     "type": type_image,
                                     "image_url": {
-                                        "url": f"data:image/jpeg;base64,{base64_image}",
+                                        "url": image.data_url,
                                     }
                                 }
                             )
@@ -240,11 +242,12 @@ class Vision:
                             content.append(
                                 {
                                     "type": type_image,
-                                    "image_url": f"data:image/jpeg;base64,{base64_image}",
+                                    "image_url": image.data_url,
                                 }
                             )
                         self.attachments[id] = attachment.path
                         attachment.consumed = True
+        self.window.core.vision.encoder.report(images, "openai")
 
         return content
 
@@ -278,22 +281,25 @@ class Vision:
                 self.urls.append(url)
 
         # local images (attachments)
+        images = []
         if attachments is not None and len(attachments) > 0:
             for id in attachments:
                 attachment = attachments[id]
                 if os.path.exists(attachment.path):
                     # check if it's an image
                     if self.is_image(attachment.path):
-                        base64_image = self.encode_image(attachment.path)
+                        image = self.window.core.vision.encoder.encode(attachment.path, "openai")
+                        images.append(image)
                         content.append(
                             {
                                 "type": "input_image",
                                 "detail": "auto",
-                                "image_url": f"data:image/jpeg;base64,{base64_image}",
+                                "image_url": image.data_url,
                             }
                         )
                         self.attachments[id] = attachment.path
                         attachment.consumed = True
+        self.window.core.vision.encoder.report(images, "openai")
 
         if content:
             items.append({
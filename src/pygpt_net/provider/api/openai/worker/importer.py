@@ -6,11 +6,9 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.05 17:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
-import os
-
 from PySide6.QtCore import QObject, Signal, QRunnable, Slot
 
 
@@ -126,8 +124,6 @@ class Importer(QObject):
         :param store_id: store ID
         :param files: files
         """
-        print("Uploading files: {}".format(files))
-        print("Store ID: {}".format(store_id))
         self.worker = ImportWorker()
         self.worker.window = self.window
         self.worker.mode = "upload_files"
@@ -318,30 +314,18 @@ class ImportWorker(QRunnable):
         :param silent: silent mode (no signals emit)
         :return: result
         """
-        num = 0
         try:
             self.log("Uploading files...")
-            for file in self.files:
-                try:
-                    file_id = self.window.core.api.openai.store.upload(file)
-                    if file_id is not None:
-                        stored_file = self.window.core.api.openai.store.add_file(
-                            self.store_id,
-                            file_id,
-                        )
-                        if stored_file is not None:
-                            data = self.window.core.api.openai.store.get_file(file_id)
-                            self.window.core.remote_store.openai.files.insert(self.store_id, data)  # insert to DB
-                            msg = "Uploaded file: {}/{}".format((num + 1), len(self.files))
-                            self.signals.status.emit("upload_files", msg)
-                            self.log(msg)
-                            num = num + 1
-                    else:
-                        print("Failed to upload file: {}".format(os.path.basename(file)))
-                except Exception as e:
-                    print(e)
-                    self.window.core.debug.log(e)
-                    self.signals.status.emit("upload_files", "Failed to upload file: {}".format(os.path.basename(file)))
+            stats = self.window.core.api.openai.store.upload_files(
+                self.store_id,
+                self.files,
+                callback=self.callback,
+                progress=self.progress,
+            )
+            num = stats["uploaded"]
+            self.log("Uploaded: {}, skipped (unchanged): {}, failed: {}".format(
+                num, stats["skipped"], stats["failed"]
+            ))
             if not silent:
                 self.signals.finished.emit("upload_files", self.store_id, num)
             return True
@@ -379,6 +363,15 @@ class ImportWorker(QRunnable):
             self.signals.error.emit("import_files", e)
         return False
 
+    def progress(self, done: int, total: int):
+        """
+        Upload progress callback
+
+        :param done: number of processed files
+        :param total: number of all files
+        """
+        self.signals.status.emit("upload_files", "Uploaded file: {}/{}".format(done, total))
+
     def callback(self, msg: str):
         """
         Log callback
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.07 23:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import asyncio
@@ -28,8 +28,11 @@ from pygpt_net.core.realtime.shared.audio import (
     coerce_to_pcm16_mono,
     resample_pcm16_mono,
     iter_pcm_chunks,
+    packet_bytes,
+    build_append_message,
     DEFAULT_24K,
 )
+from pygpt_net.core.audio.backend.shared.ring import PacketBatcher, get_latency_meter
 from pygpt_net.core.realtime.shared.tools import (
     sanitize_function_tools,
     tools_signature,
@@ -90,6 +93,9 @@ class xAIIRealtimeClient:
 
         self._DEFAULT_RATE = DEFAULT_24K
 
+        # Live input batching (small mic frames -> fixed-size packets)
+        self._in_batcher: Optional[PacketBatcher] = None
+
         # Per-response extraction state (tools/images/citations/usage/assembled text)
         self._rt_state = None  # dict populated on response.created
 
@@ -517,6 +523,8 @@ class xAIIRealtimeClient:
     async def _close_session_internal(self):
         """Close WS and stop the receiver; keep the background loop alive for reuse."""
         self._running = False
+        if self._in_batcher is not None:
+            self._in_batcher.clear()
 
         # Cancel active response if any
         if self.ws and self._response_active:
@@ -676,10 +684,7 @@ class xAIIRealtimeClient:
                 for chunk in iter_pcm_chunks(pcm, sr, ms=50):
                     if not chunk:
                         continue
-                    await self.ws.send(json.dumps({
-                        "type": "input_audio_buffer.append",
-                        "audio": base64.b64encode(chunk).decode("utf-8"),
-                    }))
+                    await self.ws.send(build_append_message(chunk))
                 await self.ws.send(json.dumps({"type": "input_audio_buffer.commit"}))
 
             # If we were waiting for a previous response, do it inside lock handoff-safe
@@ -801,15 +806,14 @@ class xAIIRealtimeClient:
             self._send_lock = asyncio.Lock()
 
         async with self._send_lock:
-            # Append in ~50 ms chunks to keep frames small
-            for chunk in iter_pcm_chunks(pcm, sr, ms=50):
-                if not chunk:
-                    continue
+            # Batch small mic frames into fixed-size packets, flush rest on final chunk
+            batcher = self._get_in_batcher(sr)
+            packets = batcher.push(pcm, payload.get("ts"))
+            if is_final:
+                packets.extend(batcher.flush())
+            for chunk in packets:
                 try:
-                    await self.ws.send(json.dumps({
-                        "type": "input_audio_buffer.append",
-                        "audio": base64.b64encode(chunk).decode("utf-8"),
-                    }))
+                    await self.ws.send(build_append_message(chunk))
                 except Exception:
                     return
 
@@ -845,10 +849,26 @@ class xAIIRealtimeClient:
             self._send_lock = asyncio.Lock()
         async with self._send_lock:
             try:
+                if self._in_batcher is not None:
+                    for chunk in self._in_batcher.flush():
+                        await self.ws.send(build_append_message(chunk))
                 await self.ws.send(json.dumps({"type": "input_audio_buffer.commit"}))
             except Exception:
                 pass
 
+    def _get_in_batcher(self, sr: int) -> PacketBatcher:
+        """
+        Get live input packet batcher (PCM16 mono), packet size from config.
+        """
+        try:
+            ms = int(self.window.core.config.get("audio.input.packet_ms", 50) or 50)
+        except Exception:
+            ms = 50
+        size = packet_bytes(sr, ms)
+        if self._in_batcher is None or self._in_batcher.packet_bytes != size:
+            self._in_batcher = PacketBatcher(size, frame_bytes=2, meter=get_latency_meter("mic_to_socket"))
+        return self._in_batcher
+
     def force_response_now_sync(self, timeout: float = 5.0):
         """Synchronously force the model to create a response from current input buffer."""
         self._ensure_background_loop()
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.06 06:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import os
@@ -286,18 +286,13 @@ class Store:
         return items
 
     def remove_files(self, callback: Optional[callable] = None) -> int:
-        num = 0
         files = self.get_files_ids()
-        for file_id in files:
-            self.log("Removing file: " + file_id, callback)
-            try:
-                res = self.delete_file(file_id)
-                if res:
-                    num += 1
-            except Exception as e:
-                msg = "Error removing file {}: {}".format(file_id, str(e))
-                self.log(msg, callback)
-        return num
+        self.log("Removing files: {}".format(len(files)), callback)
+        return self.window.core.remote_store.sync.delete(
+            self.delete_file,
+            files,
+            callback=callback,
+        )
 
     def remove_file(self, file_id: str, callback: Optional[callable] = None) -> bool:
         self.log("Removing file: " + file_id, callback)
@@ -418,16 +413,13 @@ class Store:
         """
         Delete all collections.
         """
-        num = 0
         ids = self.get_collections_ids_collections([])
-        for cid in ids:
-            self.log("Removing collection: " + cid, callback)
-            try:
-                self.remove_collection_collections(cid)
-                num += 1
-            except Exception as e:
-                self.log("Error removing collection {}: {}".format(cid, e), callback)
-        return num
+        self.log("Removing collections: {}".format(len(ids)), callback)
+        return self.window.core.remote_store.sync.delete(
+            self.remove_collection_collections,
+            ids,
+            callback=callback,
+        )
 
     # Collections: documents membership
 
@@ -497,16 +489,13 @@ class Store:
         """
         Remove all documents from a specific collection.
         """
-        num = 0
         files = self.get_collection_files_ids_collections(collection_id, [])
-        for file_id in files:
-            self.log("Removing document from collection [{}]: {}".format(collection_id, file_id), callback)
-            try:
-                self.delete_collection_file_collections(collection_id, file_id)
-                num += 1
-            except Exception as e:
-                self.log("Error removing document {} from collection {}: {}".format(file_id, collection_id, e), callback)
-        return num
+        self.log("Removing documents from collection [{}]: {}".format(collection_id, len(files)), callback)
+        return self.window.core.remote_store.sync.delete(
+            self.delete_collection_file_collections,
+            [(collection_id, file_id) for file_id in files],
+            callback=callback,
+        )
 
     def remove_from_collections_collections(self, callback: Optional[callable] = None) -> int:
         """
@@ -585,6 +574,34 @@ class Store:
             fields=fields or None,
         )
 
+    def upload_files(
+            self,
+            store_id: str,
+            paths: List[str],
+            callback: Optional[callable] = None,
+            progress: Optional[callable] = None
+    ) -> dict:
+        """
+        Upload files (parallel, skip unchanged files)
+
+        :param store_id: store id
+        :param paths: local file paths
+        :param callback: callback function for logging
+        :param progress: progress callback: (done, total)
+        :return: stats dict: uploaded, skipped, failed
+        """
+        files = self.window.core.remote_store.xai.files
+        return self.window.core.remote_store.sync.upload(
+            provider=files.PROVIDER_NAME,
+            store_id=store_id,
+            paths=paths,
+            existing=files.get_hashes(store_id),
+            upload=lambda path: self.upload_to_collection_collections(store_id, path),
+            commit=lambda path, doc, hash: files.insert(store_id, doc.file_metadata, hash),
+            callback=callback,
+            progress=progress,
+        )
+
     def get_collection_stats_collections(self, collection_id: str) -> Dict[str, Any]:
         """
         Compute simple stats for a collection: total docs and total bytes.
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.04 19:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import os
@@ -37,9 +37,8 @@ class Vision:
         :param attachments: Attachments dict (id -> AttachmentItem)
         :return: List of image sources
         """
-        import base64
-
         images: List[str] = []
+        encoded = []
         self.attachments = {}
         self.urls = []
 
@@ -49,14 +48,14 @@ class Vision:
         for id_, att in (attachments or {}).items():
             try:
                 if att.path and self.window.core.api.xai.vision.is_image(att.path):
-                    mime = self.window.core.api.xai.vision.guess_mime(att.path)
-                    with open(att.path, "rb") as f:
-                        b64 = base64.b64encode(f.read()).decode("utf-8")
-                    images.append(f"data:{mime};base64,{b64}")
+                    image = self.window.core.vision.encoder.encode(att.path, "xai")
+                    encoded.append(image)
+                    images.append(image.data_url)
                     self.attachments[id_] = att.path
                     att.consumed = True
             except Exception:
                 continue
+        self.window.core.vision.encoder.report(encoded, "xai")
         return images
 
     def is_image(self, path: str) -> bool:
@@ -6,11 +6,9 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.06 06:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
-import os
-
 from PySide6.QtCore import QObject, Signal, QRunnable, Slot
 
 
@@ -242,23 +240,18 @@ class ImportWorker(QRunnable):
             return False
 
     def upload_files(self, silent: bool = False) -> bool:
-        num = 0
         try:
             self.log("Uploading files to collection...")
-            for path in self.files:
-                try:
-                    doc = self.window.core.api.xai.store.upload_to_collection_collections(self.store_id, path)
-                    if doc is not None:
-                        self.window.core.remote_store.xai.files.insert(self.store_id, doc.file_metadata)
-                        num += 1
-                        msg = "Uploaded file: {}/{}".format(num, len(self.files))
-                        self.signals.status.emit("upload_files", msg)
-                        self.log(msg)
-                    else:
-                        self.signals.status.emit("upload_files", "Failed to upload: {}".format(os.path.basename(path)))
-                except Exception as e:
-                    self.window.core.debug.log(e)
-                    self.signals.status.emit("upload_files", "Failed to upload: {}".format(os.path.basename(path)))
+            stats = self.window.core.api.xai.store.upload_files(
+                self.store_id,
+                self.files,
+                callback=self.callback,
+                progress=self.progress,
+            )
+            num = stats["uploaded"]
+            self.log("Uploaded: {}, skipped (unchanged): {}, failed: {}".format(
+                num, stats["skipped"], stats["failed"]
+            ))
             if not silent:
                 self.signals.finished.emit("upload_files", self.store_id, num)
             return True
@@ -292,6 +285,9 @@ class ImportWorker(QRunnable):
 
     # ---------- Utils ----------
 
+    def progress(self, done: int, total: int):
+        self.signals.status.emit("upload_files", "Uploaded file: {}/{}".format(done, total))
+
     def callback(self, msg: str):
         self.log(msg)
 
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 from typing import List, Dict, Optional
@@ -37,10 +37,15 @@ class BaseProvider:
     def update_item(self, item: CtxItem) -> bool:
         pass
 
+    def update_items(self, items: List[CtxItem]) -> bool:
+        for item in items:
+            self.update_item(item)
+        return True
+
     def create(self, meta: CtxMeta) -> int:
         pass
 
-    def load(self, id: int) -> List[CtxItem]:
+    def load(self, id: int, columns: Optional[List[str]] = None) -> List[CtxItem]:
         return []
 
     def save(self, id: int, meta: CtxMeta, items: List[CtxItem]) -> bool:
@@ -85,6 +90,9 @@ class BaseProvider:
     def update_meta_indexes_by_id(self, id: int, meta: CtxMeta) -> bool:
         pass
 
+    def update_meta_summary_by_id(self, id: int, meta: CtxMeta) -> bool:
+        pass
+
     def update_meta_indexed_by_id(self, id: int) -> bool:
         pass
 
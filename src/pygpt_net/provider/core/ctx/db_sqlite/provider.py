@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 import time
@@ -133,14 +133,15 @@ class DbSqliteProvider(BaseProvider):
         """
         return self.storage.get_item_by_id(id)
 
-    def load(self, id: int) -> List[CtxItem]:
+    def load(self, id: int, columns: Optional[List[str]] = None) -> List[CtxItem]:
         """
         Load items for ctx ID
 
         :param id: ctx ID
+        :param columns: load only these columns (fast path), None = all
         :return: list of ctx items
         """
-        return self.storage.get_items(id)
+        return self.storage.get_items(id, columns)
 
     def get_ctx_count_by_day(
             self,
@@ -221,6 +222,17 @@ class DbSqliteProvider(BaseProvider):
         self.storage.update_meta_ts(item.meta_id)
         return self.storage.update_item(item) is not None
 
+    def update_items(self, items: List[CtxItem]) -> bool:
+        """
+        Update items in ctx (batch)
+
+        :param items: ctx items (CtxItem)
+        :return: True if updated
+        """
+        if not items:
+            return True
+        return self.storage.update_items(items) is not None
+
     def save(self, id: int, meta: CtxMeta, items: List[CtxItem]) -> bool:
         """
         Save ctx
@@ -301,6 +313,16 @@ class DbSqliteProvider(BaseProvider):
         """
         return self.storage.update_meta_indexes_by_id(id, meta)
 
+    def update_meta_summary_by_id(self, id: int, meta: CtxMeta) -> bool:
+        """
+        Update meta rolling summary by ID
+
+        :param id: ctx ID
+        :param meta: CtxMeta
+        :return: True if updated
+        """
+        return self.storage.update_meta_summary_by_id(id, meta)
+
     def update_meta_indexed_by_id(self, id: int) -> bool:
         """
         Update meta indexed timestamp by ID
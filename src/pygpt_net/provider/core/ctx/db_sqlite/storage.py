@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.15 22:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 from datetime import datetime
@@ -312,14 +312,27 @@ class Storage:
                 return int(row.id)
         return 0
 
-    def get_items(self, id: int) -> List[CtxItem]:
+    def get_items(
+            self,
+            id: int,
+            columns: Optional[List[str]] = None
+    ) -> List[CtxItem]:
         """
         Return ctx items list by ctx meta ID
 
+        :param id: ctx meta ID
+        :param columns: load only these columns (fast path), None = all
         :return: list of CtxItem
         """
-        stmt = text("""
-            SELECT * FROM ctx_item WHERE meta_id = :id ORDER BY id ASC
+        fields = "*"
+        if columns:
+            names = ["id", "meta_id"]
+            for column in columns:
+                if re.fullmatch(r"\w+", column) and column not in names:
+                    names.append(column)
+            fields = ", ".join(names)
+        stmt = text(f"""
+            SELECT {fields} FROM ctx_item WHERE meta_id = :id ORDER BY id ASC
         """).bindparams(id=id)
         items = []
         db = self.window.core.db.get_db()
@@ -573,6 +586,28 @@ class Storage:
             conn.execute(stmt)
             return True
 
+    def update_meta_summary_by_id(self, id: int, meta: CtxMeta) -> bool:
+        """
+        Update ctx meta rolling summary
+
+        :param id: ctx meta ID
+        :param meta: CtxMeta
+        :return: True if updated
+        """
+        db = self.window.core.db.get_db()
+        stmt = text("""
+            UPDATE ctx_meta 
+            SET
+                summary_json = :summary_json
+            WHERE id = :id
+        """).bindparams(
+            id=id,
+            summary_json=pack_item_value(meta.summary),
+        )
+        with db.begin() as conn:
+            conn.execute(stmt)
+            return True
+
     def update_meta_ts(self, id: int) -> bool:
         """
         Update ctx meta updated timestamp
@@ -888,7 +923,47 @@ class Storage:
         :return: True if updated
         """
         db = self.window.core.db.get_db()
-        stmt = text("""
+        stmt = self.prepare_update_item(item)
+        with db.begin() as conn:
+            conn.execute(stmt)
+        return True
+
+    def update_items(self, items: List[CtxItem]) -> bool:
+        """
+        Update ctx items and their meta updated timestamps in single transaction
+
+        :param items: Context items (CtxItem)
+        :return: True if updated
+        """
+        db = self.window.core.db.get_db()
+        ts = int(time.time())
+        meta_ids = []
+        for item in items:
+            if item.meta_id not in meta_ids:
+                meta_ids.append(item.meta_id)
+        with db.begin() as conn:
+            for id in meta_ids:
+                conn.execute(text("""
+                    UPDATE ctx_meta 
+                    SET
+                        updated_ts = :updated_ts
+                    WHERE id = :id
+                """).bindparams(
+                    id=id,
+                    updated_ts=ts,
+                ))
+            for item in items:
+                conn.execute(self.prepare_update_item(item))
+        return True
+
+    def prepare_update_item(self, item: CtxItem):
+        """
+        Prepare ctx item update statement
+
+        :param item: Context item (CtxItem)
+        :return: update statement
+        """
+        return text("""
             UPDATE ctx_item SET
                 input = :input,
                 output = :output,
@@ -950,9 +1025,6 @@ class Storage:
             audio_id=item.audio_id,
             audio_expires_ts=int(item.audio_expires_ts or 0)
         )
-        with db.begin() as conn:
-            conn.execute(stmt)
-        return True
 
     def get_ctx_count_by_day(
             self,
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.23 15:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import json
@@ -125,66 +125,74 @@ def unpack_item_value(value: Any) -> Any:
         return value
 
 
+# JSON columns: (column, item attribute, default value factory)
+ITEM_JSON_COLUMNS = (
+    ('additional_ctx_json', 'additional_ctx', list),
+    ('attachments_json', 'attachments', list),
+    ('cmds_json', 'cmds', list),
+    ('docs_json', 'doc_ids', list),
+    ('extra', 'extra', dict),
+    ('files_json', 'files', list),
+    ('images_json', 'images', list),
+    ('results_json', 'results', list),
+    ('urls_json', 'urls', list),
+)
+
+
 def unpack_item(
         item: CtxItem,
-        row: Dict[str, Any]
+        row: Dict[str, Any],
+        lazy: bool = True
 ) -> CtxItem:
     """
     Unpack context item from DB row
 
+    JSON columns are kept raw and decoded on first access (lazy), empty
+    values are set directly. JSON columns missing in row (partial SELECT) are skipped.
+
     :param item: Context item (CtxItem)
     :param row: DB row
+    :param lazy: decode JSON columns on first access
     :return: context item
     """
-    item.additional_ctx = unpack_item_value(row['additional_ctx_json'])
-    item.attachments = unpack_item_value(row['attachments_json'])
-    item.audio_expires_ts = row['audio_expires_ts']
-    item.audio_id = row['audio_id']
-    item.cmds = unpack_item_value(row['cmds_json'])
-    item.doc_ids = unpack_item_value(row['docs_json'])
-    item.external_id = row['external_id']
-    item.extra = unpack_item_value(row['extra'])
-    item.files = unpack_item_value(row['files_json'])
+    g = row.get
+    raw = {}
+    for column, name, default in ITEM_JSON_COLUMNS:
+        if column not in row:
+            continue
+        value = row[column]
+        if value is None:
+            setattr(item, name, default())
+        elif value == "[]" or value == "{}":
+            setattr(item, name, [] if value == "[]" else {})
+        elif lazy and isinstance(value, str):
+            raw[name] = value
+        else:
+            value = unpack_item_value(value)
+            setattr(item, name, default() if value is None else value)
+    if raw:
+        item.lazy = raw
+
+    item.audio_expires_ts = g('audio_expires_ts', 0)
+    item.audio_id = g('audio_id')
+    item.external_id = g('external_id')
     item.id = unpack_var(row['id'], 'int')
-    item.images = unpack_item_value(row['images_json'])
-    item.input = row['input']
-    item.input_name = row['input_name']
-    item.input_timestamp = unpack_var(row['input_ts'], 'int')
-    item.input_tokens = unpack_var(row['input_tokens'], 'int')
-    item.internal = unpack_var(row['is_internal'], 'bool')
-    item.meta_id = unpack_var(row['meta_id'], 'int')
-    item.mode = row['mode']
-    item.model = row['model']
-    item.msg_id = row['msg_id']
-    item.output = row['output']
-    item.output_name = row['output_name']
-    item.output_timestamp = unpack_var(row['output_ts'], 'int')
-    item.output_tokens = unpack_var(row['output_tokens'], 'int')
-    item.results = unpack_item_value(row['results_json'])
-    item.run_id = row['run_id']
-    item.thread = row['thread_id']
-    item.total_tokens = unpack_var(row['total_tokens'], 'int')
-    item.urls = unpack_item_value(row['urls_json'])
-
-    # set defaults
-    if item.cmds is None:
-        item.cmds = []
-    if item.results is None:
-        item.results = []
-    if item.urls is None:
-        item.urls = []
-    if item.images is None:
-        item.images = []
-    if item.files is None:
-        item.files = []
-    if item.attachments is None:
-        item.attachments = []
-    if item.additional_ctx is None:
-        item.additional_ctx = []
-    if item.doc_ids is None:
-        item.doc_ids = []
-    if item.extra is None:
-        item.extra = {}
+    item.input = g('input')
+    item.input_name = g('input_name')
+    item.input_timestamp = unpack_var(g('input_ts'), 'int')
+    item.input_tokens = unpack_var(g('input_tokens'), 'int')
+    item.internal = unpack_var(g('is_internal'), 'bool')
+    item.meta_id = unpack_var(g('meta_id'), 'int')
+    item.mode = g('mode')
+    item.model = g('model')
+    item.msg_id = g('msg_id')
+    item.output = g('output')
+    item.output_name = g('output_name')
+    item.output_timestamp = unpack_var(g('output_ts'), 'int')
+    item.output_tokens = unpack_var(g('output_tokens'), 'int')
+    item.run_id = g('run_id')
+    item.thread = g('thread_id')
+    item.total_tokens = unpack_var(g('total_tokens'), 'int')
     return item
 
 
@@ -221,12 +229,15 @@ def unpack_meta(
     meta.preset = row['preset_id']
     meta.run = row['run_id']
     meta.status = row['status']
+    meta.summary = unpack_item_value(row['summary_json'])
     meta.thread = row['thread_id']
     meta.updated = unpack_var(row['updated_ts'], 'int')
     meta.uuid = row['uuid']
 
     if meta.additional_ctx is None:
         meta.additional_ctx = []
+    if not isinstance(meta.summary, dict):
+        meta.summary = {}
 
     # add group if exists
     if meta.group_id:
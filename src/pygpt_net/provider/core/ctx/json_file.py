@@ -6,13 +6,15 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2023.12.31 04:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import datetime
 import json
 import os
 
+from typing import Optional
+
 from packaging.version import Version
 
 from pygpt_net.provider.core.ctx.base import BaseProvider
@@ -82,11 +84,12 @@ class JsonFileProvider(BaseProvider):
 
         return contexts
 
-    def load(self, id: str) -> list:
+    def load(self, id: str, columns: Optional[list] = None) -> list:
         """
         Load ctx data from json file
 
         :param id: context id
+        :param columns: not used (all data is loaded from file)
         :return: context items (list of CtxItem)
         """
         data = []
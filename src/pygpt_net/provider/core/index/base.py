@@ -6,10 +6,10 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 
 from packaging.version import Version
 
@@ -50,7 +50,8 @@ class BaseProvider:
             store_id: str,
             idx: str,
             meta_id: int,
-            doc_id: str
+            doc_id: str,
+            item_id: int = 0
     ) -> int:
         pass
 
@@ -77,6 +78,13 @@ class BaseProvider:
     ) -> bool:
         pass
 
+    def update_ctx_item(
+            self,
+            id: int,
+            doc_id: str
+    ) -> bool:
+        pass
+
     def update_external(
             self,
             content: str,
@@ -119,6 +127,14 @@ class BaseProvider:
     ) -> str:
         pass
 
+    def get_ctx_items(
+            self,
+            store_id: str,
+            idx: str,
+            meta_id: int
+    ) -> Dict[int, Dict[str, Any]]:
+        return {}
+
     def get_file_doc_id(
             self,
             store_id: str,
@@ -144,6 +160,9 @@ class BaseProvider:
     ):
         pass
 
+    def remove_ctx_items(self, ids: List[int]):
+        pass
+
     def remove_external(
             self,
             store_id: str,
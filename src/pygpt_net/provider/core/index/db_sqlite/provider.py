@@ -6,10 +6,10 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 
 from packaging.version import Version
 
@@ -78,7 +78,8 @@ class DbSqliteProvider(BaseProvider):
             store_id: str,
             idx: str,
             meta_id: int,
-            doc_id: str
+            doc_id: str,
+            item_id: int = 0
     ) -> int:
         """
         Append context meta to index
@@ -87,9 +88,10 @@ class DbSqliteProvider(BaseProvider):
         :param: idx: index
         :param: meta_id: context meta ID
         :param: doc_id: document ID
+        :param: item_id: context item ID (0 = whole meta)
         :return: ID of inserted context meta
         """
-        return self.storage.insert_ctx_meta(store_id, idx, meta_id, doc_id)
+        return self.storage.insert_ctx_meta(store_id, idx, meta_id, doc_id, item_id)
 
     def append_external(
             self,
@@ -173,6 +175,22 @@ class DbSqliteProvider(BaseProvider):
         """
         return self.storage.get_meta_doc_id(store_id, idx, meta_id)
 
+    def get_ctx_items(
+            self,
+            store_id: str,
+            idx: str,
+            meta_id: int
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Get indexed context items by meta ID
+
+        :param store_id: store ID
+        :param idx: index
+        :param meta_id: context meta ID
+        :return: dict: item_id -> {id, doc_id, updated_ts}
+        """
+        return self.storage.get_ctx_items(store_id, idx, meta_id)
+
     def get_file_doc_id(
             self,
             store_id: str,
@@ -235,6 +253,19 @@ class DbSqliteProvider(BaseProvider):
         """
         return self.storage.update_ctx_meta(meta_id, doc_id)
 
+    def update_ctx_item(
+            self,
+            id: int,
+            doc_id: str
+    ) -> bool:
+        """
+        Update document ID and timestamp of indexed context item
+
+        :param: id: record ID
+        :param: doc_id: document ID
+        """
+        return self.storage.update_ctx_item(id, doc_id)
+
     def update_external(
             self,
             content: str,
@@ -282,6 +313,14 @@ class DbSqliteProvider(BaseProvider):
         """
         self.storage.remove_ctx_meta(store_id, idx, meta_id)
 
+    def remove_ctx_items(self, ids: List[int]):
+        """
+        Remove indexed context items records
+
+        :param ids: record IDs
+        """
+        self.storage.remove_ctx_items(ids)
+
     def remove_external(
             self,
             store_id: str,
@@ -6,12 +6,12 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.14 22:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import uuid
 import time
-from typing import Dict, Optional
+from typing import Dict, Optional, List
 
 from sqlalchemy import text
 from traitlets import Any
@@ -129,7 +129,8 @@ class Storage:
             store_id: str,
             idx: str,
             meta_id: int,
-            doc_id: str
+            doc_id: str,
+            item_id: int = 0
     ) -> int:
         """
         Insert ctx meta to index
@@ -138,6 +139,7 @@ class Storage:
         :param idx: index
         :param meta_id: meta ID
         :param doc_id: document ID
+        :param item_id: ctx item ID (0 = whole meta)
         """
         id = None
         ts = int(time.time())
@@ -147,6 +149,7 @@ class Storage:
             (
                 uuid,
                 meta_id,
+                item_id,
                 doc_id,
                 created_ts,
                 updated_ts,
@@ -157,6 +160,7 @@ class Storage:
             (
                 :uuid,
                 :meta_id,
+                :item_id,
                 :doc_id,
                 :created_ts,
                 :updated_ts,
@@ -166,6 +170,7 @@ class Storage:
         """).bindparams(
             uuid=str(uuid.uuid4()),
             meta_id=meta_id,
+            item_id=int(item_id or 0),
             doc_id=doc_id,
             created_ts=ts,
             updated_ts=ts,
@@ -364,6 +369,45 @@ class Storage:
             data = row._asdict()
             return data['doc_id']
 
+    def get_ctx_items(
+            self,
+            store_id: str,
+            idx: str,
+            meta_id: int
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Get indexed ctx items by meta id
+
+        :param store_id: store id
+        :param idx: index name
+        :param meta_id: meta id
+        :return: dict: item_id -> {id, doc_id, updated_ts}, item_id = 0 for whole meta records
+        """
+        db = self.window.core.db.get_db()
+        stmt = text("""
+            SELECT id, item_id, doc_id, updated_ts
+            FROM idx_ctx
+            WHERE store = :store_id
+            AND idx = :idx
+            AND meta_id = :meta_id
+            ORDER BY id ASC
+        """).bindparams(
+            store_id=store_id,
+            idx=idx,
+            meta_id=meta_id,
+        )
+        items = {}
+        with db.connect() as conn:
+            result = conn.execute(stmt)
+            for row in result:
+                data = row._asdict()
+                items[int(data['item_id'] or 0)] = {
+                    "id": data['id'],
+                    "doc_id": data['doc_id'],
+                    "updated_ts": int(data['updated_ts'] or 0),
+                }
+        return items
+
     def get_file_doc_id(
             self,
             store_id: str,
@@ -489,6 +533,34 @@ class Storage:
             conn.execute(stmt)
         return True
 
+    def update_ctx_item(
+            self,
+            id: int,
+            doc_id: str
+    ) -> bool:
+        """
+        Update document ID and timestamp of indexed ctx item
+
+        :param id: idx_ctx record ID
+        :param doc_id: document ID
+        """
+        db = self.window.core.db.get_db()
+        stmt = text("""
+            UPDATE 
+                idx_ctx
+            SET 
+                updated_ts = :updated_ts,
+                doc_id = :doc_id
+            WHERE id = :id
+        """).bindparams(
+            id=id,
+            doc_id=doc_id,
+            updated_ts=int(time.time()),
+        )
+        with db.begin() as conn:
+            conn.execute(stmt)
+        return True
+
     def update_external(
             self,
             content: str,
@@ -566,6 +638,21 @@ class Storage:
                     meta_id=meta_id,
                 ))
 
+    def remove_ctx_items(self, ids: List[int]):
+        """
+        Remove indexed ctx items records
+
+        :param ids: idx_ctx record IDs
+        """
+        if not ids:
+            return
+        db = self.window.core.db.get_db()
+        with db.begin() as conn:
+            conn.execute(
+                text("DELETE FROM idx_ctx WHERE id = :id"),
+                [{"id": id} for id in ids],
+            )
+
     def remove_external(
             self,
             store_id: str,
@@ -137,6 +137,16 @@ class DbSqliteProvider(BaseProvider):
         """
         return self.storage.get_all_by_file_id(file_id)
 
+    def get_hashes(self, provider: str, store_id: str) -> Dict[str, str]:
+        """
+        Get content hashes of files in store
+
+        :param provider: provider name
+        :param store_id: store ID
+        :return: dict hash -> file ID
+        """
+        return self.storage.get_hashes(provider, store_id)
+
     def delete_by_id(self, id: int) -> bool:
         """
         Delete file by ID
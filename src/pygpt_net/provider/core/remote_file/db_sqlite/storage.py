@@ -167,6 +167,26 @@ class Storage:
                 items[file.id] = file
         return items
 
+    def get_hashes(self, provider: str, store_id: str) -> Dict[str, str]:
+        """
+        Get content hashes of files in store
+
+        :param provider: provider name
+        :param store_id: store ID
+        :return: dict hash -> file ID
+        """
+        stmt = text("""
+            SELECT hash, file_id FROM remote_file
+            WHERE provider = :provider AND store_id = :store_id AND hash IS NOT NULL AND hash != ''
+        """).bindparams(provider=provider, store_id=store_id)
+        items = {}
+        db = self.window.core.db.get_db()
+        with db.connect() as conn:
+            result = conn.execute(stmt)
+            for row in result:
+                items[row.hash] = row.file_id
+        return items
+
     def truncate_all(self, provider: str) -> bool:
         """
         Truncate all files items
@@ -292,6 +312,7 @@ class Storage:
                     file_id = :file_id,
                     store_id = :store_id,
                     thread_id = :thread_id,
+                    hash = :hash,
                     updated_ts = :updated_ts
                 WHERE id = :id
                 """).bindparams(
@@ -302,6 +323,7 @@ class Storage:
                 file_id=file.file_id,
                 store_id=file.store_id,
                 thread_id=file.thread_id,
+                hash=file.hash or "",
                 updated_ts=int(ts or 0)
             )
             conn.execute(stmt)
@@ -326,6 +348,7 @@ class Storage:
                     file_id,
                     store_id,
                     thread_id,
+                    hash,
                     created_ts,
                     updated_ts
                 )
@@ -339,6 +362,7 @@ class Storage:
                     :file_id,
                     :store_id,
                     :thread_id,
+                    :hash,
                     :created_ts,
                     :updated_ts
                 )
@@ -351,6 +375,7 @@ class Storage:
             file_id=file.file_id,
             store_id=file.store_id,
             thread_id=file.thread_id,
+            hash=file.hash or "",
             created_ts=int(ts or 0),
             updated_ts=int(ts or 0)
         )
@@ -35,6 +35,7 @@ def unpack_file(file: RemoteFileItem, row: dict) -> RemoteFileItem:
     file.file_id = row['file_id']
     file.store_id = row['store_id']
     file.thread_id = row['thread_id']
+    file.hash = row.get('hash') or ""
     return file
 
 def pack_item_value(value: any) -> str:
@@ -6,9 +6,11 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.26 04:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
+from typing import Optional
+
 from llama_index.core.readers.base import BaseReader
 
 
@@ -26,6 +28,7 @@ class BaseLoader:
         self.init_args_types = {}
         self.init_args_desc = {}
         self.allow_compiled = True  # allow in compiled and Snap versions
+        self.prefetch = False  # allow parallel prefetch of URLs into web cache before loading
         # This is required due to some readers may require Python environment to install additional packages
 
     def attach_window(self, window):
@@ -69,6 +72,44 @@ class BaseLoader:
                 args[key] = self.args[key]
         return args
 
+    def get_cache(self):
+        """
+        Get web cache (if enabled)
+
+        :return: web cache instance or None
+        """
+        if self.window is None or not self.window.core.web.cache.is_enabled():
+            return None
+        return self.window.core.web.cache
+
+    def get_cache_ttl(self) -> Optional[int]:
+        """
+        Get web cache TTL for loader (from 'cache_ttl' argument)
+
+        :return: TTL in seconds, None = default
+        """
+        ttl = self.get_args().get("cache_ttl")
+        if ttl is None or int(ttl) < 0:
+            return None
+        return int(ttl)
+
+    def get_parallel_args(self) -> dict:
+        """
+        Prepare keyword arguments for parallel (chunked) readers
+
+        :return: keyword arguments dict
+        """
+        args = self.get_args()
+        is_compiled = self.window is not None and (
+                self.window.core.config.is_compiled() or self.window.core.platforms.is_snap()
+        )
+        return {
+            "workers": int(args.get("parallel_workers", 0) or 0),
+            "chunk_size": int(args.get("parallel_chunk_size", 50) or 1),
+            "min_size": int(args.get("parallel_min_size", 100) or 0),
+            "use_processes": not is_compiled,  # spawn is not available in compiled / Snap versions
+        }
+
     def prepare_args(self, **kwargs) -> dict:
         """
         Prepare arguments for reader load method
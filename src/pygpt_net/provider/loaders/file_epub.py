@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.06 01:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from llama_index.core.readers.base import BaseReader
@@ -21,6 +21,24 @@ class Loader(BaseLoader):
         self.name = "Epub files"
         self.extensions = ["epub"]
         self.type = ["file"]
+        self.init_args = {
+            "parallel": True,
+            "parallel_workers": 0,
+            "parallel_chunk_size": 5,
+            "parallel_min_size": 20,
+        }
+        self.init_args_types = {
+            "parallel": "bool",
+            "parallel_workers": "int",
+            "parallel_chunk_size": "int",
+            "parallel_min_size": "int",
+        }
+        self.init_args_desc = {
+            "parallel": "Parse large files in parallel and stream chapters to the indexer",
+            "parallel_workers": "Number of worker processes, 0 = auto (CPU count - 1)",
+            "parallel_chunk_size": "Number of chapters parsed in one task",
+            "parallel_min_size": "Min number of chapters to parse in parallel",
+        }
 
     def get(self) -> BaseReader:
         """
@@ -28,5 +46,8 @@ class Loader(BaseLoader):
 
         :return: Data reader instance
         """
+        if self.get_args().get("parallel"):
+            from .hub.parallel.epub import ParallelEpubReader
+            return ParallelEpubReader(**self.get_parallel_args())
         from llama_index.readers.file.epub import EpubReader
         return EpubReader()  # no args
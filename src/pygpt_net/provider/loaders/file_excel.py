@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.06 01:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from llama_index.core.readers.base import BaseReader
@@ -21,6 +21,21 @@ class Loader(BaseLoader):
         self.name = "Excel .xlsx spreadsheets"
         self.extensions = ["xlsx"]
         self.type = ["file"]
+        self.init_args = {
+            "parallel": True,
+            "parallel_workers": 0,
+            "parallel_min_size": 2,
+        }
+        self.init_args_types = {
+            "parallel": "bool",
+            "parallel_workers": "int",
+            "parallel_min_size": "int",
+        }
+        self.init_args_desc = {
+            "parallel": "Parse large files in parallel and stream sheets to the indexer",
+            "parallel_workers": "Number of worker processes, 0 = auto (CPU count - 1)",
+            "parallel_min_size": "Min number of sheets to parse in parallel",
+        }
 
     def get(self) -> BaseReader:
         """
@@ -28,5 +43,8 @@ class Loader(BaseLoader):
 
         :return: Data reader instance
         """
+        if self.get_args().get("parallel"):
+            from .hub.parallel.excel import ParallelExcelReader
+            return ParallelExcelReader(**self.get_parallel_args())
         from .hub.pandas_excel.base import PandasExcelReader
         return PandasExcelReader()
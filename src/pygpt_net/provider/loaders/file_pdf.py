@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.06 01:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from llama_index.core.readers.base import BaseReader
@@ -23,9 +23,23 @@ class Loader(BaseLoader):
         self.type = ["file"]
         self.init_args = {
             "return_full_document": False,
+            "parallel": True,
+            "parallel_workers": 0,
+            "parallel_chunk_size": 50,
+            "parallel_min_size": 100,
         }
         self.init_args_types = {
             "return_full_document": "bool",
+            "parallel": "bool",
+            "parallel_workers": "int",
+            "parallel_chunk_size": "int",
+            "parallel_min_size": "int",
+        }
+        self.init_args_desc = {
+            "parallel": "Parse large files in parallel and stream pages to the indexer",
+            "parallel_workers": "Number of worker processes, 0 = auto (CPU count - 1)",
+            "parallel_chunk_size": "Number of pages parsed in one task",
+            "parallel_min_size": "Min number of pages to parse in parallel",
         }
 
     def get(self) -> BaseReader:
@@ -34,6 +48,9 @@ class Loader(BaseLoader):
 
         :return: Data reader instance
         """
-        from llama_index.readers.file.docs import PDFReader
         args = self.get_args()
-        return PDFReader(**args)
+        if args.get("parallel") and not args.get("return_full_document"):
+            from .hub.parallel.pdf import ParallelPDFReader
+            return ParallelPDFReader(**self.get_parallel_args())
+        from llama_index.readers.file.docs import PDFReader
+        return PDFReader(return_full_document=args.get("return_full_document", False))
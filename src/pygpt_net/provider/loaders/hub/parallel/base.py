@@ -0,0 +1,168 @@
+"""Parallel (chunked) document reader.
+
+Splits a large document into page / sheet ranges, parses ranges in a process pool
+and yields documents in order, as soon as they are ready. At most `workers + 1`
+ranges are parsed or buffered at once, so memory use is bounded by the window,
+not by the file size.
+
+"""
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from llama_index.core.readers.base import BaseReader
+from llama_index.core.schema import Document
+
+
+class ParallelReader(BaseReader):
+    """Base reader for parsing document ranges in parallel."""
+
+    streaming = True  # indexer consumes lazy_load_data() as a stream
+
+    def __init__(
+        self,
+        workers: int = 0,
+        chunk_size: int = 50,
+        min_size: int = 100,
+        use_processes: bool = True,
+    ) -> None:
+        """
+        :param workers: number of worker processes, 0 = auto (CPU count - 1)
+        :param chunk_size: number of units (pages, chapters) parsed in one task
+        :param min_size: min number of units to parse in parallel, smaller files are parsed in-process
+        :param use_processes: use process pool (threads are used if False, e.g. in compiled version)
+        """
+        super().__init__()
+        self.workers = int(workers or 0)
+        self.chunk_size = max(1, int(chunk_size or 1))
+        self.min_size = max(0, int(min_size or 0))
+        self.use_processes = use_processes
+
+    def get_workers(self) -> int:
+        """
+        Get number of workers
+
+        :return: number of workers
+        """
+        if self.workers > 0:
+            return self.workers
+        return max(1, (os.cpu_count() or 2) - 1)
+
+    def get_ranges(self, file: Path) -> List[Tuple]:
+        """
+        Get task arguments for file (e.g. page ranges)
+
+        :param file: file path
+        :return: list of argument tuples passed to get_task()
+        """
+        raise NotImplementedError
+
+    def get_task(self) -> Callable[..., List[Tuple[str, Dict[str, Any]]]]:
+        """
+        Get module-level (picklable) parse function
+
+        Function is called with (path, *range) and returns list of (text, metadata).
+
+        :return: parse function
+        """
+        raise NotImplementedError
+
+    def get_size(self, ranges: List[Tuple]) -> int:
+        """
+        Get number of units in ranges (used for min_size threshold)
+
+        :param ranges: task ranges
+        :return: number of units
+        """
+        return len(ranges)
+
+    def create_pool(self, workers: int):
+        """
+        Create executor
+
+        :param workers: number of workers
+        :return: executor
+        """
+        if self.use_processes:
+            # spawn: forking a multi-threaded (Qt) process is not safe
+            return ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return ThreadPoolExecutor(max_workers=workers)
+
+    def lazy_load_data(
+        self,
+        file: Path,
+        extra_info: Optional[Dict] = None,
+        **kwargs: Any,
+    ) -> Iterator[Document]:
+        """
+        Parse file and yield documents (in document order)
+
+        :param file: file path
+        :param extra_info: additional metadata
+        :return: documents iterator
+        """
+        path = str(file)
+        ranges = self.get_ranges(Path(file))
+        task = self.get_task()
+        workers = min(self.get_workers(), len(ranges))
+        if workers <= 1 or self.get_size(ranges) < self.min_size:
+            for args in ranges:
+                yield from self.to_documents(task(path, *args), extra_info)
+            return
+
+        pool = self.create_pool(workers)
+        pending = deque()
+        try:
+            queue = iter(ranges)
+            for args in queue:
+                pending.append(pool.submit(task, path, *args))
+                if len(pending) > workers:
+                    break
+            while pending:
+                result = pending.popleft().result()
+                for args in queue:  # keep window full while consuming
+                    pending.append(pool.submit(task, path, *args))
+                    break
+                yield from self.to_documents(result, extra_info)
+        finally:
+            for future in pending:
+                future.cancel()
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def to_documents(
+        self,
+        items: List[Tuple[str, Dict[str, Any]]],
+        extra_info: Optional[Dict] = None,
+    ) -> Iterator[Document]:
+        """
+        Convert parsed items to documents
+
+        :param items: list of (text, metadata)
+        :param extra_info: additional metadata
+        :return: documents iterator
+        """
+        for text, metadata in items:
+            if extra_info:
+                metadata.update(extra_info)
+            yield Document(text=text, metadata=metadata)
+
+    def load_data(
+        self,
+        file: Path,
+        extra_info: Optional[Dict] = None,
+        **kwargs: Any,
+    ) -> List[Document]:
+        """
+        Parse file and return all documents
+
+        :param file: file path
+        :param extra_info: additional metadata
+        :return: list of documents
+        """
+        return list(self.lazy_load_data(file, extra_info=extra_info))
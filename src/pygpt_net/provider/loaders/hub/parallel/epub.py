@@ -0,0 +1,54 @@
+"""Parallel EPUB reader (chapter ranges)."""
+
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from .base import ParallelReader
+
+
+def get_chapters(path: str) -> list:
+    """
+    Get chapter (document) items from EPUB
+
+    :param path: file path
+    :return: list of chapter items
+    """
+    import ebooklib
+    from ebooklib import epub
+
+    book = epub.read_epub(path, options={"ignore_ncx": True})
+    return [item for item in book.get_items() if item.get_type() == ebooklib.ITEM_DOCUMENT]
+
+
+def read_epub_chapters(path: str, start: int, end: int) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Extract text from EPUB chapters (runs in worker process)
+
+    :param path: file path
+    :param start: first chapter index
+    :param end: last chapter index (exclusive)
+    :return: list with one (text, metadata) for the whole range
+    """
+    import html2text
+
+    chapters = get_chapters(path)[start:end]
+    texts = [html2text.html2text(item.get_content().decode("utf-8")) for item in chapters]
+    meta = {
+        "file_name": Path(path).name,
+        "chapters": "{}-{}".format(start + 1, start + len(chapters)),
+    }
+    return [("\n".join(texts), meta)]
+
+
+class ParallelEpubReader(ParallelReader):
+    """EPUB reader, one document per chapter range."""
+
+    def get_ranges(self, file: Path) -> List[Tuple]:
+        num = len(get_chapters(str(file)))
+        return [(i, min(i + self.chunk_size, num)) for i in range(0, num, self.chunk_size)]
+
+    def get_size(self, ranges: List[Tuple]) -> int:
+        return ranges[-1][1] if ranges else 0  # no per-file state, reader is shared by threads
+
+    def get_task(self):
+        return read_epub_chapters
@@ -0,0 +1,57 @@
+"""Parallel Excel reader (one sheet per task)."""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .base import ParallelReader
+
+
+def read_excel_sheet(
+    path: str,
+    sheet_name: str,
+    pandas_config: Optional[dict] = None,
+    row_joiner: str = "\n",
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Extract values from Excel sheet (runs in worker process)
+
+    :param path: file path
+    :param sheet_name: sheet name
+    :param pandas_config: options for pandas.read_excel
+    :param row_joiner: rows separator
+    :return: list with one (text, metadata) for the sheet
+    """
+    import pandas as pd
+
+    df = pd.read_excel(path, sheet_name=sheet_name, **(pandas_config or {}))
+    rows = df.values.astype(str).tolist()
+    text = row_joiner.join(row_joiner.join(row) for row in rows)
+    return [(text, {"sheet_name": sheet_name})]
+
+
+class ParallelExcelReader(ParallelReader):
+    """Excel reader, one document per sheet."""
+
+    def __init__(
+        self,
+        *args: Any,
+        pandas_config: Optional[dict] = None,
+        row_joiner: str = "\n",
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.pandas_config = pandas_config or {}
+        self.row_joiner = row_joiner or "\n"
+
+    def get_ranges(self, file: Path) -> List[Tuple]:
+        import openpyxl
+
+        wb = openpyxl.load_workbook(file, read_only=True)
+        try:
+            names = list(wb.sheetnames)
+        finally:
+            wb.close()
+        return [(name, self.pandas_config, self.row_joiner) for name in names]
+
+    def get_task(self):
+        return read_excel_sheet
@@ -0,0 +1,45 @@
+"""Parallel PDF reader (page ranges)."""
+
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from .base import ParallelReader
+
+
+def read_pdf_pages(path: str, start: int, end: int) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Extract text from PDF pages (runs in worker process)
+
+    :param path: file path
+    :param start: first page index
+    :param end: last page index (exclusive)
+    :return: list of (text, metadata), one per page
+    """
+    import pypdf
+
+    name = Path(path).name
+    with open(path, "rb") as fp:
+        pdf = pypdf.PdfReader(fp)
+        labels = pdf.page_labels
+        items = []
+        for i in range(start, min(end, len(pdf.pages))):
+            text = pdf.pages[i].extract_text() or ""
+            items.append((text, {"page_label": labels[i], "file_name": name}))
+    return items
+
+
+class ParallelPDFReader(ParallelReader):
+    """PDF reader, one document per page (same as PDFReader)."""
+
+    def get_ranges(self, file: Path) -> List[Tuple]:
+        import pypdf
+
+        with open(file, "rb") as fp:
+            num = len(pypdf.PdfReader(fp).pages)
+        return [(i, min(i + self.chunk_size, num)) for i in range(0, num, self.chunk_size)]
+
+    def get_size(self, ranges: List[Tuple]) -> int:
+        return ranges[-1][1] if ranges else 0  # number of pages (ranges are contiguous)
+
+    def get_task(self):
+        return read_pdf_pages
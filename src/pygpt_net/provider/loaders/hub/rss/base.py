@@ -0,0 +1,59 @@
+"""Read RSS feeds"""
+
+from typing import List, Optional, Any
+
+from llama_index.core.readers.base import BaseReader
+from llama_index.core.schema import Document
+
+
+class RssReader(BaseReader):
+    """RSS reader with cached feed fetching."""
+
+    def __init__(
+            self,
+            cache: Any,
+            html_to_text: bool = False,
+            ttl: Optional[int] = None
+    ):
+        """
+        RSS reader
+
+        :param cache: web cache (core.web.cache)
+        :param html_to_text: convert HTML to text
+        :param ttl: cache TTL in seconds, None = default
+        """
+        self.cache = cache
+        self.html_to_text = html_to_text
+        self.ttl = ttl
+
+    def load_data(self, urls: List[str]) -> List[Document]:
+        """
+        Read feeds and return documents (one per entry).
+
+        :param urls: feed URLs
+        :return: list of documents
+        """
+        import feedparser
+
+        documents = []
+        responses = self.cache.fetch_many(urls, ttl=self.ttl)
+        for url in urls:
+            response = responses.get(url)
+            if response is None:
+                continue
+            feed = feedparser.parse(response.content)
+            for entry in feed.entries:
+                doc_id = getattr(entry, "id", None) or getattr(entry, "link", None)
+                if "content" in entry:
+                    data = entry.content[0].value
+                else:
+                    data = entry.get("description") or entry.get("summary") or ""
+                if self.html_to_text:
+                    import html2text
+                    data = html2text.html2text(data)
+                extra_info = {
+                    "title": entry.get("title"),
+                    "link": entry.get("link"),
+                }
+                documents.append(Document(text=data, id_=doc_id, extra_info=extra_info))
+        return documents
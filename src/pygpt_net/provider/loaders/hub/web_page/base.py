@@ -1,7 +1,7 @@
 """Read Webpages"""
 
 
-from typing import List
+from typing import List, Optional, Any
 
 from llama_index.core.readers.base import BaseReader
 from llama_index.core.schema import Document
@@ -10,6 +10,16 @@ from llama_index.core.schema import Document
 class WebPage(BaseReader):
     """Webpage base reader."""
 
+    def __init__(self, cache: Optional[Any] = None, ttl: Optional[int] = None):
+        """
+        Webpage reader
+
+        :param cache: web cache (core.web.cache), None = no cache
+        :param ttl: cache TTL in seconds, None = default
+        """
+        self.cache = cache
+        self.ttl = ttl
+
     def load_data(self, **kwargs) -> List[Document]:
         """
         Read URL and return documents.
@@ -17,7 +27,12 @@ class WebPage(BaseReader):
         :param kwargs: keyword arguments
         :return: list of documents
         """
-        from llama_index.readers.web import BeautifulSoupWebReader
-
         url = kwargs.get("url")
-        return BeautifulSoupWebReader().load_data([url])
+        if self.cache is None:
+            from llama_index.readers.web import BeautifulSoupWebReader
+            return BeautifulSoupWebReader().load_data([url])
+
+        from bs4 import BeautifulSoup
+        response = self.cache.fetch(url, ttl=self.ttl)
+        soup = BeautifulSoup(response.content, "html.parser")
+        return [Document(text=soup.getText(), id_=url, extra_info={"URL": url})]
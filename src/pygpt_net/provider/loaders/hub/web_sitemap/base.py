@@ -0,0 +1,78 @@
+"""Read all pages from sitemap.xml"""
+
+import re
+from typing import List, Optional, Any
+from xml.etree import ElementTree
+
+from llama_index.core.readers.base import BaseReader
+from llama_index.core.schema import Document
+
+
+class SitemapReader(BaseReader):
+    """Sitemap reader with parallel, cached page fetching."""
+
+    MAX_DEPTH = 3  # max nesting of sitemap index files
+
+    def __init__(
+            self,
+            cache: Any,
+            html_to_text: bool = False,
+            limit: int = 10,
+            ttl: Optional[int] = None
+    ):
+        """
+        Sitemap reader
+
+        :param cache: web cache (core.web.cache)
+        :param html_to_text: convert HTML to text
+        :param limit: max number of concurrent requests (per host)
+        :param ttl: cache TTL in seconds, None = default
+        """
+        self.cache = cache
+        self.html_to_text = html_to_text
+        self.limit = limit
+        self.ttl = ttl
+
+    def get_urls(self, sitemap_url: str, depth: int = 0) -> List[str]:
+        """
+        Get page URLs from sitemap (and nested sitemap index files)
+
+        :param sitemap_url: sitemap URL
+        :param depth: current nesting depth
+        :return: list of URLs
+        """
+        response = self.cache.fetch(sitemap_url, ttl=self.ttl)
+        root = ElementTree.fromstring(response.content)
+        tag = re.sub(r"^\{.*\}", "", root.tag)
+        locs = [el.text.strip() for el in root.iter() if el.tag.endswith("loc") and el.text]
+        if tag != "sitemapindex":
+            return locs
+        urls = []
+        if depth < self.MAX_DEPTH:
+            for loc in locs:
+                urls.extend(self.get_urls(loc, depth + 1))
+        return urls
+
+    def load_data(self, sitemap_url: str, filter: str = "") -> List[Document]:
+        """
+        Read all pages from sitemap and return documents.
+
+        :param sitemap_url: sitemap URL
+        :param filter: only URLs starting with this prefix
+        :return: list of documents
+        """
+        urls = self.get_urls(sitemap_url)
+        if filter:
+            urls = [url for url in urls if url.startswith(filter)]
+        responses = self.cache.fetch_many(urls, ttl=self.ttl, host_limit=self.limit)
+        documents = []
+        for url in urls:
+            response = responses.get(url)
+            if response is None or response.status_code != 200:
+                continue
+            text = response.text
+            if self.html_to_text:
+                import html2text
+                text = html2text.html2text(text)
+            documents.append(Document(text=text, id_=url, extra_info={"Source": url}))
+        return documents
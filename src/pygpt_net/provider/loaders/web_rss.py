@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.06 01:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from llama_index.core.readers.base import BaseReader
@@ -34,6 +34,15 @@ class Loader(BaseLoader):
                 }
             }
         ]
+        self.init_args = {
+            "cache_ttl": -1,
+        }
+        self.init_args_types = {
+            "cache_ttl": "int",
+        }
+        self.init_args_desc = {
+            "cache_ttl": "Cache TTL in seconds, -1 = default, 0 = always revalidate",
+        }
 
     def get(self) -> BaseReader:
         """
@@ -41,8 +50,12 @@ class Loader(BaseLoader):
 
         :return: Data reader instance
         """
-        from llama_index.readers.web.rss.base import RssReader
-        return RssReader()
+        cache = self.get_cache()
+        if cache is None:
+            from llama_index.readers.web.rss.base import RssReader
+            return RssReader()
+        from .hub.rss.base import RssReader
+        return RssReader(cache=cache, ttl=self.get_cache_ttl())
 
     def prepare_args(self, **kwargs) -> dict:
         """
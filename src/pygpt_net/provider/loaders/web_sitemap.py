@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.16 01:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from llama_index.core.readers.base import BaseReader
@@ -38,14 +38,17 @@ class Loader(BaseLoader):
         self.init_args = {
             "html_to_text": False,
             "limit": 10,
+            "cache_ttl": -1,
         }
         self.init_args_types = {
             "html_to_text": "bool",
             "limit": "int",
+            "cache_ttl": "int",
         }
         self.init_args_desc = {
             "html_to_text": "Whether to convert HTML to text",
             "limit": "Maximum number of concurrent requests",
+            "cache_ttl": "Cache TTL in seconds, -1 = default, 0 = always revalidate",
         }
 
     def get(self) -> BaseReader:
@@ -55,7 +58,17 @@ class Loader(BaseLoader):
         :return: Data reader instance
         """
         args = self.get_args()
-        return SitemapReader(**args)
+        cache = self.get_cache()
+        if cache is None:
+            args.pop("cache_ttl", None)
+            return SitemapReader(**args)
+        from .hub.web_sitemap.base import SitemapReader as CachedSitemapReader
+        return CachedSitemapReader(
+            cache=cache,
+            html_to_text=bool(args.get("html_to_text", False)),
+            limit=int(args.get("limit", 10)),
+            ttl=self.get_cache_ttl(),
+        )
 
     def prepare_args(self, **kwargs) -> dict:
         """
@@ -6,10 +6,13 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.01.16 01:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple, List
 
 from llama_index.core.indices.base import BaseIndex
@@ -17,10 +20,13 @@ from llama_index.core.indices.vector_store.base import VectorStoreIndex
 
 from .base import BaseStore
 from .ctx_attachment import CtxAttachmentProvider
+from .keyword import KeywordStore
 from .temp import TempProvider
 
 
 class Storage:
+    MAX_CTX_INDEXES = 3  # max resident context attachment indexes
+
     def __init__(self, window=None):
         """
         Storage handler
@@ -30,7 +36,31 @@ class Storage:
         self.window = window
         self.storages = {}
         self.indexes = {}
+        self.generations = {}  # index name or path -> generation, changed on every update
         self.tmp_storage = TempProvider(window=window)
+        self.keyword = KeywordStore(window=window)  # BM25 keyword indexes
+        self.ctx_indexes = OrderedDict()  # path -> resident context attachment index
+        self.ctx_dirty = set()  # paths waiting for persist
+        self.ctx_lock = threading.RLock()
+        self.ctx_executor = None
+        self.ctx_future = None
+
+    def get_generation(self, id: Optional[str] = None) -> int:
+        """
+        Get index generation (used to invalidate cached query results)
+
+        :param id: index name or path
+        :return: generation
+        """
+        return self.generations.get(id, 0)
+
+    def touch(self, id: Optional[str] = None):
+        """
+        Mark index as updated
+
+        :param id: index name or path
+        """
+        self.generations[id] = self.generations.get(id, 0) + 1
 
     def get_storage(self) -> Optional[BaseStore]:
         """
@@ -143,6 +173,7 @@ class Storage:
         storage = self.get_storage()
         if storage is None:
             raise Exception('Storage engine not found!')
+        self.touch(id)
         storage.store(
             id=id,
             index=index,
@@ -158,6 +189,8 @@ class Storage:
         storage = self.get_storage()
         if storage is None:
             raise Exception('Storage engine not found!')
+        self.touch(id)
+        self.remove_keyword(id)
         return storage.remove(id)
 
     def truncate(self, id: str) -> bool:
@@ -170,6 +203,8 @@ class Storage:
         storage = self.get_storage()
         if storage is None:
             raise Exception('Storage engine not found!')
+        self.touch(id)
+        self.remove_keyword(id)
         return storage.truncate(id)
 
     def remove_document(self, id: str, doc_id: str) -> bool:
@@ -183,11 +218,27 @@ class Storage:
         storage = self.get_storage()
         if storage is None:
             raise Exception('Storage engine not found!')
+        self.touch(id)
+        try:
+            self.keyword.remove_document(id, doc_id)
+        except Exception as e:
+            self.window.core.debug.log(e)
         return storage.remove_document(
             id=id,
             doc_id=doc_id,
         )
 
+    def remove_keyword(self, id: str):
+        """
+        Remove keyword index
+
+        :param id: index name
+        """
+        try:
+            self.keyword.remove(id)
+        except Exception as e:
+            self.window.core.debug.log(e)
+
     def get_tmp(
             self,
             identifier: str,
@@ -261,22 +312,30 @@ class Storage:
             embed_model: Optional = None,
     ) -> BaseIndex:
         """
-        Get context index instance
+        Get context index instance (kept resident while context is in use)
 
         :param path: path to index directory
         :param llm: LLM instance
         :param embed_model: Embedding model instance
         :return: index instance
         """
-        # convert path to md5 hash
-        storage = self.get_ctx_idx_storage(path)
-        if storage is None:
-            raise Exception('Storage engine not found!')
-        return storage.get(
-            id="",
-            llm=llm,
-            embed_model=embed_model,
-        )
+        with self.ctx_lock:
+            index = self.ctx_indexes.get(path)
+            if index is not None and getattr(index, "_embed_model", None) is embed_model:
+                self.ctx_indexes.move_to_end(path)
+                return index
+            if path in self.ctx_dirty:
+                self.persist_ctx_idx(path)  # other embed model, reload from persisted state
+            storage = self.get_ctx_idx_storage(path)
+            if storage is None:
+                raise Exception('Storage engine not found!')
+            index = storage.get(
+                id="",
+                llm=llm,
+                embed_model=embed_model,
+            )
+            self.keep_ctx_idx(path, index)
+            return index
 
     def store_ctx_idx(
             self,
@@ -284,18 +343,86 @@ class Storage:
             index: Optional[BaseIndex] = None
     ):
         """
-        Store context index
+        Store context index (persisted in background)
 
         :param path: path to index directory
         :param index: index instance
         """
-        storage = self.get_ctx_idx_storage(path)
-        if storage is None:
-            raise Exception('Storage engine not found!')
-        storage.store(
-            id="",
-            index=index,
-        )
+        self.touch(path)
+        with self.ctx_lock:
+            self.keep_ctx_idx(path, index)
+            self.ctx_dirty.add(path)
+            if self.ctx_future is None or self.ctx_future.done():
+                if self.ctx_executor is None:
+                    self.ctx_executor = ThreadPoolExecutor(max_workers=1)
+                self.ctx_future = self.ctx_executor.submit(self.flush_ctx_idx)
+
+    def keep_ctx_idx(self, path: str, index: BaseIndex):
+        """
+        Keep context index resident (LRU, least recently used is persisted and dropped)
+
+        :param path: path to index directory
+        :param index: index instance
+        """
+        with self.ctx_lock:
+            self.ctx_indexes[path] = index
+            self.ctx_indexes.move_to_end(path)
+            while len(self.ctx_indexes) > self.MAX_CTX_INDEXES:
+                old = next(iter(self.ctx_indexes))
+                if old in self.ctx_dirty:
+                    self.persist_ctx_idx(old)
+                del self.ctx_indexes[old]
+
+    def persist_ctx_idx(self, path: str):
+        """
+        Persist resident context index to disk
+
+        :param path: path to index directory
+        """
+        with self.ctx_lock:
+            self.ctx_dirty.discard(path)
+            index = self.ctx_indexes.get(path)
+            if index is None:
+                return
+            storage = self.get_ctx_idx_storage(path)
+            if storage is None:
+                raise Exception('Storage engine not found!')
+            storage.store(
+                id="",
+                index=index,
+            )
+
+    def flush_ctx_idx(self):
+        """Persist all pending context indexes"""
+        while True:
+            with self.ctx_lock:
+                if not self.ctx_dirty:
+                    return
+                path = next(iter(self.ctx_dirty))
+                try:
+                    self.persist_ctx_idx(path)
+                except Exception as e:
+                    self.window.core.debug.log(e)
+
+    def release_ctx_idx(
+            self,
+            path: Optional[str] = None,
+            persist: bool = True
+    ):
+        """
+        Release resident context index
+
+        :param path: path to index directory, None = all
+        :param persist: persist pending changes (False if index is removed)
+        """
+        with self.ctx_lock:
+            paths = [path] if path is not None else list(self.ctx_indexes.keys())
+            for p in paths:
+                if persist and p in self.ctx_dirty:
+                    self.persist_ctx_idx(p)
+                self.ctx_dirty.discard(p)
+                self.ctx_indexes.pop(p, None)
+                self.touch(p)
 
     def clean_ctx_idx(self, path: str):
         """
@@ -306,6 +433,7 @@ class Storage:
         storage = self.get_ctx_idx_storage(path)
         if storage is None:
             raise Exception('Storage engine not found!')
+        self.release_ctx_idx(path, persist=False)
         storage.clean()
 
     def index_from_empty(
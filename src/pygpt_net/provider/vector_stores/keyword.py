@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.19 00:00:00                  #
+# ================================================== #
+
+import json
+import os
+import re
+import sqlite3
+import threading
+from contextlib import closing, contextmanager
+from typing import Optional, List, Iterable, Iterator
+
+from llama_index.core.schema import BaseNode, NodeWithScore, TextNode, MetadataMode
+
+
+STOPWORDS = frozenset("""
+a an and are as at be by can did do does for from has have how i in is it its me my of on or
+should that the this to was were what when where which who why will with you your
+""".split())
+
+
+class KeywordStore:
+    TABLE = "nodes"
+
+    def __init__(self, window=None):
+        """
+        Local BM25 keyword index (SQLite FTS5), one database per vector index
+
+        :param window: Window instance
+        """
+        self.window = window
+        self.lock = threading.Lock()
+        self.available = None  # FTS5 support, checked on first use
+        self.conns = {}  # (path, thread ID) -> connection kept open in batch()
+
+    def is_available(self) -> bool:
+        """
+        Check if SQLite is compiled with FTS5
+
+        :return: True if available
+        """
+        if self.available is None:
+            try:
+                with closing(sqlite3.connect(":memory:")) as conn:
+                    conn.execute("CREATE VIRTUAL TABLE t USING fts5(text)")
+                self.available = True
+            except sqlite3.Error:
+                self.available = False
+        return self.available
+
+    def get_path(self, id: str, store: Optional[str] = None) -> str:
+        """
+        Get keyword database path
+
+        :param id: index name
+        :param store: vector store id (current if None)
+        :return: database path
+        """
+        if store is None:
+            store = self.window.core.config.get("llama.idx.storage")
+        return os.path.join(
+            self.window.core.config.get_user_dir("idx"),
+            "keyword",
+            str(store),
+            "{}.db".format(id),
+        )
+
+    def connect(self, path: str) -> sqlite3.Connection:
+        """
+        Open database and create table if not exists
+
+        :param path: database path
+        :return: connection
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        conn = sqlite3.connect(path)
+        # unicode61 with '_' as token char: identifiers like snake_case names are kept whole
+        conn.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS {} USING fts5("
+            "text, node_id UNINDEXED, doc_id UNINDEXED, metadata UNINDEXED, "
+            "tokenize=\"unicode61 tokenchars '_'\")".format(self.TABLE)
+        )
+        return conn
+
+    @contextmanager
+    def batch(self, id: str) -> Iterator[None]:
+        """
+        Reuse one connection for all writes to keyword index in block (current thread)
+
+        :param id: index name
+        """
+        key = (self.get_path(id), threading.get_ident())
+        if key in self.conns:
+            yield  # nested
+            return
+        self.conns[key] = None  # opened on first write
+        try:
+            yield
+        finally:
+            conn = self.conns.pop(key, None)
+            if conn is not None:
+                conn.close()
+
+    @contextmanager
+    def open(self, path: str) -> Iterator[sqlite3.Connection]:
+        """
+        Get connection (batch connection if opened in current thread)
+
+        :param path: database path
+        :return: connection
+        """
+        key = (path, threading.get_ident())
+        if key not in self.conns:
+            with closing(self.connect(path)) as conn:
+                yield conn
+            return
+        if self.conns[key] is None:
+            self.conns[key] = self.connect(path)
+        yield self.conns[key]
+
+    def exists(self, id: str) -> bool:
+        """
+        Check if keyword index exists and is not empty
+
+        :param id: index name
+        :return: True if exists
+        """
+        if not id or not self.is_available():
+            return False
+        path = self.get_path(id)
+        if not os.path.exists(path):
+            return False
+        return self.count(id) > 0
+
+    def count(self, id: str) -> int:
+        """
+        Count indexed nodes
+
+        :param id: index name
+        :return: number of nodes
+        """
+        path = self.get_path(id)
+        if not os.path.exists(path):
+            return 0
+        with self.lock, self.open(path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM {}".format(self.TABLE)).fetchone()[0]
+
+    def add(self, id: str, nodes: Iterable[BaseNode]):
+        """
+        Add nodes to keyword index
+
+        :param id: index name
+        :param nodes: nodes (chunks) inserted into vector index
+        """
+        if not self.is_available():
+            return
+        rows = []
+        for node in nodes:
+            text = node.get_content(metadata_mode=MetadataMode.NONE)
+            if not text:
+                continue
+            rows.append((
+                text,
+                node.node_id,
+                node.ref_doc_id or "",
+                json.dumps(node.metadata or {}, default=str),
+            ))
+        if not rows:
+            return
+        with self.lock, self.open(self.get_path(id)) as conn, conn:
+            conn.executemany(
+                "INSERT INTO {} (text, node_id, doc_id, metadata) VALUES (?, ?, ?, ?)".format(self.TABLE),
+                rows,
+            )
+
+    def remove_document(self, id: str, doc_id: str):
+        """
+        Remove document nodes from keyword index
+
+        :param id: index name
+        :param doc_id: document ID
+        """
+        path = self.get_path(id)
+        if not self.is_available() or not os.path.exists(path):
+            return
+        with self.lock, self.open(path) as conn, conn:
+            conn.execute("DELETE FROM {} WHERE doc_id = ?".format(self.TABLE), (doc_id,))
+
+    def remove(self, id: str, store: Optional[str] = None):
+        """
+        Remove keyword index
+
+        :param id: index name
+        :param store: vector store id (current if None)
+        """
+        path = self.get_path(id, store)
+        with self.lock:
+            for key, conn in list(self.conns.items()):
+                if key[0] == path and conn is not None:
+                    conn.close()
+                    self.conns[key] = None
+            if os.path.exists(path):
+                os.remove(path)
+
+    def build_query(self, query: str) -> str:
+        """
+        Build FTS5 match expression (any of query keywords, terms with punctuation as phrases)
+
+        :param query: query string
+        :return: match expression
+        """
+        words = [w for w in query.split() if re.search(r"\w", w)]
+        keywords = [w for w in words if re.sub(r"\W", "", w).lower() not in STOPWORDS]
+        terms = []
+        for word in keywords or words:  # stopwords only if nothing else left
+            term = '"{}"'.format(word.replace('"', '""'))
+            if term not in terms:
+                terms.append(term)
+        return " OR ".join(terms)
+
+    def search(
+            self,
+            id: str,
+            query: str,
+            top_k: int = 10
+    ) -> List[NodeWithScore]:
+        """
+        Search keyword index (BM25)
+
+        :param id: index name
+        :param query: query string
+        :param top_k: max number of nodes
+        :return: nodes with BM25 scores (higher is better)
+        """
+        path = self.get_path(id)
+        match = self.build_query(query)
+        if not match or not self.is_available() or not os.path.exists(path):
+            return []
+        with self.lock, closing(self.connect(path)) as conn:
+            rows = conn.execute(
+                "SELECT text, node_id, metadata, bm25({t}) FROM {t} WHERE {t} MATCH ? "
+                "ORDER BY bm25({t}) LIMIT ?".format(t=self.TABLE),
+                (match, int(top_k)),
+            ).fetchall()
+        nodes = []
+        for text, node_id, metadata, rank in rows:
+            node = TextNode(id_=node_id, text=text, metadata=json.loads(metadata or "{}"))
+            nodes.append(NodeWithScore(node=node, score=-float(rank)))  # FTS5 bm25() is negative
+        return nodes
@@ -0,0 +1,833 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Optional, List, Any, Sequence, Dict, Tuple
+
+import numpy as np
+from llama_index.core import StorageContext, load_index_from_storage
+from llama_index.core.bridge.pydantic import PrivateAttr
+from llama_index.core.indices.base import BaseIndex
+from llama_index.core.indices.vector_store.base import VectorStoreIndex
+from llama_index.core.schema import BaseNode
+from llama_index.core.vector_stores.simple import build_metadata_filter_fn
+from llama_index.core.vector_stores.types import (
+    BasePydanticVectorStore,
+    MetadataFilters,
+    VectorStoreQuery,
+    VectorStoreQueryMode,
+    VectorStoreQueryResult,
+)
+
+from pygpt_net.utils import parse_args
+
+from .base import BaseStore
+
+
+class NumpyVectorStore(BasePydanticVectorStore):
+    """
+    Local vector store with embeddings kept in memory-mapped float32 matrix
+
+    Vectors are L2-normalized and appended to `vectors.<gen>.npy`, node IDs, ref doc IDs
+    and metadata are stored in SQLite sidecar table (`rows.db`). Deletes only mark rows
+    as deleted (tombstones), deleted rows are dropped from disk on compact().
+    """
+    stores_text: bool = False
+    flat_metadata: bool = False
+
+    path: str
+    index_type: str = "flat"  # flat, ivf, hnsw
+    ivf_lists: int = 0  # 0 = sqrt(rows)
+    ivf_probes: int = 16
+    ivf_min_rows: int = 20000
+    hnsw_m: int = 16
+    hnsw_ef: int = 64
+    block_rows: int = 65536
+    compact_ratio: float = 0.5
+
+    _lock: Any = PrivateAttr(default=None)
+    _db: Any = PrivateAttr(default=None)
+    _vectors: Any = PrivateAttr(default=None)
+    _gen: int = PrivateAttr(default=0)
+    _dim: int = PrivateAttr(default=0)
+    _count: int = PrivateAttr(default=0)
+    _node_ids: List[str] = PrivateAttr(default_factory=list)
+    _ref_ids: List[Optional[str]] = PrivateAttr(default_factory=list)
+    _alive: Any = PrivateAttr(default=None)
+    _rows: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _metadata: Optional[Dict[int, dict]] = PrivateAttr(default=None)
+    _ann: Optional[dict] = PrivateAttr(default=None)
+
+    def __init__(self, path: str, **kwargs: Any):
+        """
+        Numpy vector store
+
+        :param path: store directory
+        :param kwargs: store options (index_type, ivf_lists, ivf_probes, etc.)
+        """
+        super().__init__(path=path, **kwargs)
+        self._lock = threading.RLock()
+        self.open()
+
+    @property
+    def client(self) -> None:
+        """No client, local store"""
+        return None
+
+    def get_vectors_path(self, gen: int) -> str:
+        """
+        Get path to vectors matrix file
+
+        :param gen: file generation
+        :return: file path
+        """
+        return os.path.join(self.path, "vectors.{}.npy".format(gen))
+
+    def open(self):
+        """Open sidecar table, map vectors matrix and load row IDs"""
+        os.makedirs(self.path, exist_ok=True)
+        self._db = sqlite3.connect(os.path.join(self.path, "rows.db"), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS rows ("
+            "row INTEGER PRIMARY KEY, node_id TEXT NOT NULL, ref_doc_id TEXT, "
+            "metadata TEXT, deleted INTEGER NOT NULL DEFAULT 0)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS rows_ref_doc_id ON rows (ref_doc_id)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS info (key TEXT PRIMARY KEY, value TEXT)")
+        self._db.commit()
+        info = dict(self._db.execute("SELECT key, value FROM info").fetchall())
+        self._gen = int(info.get("gen", 0))
+        self._dim = int(info.get("dim", 0))
+
+        path = self.get_vectors_path(self._gen)
+        self._vectors = np.lib.format.open_memmap(path, mode="r+") if os.path.exists(path) else None
+        capacity = self._vectors.shape[0] if self._vectors is not None else 0
+
+        # rows not written to matrix (interrupted write) are dropped
+        rows = self._db.execute(
+            "SELECT row, node_id, ref_doc_id, deleted FROM rows ORDER BY row"
+        ).fetchall()
+        if len(rows) > capacity:
+            with self._db:
+                self._db.execute("DELETE FROM rows WHERE row >= ?", (capacity,))
+            rows = rows[:capacity]
+        self._count = len(rows)
+        self._node_ids = [row[1] for row in rows]
+        self._ref_ids = [row[2] for row in rows]
+        self._alive = np.array([not row[3] for row in rows], dtype=bool)
+        self._rows = {row[1]: row[0] for row in rows if not row[3]}
+        self._metadata = None
+
+        # remove files left by interrupted resize or compaction
+        for name in os.listdir(self.path):
+            if name.startswith("vectors.") and name != os.path.basename(path):
+                self.remove_file(os.path.join(self.path, name))
+        self.load_ann()
+
+    def close(self):
+        """Flush and close store"""
+        with self._lock:
+            if self._vectors is not None:
+                self._vectors.flush()
+                self._vectors = None
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+            self._ann = None
+
+    def set_info(self, key: str, value: Any):
+        """
+        Set sidecar info value (commit by caller)
+
+        :param key: key
+        :param value: value
+        """
+        self._db.execute("INSERT OR REPLACE INTO info (key, value) VALUES (?, ?)", (key, str(value)))
+
+    def remove_file(self, path: str):
+        """
+        Remove file, ignore errors (e.g. file still mapped on Windows, removed on next open)
+
+        :param path: file path
+        """
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def normalize(self, data: np.ndarray) -> np.ndarray:
+        """
+        L2-normalize vectors (rows)
+
+        :param data: vectors
+        :return: normalized vectors
+        """
+        norms = np.linalg.norm(data, axis=-1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (data / norms).astype(np.float32, copy=False)
+
+    def reserve(self, n: int):
+        """
+        Make room for n more rows (grows matrix to new generation file)
+
+        :param n: number of rows to append
+        """
+        needed = self._count + n
+        capacity = self._vectors.shape[0] if self._vectors is not None else 0
+        if needed <= capacity:
+            return
+        gen = self._gen + 1
+        path = self.get_vectors_path(gen)
+        vectors = np.lib.format.open_memmap(
+            path,
+            mode="w+",
+            dtype=np.float32,
+            shape=(max(1024, needed, capacity * 2), self._dim),
+        )
+        for start in range(0, self._count, self.block_rows):
+            end = min(start + self.block_rows, self._count)
+            vectors[start:end] = self._vectors[start:end]
+        vectors.flush()
+        self.swap(vectors, gen)
+
+    def swap(self, vectors: np.ndarray, gen: int):
+        """
+        Switch to new matrix generation (sidecar must be consistent with it on commit)
+
+        :param vectors: new matrix
+        :param gen: new generation
+        """
+        with self._db:
+            self.set_info("gen", gen)
+        old = self.get_vectors_path(self._gen)
+        self._vectors = vectors
+        self._gen = gen
+        self.remove_file(old)
+
+    def add(self, nodes: Sequence[BaseNode], **add_kwargs: Any) -> List[str]:
+        """
+        Append nodes embeddings
+
+        :param nodes: nodes with embeddings
+        :return: node IDs
+        """
+        if not nodes:
+            return []
+        data = np.asarray([node.get_embedding() for node in nodes], dtype=np.float32)
+        with self._lock:
+            if self._dim == 0:
+                self._dim = data.shape[1]
+                with self._db:
+                    self.set_info("dim", self._dim)
+            elif data.shape[1] != self._dim:
+                raise ValueError("Embedding dimension mismatch: {} != {}".format(data.shape[1], self._dim))
+            data = self.normalize(data)
+            self.reserve(len(nodes))
+            start = self._count
+            self._vectors[start:start + len(nodes)] = data
+            self._vectors.flush()
+
+            replaced = []
+            params = []
+            for i, node in enumerate(nodes):
+                row = start + i
+                if node.node_id in self._rows:
+                    replaced.append(self._rows[node.node_id])
+                self._rows[node.node_id] = row
+                metadata = dict(node.metadata)
+                metadata.update(document_id=node.ref_doc_id, doc_id=node.ref_doc_id, ref_doc_id=node.ref_doc_id)
+                params.append((row, node.node_id, node.ref_doc_id, json.dumps(metadata, default=str)))
+                if self._metadata is not None:
+                    self._metadata[row] = metadata
+            with self._db:
+                self._db.executemany(
+                    "INSERT INTO rows (row, node_id, ref_doc_id, metadata) VALUES (?, ?, ?, ?)",
+                    params,
+                )
+                self._db.executemany("UPDATE rows SET deleted = 1 WHERE row = ?", [(row,) for row in replaced])
+
+            self._node_ids.extend(node.node_id for node in nodes)
+            self._ref_ids.extend(node.ref_doc_id for node in nodes)
+            self._alive = np.concatenate([self._alive, np.ones(len(nodes), dtype=bool)])
+            self._count += len(nodes)
+            if replaced:
+                self._alive[replaced] = False
+            self.ann_add(start, self._count)
+            self.ann_delete(replaced)
+        return [node.node_id for node in nodes]
+
+    def delete(self, ref_doc_id: str, **delete_kwargs: Any) -> None:
+        """
+        Delete nodes of ref doc (tombstones)
+
+        :param ref_doc_id: ref doc ID
+        """
+        with self._lock:
+            rows = [row for (row,) in self._db.execute(
+                "SELECT row FROM rows WHERE ref_doc_id = ? AND deleted = 0", (ref_doc_id,)
+            ).fetchall()]
+            self.tombstone(rows)
+
+    def delete_nodes(
+            self,
+            node_ids: Optional[List[str]] = None,
+            filters: Optional[MetadataFilters] = None,
+            **delete_kwargs: Any,
+    ) -> None:
+        """
+        Delete nodes by IDs and/or metadata filters (tombstones)
+
+        :param node_ids: node IDs
+        :param filters: metadata filters
+        """
+        if node_ids is None and filters is None:
+            return
+        with self._lock:
+            mask = self.get_mask(node_ids=node_ids, filters=filters)
+            self.tombstone(np.flatnonzero(mask).tolist())
+
+    def tombstone(self, rows: List[int]):
+        """
+        Mark rows as deleted
+
+        :param rows: row numbers
+        """
+        if not rows:
+            return
+        with self._db:
+            self._db.executemany("UPDATE rows SET deleted = 1 WHERE row = ?", [(row,) for row in rows])
+        self._alive[rows] = False
+        for row in rows:
+            node_id = self._node_ids[row]
+            if self._rows.get(node_id) == row:
+                del self._rows[node_id]
+        self.ann_delete(rows)
+
+    def clear(self) -> None:
+        """Remove all nodes"""
+        with self._lock:
+            self.close()
+            for name in os.listdir(self.path):
+                self.remove_file(os.path.join(self.path, name))
+            self.open()
+
+    def persist(self, persist_path: str = None, fs: Optional[Any] = None) -> None:
+        """
+        Flush store (rows are written on add), compact if too many rows are deleted
+
+        :param persist_path: ignored, store is kept in own directory
+        :param fs: ignored
+        """
+        with self._lock:
+            if self._vectors is None:
+                return
+            deleted = self._count - int(self._alive.sum())
+            if 0 < self.compact_ratio and deleted > 0 and deleted >= self.compact_ratio * self._count:
+                self.compact()
+            self._vectors.flush()
+            self.save_ann()
+
+    def compact(self):
+        """Rewrite matrix and sidecar without deleted rows"""
+        with self._lock:
+            self.drop_ann()  # rows are renumbered
+            keep = np.flatnonzero(self._alive)
+            gen = self._gen + 1
+            vectors = np.lib.format.open_memmap(
+                self.get_vectors_path(gen),
+                mode="w+",
+                dtype=np.float32,
+                shape=(max(1024, len(keep)), self._dim),
+            )
+            for start in range(0, len(keep), self.block_rows):
+                rows = keep[start:start + self.block_rows]
+                vectors[start:start + len(rows)] = self._vectors[rows]
+            vectors.flush()
+            data = self._db.execute(
+                "SELECT node_id, ref_doc_id, metadata FROM rows WHERE deleted = 0 ORDER BY row"
+            ).fetchall()
+            with self._db:
+                self._db.execute("DELETE FROM rows")
+                self._db.executemany(
+                    "INSERT INTO rows (row, node_id, ref_doc_id, metadata) VALUES (?, ?, ?, ?)",
+                    [(i,) + tuple(row) for i, row in enumerate(data)],
+                )
+                self.set_info("gen", gen)
+            old = self.get_vectors_path(self._gen)
+            self._vectors = vectors
+            self._gen = gen
+            self._count = len(keep)
+            self._node_ids = [row[0] for row in data]
+            self._ref_ids = [row[1] for row in data]
+            self._alive = np.ones(self._count, dtype=bool)
+            self._rows = {node_id: i for i, node_id in enumerate(self._node_ids)}
+            self._metadata = None
+            self.remove_file(old)
+
+    def get_metadata(self) -> Dict[int, dict]:
+        """
+        Get metadata of all rows (loaded on first use of metadata filters)
+
+        :return: dict row -> metadata
+        """
+        if self._metadata is None:
+            self._metadata = {
+                row: json.loads(data) if data else {}
+                for row, data in self._db.execute("SELECT row, metadata FROM rows WHERE deleted = 0")
+            }
+        return self._metadata
+
+    def get_mask(
+            self,
+            node_ids: Optional[List[str]] = None,
+            doc_ids: Optional[List[str]] = None,
+            filters: Optional[MetadataFilters] = None,
+    ) -> np.ndarray:
+        """
+        Get mask of alive rows matching query restrictions
+
+        :param node_ids: node IDs
+        :param doc_ids: ref doc IDs
+        :param filters: metadata filters
+        :return: bool mask
+        """
+        mask = self._alive.copy()
+        if node_ids is not None:
+            allowed = np.zeros(self._count, dtype=bool)
+            allowed[[self._rows[id] for id in node_ids if id in self._rows]] = True
+            mask &= allowed
+        if doc_ids is not None:
+            docs = set(doc_ids)
+            mask &= np.fromiter((ref in docs for ref in self._ref_ids), dtype=bool, count=self._count)
+        if filters is not None and filters.filters:
+            metadata = self.get_metadata()
+            match = build_metadata_filter_fn(lambda node_id: metadata[self._rows[node_id]], filters)
+            for row in np.flatnonzero(mask):
+                if not match(self._node_ids[row]):
+                    mask[row] = False
+        return mask
+
+    def query(self, query: VectorStoreQuery, **kwargs: Any) -> VectorStoreQueryResult:
+        """
+        Query nodes by similarity (cosine, vectorized matrix product)
+
+        :param query: query
+        :return: query result
+        """
+        if query.mode != VectorStoreQueryMode.DEFAULT:
+            raise ValueError("Query mode not supported by NumpyVectorStore: {}".format(query.mode))
+        with self._lock:
+            if query.query_embedding is None or self._count == 0:
+                return VectorStoreQueryResult(similarities=[], ids=[])
+            q = self.normalize(np.asarray(query.query_embedding, dtype=np.float32))
+            k = max(1, int(query.similarity_top_k or 1))
+            restricted = query.node_ids is not None or query.doc_ids is not None \
+                or (query.filters is not None and bool(query.filters.filters))
+            found = None
+            if not restricted:
+                found = self.ann_search(q, k)
+            if found is None:
+                mask = self.get_mask(query.node_ids, query.doc_ids, query.filters)
+                found = self.exact_search(q, k, mask, restricted)
+            rows, scores = found
+            return VectorStoreQueryResult(
+                similarities=[float(s) for s in scores],
+                ids=[self._node_ids[row] for row in rows],
+            )
+
+    def top_k(self, rows: np.ndarray, scores: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get top-k rows by score (sorted, without masked rows)
+
+        :param rows: row numbers
+        :param scores: scores
+        :param k: number of results
+        :return: rows, scores
+        """
+        if len(scores) > k:
+            part = np.argpartition(-scores, k - 1)[:k]
+            rows, scores = rows[part], scores[part]
+        order = np.argsort(-scores, kind="stable")
+        rows, scores = rows[order], scores[order]
+        valid = np.isfinite(scores)
+        return rows[valid], scores[valid]
+
+    def exact_search(
+            self,
+            q: np.ndarray,
+            k: int,
+            mask: np.ndarray,
+            sparse: bool = False,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Exact search, matrix is scanned in blocks to keep memory bounded
+
+        :param q: normalized query vector
+        :param k: number of results
+        :param mask: rows mask
+        :param sparse: True to score only masked rows (restricted query)
+        :return: rows, scores
+        """
+        if sparse:
+            rows = np.flatnonzero(mask)
+            scores = np.concatenate([
+                self._vectors[rows[i:i + self.block_rows]] @ q for i in range(0, len(rows), self.block_rows)
+            ]) if len(rows) else np.empty(0, dtype=np.float32)
+            return self.top_k(rows, scores, k)
+
+        best_rows = []
+        best_scores = []
+        for start in range(0, self._count, self.block_rows):
+            end = min(start + self.block_rows, self._count)
+            scores = self._vectors[start:end] @ q
+            scores[~mask[start:end]] = -np.inf
+            rows, scores = self.top_k(np.arange(start, end), scores, k)
+            best_rows.append(rows)
+            best_scores.append(scores)
+        return self.top_k(np.concatenate(best_rows), np.concatenate(best_scores), k)
+
+    def get_ann_path(self) -> str:
+        """
+        Get ANN index file path
+
+        :return: file path
+        """
+        ext = "bin" if self.index_type == "hnsw" else "npz"
+        return os.path.join(self.path, "ann.{}".format(ext))
+
+    def load_ann(self):
+        """Load saved ANN index, add rows appended after save"""
+        self._ann = None
+        path = self.get_ann_path()
+        if self.index_type not in ("ivf", "hnsw") or not os.path.exists(path):
+            return
+        info = dict(self._db.execute("SELECT key, value FROM info").fetchall())
+        count = int(info.get("ann_count", 0))
+        if info.get("ann_type") != self.index_type or count > self._count:
+            self.drop_ann()
+            return
+        try:
+            if self.index_type == "ivf":
+                data = np.load(path)
+                assign = np.full(self._count, -1, dtype=np.int32)
+                assign[:count] = data["assign"][:count]
+                self._ann = {"centroids": data["centroids"], "assign": assign}
+            else:
+                import hnswlib
+                index = hnswlib.Index(space="ip", dim=self._dim)
+                index.load_index(path, max_elements=max(1024, self._count))
+                self._ann = {"hnsw": index}
+        except Exception:
+            self.drop_ann()
+            return
+        self._ann["count"] = count
+        self.ann_add(count, self._count)
+        self.ann_delete(np.flatnonzero(~self._alive[:count]).tolist())
+
+    def save_ann(self):
+        """Save ANN index"""
+        if self._ann is None:
+            return
+        path = self.get_ann_path()
+        if "hnsw" in self._ann:
+            self._ann["hnsw"].save_index(path)
+        else:
+            with open(path, "wb") as f:
+                np.savez(f, centroids=self._ann["centroids"], assign=self._ann["assign"][:self._count])
+        with self._db:
+            self.set_info("ann_type", self.index_type)
+            self.set_info("ann_count", self._count)
+
+    def drop_ann(self):
+        """Remove ANN index (rebuilt on next query)"""
+        self._ann = None
+        for ext in ("npz", "bin"):
+            path = os.path.join(self.path, "ann.{}".format(ext))
+            if os.path.exists(path):
+                self.remove_file(path)
+
+    def build_ann(self) -> bool:
+        """
+        Build ANN index if enabled and store is large enough
+
+        :return: True if index is available
+        """
+        if self._ann is not None:
+            return True
+        alive = np.flatnonzero(self._alive)
+        if self.index_type not in ("ivf", "hnsw") or len(alive) < max(1, self.ivf_min_rows):
+            return False
+        if self.index_type == "hnsw":
+            try:
+                import hnswlib
+            except ImportError:
+                return False  # optional dependency, exact search is used
+            index = hnswlib.Index(space="ip", dim=self._dim)
+            index.init_index(
+                max_elements=max(1024, self._count),
+                ef_construction=max(100, self.hnsw_ef),
+                M=self.hnsw_m,
+            )
+            self._ann = {"hnsw": index, "count": 0}
+        else:
+            self._ann = {
+                "centroids": self.train_ivf(alive),
+                "assign": np.full(self._count, -1, dtype=np.int32),
+                "count": 0,
+            }
+        self.ann_add(0, self._count)
+        self.ann_delete(np.flatnonzero(~self._alive).tolist())
+        return True
+
+    def train_ivf(self, alive: np.ndarray, iterations: int = 10) -> np.ndarray:
+        """
+        Train IVF centroids (spherical k-means on sample of rows)
+
+        :param alive: alive rows
+        :param iterations: k-means iterations
+        :return: normalized centroids
+        """
+        rnd = np.random.default_rng(0)
+        lists = self.ivf_lists or int(np.sqrt(len(alive)))
+        lists = max(1, min(lists, len(alive)))
+        sample = np.sort(rnd.choice(alive, size=min(len(alive), lists * 40), replace=False))
+        data = np.asarray(self._vectors[sample])
+        centroids = data[rnd.choice(len(data), size=lists, replace=False)].copy()
+        for _ in range(iterations):
+            assign = np.argmax(data @ centroids.T, axis=1)
+            order = np.argsort(assign, kind="stable")
+            used, starts = np.unique(assign[order], return_index=True)
+            centroids[used] = np.add.reduceat(data[order], starts, axis=0)
+            centroids = self.normalize(centroids)
+        return centroids
+
+    def ann_add(self, start: int, end: int):
+        """
+        Add rows to ANN index
+
+        :param start: first row
+        :param end: end row (exclusive)
+        """
+        if self._ann is None or end <= start:
+            return
+        if "hnsw" in self._ann:
+            index = self._ann["hnsw"]
+            if index.get_max_elements() < end:
+                index.resize_index(max(end, index.get_max_elements() * 2))
+            for i in range(start, end, self.block_rows):
+                j = min(i + self.block_rows, end)
+                index.add_items(np.asarray(self._vectors[i:j]), np.arange(i, j))
+        else:
+            assign = self._ann["assign"]
+            if len(assign) < end:
+                assign = np.concatenate([assign, np.full(end - len(assign), -1, dtype=np.int32)])
+            for i in range(start, end, self.block_rows):
+                j = min(i + self.block_rows, end)
+                assign[i:j] = np.argmax(self._vectors[i:j] @ self._ann["centroids"].T, axis=1)
+            self._ann["assign"] = assign
+        self._ann["count"] = end
+
+    def ann_delete(self, rows: List[int]):
+        """
+        Remove rows from ANN index (IVF uses alive mask)
+
+        :param rows: row numbers
+        """
+        if self._ann is None or "hnsw" not in self._ann:
+            return
+        for row in rows:
+            try:
+                self._ann["hnsw"].mark_deleted(row)
+            except RuntimeError:
+                pass  # already deleted
+
+    def ann_search(self, q: np.ndarray, k: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Approximate search
+
+        :param q: normalized query vector
+        :param k: number of results
+        :return: rows, scores or None if ANN index is not available
+        """
+        if not self.build_ann():
+            return None
+        if "hnsw" in self._ann:
+            index = self._ann["hnsw"]
+            index.set_ef(max(self.hnsw_ef, k))
+            try:
+                labels, distances = index.knn_query(q, k=min(k, int(self._alive.sum())))
+            except RuntimeError:
+                return None  # not enough results, use exact search
+            return labels[0].astype(np.int64), 1.0 - distances[0]
+
+        centroids = self._ann["centroids"]
+        probes = min(max(1, self.ivf_probes), len(centroids))
+        nearest = np.argpartition(-(centroids @ q), probes - 1)[:probes]
+        mask = np.isin(self._ann["assign"][:self._count], nearest) & self._alive
+        if mask.sum() < k:
+            return None
+        return self.exact_search(q, k, mask, sparse=True)
+
+
+class NumpyProvider(BaseStore):
+    def __init__(self, *args, **kwargs):
+        super(NumpyProvider, self).__init__(*args, **kwargs)
+        """
+        Numpy (memory-mapped) vector store provider
+
+        :param args: args
+        :param kwargs: kwargs
+        """
+        self.window = kwargs.get('window', None)
+        self.id = "NumpyVectorStore"
+        self.prefix = "numpy_"  # prefix for index directory
+        self.indexes = {}
+        self.stores = {}
+        self.stores_args = {}
+
+    def get_store_args(self) -> dict:
+        """
+        Get store options from vector store keyword arguments
+
+        :return: store options
+        """
+        args = parse_args(
+            self.window.core.config.get('llama.idx.storage.args', []),
+        )
+        options = (
+            "index_type",
+            "ivf_lists",
+            "ivf_probes",
+            "ivf_min_rows",
+            "hnsw_m",
+            "hnsw_ef",
+            "block_rows",
+            "compact_ratio",
+        )
+        return {k: v for k, v in args.items() if k in options}
+
+    def get_vector_store(self, id: str) -> NumpyVectorStore:
+        """
+        Get vector store (opened once, reopened on options change)
+
+        :param id: index name
+        :return: NumpyVectorStore instance
+        """
+        args = self.get_store_args()
+        store = self.stores.get(id)
+        if store is not None and self.stores_args.get(id) != args:
+            store.close()
+            store = None
+        if store is None:
+            store = NumpyVectorStore(path=os.path.join(self.get_path(id), "vectors"), **args)
+            self.stores[id] = store
+            self.stores_args[id] = args
+        return store
+
+    def close(self, id: str):
+        """
+        Close vector store
+
+        :param id: index name
+        """
+        store = self.stores.pop(id, None)
+        self.stores_args.pop(id, None)
+        if store is not None:
+            store.close()
+
+    def create(
+            self,
+            id: str,
+            embed_model: Optional = None
+    ):
+        """
+        Create empty index
+
+        :param id: index name
+        """
+        path = self.get_path(id)
+        if not os.path.exists(path):
+            os.makedirs(path, exist_ok=True)
+            storage_context = StorageContext.from_defaults(
+                vector_store=self.get_vector_store(id),
+            )
+            index = VectorStoreIndex(
+                [],
+                storage_context=storage_context,
+                embed_model=embed_model,
+            )
+            self.store(
+                id=id,
+                index=index,
+            )
+
+    def get(
+            self,
+            id: str,
+            llm: Optional = None,
+            embed_model: Optional = None,
+    ) -> BaseIndex:
+        """
+        Get index
+
+        :param id: index name
+        :param llm: LLM instance
+        :param embed_model: Embedding model instance
+        :return: index instance
+        """
+        if not self.exists(id):
+            self.create(id, embed_model)
+        path = self.get_path(id)
+        storage_context = StorageContext.from_defaults(
+            vector_store=self.get_vector_store(id),
+            persist_dir=path,
+        )
+        self.indexes[id] = load_index_from_storage(
+            storage_context,
+            llm=llm,
+            embed_model=embed_model,
+        )
+        return self.indexes[id]
+
+    def store(
+            self,
+            id: str,
+            index: Optional[BaseIndex] = None
+    ):
+        """
+        Store index
+
+        :param id: index name
+        :param index: index instance
+        """
+        if index is None:
+            index = self.indexes[id]
+        path = self.get_path(id)
+        index.storage_context.persist(
+            persist_dir=path,
+        )
+        self.indexes[id] = index
+
+    def remove(
+            self,
+            id: str
+    ) -> bool:
+        """
+        Clear index
+
+        :param id: index name
+        :return: True if success
+        """
+        self.close(id)
+        return super(NumpyProvider, self).remove(id)
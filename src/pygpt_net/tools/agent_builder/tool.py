@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.25 14:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import copy
@@ -403,6 +403,9 @@ class AgentBuilder(BaseTool):
                              allowed_inputs=0, allowed_outputs=1),
                 PropertySpec(id="memory", type="memory", name=trans("node.editor.property.memory.name"), editable=False,
                              allowed_inputs=0, allowed_outputs=-1),
+                PropertySpec(id="concurrency", type="int", name=trans("node.editor.property.concurrency.name"),
+                             editable=True, value=0,
+                             description=trans("node.editor.property.concurrency.desc")),
             ],
         ))
         # Agent
@@ -450,6 +453,39 @@ class AgentBuilder(BaseTool):
                              allowed_inputs=-1, allowed_outputs=0),
             ],
         ))
+        # Parallel (fan-out)
+        registry.register(NodeTypeSpec(
+            type_name="Flow/Parallel",
+            display_name=trans("node.editor.spec.parallel.title"),
+            title=trans("node.editor.spec.parallel.title"),
+            base_id="parallel",
+            export_kind="parallel",
+            bg_color="#7A5A1E",
+            properties=[
+                PropertySpec(id="input", type="flow", name=trans("node.editor.property.input.name"), editable=False,
+                             allowed_inputs=-1, allowed_outputs=0),
+                PropertySpec(id="output", type="flow", name=trans("node.editor.property.output.name"), editable=False,
+                             allowed_inputs=0, allowed_outputs=-1),
+            ],
+        ))
+        # Join
+        registry.register(NodeTypeSpec(
+            type_name="Flow/Join",
+            display_name=trans("node.editor.spec.join.title"),
+            title=trans("node.editor.spec.join.title"),
+            base_id="join",
+            export_kind="join",
+            bg_color="#1E6B6B",
+            properties=[
+                PropertySpec(id="reducer", type="combo", name=trans("node.editor.property.reducer.name"),
+                             editable=True, value="concat", options=["concat", "json", "first", "longest"],
+                             description=trans("node.editor.property.reducer.desc")),
+                PropertySpec(id="input", type="flow", name=trans("node.editor.property.input.name"), editable=False,
+                             allowed_inputs=-1, allowed_outputs=0),
+                PropertySpec(id="output", type="flow", name=trans("node.editor.property.output.name"), editable=False,
+                             allowed_inputs=0, allowed_outputs=1),
+            ],
+        ))
         # End
         registry.register(NodeTypeSpec(
             type_name="Flow/End",
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.12.16 01:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import datetime
@@ -145,8 +145,44 @@ class IndexerTool(BaseTool):
         """
         if check:
             self.check_current_idx()
+        self.update_retrieval()
         self.update_tabs()
 
+    def update_retrieval(self):
+        """Update retrieval mode select for current index"""
+        if "tool.indexer.retrieval" in self.window.ui.nodes:
+            self.window.ui.nodes["tool.indexer.retrieval"].set_value(
+                self.window.core.idx.get_retrieval_mode(self.current_idx)
+            )
+
+    def set_retrieval_mode(self, mode: str):
+        """
+        Set retrieval mode for current index
+
+        :param mode: retrieval mode (vector, hybrid, keyword)
+        """
+        if not mode or mode == self.window.core.idx.get_retrieval_mode(self.current_idx):
+            return
+        self.window.core.idx.set_retrieval_mode(self.current_idx, mode)
+        self.window.core.idx.chat.cache.clear(self.current_idx)
+        self.log("Retrieval mode for index {}: {}".format(self.current_idx, mode))
+        if mode != "vector" and not self.window.core.idx.storage.keyword.exists(self.current_idx):
+            self.log(trans("tool.indexer.retrieval.no_keyword"))
+
+    def rebuild_keyword(self):
+        """Rebuild keyword (BM25) index for current index"""
+        if self.current_idx == "-" or self.current_idx is None or self.current_idx == "_":
+            self.window.ui.dialogs.alert(trans("tool.indexer.alert.no_idx"))
+            return
+        try:
+            model = self.window.core.models.from_defaults()
+            index, llm = self.window.core.idx.chat.get_index(self.current_idx, model)
+            num = self.window.core.idx.indexing.rebuild_keyword(self.current_idx, index)
+            self.log("Keyword index rebuilt: {}, nodes: {}".format(self.current_idx, num))
+        except Exception as e:
+            self.window.core.debug.log(e)
+            self.log("Error: {}".format(e))
+
     def on_reload(self):
         """On app profile reload"""
         self.reload()
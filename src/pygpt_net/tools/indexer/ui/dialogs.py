@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.22 17:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from PySide6.QtCore import Qt
@@ -63,6 +63,11 @@ class DialogBuilder:
             lambda: self.window.tools.get("indexer").truncate_idx()
         )
 
+        self.actions["file.rebuild_keyword"] = QAction(QIcon(":/icons/reload.svg"), trans("tool.indexer.menu.file.rebuild_keyword"))
+        self.actions["file.rebuild_keyword"].triggered.connect(
+            lambda: self.window.tools.get("indexer").rebuild_keyword()
+        )
+
         self.actions["config.settings"] = QAction(QIcon(":/icons/settings.svg"), trans("tool.indexer.menu.config.settings"))
         self.actions["config.settings"].triggered.connect(
             lambda: self.window.tools.get("indexer").open_settings()
@@ -71,6 +76,7 @@ class DialogBuilder:
         # add actions
         self.menu["file"].addAction(self.actions["file.clear_log"])
         self.menu["file"].addAction(self.actions["file.truncate_idx"])
+        self.menu["file"].addAction(self.actions["file.rebuild_keyword"])
         self.menu["config"].addAction(self.actions["config.settings"])
         return self.menu_bar
 
@@ -92,6 +98,16 @@ class DialogBuilder:
         self.window.ui.nodes["tool.indexer.idx.label"] = QLabel(trans("tool.indexer.idx"))
         self.window.ui.nodes["tool.indexer.provider"] = HelpLabel(self.window.core.config.get("llama.idx.storage"))
 
+        # retrieval mode select (per index)
+        self.window.ui.nodes["tool.indexer.retrieval"] = OptionCombo(self.window, "tool.indexer", "retrieval", {
+            "label": trans("tool.indexer.retrieval"),
+            "keys": self.window.controller.config.placeholder.apply_by_id("llama_index_retrieval_modes"),
+            "value": "vector",
+        })
+        self.window.ui.add_hook("update.tool.indexer.retrieval", self.hook_retrieval_change)
+        self.window.ui.nodes["tool.indexer.retrieval"].layout.setContentsMargins(0, 0, 0, 0)
+        self.window.ui.nodes["tool.indexer.retrieval.label"] = QLabel(trans("tool.indexer.retrieval"))
+
         # set first index
         default_idx = None
         indexes = self.window.core.config.get("llama.idx.list")
@@ -99,11 +115,16 @@ class DialogBuilder:
             default_idx = indexes[0]["id"]
         if default_idx:
             self.window.ui.nodes["tool.indexer.idx"].set_value(default_idx)
+            self.window.ui.nodes["tool.indexer.retrieval"].set_value(
+                self.window.core.idx.get_retrieval_mode(default_idx)
+            )
 
         idx_layout = QHBoxLayout()
         idx_layout.addWidget(self.window.ui.nodes["tool.indexer.provider"])
         idx_layout.addWidget(self.window.ui.nodes["tool.indexer.idx.label"], alignment=Qt.AlignRight)
         idx_layout.addWidget(self.window.ui.nodes["tool.indexer.idx"])
+        idx_layout.addWidget(self.window.ui.nodes["tool.indexer.retrieval.label"], alignment=Qt.AlignRight)
+        idx_layout.addWidget(self.window.ui.nodes["tool.indexer.retrieval"])
 
         self.window.ui.tabs['tool.indexer'] = QTabWidget(self.window)
         self.window.ui.tabs['tool.indexer'].addTab(files, trans("tool.indexer.tab.files"))
@@ -164,6 +185,18 @@ class DialogBuilder:
         """
         self.window.tools.get("indexer").set_current_idx(value, check=False)
 
+    def hook_retrieval_change(self, key, value, caller, *args, **kwargs):
+        """
+        Hook: on retrieval mode change
+
+        :param key: Option key
+        :param value: Option value
+        :param caller: Caller
+        :param args: Args
+        :param kwargs: Kwargs
+        """
+        self.window.tools.get("indexer").set_retrieval_mode(value)
+
 class IndexerDialog(BaseDialog):
     def __init__(self, window=None):
         """
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.20 20:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import os
@@ -353,6 +353,8 @@ class MainWindow(QMainWindow, QtStyleTools):
         self.controller.plugins.save_all()
         print("Saving tools...")
         self.tools.on_exit()
+        print("Saving attachment indexes...")
+        self.core.idx.storage.release_ctx_idx()
         print("Closing clients...")
         self.controller.kernel.close_clients()
         print("Saving layout state...")
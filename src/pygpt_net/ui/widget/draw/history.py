@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+
+import zlib
+from collections import deque
+from typing import Dict, Optional, Tuple, List
+
+import numpy as np
+
+from PySide6.QtCore import QRect, QSize
+from PySide6.QtGui import QImage
+
+from .pixels import FORMATS_32, image_view
+
+LAYERS = ("base", "draw")  # diffed canvas layers
+TILE_SIZE = 64  # tile edge in pixels
+COMPRESS_LEVEL = 1  # zlib level (fast, strokes and flat areas compress well anyway)
+
+Rect = Tuple[int, int, int, int]  # x, y, width, height
+
+
+def diff_tiles(before: np.ndarray, after: np.ndarray, tile: int = TILE_SIZE) -> List[Rect]:
+    """
+    Find tiles that differ between two pixel arrays of the same shape
+
+    :param before: pixels before (height, width)
+    :param after: pixels after (height, width)
+    :param tile: tile edge in pixels
+    :return: list of tile rects (x, y, width, height)
+    """
+    neq = before != after
+    if not neq.any():
+        return []
+    h, w = neq.shape
+    rows = np.logical_or.reduceat(neq, np.arange(0, h, tile), axis=0)
+    grid = np.logical_or.reduceat(rows, np.arange(0, w, tile), axis=1)
+    rects = []
+    for ty, tx in zip(*np.nonzero(grid)):
+        x, y = int(tx) * tile, int(ty) * tile
+        rects.append((x, y, min(tile, w - x), min(tile, h - y)))
+    return rects
+
+
+def pack_tile(view: np.ndarray, rect: Rect) -> bytes:
+    """
+    Compress pixels of tile
+
+    :param view: pixels (height, width)
+    :param rect: tile rect
+    :return: compressed bytes
+    """
+    x, y, w, h = rect
+    return zlib.compress(view[y:y + h, x:x + w].tobytes(), COMPRESS_LEVEL)
+
+
+def unpack_tile(view: np.ndarray, rect: Rect, data: bytes):
+    """
+    Write compressed tile pixels back
+
+    :param view: writable pixels (height, width)
+    :param rect: tile rect
+    :param data: compressed bytes
+    """
+    x, y, w, h = rect
+    view[y:y + h, x:x + w] = np.frombuffer(zlib.decompress(data), dtype=np.uint32).reshape(h, w)
+
+
+def pack_image(img: QImage) -> tuple:
+    """
+    Compress whole image
+
+    :param img: image
+    :return: (width, height, format, compressed bytes)
+    """
+    if img.format() not in FORMATS_32:
+        img = img.convertToFormat(QImage.Format_ARGB32)
+    return img.width(), img.height(), img.format(), pack_tile(image_view(img), (0, 0, img.width(), img.height()))
+
+
+def unpack_image(packed: tuple) -> QImage:
+    """
+    Restore image compressed with pack_image()
+
+    :param packed: (width, height, format, compressed bytes)
+    :return: image
+    """
+    w, h, fmt, data = packed
+    img = QImage(w, h, fmt)
+    unpack_tile(image_view(img, writable=True), (0, 0, w, h), data)
+    return img
+
+
+def same_image(a: Optional[QImage], b: Optional[QImage]) -> bool:
+    """
+    Check if both images are the same (shared) image data
+
+    :param a: image or None
+    :param b: image or None
+    :return: True if same
+    """
+    if a is None or b is None:
+        return a is None and b is None
+    return a.cacheKey() == b.cacheKey()
+
+
+class UndoStep:
+    def __init__(self, state: dict, pending: bool = True):
+        """
+        Single undo/redo step
+
+        Pending step keeps shallow (copy-on-write) copies of layers until it is sealed
+        against the state after the action. Sealed step keeps only compressed tiles
+        that have changed, or whole compressed layers if the canvas size has changed.
+
+        :param state: painter state (base, draw, src, canvas_size, baseRect)
+        :param pending: True to keep layers for sealing later
+        """
+        self.canvas_size = QSize(state['canvas_size'])
+        self.base_rect = QRect(state['baseRect']) if state.get('baseRect') is not None else QRect()
+        self.src = state.get('src')  # source image is replaced, never modified in place
+        self.pending = None
+        if pending:
+            self.pending = {k: QImage(state[k]) for k in LAYERS if state.get(k) is not None}
+        self.full: Optional[Dict[str, tuple]] = None  # layer -> packed image
+        self.tiles: Dict[str, Dict[Rect, bytes]] = {}  # layer -> {rect: compressed pixels}
+        self.nbytes = 0
+
+    def seal(self, current: dict) -> bool:
+        """
+        Replace kept layers with compressed delta against current state
+
+        :param current: painter state after the action
+        :return: False if nothing has changed (step can be dropped)
+        """
+        if self.pending is None:
+            return True
+        before, self.pending = self.pending, None
+        if not self._is_diffable(before, current):
+            self.full = {k: pack_image(img) for k, img in before.items()}
+        else:
+            for k in LAYERS:
+                view = image_view(before[k])
+                tiles = {rect: pack_tile(view, rect) for rect in diff_tiles(view, image_view(current[k]))}
+                if tiles:
+                    self.tiles[k] = tiles
+            if not self.tiles \
+                    and same_image(self.src, current.get('src')) \
+                    and self.base_rect == current.get('baseRect'):
+                return False
+        self._update_size(current)
+        return True
+
+    def apply(self, current: dict) -> Tuple[dict, "UndoStep"]:
+        """
+        Restore state stored in step
+
+        Layers of current state are modified in place when only tiles are stored.
+
+        :param current: current painter state
+        :return: (restored state, inverse step)
+        """
+        inverse = UndoStep(current, pending=False)
+        layers = {}
+        if self.full is not None:
+            inverse.full = {k: pack_image(current[k]) for k in LAYERS if current.get(k) is not None}
+            for k in LAYERS:
+                layers[k] = unpack_image(self.full[k]) if k in self.full else None
+        else:
+            for k in LAYERS:
+                img = current[k]
+                tiles = self.tiles.get(k)
+                if tiles:
+                    view = image_view(img, writable=True)
+                    inv = {}
+                    for rect, data in tiles.items():
+                        inv[rect] = pack_tile(view, rect)
+                        unpack_tile(view, rect, data)
+                    inverse.tiles[k] = inv
+                layers[k] = img
+        state = {
+            'base': layers['base'],
+            'draw': layers['draw'],
+            'src': self.src,
+            'canvas_size': QSize(self.canvas_size),
+            'baseRect': QRect(self.base_rect),
+        }
+        inverse._update_size(state)
+        return state, inverse
+
+    def _is_diffable(self, before: Dict[str, QImage], current: dict) -> bool:
+        """
+        Check if layers can be compared tile by tile
+
+        :param before: layers before
+        :param current: current state
+        :return: True if all layers have the same size and 32-bit format
+        """
+        for k in LAYERS:
+            a, b = before.get(k), current.get(k)
+            if a is None or b is None or a.size() != b.size():
+                return False
+            if a.format() != b.format() or a.format() not in FORMATS_32:
+                return False
+        return True
+
+    def _update_size(self, other: dict):
+        """
+        Update memory used by step
+
+        :param other: the opposite state (source image is counted only if it differs)
+        """
+        size = 0
+        if self.full is not None:
+            size += sum(len(packed[3]) for packed in self.full.values())
+        for tiles in self.tiles.values():
+            size += sum(len(data) for data in tiles.values())
+        if self.src is not None and not same_image(self.src, other.get('src')):
+            size += self.src.sizeInBytes()
+        self.nbytes = size
+
+
+class UndoHistory:
+    def __init__(self, limit: int = 50, max_bytes: int = 128 * 1024 * 1024):
+        """
+        Undo/redo history of painter with delta steps in a fixed memory budget
+
+        :param limit: max number of undo steps
+        :param max_bytes: memory budget of all steps (the latest undo step is always kept)
+        """
+        self.limit = limit
+        self.max_bytes = max_bytes
+        self.undo_stack = deque()
+        self.redo_stack = deque()
+
+    def push(self, state: dict):
+        """
+        Save state before an action
+
+        :param state: current painter state
+        """
+        self.seal(state)
+        self.undo_stack.append(UndoStep(state))
+        self.redo_stack.clear()
+        self._trim()
+
+    def seal(self, current: dict):
+        """
+        Seal the latest step against state after the action
+
+        :param current: current painter state
+        """
+        if self.undo_stack and self.undo_stack[-1].pending is not None:
+            if not self.undo_stack[-1].seal(current):
+                self.undo_stack.pop()
+            self._trim()
+
+    def undo(self, current: dict) -> Optional[dict]:
+        """
+        Undo the last step
+
+        :param current: current painter state
+        :return: restored state or None
+        """
+        self.seal(current)
+        if not self.undo_stack:
+            return None
+        state, inverse = self.undo_stack.pop().apply(current)
+        self.redo_stack.append(inverse)
+        self._trim()
+        return state
+
+    def redo(self, current: dict) -> Optional[dict]:
+        """
+        Redo the last undone step
+
+        :param current: current painter state
+        :return: restored state or None
+        """
+        if not self.redo_stack:
+            return None
+        state, inverse = self.redo_stack.pop().apply(current)
+        self.undo_stack.append(inverse)
+        self._trim()
+        return state
+
+    def has_undo(self) -> bool:
+        """
+        Check if undo is available
+
+        :return: True if undo is available
+        """
+        return bool(self.undo_stack)
+
+    def has_redo(self) -> bool:
+        """
+        Check if redo is available
+
+        :return: True if redo is available
+        """
+        return bool(self.redo_stack)
+
+    def get_size(self) -> int:
+        """
+        Get memory used by sealed steps
+
+        :return: size in bytes
+        """
+        return sum(s.nbytes for s in self.undo_stack) + sum(s.nbytes for s in self.redo_stack)
+
+    def clear(self):
+        """Clear history"""
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+
+    def _trim(self):
+        """Drop the oldest undo steps over count limit or memory budget"""
+        while len(self.undo_stack) > max(1, self.limit):
+            self.undo_stack.popleft()
+        while len(self.undo_stack) > 1 and self.get_size() > self.max_bytes:
+            self.undo_stack.popleft()
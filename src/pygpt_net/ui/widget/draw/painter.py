@@ -6,14 +6,13 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.12.28 14:30:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import datetime
 import os
 import bisect
 import math
-from collections import deque
 
 from PySide6.QtCore import Qt, QPoint, QPointF, QRect, QSize, QSaveFile, QIODevice, QTimer, Signal
 from PySide6.QtGui import QImage, QPainter, QPen, QAction, QIcon, QColor, QCursor
@@ -22,6 +21,9 @@ from PySide6.QtWidgets import QMenu, QWidget, QFileDialog, QMessageBox, QApplica
 from pygpt_net.core.tabs.tab import Tab
 from pygpt_net.utils import trans
 
+from .history import UndoHistory
+from .pixels import image_view, mask_bounds, to_32bit
+
 
 class PainterWidget(QWidget):
     # Emitted whenever zoom changes; payload is zoom factor (e.g. 1.0 for 100%)
@@ -73,10 +75,10 @@ class PainterWidget(QWidget):
         self._selectionStart = QPoint()
         self._selectionRect = QRect()
 
-        # Undo/redo: store full layered state to support non-destructive operations
-        self.undoLimit = 10
-        self.undoStack = deque(maxlen=self.undoLimit)
-        self.redoStack = deque()
+        # Undo/redo: layered state stored as compressed tile deltas in a fixed memory budget
+        self.undoLimit = 50
+        self.undoMemoryLimit = 128 * 1024 * 1024  # bytes
+        self.history = UndoHistory(self.undoLimit, self.undoMemoryLimit)
 
         self.originalImage = None  # kept for API compatibility; reflects current composited image
         self.setFocusPolicy(Qt.StrongFocus)
@@ -524,12 +526,11 @@ class PainterWidget(QWidget):
         self.originalImage = self.image
 
     def _snapshot_state(self):
-        """Create a full snapshot for undo."""
+        """Get current layered state for undo history (layers are not copied here)."""
         state = {
-            'image': QImage(self.image),
-            'base': QImage(self.baseCanvas) if self.baseCanvas is not None else None,
-            'draw': QImage(self.drawingLayer) if self.drawingLayer is not None else None,
-            'src': QImage(self.sourceImageOriginal) if self.sourceImageOriginal is not None else None,
+            'base': self.baseCanvas,
+            'draw': self.drawingLayer,
+            'src': self.sourceImageOriginal,
             'canvas_size': QSize(self._canvasSize.width(), self._canvasSize.height()),
             'baseRect': QRect(self.baseTargetRect),
         }
@@ -539,33 +540,32 @@ class PainterWidget(QWidget):
         """
         Apply a snapshot (used by undo/redo).
 
-        :param state: State dict from _snapshot_state()
+        :param state: State dict restored by undo history
         """
         if not state:
             return
 
         target_canvas_size = state.get('canvas_size', None)
         if isinstance(target_canvas_size, QSize) and target_canvas_size.isValid():
-            old_canvas = QSize(self._canvasSize)
             self._canvasSize = QSize(target_canvas_size)
 
-            self.image = QImage(state['image']) if state['image'] is not None else QImage(self._canvasSize, QImage.Format_RGB32)
             if self.image.size() != self._canvasSize:
-                self.image = self.image.scaled(self._canvasSize, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+                self.image = QImage(self._canvasSize, QImage.Format_RGB32)
+                self.image.fill(Qt.white)
 
             if state['base'] is not None:
-                self.baseCanvas = QImage(state['base'])
+                self.baseCanvas = state['base']
             else:
                 self.baseCanvas = QImage(self._canvasSize, QImage.Format_RGB32)
                 self.baseCanvas.fill(Qt.white)
 
             if state['draw'] is not None:
-                self.drawingLayer = QImage(state['draw'])
+                self.drawingLayer = state['draw']
             else:
                 self.drawingLayer = QImage(self._canvasSize, QImage.Format_ARGB32_Premultiplied)
                 self.drawingLayer.fill(Qt.transparent)
 
-            self.sourceImageOriginal = QImage(state['src']) if state['src'] is not None else None
+            self.sourceImageOriginal = state['src']
             self.baseTargetRect = QRect(state['baseRect']) if state['baseRect'] is not None else QRect()
 
             self._mark_composite_dirty()
@@ -648,64 +648,13 @@ class PainterWidget(QWidget):
         """
         if img is None or img.isNull():
             return None
-
-        w, h = img.width(), img.height()
-        if w <= 0 or h <= 0:
-            return None
-
-        def is_bg(px: QColor) -> bool:
-            return px.red() >= threshold and px.green() >= threshold and px.blue() >= threshold
-
-        left = 0
-        found = False
-        for x in range(w):
-            for y in range(h):
-                if not is_bg(img.pixelColor(x, y)):
-                    left = x
-                    found = True
-                    break
-            if found:
-                break
-        if not found:
-            return None  # all white
-
-        right = w - 1
-        found = False
-        for x in range(w - 1, -1, -1):
-            for y in range(h):
-                if not is_bg(img.pixelColor(x, y)):
-                    right = x
-                    found = True
-                    break
-            if found:
-                break
-
-        top = 0
-        found = False
-        for y in range(h):
-            for x in range(left, right + 1):
-                if not is_bg(img.pixelColor(x, y)):
-                    top = y
-                    found = True
-                    break
-            if found:
-                break
-
-        bottom = h - 1
-        found = False
-        for y in range(h - 1, -1, -1):
-            for x in range(left, right + 1):
-                if not is_bg(img.pixelColor(x, y)):
-                    bottom = y
-                    found = True
-                    break
-            if found:
-                break
-
-        if right < left or bottom < top:
+        if img.width() <= 0 or img.height() <= 0:
             return None
 
-        return QRect(left, top, right - left + 1, bottom - top + 1)
+        img = to_32bit(img, premultiplied=False)  # keep reference while the view is used
+        px = image_view(img)  # 0xAARRGGBB
+        mask = (((px >> 16) & 0xFF) < threshold) | (((px >> 8) & 0xFF) < threshold) | ((px & 0xFF) < threshold)
+        return mask_bounds(mask)
 
     def _detect_nontransparent_bounds(self, img: QImage) -> QRect | None:
         """
@@ -716,51 +665,12 @@ class PainterWidget(QWidget):
         """
         if img is None or img.isNull():
             return None
-        w, h = img.width(), img.height()
-        if w <= 0 or h <= 0:
-            return None
-
-        left = -1
-        for x in range(w):
-            for y in range(h):
-                if img.pixelColor(x, y).alpha() > 0:
-                    left = x
-                    break
-            if left != -1:
-                break
-        if left == -1:
+        if img.width() <= 0 or img.height() <= 0:
             return None
 
-        right = -1
-        for x in range(w - 1, -1, -1):
-            for y in range(h):
-                if img.pixelColor(x, y).alpha() > 0:
-                    right = x
-                    break
-            if right != -1:
-                break
-
-        top = -1
-        for y in range(h):
-            for x in range(left, right + 1):
-                if img.pixelColor(x, y).alpha() > 0:
-                    top = y
-                    break
-            if top != -1:
-                break
-
-        bottom = -1
-        for y in range(h - 1, -1, -1):
-            for x in range(left, right + 1):
-                if img.pixelColor(x, y).alpha() > 0:
-                    bottom = y
-                    break
-            if bottom != -1:
-                break
-
-        if right < left or bottom < top:
-            return None
-        return QRect(left, top, right - left + 1, bottom - top + 1)
+        img = to_32bit(img)  # keep reference while the view is used
+        px = image_view(img)  # 0xAARRGGBB
+        return mask_bounds((px >> 24) != 0)
 
     # ---------- Public API (clipboard, file, actions) ----------
 
@@ -898,26 +808,22 @@ class PainterWidget(QWidget):
     def saveForUndo(self):
         """Save current state for undo"""
         self._ensure_layers()
-        self._ensure_composited_image()
-        self.undoStack.append(self._snapshot_state())
-        self.redoStack.clear()
+        self.history.push(self._snapshot_state())
 
     def undo(self):
         """Undo the last action"""
-        if self.undoStack:
-            current = self._snapshot_state()
-            self.redoStack.append(current)
-            state = self.undoStack.pop()
+        self._ensure_layers()
+        state = self.history.undo(self._snapshot_state())
+        if state is not None:
             self._apply_state(state)
             if self.window and hasattr(self.window, "controller"):
                 self.window.controller.painter.common.sync_canvas_combo_from_widget()
 
     def redo(self):
         """Redo the last undo action"""
-        if self.redoStack:
-            current = self._snapshot_state()
-            self.undoStack.append(current)
-            state = self.redoStack.pop()
+        self._ensure_layers()
+        state = self.history.redo(self._snapshot_state())
+        if state is not None:
             self._apply_state(state)
             if self.window and hasattr(self.window, "controller"):
                 self.window.controller.painter.common.sync_canvas_combo_from_widget()
@@ -928,7 +834,7 @@ class PainterWidget(QWidget):
 
         :return: True if undo is available
         """
-        return bool(self.undoStack)
+        return self.history.has_undo()
 
     def has_redo(self) -> bool:
         """
@@ -936,7 +842,7 @@ class PainterWidget(QWidget):
 
         :return: True if redo is available
         """
-        return bool(self.redoStack)
+        return self.history.has_redo()
 
     def save_base(self, path: str, include_drawing: bool = False) -> bool:
         """
@@ -1443,6 +1349,9 @@ class PainterWidget(QWidget):
             self._mouseDown = False
             if self.cropping and self._selecting:
                 self._finalize_crop()
+            if self.drawing:
+                # stroke finished: keep only changed tiles in undo history
+                self.history.seal(self._snapshot_state())
             self.drawing = False
 
     def keyPressEvent(self, event):
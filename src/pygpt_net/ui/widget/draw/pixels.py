@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+
+import numpy as np
+
+from PySide6.QtCore import QRect
+from PySide6.QtGui import QImage
+
+# 32-bit formats with 0xAARRGGBB pixel layout (native endianness)
+FORMATS_32 = (
+    QImage.Format_RGB32,
+    QImage.Format_ARGB32,
+    QImage.Format_ARGB32_Premultiplied,
+)
+
+
+def to_32bit(img: QImage, premultiplied: bool = True) -> QImage:
+    """
+    Convert image to 32-bit 0xAARRGGBB format if needed
+
+    :param img: image
+    :param premultiplied: False to convert premultiplied alpha to straight alpha
+    :return: image in 32-bit format (same image if already in matching format)
+    """
+    fmt = img.format()
+    if fmt in FORMATS_32 and (premultiplied or fmt != QImage.Format_ARGB32_Premultiplied):
+        return img
+    return img.convertToFormat(QImage.Format_ARGB32)
+
+
+def image_view(img: QImage, writable: bool = False) -> np.ndarray:
+    """
+    NumPy view over pixels of 32-bit image (no copy)
+
+    Returned array has shape (height, width) and dtype uint32 (0xAARRGGBB).
+    Writable view detaches the image from its shared copies (copy-on-write).
+    The view does not keep the image alive: keep a reference to the image while using it.
+
+    :param img: image in one of FORMATS_32
+    :param writable: True to get writable view
+    :return: array (height, width)
+    """
+    h, w = img.height(), img.width()
+    buf = img.bits() if writable else img.constBits()
+    arr = np.frombuffer(buf, dtype=np.uint32)
+    return arr.reshape(h, img.bytesPerLine() // 4)[:, :w]
+
+
+def mask_bounds(mask: np.ndarray) -> QRect | None:
+    """
+    Tight bounding rect of True values in 2D mask
+
+    :param mask: bool array (height, width)
+    :return: QRect or None if mask is empty
+    """
+    rows = np.flatnonzero(mask.any(axis=1))
+    if rows.size == 0:
+        return None
+    cols = np.flatnonzero(mask.any(axis=0))
+    top, bottom = int(rows[0]), int(rows[-1])
+    left, right = int(cols[0]), int(cols[-1])
+    return QRect(left, top, right - left + 1, bottom - top + 1)
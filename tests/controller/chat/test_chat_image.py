@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.21 02:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 import os
@@ -118,10 +118,10 @@ def test_save(mock_window):
         mock_window.ui.status.assert_called_once()  # should update status
 
 
-def test_delete(mock_window):
+def test_delete(mock_window, monkeypatch):
     image = Image(mock_window)
     # image.window.ui.dialogs.confirm = MagicMock()
-    os.remove = MagicMock()
+    monkeypatch.setattr(os, "remove", MagicMock())
     image.delete('path', force=True)
     # image.window.ui.dialogs.confirm.assert_called_once()
     os.remove.assert_called_once_with('path')
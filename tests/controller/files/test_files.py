@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.03 14:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 import os
@@ -20,10 +20,10 @@ from tests.mocks import mock_window
 from pygpt_net.controller import Files
 
 
-def test_delete(mock_window):
+def test_delete(mock_window, monkeypatch):
     """Test delete"""
     files = Files(mock_window)
-    os.remove = MagicMock()
+    monkeypatch.setattr(os, "remove", MagicMock())
 
     files.delete('test', force=True)
     os.remove.assert_called_once_with('test')
@@ -38,11 +38,11 @@ def test_rename(mock_window):
     assert mock_window.ui.dialog['rename'].current == 'test'
 
 
-def test_update_name(mock_window):
+def test_update_name(mock_window, monkeypatch):
     """Test update name"""
     files = Files(mock_window)
-    os.rename = MagicMock()
-    os.path.exists = MagicMock(return_value=False)
+    monkeypatch.setattr(os, "rename", MagicMock())
+    monkeypatch.setattr(os.path, "exists", MagicMock(return_value=False))
     mock_window.update_status = MagicMock()
     files.update_name('test', 'test2')
     os.rename.assert_called_once_with('test', os.path.join(os.path.dirname('test'), 'test2'))
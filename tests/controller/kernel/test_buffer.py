@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.19 00:00:00                  #
+# ================================================== #
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from pygpt_net.controller.kernel.buffer import Buffer
+from pygpt_net.item.ctx import CtxItem, CtxMeta
+
+
+def make_item(id, meta_id=1):
+    item = CtxItem()
+    item.id = id
+    item.meta_id = meta_id
+    return item
+
+
+@pytest.fixture
+def buffer():
+    window = MagicMock()
+    window.core.config.get.side_effect = lambda key, default=None: default
+    window.core.ctx.meta = {1: CtxMeta()}
+    window.core.ctx.get_items.return_value = []
+    return Buffer(window)
+
+
+def test_not_active(buffer):
+    """Test writes are not buffered outside of run"""
+    assert buffer.update_item(make_item(1)) is False
+    assert buffer.save(1) is False
+    assert buffer.flush() == 0
+
+
+def test_run_batches_writes(buffer):
+    """Test repeated writes are written once, with latest state, on run end"""
+    provider = buffer.window.core.ctx.provider
+    buffer.begin()
+    first = make_item(1)
+    second = make_item(2)
+    for item in [first, second, first]:
+        assert buffer.update_item(item) is True
+    assert buffer.save(1) is True
+    assert buffer.save(1) is True
+    assert buffer.update_item(CtxItem()) is False  # not stored yet, no ID
+    provider.update_items.assert_not_called()
+
+    buffer.end()
+    provider.update_items.assert_called_once_with([second, first])
+    provider.save.assert_called_once()
+    assert buffer.is_active() is False
+    assert buffer.update_item(first) is False
+
+
+def test_step_flush(buffer):
+    """Test step end (idle) flushes and stops buffering, open run keeps buffering"""
+    provider = buffer.window.core.ctx.provider
+    buffer.set_busy(True)
+    buffer.update_item(make_item(1))
+    buffer.set_busy(False)
+    assert provider.update_items.call_count == 1
+    assert buffer.is_active() is False
+
+    buffer.begin()
+    buffer.set_busy(True)
+    buffer.set_busy(False)
+    assert buffer.update_item(make_item(1)) is True  # run in progress
+
+
+def test_reset_flushes(buffer):
+    """Test stop and error flush pending writes"""
+    provider = buffer.window.core.ctx.provider
+    buffer.begin()
+    buffer.begin()
+    buffer.update_item(make_item(1))
+    buffer.reset()
+    provider.update_items.assert_called_once()
+    assert buffer.runs == 0
+
+
+def test_disabled(buffer):
+    """Test buffer can be disabled"""
+    buffer.window.core.config.get.side_effect = lambda key, default=None: False if key == "ctx.buffer" else default
+    buffer.begin()
+    buffer.set_busy(True)
+    assert buffer.update_item(make_item(1)) is False
+
+
+def test_defer_update(buffer):
+    """Test ctx list updates are coalesced while run is in progress"""
+    assert buffer.defer_update() is False  # no run
+    buffer.timer = MagicMock()
+    buffer.timer.isActive.return_value = False
+    buffer.begin()
+    assert buffer.defer_update() is False  # first update is immediate
+    assert buffer.defer_update() is True
+    buffer.timer.start.assert_called_once()
+    buffer.timer.isActive.return_value = True
+    assert buffer.defer_update() is True
+    buffer.timer.start.assert_called_once()  # single pending update
+
+    buffer.handle_update()
+    buffer.window.controller.ctx.update.assert_called_once_with(reload=True, all=False)
+
+
+def test_flush_failed_kept_for_retry(buffer):
+    """Test failed writes are logged and written in next flush, newer state is kept"""
+    provider = buffer.window.core.ctx.provider
+    provider.update_items.side_effect = [Exception("db locked"), None]
+    provider.save.side_effect = [Exception("db locked"), None]
+    buffer.begin()
+    first = make_item(1)
+    buffer.update_item(first)
+    buffer.save(1)
+    assert buffer.flush() == 0
+    buffer.window.core.debug.log.assert_called()
+    assert list(buffer.items.values()) == [first]
+    assert list(buffer.metas) == [1]
+
+    newer = make_item(1)
+    buffer.update_item(newer)
+    buffer.update_item(make_item(2))
+    buffer.end()
+    assert provider.update_items.call_args[0][0][0] is newer
+    assert provider.save.call_count == 2
+    assert not buffer.items and not buffer.metas
+
+
+def test_direct_write_drops_queued(buffer):
+    """Test write outside of run drops older queued write"""
+    buffer.window.core.ctx.provider.update_items.side_effect = Exception("db locked")
+    buffer.begin()
+    buffer.update_item(make_item(1))
+    buffer.end()
+    assert 1 in buffer.items
+    assert buffer.update_item(make_item(1)) is False
+    assert 1 not in buffer.items
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.23 15:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 import json
 import pytest
@@ -194,4 +194,21 @@ def test_append(reply_instance):
     # The original results should be added to the stack and then cleared.
     assert fake_ctx.results == []
     assert reply.reply_stack[-1] == [{"result": "append"}]
-    assert reply.reply_ctx == fake_ctx
\ No newline at end of file
+    assert reply.reply_ctx == fake_ctx
+# Test flush is delayed until all async command workers are released.
+def test_wait_release(reply_instance):
+    reply, window = reply_instance
+    reply.set_calls([{"cmd": "a"}, {"cmd": "b"}])
+    reply.wait()
+    reply.wait()
+    fake_ctx = create_fake_ctx(pid=4, results=[{"request": {"cmd": "b"}, "result": "b"}])
+    context = BridgeContext()
+    context.ctx = fake_ctx
+    reply.add(context, extra={"flush": True})
+    window.dispatch.assert_not_called()
+    reply.release()
+    window.dispatch.assert_not_called()
+    reply.release()
+    assert window.dispatch.call_count == 2
+    assert reply.reply_stack == []
+    assert reply.pending == 0
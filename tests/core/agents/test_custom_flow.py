@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+
+from pygpt_net.core.agents.custom.schema import parse_schema
+from pygpt_net.core.agents.custom.graph import build_graph
+from pygpt_net.core.agents.custom.memory import MemoryManager
+from pygpt_net.core.agents.custom.join import BranchOutput, reduce_outputs
+
+
+def port(out=None, inp=None):
+    return {"in": list(inp or []), "out": list(out or [])}
+
+
+def fan_out_schema():
+    return [
+        {"type": "start", "id": "start", "slots": {"output": port(["parallel_1"]), "concurrency": "2"}},
+        {"type": "parallel", "id": "parallel_1", "slots": {
+            "input": port(inp=["start"]), "output": port(["agent_1", "agent_2"])}},
+        {"type": "agent", "id": "agent_1", "slots": {
+            "name": "A", "input": port(inp=["parallel_1"]), "output": port(["join_1"])}},
+        {"type": "agent", "id": "agent_2", "slots": {
+            "name": "B", "input": port(inp=["parallel_1"]), "output": port(["agent_3"])}},
+        {"type": "agent", "id": "agent_3", "slots": {
+            "name": "C", "input": port(inp=["agent_2"]), "output": port(["join_1"])}},
+        {"type": "join", "id": "join_1", "slots": {
+            "reducer": "json", "input": port(inp=["agent_1", "agent_3"]), "output": port(["end"])}},
+        {"type": "end", "id": "end", "slots": {"input": port(inp=["join_1"])}},
+    ]
+
+
+def test_parse_schema_parallel_join():
+    fs = parse_schema(fan_out_schema())
+    assert list(fs.parallels) == ["parallel_1"]
+    assert fs.parallels["parallel_1"].outputs == ["agent_1", "agent_2"]
+    assert fs.joins["join_1"].reducer == "json"
+    assert fs.joins["join_1"].outputs == ["end"]
+    assert fs.starts["start"].concurrency == 2
+
+
+def test_graph_find_join_and_concurrency():
+    g = build_graph(parse_schema(fan_out_schema()))
+    assert g.get_next("parallel_1") == ["agent_1", "agent_2"]
+    assert g.find_join("parallel_1") == "join_1"
+    assert g.find_join("join_1") is None
+    assert g.get_concurrency() == 2
+
+
+def test_memory_fork_merge():
+    mem = MemoryManager()
+    mem.set("mem_1", [{"role": "user", "content": "base"}], "r0")
+    mem.get("mem_2")
+
+    branch_a = mem.fork()
+    branch_b = mem.fork()
+    state = branch_a.get("mem_1")
+    assert state.items == [{"role": "user", "content": "base"}]
+    state.set_from(state.items + [{"role": "assistant", "content": "a"}], "r1")
+    branch_b.get("mem_2")  # read only
+
+    # parent is not modified until merge
+    assert len(mem.get("mem_1").items) == 1
+
+    mem.merge(branch_a)
+    mem.merge(branch_b)
+    assert len(mem.get("mem_1").items) == 2
+    assert mem.get("mem_1").last_response_id == "r1"
+    assert mem.get("mem_2").items == []
+
+
+def test_reduce_outputs():
+    outputs = [
+        BranchOutput(node_id="agent_1", name="A", content="aaa", duration=2.0),
+        BranchOutput(node_id="agent_2", name="B", content="b", duration=1.0),
+    ]
+    assert reduce_outputs(outputs, "concat") == "### A\n\naaa\n\n### B\n\nb"
+    assert '"agent": "B"' in reduce_outputs(outputs, "json")
+    assert reduce_outputs(outputs, "first") == "b"
+    assert reduce_outputs(outputs, "longest") == "aaa"
+    assert reduce_outputs(outputs, "unknown") == reduce_outputs(outputs, "concat")
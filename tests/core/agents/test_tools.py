@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.21 07:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import json
@@ -23,17 +23,19 @@ def fake_window():
     # Setup idx services.
     window.core.idx = MagicMock()
     window.core.idx.llm = MagicMock()
-    window.core.idx.llm.get_service_context.return_value = ("llm_service", "embed_service")
-    def storage_get(idx, llm, embed):
+    def get_index(idx, model):
         if idx == "valid":
             fake_index = MagicMock()
             fake_query_engine = MagicMock()
             fake_query_engine.query = lambda q: "fake query result"
             fake_index.as_query_engine = lambda similarity_top_k: fake_query_engine
-            return fake_index
-        return None
-    window.core.idx.storage = MagicMock()
-    window.core.idx.storage.get.side_effect = storage_get
+            return fake_index, "llm_service"
+        return None, "llm_service"
+    def get_query_engine(idx, index, llm=None, similarity_top_k=None):
+        return index.as_query_engine(similarity_top_k=similarity_top_k)
+    window.core.idx.chat = MagicMock()
+    window.core.idx.chat.get_index.side_effect = get_index
+    window.core.idx.chat.get_query_engine.side_effect = get_query_engine
 
     # Setup command functions.
     window.core.command = MagicMock()
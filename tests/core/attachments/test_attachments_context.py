@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.05 18:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import os
@@ -103,10 +103,12 @@ def test_query_context(mock_window):
             mock_file.read = MagicMock(return_value="test_text")
             mock_window.core.idx.chat.query_attachment = MagicMock(return_value="test_text")
             context = Context(mock_window)
-            context.index_attachment = MagicMock(return_value=["doc_uuid"])
+            mock_window.core.idx.indexing.index_attachments = MagicMock(return_value=[["doc_uuid"]])
             result = context.query_context(ctx, history)
             assert result == "test_text"
-            assert context.index_attachment.called_once()
+            mock_window.core.idx.indexing.index_attachments.assert_called_once()
+            assert meta.additional_ctx[0]["indexed"] is True
+            assert meta.additional_ctx[0]["doc_ids"] == ["doc_uuid"]
             assert mock_window.core.ctx.replace.called_once()
             assert mock_window.core.ctx.save.called_once()
 
@@ -188,6 +190,34 @@ def test_upload(mock_window):
             assert result["indexed"] == False
 
 
+def test_upload_auto_index_batch(mock_window):
+    """Test auto indexed uploads are indexed in one batch"""
+    meta = CtxMeta()
+    results = []
+    with patch("os.makedirs", return_value=True), \
+            patch('os.path.getsize', return_value=123):
+        with patch('builtins.open', mock_open()):
+            mock_window.core.tokens.from_str = MagicMock(return_value=4321)
+            context = Context(mock_window)
+            context.store_content = MagicMock(return_value=("test_src", []))
+            context.read_content = MagicMock(return_value=("test_content", []))
+            for i in range(3):
+                attachment = attachment_mod.AttachmentItem()
+                attachment.path = "test_path_{}".format(i)
+                results.append(context.upload(meta, attachment, "prompt", auto_index=True))
+            assert all(not r["indexed"] for r in results)  # not indexed until batch
+            mock_window.core.idx.indexing.index_attachments = MagicMock(
+                return_value=[["doc_0"], None, ["doc_2"]]
+            )
+            assert context.index_pending() == 2
+            mock_window.core.idx.indexing.index_attachments.assert_called_once()
+            assert len(mock_window.core.idx.indexing.index_attachments.call_args[0][0]) == 3
+            assert results[0]["indexed"] is True
+            assert results[0]["doc_ids"] == ["doc_0"]
+            assert results[1]["indexed"] is False  # failed, indexed on query
+            assert context.pending == []
+
+
 def test_read_content(mock_window):
     """Test read_content"""
     attachment = attachment_mod.AttachmentItem()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+from pygpt_net.core.audio.backend.shared.ring import (
+    LatencyMeter,
+    PcmRingBuffer,
+    PacketBatcher,
+    get_latency_meter,
+    get_latency_stats,
+)
+
+
+def test_ring_write_read_wraparound():
+    """Test ring buffer wraparound"""
+    ring = PcmRingBuffer(capacity=8, frame_bytes=2)
+    assert ring.write(b"abcdef") == 6
+    assert ring.read(4) == b"abcd"
+    ring.write(b"ghij")  # wraps around the end
+    assert len(ring) == 6
+    assert ring.capacity == 8
+    assert ring.peek() == b"efghij"
+    assert ring.read() == b"efghij"
+    assert len(ring) == 0
+
+
+def test_ring_grow_and_frame_alignment():
+    """Test ring buffer growth and frame-aligned reads"""
+    ring = PcmRingBuffer(capacity=4, frame_bytes=2)
+    ring.write(b"abc")
+    ring.write(b"defghij")
+    assert ring.capacity >= 10
+    assert ring.read(5) == b"abcd"  # aligned down to frame size
+    assert ring.consume(2) == 2
+    assert ring.read() == b"ghij"
+    ring.write(b"xy")
+    ring.clear()
+    assert len(ring) == 0
+    assert ring.read() == b""
+
+
+def test_ring_latency_marks():
+    """Test latency samples on read"""
+    meter = LatencyMeter("test")
+    ring = PcmRingBuffer(capacity=16, frame_bytes=2, meter=meter)
+    ring.write(b"aaaa", ts=0.0)
+    ring.write(b"bbbb", ts=0.0)
+    ring.read(4)
+    assert meter.get_stats()["count"] == 1
+    ring.read(2)
+    assert meter.get_stats()["count"] == 1  # second chunk not fully read
+    ring.read()
+    assert meter.get_stats()["count"] == 2
+
+
+def test_packet_batcher():
+    """Test fixed-size packets"""
+    batcher = PacketBatcher(packet_bytes=4, frame_bytes=2)
+    assert batcher.push(b"ab") == []
+    assert batcher.push(b"cdefghij") == [b"abcd", b"efgh"]
+    assert batcher.flush() == [b"ij"]
+    assert batcher.flush() == []
+
+
+def test_latency_meter_stats():
+    """Test latency meter stats"""
+    meter = get_latency_meter("test_meter")
+    assert get_latency_meter("test_meter") is meter
+    meter.reset()
+    assert meter.get_stats()["p50"] is None
+    for i in range(1, 101):
+        meter.add(i / 1000.0)
+    meter.add(-1.0)  # ignored
+    stats = get_latency_stats()["test_meter"]
+    assert stats["count"] == 100
+    assert stats["p50"] == 50.0
+    assert stats["p95"] == 95.0
+    assert stats["max"] == 100.0
+    assert stats["last"] == 100.0
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.04 00:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import importlib
@@ -94,7 +94,7 @@ def test_request_runs_worker_sync_when_mode_in_sync_modes(monkeypatch):
     worker = SimpleNamespace()
     worker.run = Mock()
     monkeypatch.setattr(mod.Bridge, "get_worker", lambda self: worker)
-    monkeypatch.setattr(mod.Bridge, "apply_rate_limit", lambda self: None)
+    monkeypatch.setattr(mod.Bridge, "apply_rate_limit", lambda self, context=None: None)
     res = b.request(ctx, extra={"a": 1})
     assert res is True
     worker.run.assert_called_once()
@@ -107,7 +107,7 @@ def test_request_starts_worker_async_when_mode_not_in_sync_modes(monkeypatch):
     worker = SimpleNamespace()
     worker.run = Mock()
     monkeypatch.setattr(mod.Bridge, "get_worker", lambda self: worker)
-    monkeypatch.setattr(mod.Bridge, "apply_rate_limit", lambda self: None)
+    monkeypatch.setattr(mod.Bridge, "apply_rate_limit", lambda self, context=None: None)
     res = b.request(ctx, extra=None)
     assert res is True
     window.threadpool.start.assert_called_once_with(worker)
@@ -120,7 +120,7 @@ def test_request_agent_mode_uses_sub_mode_and_idx(monkeypatch):
     ctx = DummyContext(mode=mod.MODE_AGENT)
     worker = SimpleNamespace()
     monkeypatch.setattr(mod.Bridge, "get_worker", lambda self: worker)
-    monkeypatch.setattr(mod.Bridge, "apply_rate_limit", lambda self: None)
+    monkeypatch.setattr(mod.Bridge, "apply_rate_limit", lambda self, context=None: None)
     res = b.request(ctx)
     assert res is True
     assert ctx.parent_mode == mod.MODE_AGENT
@@ -138,7 +138,7 @@ def test_request_switches_model_when_not_supported(monkeypatch):
     b = Bridge(window)
     ctx = DummyContext(mode=mod.MODE_CHAT, model=fm)
     monkeypatch.setattr(mod.Bridge, "get_worker", lambda self: SimpleNamespace(run=Mock()))
-    monkeypatch.setattr(mod.Bridge, "apply_rate_limit", lambda self: None)
+    monkeypatch.setattr(mod.Bridge, "apply_rate_limit", lambda self, context=None: None)
     res = b.request(ctx)
     assert res is True
     assert ctx.idx is None
@@ -227,31 +227,29 @@ def test_get_worker_connects_signals(monkeypatch):
     w = b.get_worker()
     assert w.window is window
 
-def test_apply_rate_limit_no_limit(monkeypatch):
+def test_apply_rate_limit_no_limit():
     window = make_window()
-    window.core.config.has = Mock(return_value=False)
+    window.core.config.has = Mock(return_value=True)
+    window.core.config.get = Mock(return_value=0)
+    window.core.limiter = SimpleNamespace(wait=Mock())
     b = Bridge(window)
-    b.last_call = None
-    called = []
-    monkeypatch.setattr(mod.time, "sleep", Mock(side_effect=lambda s: called.append(s)))
-    b.apply_rate_limit()
-    assert called == []
-    assert b.last_call is not None
+    b.apply_rate_limit(DummyContext())
+    window.core.limiter.wait.assert_not_called()
 
-def test_apply_rate_limit_with_sleep(monkeypatch):
+def test_apply_rate_limit_with_wait():
     window = make_window()
     window.core.config.has = Mock(return_value=True)
-    window.core.config.get = Mock(return_value="30")
+    window.core.config.get = Mock(side_effect=lambda key: {"max_requests_limit": "30"}.get(key))
+    window.core.limiter = SimpleNamespace(
+        wait=Mock(return_value=0.5),
+        get_key=Mock(side_effect=lambda provider, model=None: "{}/{}".format(provider or "default", model or "*")),
+    )
+    model = SimpleNamespace(provider="openai", id="gpt-4o")
     b = Bridge(window)
-    now = mod.datetime.now()
-    interval = mod.timedelta(minutes=1) / 30
-    extra = mod.timedelta(seconds=0.5)
-    b.last_call = now - interval + extra
-    sleep_mock = Mock()
-    monkeypatch.setattr(mod.time, "sleep", sleep_mock)
-    window.core.debug.debug = Mock()
-    b.apply_rate_limit()
-    assert sleep_mock.call_count == 1
-    sleep_arg = sleep_mock.call_args[0][0]
-    assert sleep_arg == pytest.approx(extra.total_seconds(), rel=1e-3)
-    window.core.debug.debug.assert_called()
\ No newline at end of file
+    b.apply_rate_limit(DummyContext(model=model))
+    window.core.limiter.wait.assert_called_once()
+    kwargs = window.core.limiter.wait.call_args.kwargs
+    assert kwargs["key"] == "openai/gpt-4o"
+    assert kwargs["rpm"] == 30
+    assert kwargs["tpm"] == 0
+    assert kwargs["burst"] == 1
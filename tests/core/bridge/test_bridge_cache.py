@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.19 00:00:00                  #
+# ================================================== #
+
+import time
+from unittest.mock import MagicMock
+
+from tests.mocks import mock_window
+from pygpt_net.core.bridge.cache import Cache
+from pygpt_net.core.bridge.context import BridgeContext
+from pygpt_net.item.model import ModelItem
+
+
+def make_context(prompt: str = "hello", **kwargs) -> BridgeContext:
+    model = ModelItem()
+    model.id = "gpt-4o"
+    return BridgeContext(
+        prompt=prompt,
+        system_prompt="sys",
+        model=model,
+        **kwargs
+    )
+
+
+def test_disabled(mock_window):
+    """Test cache disabled by default"""
+    cache = Cache(mock_window)
+    mock_window.core.config.data['bridge.cache'] = False
+    assert cache.get_keys(make_context()) is None
+
+
+def test_exact_hit(mock_window):
+    """Test exact match"""
+    cache = Cache(mock_window)
+    mock_window.core.config.data['bridge.cache'] = True
+    mock_window.core.config.data['bridge.cache.semantic'] = False
+    context = make_context()
+    keys = cache.get_keys(context)
+    assert cache.get(keys, context) is None
+    cache.set(keys, context, "world")
+    assert cache.get(cache.get_keys(make_context()), context) == "world"
+    assert cache.get(cache.get_keys(make_context("other")), context) is None
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["stored"] == 1
+
+
+def test_bypass_and_ttl(mock_window):
+    """Test per-call bypass and TTL, full requests bypass"""
+    cache = Cache(mock_window)
+    mock_window.core.config.data['bridge.cache'] = True
+    mock_window.core.config.data['bridge.cache.semantic'] = False
+    assert cache.get_keys(make_context(cache_bypass=True)) is None
+    assert cache.get_keys(make_context(request=True)) is None
+    assert cache.get_stats()["bypass"] == 2
+    context = make_context(cache_ttl=0)
+    cache.set(cache.get_keys(context), context, "world")
+    assert len(cache.items) == 0
+    mock_window.core.config.data['bridge.cache.ttl'] = 0
+    context = make_context()
+    cache.set(cache.get_keys(context), context, "world")
+    assert len(cache.items) == 0
+    context = make_context(cache_ttl=86400)
+    cache.set(cache.get_keys(context), context, "world")
+    assert len(cache.items) == 1
+    assert list(cache.items.values())[0]["expires"] > time.time() + 3600
+
+
+def test_clear(mock_window):
+    """Test clear drops responses and embeddings model"""
+    cache = Cache(mock_window)
+    mock_window.core.config.data['bridge.cache'] = True
+    mock_window.core.config.data['bridge.cache.semantic'] = False
+    context = make_context()
+    cache.set(cache.get_keys(context), context, "world")
+    cache.embed_model = MagicMock()
+    cache.clear()
+    assert len(cache.items) == 0
+    assert cache.embed_model is None
+
+
+def test_max_items(mock_window):
+    """Test LRU eviction"""
+    cache = Cache(mock_window)
+    mock_window.core.config.data['bridge.cache'] = True
+    mock_window.core.config.data['bridge.cache.semantic'] = False
+    mock_window.core.config.data['bridge.cache.max_items'] = 2
+    for i in range(3):
+        context = make_context("p" + str(i))
+        cache.set(cache.get_keys(context), context, "out" + str(i))
+    assert len(cache.items) == 2
+    assert cache.get_stats()["evicted"] == 1
+    context = make_context("p0")
+    assert cache.get(cache.get_keys(context), context) is None
+
+
+def test_semantic_hit(mock_window):
+    """Test semantic match"""
+    cache = Cache(mock_window)
+    mock_window.core.config.data['bridge.cache'] = True
+    mock_window.core.config.data['bridge.cache.semantic'] = True
+    mock_window.core.config.data['bridge.cache.semantic.threshold'] = 0.9
+    vectors = {
+        "what is python": [1.0, 0.0, 0.1],
+        "what's python": [1.0, 0.0, 0.12],
+        "weather today": [0.0, 1.0, 0.0],
+    }
+    embed_model = MagicMock()
+    embed_model.get_text_embedding.side_effect = lambda text: vectors[text]
+    cache.embed_model = embed_model
+
+    context = make_context("what is python")
+    cache.set(cache.get_keys(context), context, "a language")
+    context = make_context("what's python")
+    assert cache.get(cache.get_keys(context), context) == "a language"
+    context = make_context("weather today")
+    assert cache.get(cache.get_keys(context), context) is None
+    assert cache.get_stats()["semantic_hits"] == 1
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.01.03 19:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 import os
@@ -16,10 +16,10 @@ from tests.mocks import mock_window
 from pygpt_net.core.camera import Camera
 
 
-def test_install(mock_window):
+def test_install(mock_window, monkeypatch):
     """Test install"""
     camera = Camera(mock_window)
-    os.path.exists = MagicMock(return_value=False)
-    os.makedirs = MagicMock()
+    monkeypatch.setattr(os.path, "exists", MagicMock(return_value=False))
+    monkeypatch.setattr(os, "makedirs", MagicMock())
     camera.install()
     os.makedirs.assert_called()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+
+import os
+import sys
+import time
+
+import pytest
+
+from pygpt_net.core.command.process import OutputBuffer, StreamProcess
+
+
+def python_cmd(code: str) -> list:
+    return [sys.executable, "-c", code]
+
+
+def test_output_buffer_unlimited():
+    """Test buffer without limit keeps everything"""
+    buffer = OutputBuffer(0)
+    buffer.write("abc")
+    buffer.write("def")
+    assert buffer.get() == "abcdef"
+    assert buffer.truncated == 0
+    assert len(buffer) == 6
+
+
+def test_output_buffer_head_tail():
+    """Test buffer keeps head and tail of large output"""
+    buffer = OutputBuffer(10)
+    for i in range(100):
+        buffer.write(str(i % 10))
+    text = buffer.get()
+    assert text.startswith("01234")
+    assert text.endswith("56789")
+    assert "[90 chars truncated]" in text
+    assert len(buffer) == 100
+
+
+def test_stream_process_output():
+    """Test stdout/stderr are streamed to callback and collected"""
+    chunks = []
+    process = StreamProcess(
+        python_cmd("import sys; print('out'); sys.stderr.write('err')"),
+        on_output=lambda text, type: chunks.append((type, text)),
+        shell=False,
+    ).run()
+    assert process.returncode == 0
+    assert process.stdout.get().strip() == "out"
+    assert process.stderr.get() == "err"
+    assert ("stderr", "err") in chunks
+    assert process.get_status() is None
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX process group")
+def test_stream_process_timeout():
+    """Test process is killed after timeout"""
+    start = time.monotonic()
+    process = StreamProcess(
+        python_cmd("import time; print('start', flush=True); time.sleep(30)"),
+        timeout=1,
+        shell=False,
+    ).run()
+    assert time.monotonic() - start < 10
+    assert process.timed_out is True
+    assert process.stdout.get().strip() == "start"
+    assert "timeout" in process.get_status()
+
+
+def test_stream_process_max_output():
+    """Test process is killed when output limit is exceeded"""
+    process = StreamProcess(
+        python_cmd("while True: print('x' * 1000)"),
+        max_output=100_000,
+        keep=1000,
+        shell=False,
+    ).run()
+    assert process.size_exceeded is True
+    assert len(process.stdout.get()) < 1100
+    assert "output exceeded" in process.get_status()
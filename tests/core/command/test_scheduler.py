@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+
+import threading
+import time
+
+from pygpt_net.core.command.scheduler import Scheduler, sort_results
+
+
+def is_write(call: dict) -> bool:
+    return call["cmd"] == "write"
+
+
+def test_get_stages():
+    """Test side-effecting calls split independent calls into stages"""
+    calls = [
+        {"cmd": "read"},
+        {"cmd": "read"},
+        {"cmd": "write"},
+        {"cmd": "read"},
+        {"cmd": "write"},
+        {"cmd": "write"},
+    ]
+    assert Scheduler.get_stages(calls, is_write) == [[0, 1], [2], [3], [4], [5]]
+    assert Scheduler.get_stages(calls) == [[0, 1, 2, 3, 4, 5]]
+    assert Scheduler.get_stages([], is_write) == []
+
+
+def test_run_parallel_keeps_call_order():
+    """Test independent calls run concurrently and results are in call order"""
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def handler(call: dict) -> str:
+        with lock:
+            active.append(1)
+            peak.append(len(active))
+        time.sleep(call["delay"])
+        with lock:
+            active.pop()
+        return call["id"]
+
+    calls = [{"cmd": "read", "id": i, "delay": 0.05 - i * 0.01} for i in range(4)]
+    results = Scheduler(max_workers=4).run(calls, handler)
+    assert results == [0, 1, 2, 3]
+    assert max(peak) > 1
+
+
+def test_run_side_effect_barrier():
+    """Test side-effecting call runs after previous and before next calls"""
+    log = []
+    lock = threading.Lock()
+
+    def handler(call: dict) -> str:
+        with lock:
+            log.append(("start", call["id"]))
+        time.sleep(0.01)
+        with lock:
+            log.append(("end", call["id"]))
+        return call["id"]
+
+    calls = [
+        {"cmd": "read", "id": "a"},
+        {"cmd": "read", "id": "b"},
+        {"cmd": "write", "id": "w"},
+        {"cmd": "read", "id": "c"},
+    ]
+    results = Scheduler(max_workers=4).run(calls, handler, side_effect=is_write)
+    assert results == ["a", "b", "w", "c"]
+    start_w = log.index(("start", "w"))
+    end_w = log.index(("end", "w"))
+    assert log.index(("end", "a")) < start_w
+    assert log.index(("end", "b")) < start_w
+    assert log.index(("start", "c")) > end_w
+
+
+def test_run_stopped():
+    """Test next stages are skipped when stopped"""
+    done = []
+
+    def handler(call: dict) -> str:
+        done.append(call["id"])
+        return call["id"]
+
+    calls = [{"cmd": "write", "id": 1}, {"cmd": "write", "id": 2}]
+    results = Scheduler().run(calls, handler, side_effect=is_write, stopped=lambda: len(done) > 0)
+    assert results == [1, None]
+
+
+def test_sort_results():
+    """Test results from many plugins are sorted in call order"""
+    calls = [
+        {"cmd": "web_search"},
+        {"cmd": "read_file"},
+        {"cmd": "web_search"},
+    ]
+    results = [
+        {"request": {"cmd": "read_file"}, "result": "file"},
+        {"request": {"cmd": "other"}, "result": "other"},
+        {"request": {"cmd": "web_search"}, "result": "search 1"},
+        {"request": {"cmd": "web_search"}, "result": "search 2"},
+    ]
+    assert [r["result"] for r in sort_results(calls, results)] == [
+        "search 1",
+        "file",
+        "search 2",
+        "other",
+    ]
@@ -6,13 +6,14 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.09.05 18:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 from unittest.mock import MagicMock, patch
 
 from tests.mocks import mock_window_conf
 from pygpt_net.core.ctx import Ctx
+from pygpt_net.core.prompt.prefix import Prefix
 from pygpt_net.item.ctx import CtxItem, CtxMeta
 
 
@@ -687,6 +688,42 @@ def test_count_prompt_items():
     assert ctx.count_prompt_items('test_model', 'test_mode', 100, 1000) == (0, 0)
 
 
+def test_count_prompt_items_aligned():
+    """
+    Test count_prompt_items matches history aligned for prompt caching
+    """
+    ctx = Ctx()
+    ctx.window = MagicMock()
+    config = {"prompt.cache": True, "prompt.cache.history_step": 4}
+    ctx.window.core.config.get.side_effect = lambda key, default=None: config.get(key, default)
+    ctx.window.core.prompt.prefix = Prefix(ctx.window)
+    ctx.window.core.tokens.from_ctx = MagicMock(return_value=100)
+    model = MagicMock(provider="openai")
+    ctx.window.core.models.has.return_value = True
+    ctx.window.core.models.get.return_value = model
+
+    items = [CtxItem() for _ in range(10)]
+    container = MagicMock()
+    container.get_items = MagicMock(return_value=items)
+    ctx.container = container
+
+    # 6 items fit, 4 skipped: aligned, nothing dropped
+    assert ctx.count_prompt_items('test_model', 'test_mode', 100, 700) == (6, 600)
+    # 7 items fit, 3 skipped: 1 more dropped to step boundary
+    assert ctx.count_prompt_items('test_model', 'test_mode', 100, 800) == (6, 600)
+    history = ctx.get_history(items + [CtxItem()], 'test_model', 'test_mode', 100, 800)
+    assert len(history) == 6
+
+    # provider without prefix caching: all fitting items are kept
+    model.provider = "ollama"
+    assert ctx.count_prompt_items('test_model', 'test_mode', 100, 800) == (7, 700)
+    assert len(ctx.get_history(items + [CtxItem()], 'test_model', 'test_mode', 100, 800)) == 7
+
+    model.provider = "openai"
+    config["prompt.cache"] = False
+    assert ctx.count_prompt_items('test_model', 'test_mode', 100, 800) == (7, 700)
+
+
 def test_get_prompt_items():
     """
     Test get_prompt_items
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+
+
+from unittest.mock import MagicMock
+
+from pygpt_net.core.ctx.prefetch import Prefetch
+from pygpt_net.item.ctx import CtxItem, CtxMeta
+
+
+def make_prefetch(config: dict = None):
+    window = MagicMock()
+    data = {
+        "ctx.prefetch": True,
+        "ctx.prefetch.size": 2,
+    }
+    data.update(config or {})
+    window.core.config.get.side_effect = lambda key, default=None: data.get(key, default)
+    metas = {}
+    for i in range(1, 6):
+        meta = CtxMeta(i)
+        meta.updated = 100
+        metas[i] = meta
+    metas[5].important = True
+    window.core.ctx.meta = metas
+    window.core.ctx.get_meta_by_id.side_effect = lambda id: metas.get(id)
+    window.core.ctx.load.side_effect = lambda id: [CtxItem(), CtxItem()]
+    window.core.ctx.get_current.return_value = 2
+    window.core.ctx.get_next.return_value = 3
+    window.core.ctx.get_prev.return_value = 1
+    renderer = MagicMock()
+    renderer.build_context_payload.return_value = '{"nodes":[]}'
+    window.controller.chat.render.instance.return_value = renderer
+    return Prefetch(window), metas
+
+
+def test_get_ids():
+    """Test neighbors first, then pinned contexts, limited by cache size"""
+    prefetch, metas = make_prefetch({"ctx.prefetch.size": 3})
+    assert prefetch.get_ids(2) == [3, 1, 5]
+    prefetch, metas = make_prefetch()
+    assert prefetch.get_ids(2) == [3, 1]
+
+
+def test_schedule_and_take():
+    """Test prefetched items and payload are used on selection"""
+    prefetch, metas = make_prefetch()
+    prefetch.schedule(2)
+    worker = prefetch.window.threadpool.start.call_args[0][0]
+    assert worker.args[0] == [3, 1]
+    prefetch.prefetch(*worker.args)
+    assert list(prefetch.cache.keys()) == [3, 1]
+    assert prefetch.running == set()
+
+    items = prefetch.take(3)
+    assert len(items) == 2
+    assert prefetch.get_payload(metas[3], items) == '{"nodes":[]}'
+    assert prefetch.get_payload(metas[3], items) is None  # used once
+    assert 3 not in prefetch.cache
+    assert prefetch.hits == 1
+
+
+def test_take_stale():
+    """Test entry is not used if context was updated after prefetch"""
+    prefetch, metas = make_prefetch()
+    prefetch.prefetch([1], None, ())
+    metas[1].updated = 200
+    assert prefetch.take(1) is None
+    assert prefetch.misses == 1
+
+
+def test_payload_items_changed():
+    """Test payload is not used if items were changed after selection"""
+    prefetch, metas = make_prefetch()
+    prefetch.prefetch([1], prefetch.window.controller.chat.render.instance(), prefetch.get_signature())
+    items = prefetch.take(1)
+    items.append(CtxItem())
+    assert prefetch.get_payload(metas[1], items) is None
+
+
+def test_dropped_during_prefetch():
+    """Test result is discarded if context was invalidated while loading"""
+    prefetch, metas = make_prefetch()
+    prefetch.running.add(1)
+    prefetch.invalidate(1)
+    prefetch.put(1, {"id": 1})
+    assert 1 not in prefetch.cache
+
+
+def test_cache_size():
+    """Test oldest entries are evicted"""
+    prefetch, metas = make_prefetch()
+    prefetch.prefetch([1, 3, 4], None, ())
+    assert list(prefetch.cache.keys()) == [3, 4]
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.19 00:00:00                  #
+# ================================================== #
+
+
+from unittest.mock import MagicMock
+
+from pygpt_net.core.ctx.summary import Summary
+from pygpt_net.item.ctx import CtxItem, CtxMeta
+from pygpt_net.item.model import ModelItem
+
+
+def make_summary(config: dict = None):
+    window = MagicMock()
+    data = {
+        "ctx.summary": True,
+        "ctx.summary.threshold": 50,
+        "ctx.summary.keep": 2,
+    }
+    data.update(config or {})
+    window.core.config.get.side_effect = lambda key, default=None: data.get(key, default)
+    window.core.tokens.from_ctx.return_value = 100
+    window.core.prompt.get.side_effect = lambda key: "{summary}|{history}" if key == "ctx.summary.user" else key
+    window.core.models.from_defaults.return_value = ModelItem()
+    window.core.models.has.return_value = False
+    meta = CtxMeta(1)
+    window.core.ctx.get_meta_by_id.return_value = meta
+    return Summary(window), meta
+
+
+def make_items(n: int) -> list:
+    items = []
+    for i in range(n):
+        item = CtxItem()
+        item.id = i + 1
+        item.meta_id = 1
+        item.input = "question {}".format(i + 1)
+        item.output = "answer {}".format(i + 1)
+        items.append(item)
+    return items
+
+
+def test_compact_below_threshold():
+    """Test short thread uses regular history"""
+    summary, meta = make_summary()
+    items = make_items(5)  # 4 history items = 400 tokens
+    assert summary.compact(items, "gpt-4o", "chat", 0, 1000) is None
+    summary.window.threadpool.start.assert_not_called()
+
+
+def test_compact_schedules_first_summary():
+    """Test summary update is scheduled when threshold is exceeded"""
+    summary, meta = make_summary()
+    items = make_items(9)  # 8 history items = 800 tokens
+    assert summary.compact(items, "gpt-4o", "chat", 0, 1000) is None  # no summary yet
+    summary.window.threadpool.start.assert_called_once()
+    assert meta.id in summary.running
+
+
+def test_compact_summary_and_recent():
+    """Test prompt is built from summary and items not folded yet"""
+    summary, meta = make_summary()
+    meta.summary = {"text": "earlier topics", "until": 6}
+    items = make_items(9)
+    result = summary.compact(items, "gpt-4o", "chat", 0, 1000)
+    assert result[0].output == "earlier topics"
+    assert result[0].extra["summary"] is True
+    assert [item.id for item in result[1:]] == [7, 8]
+    assert meta.summary["prompts"] == 1
+    assert meta.summary["saved"] == 800 - 300
+    summary.window.core.ctx.get_provider().update_meta_summary_by_id.assert_not_called()  # stored with summary
+
+    summary.compact(items, "gpt-4o", "chat", 0, 1000)  # same turn, history built again
+    assert meta.summary["prompts"] == 1
+    assert meta.summary["saved"] == 800 - 300
+    summary.compact(items + make_items(1), "gpt-4o", "chat", 0, 1000)  # next turn
+    assert meta.summary["prompts"] == 2
+
+
+def test_update():
+    """Test summary update folds items incrementally"""
+    summary, meta = make_summary()
+    meta.summary = {"text": "old", "until": 2, "folded": 2}
+    summary.running.add(meta.id)
+
+    def call(context, extra):
+        assert context.prompt.startswith("old|User: question 3")
+        return " new summary "
+
+    summary.window.core.bridge.call.side_effect = call
+    assert summary.update(meta, make_items(5)[2:4], "old") is True
+    assert meta.summary["text"] == "new summary"
+    assert meta.summary["until"] == 4
+    assert meta.summary["folded"] == 4
+    assert meta.id not in summary.running
+    summary.window.core.ctx.get_provider().update_meta_summary_by_id.assert_called_once_with(1, meta)
+    summary.window.dispatch.assert_not_called()
+
+
+def test_update_failed():
+    """Test failed summary update is not stored"""
+    summary, meta = make_summary()
+    summary.running.add(meta.id)
+    summary.window.core.bridge.call.return_value = ""
+    assert summary.update(meta, make_items(3), "") is False
+    assert meta.id not in summary.running
+    summary.window.core.ctx.get_provider().update_meta_summary_by_id.assert_not_called()
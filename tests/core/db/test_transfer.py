@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.19 00:00:00                  #
+# ================================================== #
+
+
+import json
+import os
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine, text
+
+import pygpt_net.core.db.transfer as transfer_module
+from pygpt_net.core.db.transfer import Transfer, ChunkWriter, read_archive
+
+
+@pytest.mark.parametrize("compression", ["gzip", "none"])
+def test_chunks_roundtrip(tmp_path, compression):
+    """Test write chunks and read records across chunks"""
+    path = str(tmp_path / "ctx.pgx")
+    writer = ChunkWriter(path, compression)
+    writer.add({"type": "header", "format": Transfer.FORMAT})
+    offset = writer.flush()
+    writer.add({"type": "ctx_meta", "row": {"id": 1, "name": "zażółć"}})
+    writer.flush()
+    writer.close()
+    assert offset > 0
+    records = list(read_archive(path))
+    assert records[0]["type"] == "header"
+    assert records[1]["row"]["name"] == "zażółć"
+
+
+def test_chunk_writer_resume(tmp_path):
+    """Test continue writing at offset (data after offset is truncated)"""
+    path = str(tmp_path / "ctx.pgx")
+    writer = ChunkWriter(path, "gzip")
+    writer.add({"type": "header"})
+    offset = writer.flush()
+    writer.add({"type": "ctx_meta", "row": {"id": 1}})  # interrupted chunk
+    writer.flush()
+    writer.close()
+    writer = ChunkWriter(path, "gzip", offset)
+    writer.add({"type": "ctx_meta", "row": {"id": 2}})
+    writer.flush()
+    writer.close()
+    records = list(read_archive(path))
+    assert [r.get("row", {}).get("id") for r in records] == [None, 2]
+
+
+def test_get_compression():
+    """Test compression method"""
+    transfer = Transfer(MagicMock())
+    assert transfer.get_compression("gzip") == "gzip"
+    assert transfer.get_compression(None) in ("zstd", "gzip")
+    with pytest.raises(ValueError):
+        transfer.get_compression("lzma")
+
+
+def test_import_not_archive(tmp_path):
+    """Test import of file which is not ctx archive"""
+    path = str(tmp_path / "other.jsonl")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"type": "other"}) + "\n")
+    database = MagicMock()
+    conn = database.get_db.return_value.connect.return_value.__enter__.return_value
+    conn.execute.return_value = []
+    transfer = Transfer(database)
+    with pytest.raises(ValueError):
+        transfer.import_ctx(path)
+    conn.commit.assert_not_called()
+
+
+def test_state(tmp_path):
+    """Test save and load export state"""
+    transfer = Transfer(MagicMock())
+    path = str(tmp_path / "ctx.pgx.state")
+    assert transfer.load_state(path) is None
+    transfer.save_state(path, {"last_meta_id": 5, "offset": 10})
+    assert transfer.load_state(path) == {"last_meta_id": 5, "offset": 10}
+    assert not os.path.exists(path + ".tmp")
+
+
+def test_import_resume_parents(tmp_path, monkeypatch):
+    """Test root and parent IDs after import interrupted after first commit and imported again"""
+    engine = create_engine("sqlite:///" + str(tmp_path / "db.sqlite"))
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE ctx_group (id INTEGER PRIMARY KEY, uuid TEXT, name TEXT)"))
+        conn.execute(text(
+            "CREATE TABLE ctx_meta (id INTEGER PRIMARY KEY, uuid TEXT, group_id INTEGER, "
+            "root_id INTEGER, parent_id INTEGER, name TEXT)"
+        ))
+        conn.execute(text("CREATE TABLE ctx_item (id INTEGER PRIMARY KEY, meta_id INTEGER, input TEXT)"))
+        conn.execute(text("CREATE TABLE idx_ctx (id INTEGER PRIMARY KEY, meta_id INTEGER, item_id INTEGER)"))
+        conn.execute(text("INSERT INTO ctx_meta (id, uuid, name) VALUES (1, 'other', 'other')"))
+
+    path = str(tmp_path / "ctx.pgx")
+    writer = ChunkWriter(path, "gzip")
+    writer.add({"type": "header", "format": Transfer.FORMAT, "version": Transfer.VERSION})
+    for id, uuid, root_id, parent_id in ((10, "a", 0, 0), (11, "b", 10, 10), (12, "c", 10, 11)):
+        writer.add({"type": "ctx_meta", "row": {
+            "id": id, "uuid": uuid, "group_id": 0, "root_id": root_id, "parent_id": parent_id, "name": uuid,
+        }})
+        writer.add({"type": "ctx_item", "row": {"id": id * 10, "meta_id": id, "input": uuid}})
+    writer.add({"type": "end"})
+    writer.flush()
+    writer.close()
+
+    def interrupted(path):
+        for record in read_archive(path):
+            if record["type"] == "ctx_item" and record["row"]["input"] == "c":
+                raise KeyboardInterrupt  # first batch (a, b) committed, c not
+            yield record
+
+    database = MagicMock()
+    database.get_db.return_value = engine
+    transfer = Transfer(database)
+    transfer.batch_size = 4  # meta + item rows
+    monkeypatch.setattr(transfer_module, "read_archive", interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        transfer.import_ctx(path)
+    monkeypatch.undo()
+    stats = transfer.import_ctx(path)
+    assert stats["metas"] == 1
+    assert stats["skipped"] == 2
+
+    with engine.connect() as conn:
+        rows = {row.uuid: row for row in conn.execute(text("SELECT * FROM ctx_meta"))}
+        items = conn.execute(text("SELECT meta_id, input FROM ctx_item ORDER BY id")).fetchall()
+    a, b, c = rows["a"].id, rows["b"].id, rows["c"].id
+    assert (rows["b"].root_id, rows["b"].parent_id) == (a, a)
+    assert (rows["c"].root_id, rows["c"].parent_id) == (a, b)
+    assert [tuple(row) for row in items] == [(a, "a"), (b, "b"), (c, "c")]
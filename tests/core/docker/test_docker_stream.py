@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.19 00:00:00                  #
+# ================================================== #
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from pygpt_net.core.docker.docker import Docker
+
+
+class FakeContainer:
+    """Fake container, streamed exec yields chunks and then blocks until killed"""
+
+    def __init__(self, chunks, hang: bool = True):
+        self.chunks = chunks
+        self.hang = hang
+        self.killed = threading.Event()
+        self.calls = []
+
+    def exec_run(self, cmd, **kwargs):
+        self.calls.append((cmd, kwargs))
+        if not kwargs.get("stream"):
+            self.killed.set()  # kill command
+            return SimpleNamespace(output=b"", exit_code=0)
+        return SimpleNamespace(output=self.stream())
+
+    def stream(self):
+        for chunk in self.chunks:
+            yield chunk
+        if self.hang:
+            self.killed.wait(5)
+
+
+def test_execute_stream():
+    """Test output chunks are streamed to callback"""
+    docker = Docker(MagicMock())
+    container = FakeContainer([(b"out", None), (None, b"err")], hang=False)
+    chunks = []
+    response = docker.execute_stream(container, "ls", lambda text, type: chunks.append((type, text)))
+    assert response == b""
+    assert chunks == [("stdout", "out"), ("stderr", "err")]
+    assert len(container.calls) == 1
+    assert "PYGPT_EXEC_ID" in container.calls[0][1]["environment"]
+
+
+def test_execute_stream_timeout():
+    """Test hung command is killed after timeout"""
+    docker = Docker(MagicMock())
+    container = FakeContainer([(b"started", None)])
+    chunks = []
+    response = docker.execute_stream(container, "sleep 100", lambda text, type: chunks.append(text), timeout=0.2)
+    assert response.startswith(b"Process killed: timeout")
+    assert chunks == ["started"]
+    assert container.killed.is_set()
+    exec_id = container.calls[0][1]["environment"]["PYGPT_EXEC_ID"]
+    assert container.calls[1][0][-1] == exec_id
+
+
+def test_execute_stream_max_output():
+    """Test command is killed when output exceeds limit"""
+    docker = Docker(MagicMock())
+    container = FakeContainer([(b"x" * 100, None)] * 5)
+    response = docker.execute_stream(container, "yes", lambda text, type: None, max_output=250)
+    assert response.startswith(b"Process killed: output exceeded")
+    assert container.killed.is_set()
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.01.03 19:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 import os
@@ -19,11 +19,11 @@ from tests.mocks import mock_window
 from pygpt_net.core.filesystem import Filesystem
 
 
-def test_install(mock_window):
+def test_install(mock_window, monkeypatch):
     """Test install"""
     filesystem = Filesystem(mock_window)
-    os.path.exists = MagicMock(return_value=False)
-    os.mkdir = MagicMock()
+    monkeypatch.setattr(os.path, "exists", MagicMock(return_value=False))
+    monkeypatch.setattr(os, "mkdir", MagicMock())
     filesystem.install()
     os.path.exists.assert_called()
     os.mkdir.assert_called()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.19 00:00:00                  #
+# ================================================== #
+
+from unittest.mock import MagicMock
+
+import pytest
+from llama_index.core.schema import NodeWithScore, TextNode
+
+from pygpt_net.core.idx.cache import Cache
+
+
+class FakeEmbedModel:
+    """Fake embeddings provider, counts calls"""
+    model_name = "fake"
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_agg_embedding_from_queries(self, queries):
+        self.calls += 1
+        return [0.10001 if "x" in q else 0.2 for q in queries] + [0.5]
+
+
+@pytest.fixture
+def cache():
+    window = MagicMock()
+    window.core.config.get.side_effect = lambda key, default=None: default
+    return Cache(window)
+
+
+def make_retriever():
+    retriever = MagicMock()
+    retriever.retrieve.return_value = [NodeWithScore(node=TextNode(text="doc"), score=0.9)]
+    return retriever
+
+
+def test_retrieve_cached_per_generation(cache):
+    """Test repeated query is served from cache until index generation changes"""
+    inner = make_retriever()
+    embed = FakeEmbedModel()
+    retriever = cache.wrap(inner, "base", 1, embed_model=embed, params={"similarity_top_k": 3})
+    assert retriever.retrieve("What is X?")[0].node.text == "doc"
+    assert retriever.retrieve("  what is   x? ")[0].score == 0.9  # normalized
+    assert inner.retrieve.call_count == 1
+    assert embed.calls == 1
+    assert cache.get_stats() == {"hits": 1, "misses": 1}
+
+    updated = cache.wrap(inner, "base", 2, embed_model=embed, params={"similarity_top_k": 3})
+    updated.retrieve("What is X?")
+    assert inner.retrieve.call_count == 2
+
+
+def test_retrieve_key_includes_params(cache):
+    """Test different top_k is not served from cache"""
+    inner = make_retriever()
+    cache.wrap(inner, "base", 1, params={"similarity_top_k": 3}).retrieve("q")
+    cache.wrap(inner, "base", 1, params={"similarity_top_k": 5}).retrieve("q")
+    assert inner.retrieve.call_count == 2
+
+
+def test_get_object_reused_until_generation_changes(cache):
+    """Test objects (indexes, query engines) are reused for the same generation"""
+    factory = MagicMock(side_effect=lambda: object())
+    first = cache.get_object("engine", "base", 1, "k", factory)
+    assert cache.get_object("engine", "base", 1, "k", factory) is first
+    assert cache.get_object("engine", "base", 2, "k", factory) is not first
+    assert factory.call_count == 2
+    assert len(cache.objects) == 1  # previous generation dropped
+
+
+def test_get_object_same_config(cache):
+    """Test models created again with the same config share key, expired objects are dropped"""
+    first = cache.get_object("index", "base", 1, cache.get_signature(FakeEmbedModel()), object)
+    second = cache.get_object("index", "base", 1, cache.get_signature(FakeEmbedModel()), object)
+    assert second is first
+
+    other = FakeEmbedModel()
+    other.model_name = "other"
+    assert cache.get_signature(other) != cache.get_signature(FakeEmbedModel())
+
+    cache.objects[("index", "base", "old")] = (1, 0, object())  # expired
+    cache.get_object("index", "base", 1, cache.get_signature(other), object)
+    assert ("index", "base", "old") not in cache.objects
+    assert len(cache.objects) == 2
+
+
+def test_disabled(cache):
+    """Test cache can be disabled"""
+    cache.window.core.config.get.side_effect = lambda key, default=None: False if key == "llama.idx.cache" else default
+    inner = make_retriever()
+    retriever = cache.wrap(inner, "base", 1)
+    retriever.retrieve("q")
+    retriever.retrieve("q")
+    assert inner.retrieve.call_count == 2
@@ -6,10 +6,10 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.07.22 22:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from pygpt_net.core.bridge.context import BridgeContext
 from pygpt_net.item.ctx import CtxItem
@@ -83,7 +83,6 @@ def test_query(mock_window):
     response.response = MagicMock(return_value="response")
     response.query = MagicMock(return_value=response)
     index = MagicMock()
-    index.as_query_engine = MagicMock(return_value=response)
     chat = Chat(mock_window)
     chat.get_custom_prompt = MagicMock(return_value=None)
     mock_window.core.config.set("llama.log", False)
@@ -105,10 +104,12 @@ def test_query(mock_window):
         stream=False,
     )
     extra = {}
-    chat.query(
-        context=bridge_context,
-        extra=extra,
-    )
+    with patch("pygpt_net.core.idx.chat.RetrieverQueryEngine") as engine_cls:
+        engine_cls.from_args.return_value = response
+        chat.query(
+            context=bridge_context,
+            extra=extra,
+        )
     chat.get_custom_prompt.assert_called_once_with("test")
     assert ctx.input_tokens == 222
     assert ctx.output == str(response.response)
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.14 01:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 import importlib
@@ -93,7 +93,8 @@ def make_window(config_map=None):
         indexing=SimpleNamespace(
             index_files=Mock(),
             index_urls=Mock()
-        )
+        ),
+        get_retrieval_mode=lambda idx: "vector",
     )
     models = SimpleNamespace(is_tool_call_allowed=lambda mode, model: True, from_defaults=lambda: FakeModelItem())
     plugins = SimpleNamespace(get_option=lambda a,b: False)
@@ -159,7 +160,7 @@ def test_query_stream_true_and_false(monkeypatch):
     engine = Mock()
     resp = FakeResponseObj(response=None, response_gen="GEN", source_nodes=[FakeNode("id1","t",0.9,{"k":"v"})])
     engine.query = Mock(return_value=resp)
-    index.as_query_engine = Mock(return_value=engine)
+    monkeypatch.setattr(chat_mod, "RetrieverQueryEngine", SimpleNamespace(from_args=Mock(return_value=engine)))
     llm = Mock()
     chat.get_index = Mock(return_value=(index, llm))
     chat.window.core.tokens.from_llama_messages = Mock(return_value=123)
@@ -186,7 +187,7 @@ def test_query_returns_false_when_no_response(monkeypatch):
     index = Mock()
     engine = Mock()
     engine.query = Mock(return_value=None)
-    index.as_query_engine = Mock(return_value=engine)
+    monkeypatch.setattr(chat_mod, "RetrieverQueryEngine", SimpleNamespace(from_args=Mock(return_value=engine)))
     chat.get_index = Mock(return_value=(index, Mock()))
     r = chat.query(context)
     assert r is False
@@ -329,3 +330,16 @@ def test_get_metadata_filters_and_limits():
     assert len(meta) == 3
     assert all("score" in v for v in meta.values())
     mp.undo()
+
+def test_retrieval_mode_keyword_check_cached(monkeypatch):
+    chat = make_chat(monkeypatch)
+    chat.window.core.idx.get_retrieval_mode = lambda idx: "hybrid"
+    chat.storage.get_generation = Mock(return_value=1)
+    chat.storage.keyword.exists = Mock(return_value=True)
+    assert chat.get_retrieval_mode("base") == "hybrid"
+    assert chat.get_retrieval_mode("base") == "hybrid"
+    assert chat.storage.keyword.exists.call_count == 1
+    chat.storage.get_generation.return_value = 2
+    chat.storage.keyword.exists.return_value = False
+    assert chat.get_retrieval_mode("base") == "vector"
+    assert chat.storage.keyword.exists.call_count == 2
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.10 00:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 import importlib
@@ -63,6 +63,8 @@ def make_window(store=None):
     idx.ctx = SimpleNamespace()
     idx.ctx.exists = Mock(return_value=False)
     idx.ctx.get_doc_id = Mock(return_value=None)
+    idx.ctx.get_items = Mock(return_value={})
+    idx.ctx.append = Mock()
     external = SimpleNamespace()
     external.exists = Mock(return_value=False)
     external.get_doc_id = Mock(return_value=None)
@@ -91,8 +93,11 @@ def make_window(store=None):
     core_ctx = SimpleNamespace()
     core_ctx.idx = SimpleNamespace()
     core_ctx.idx.set_meta_as_indexed = Mock()
+    core_ctx.idx.set_items_as_indexed = Mock()
+    web = SimpleNamespace()
+    web.cache = Mock(get_stats=Mock(return_value={}), format_stats=Mock(return_value=None), flush=Mock())
     window = SimpleNamespace()
-    window.core = SimpleNamespace(config=config, idx=idx, debug=debug, platforms=platforms, filesystem=filesystem, db=db, models=models)
+    window.core = SimpleNamespace(config=config, idx=idx, debug=debug, platforms=platforms, filesystem=filesystem, db=db, models=models, web=web, limiter=Mock())
     window.controller = controller
     window.core.ctx = core_ctx
     return window
@@ -341,8 +346,10 @@ def test_db_methods_get_data_and_ids(monkeypatch, indexing, window):
     assert docs2 and docs2[0].metadata['ctx_id'] == 7
 
 def test_index_db_by_meta_id_and_from_ts(monkeypatch, indexing, window):
-    doc = DocumentFake(text='d', metadata={})
+    doc = DocumentFake(text='d', metadata={'item_id': 1})
+    monkeypatch.setattr(indexing, 'get_db_items_ts', Mock(return_value={1: 10}))
     monkeypatch.setattr(indexing, 'get_db_data_by_id', Mock(return_value=[doc]))
+    monkeypatch.setattr(indexing, 'index_document', Mock())
     fake_index = SimpleNamespace(insert=Mock())
     window.core.idx.log = Mock()
     window.core.ctx.idx.set_meta_as_indexed = Mock()
@@ -354,7 +361,7 @@ def test_index_db_by_meta_id_and_from_ts(monkeypatch, indexing, window):
     assert n2 == 2
 
 def test_index_url_and_index_urls(monkeypatch, indexing, window):
-    provider = SimpleNamespace(get_external_id=Mock(return_value='uid'), prepare_args=Mock(return_value={'url':'u'}))
+    provider = SimpleNamespace(get_external_id=Mock(return_value='uid'), prepare_args=Mock(return_value={'url':'u'}), prefetch=False)
     loader_instance = SimpleNamespace(load_data=Mock(return_value=[DocumentFake(text='wx', metadata={})]))
     loader = SimpleNamespace(get=Mock(return_value=loader_instance))
     indexing.loaders['web']['wtype'] = loader
@@ -417,20 +424,19 @@ def test_get_webtype_and_remove_attachment(indexing, window):
     res = indexing.remove_attachment('ip', 'docid')
     assert res is True
 
-def test_apply_rate_limit_sleep_and_no_sleep(monkeypatch, indexing, window):
+def test_apply_rate_limit_wait_and_no_wait(indexing, window):
     window.core.config.s = {}
-    indexing.last_call = None
+    window.core.limiter = SimpleNamespace(wait=Mock(), get_key=Mock(return_value='embeddings.openai/*'), estimate_tokens=Mock(return_value=3))
     indexing.window.core.config.s['llama.idx.embeddings.limit.rpm'] = '0'
-    indexing.apply_rate_limit()
+    indexing.apply_rate_limit('text')
+    window.core.limiter.wait.assert_not_called()
     indexing.window.core.config.s['llama.idx.embeddings.limit.rpm'] = '2'
-    now = datetime.datetime.now()
-    indexing.last_call = now - datetime.timedelta(seconds=5)
-    slept = {}
-    def fake_sleep(sec):
-        slept['val'] = sec
-    monkeypatch.setattr(module.time, 'sleep', fake_sleep)
-    indexing.apply_rate_limit()
-    assert 'val' in slept
+    indexing.window.core.config.s['llama.idx.embeddings.limit.tpm'] = '1000'
+    indexing.apply_rate_limit('text')
+    kwargs = window.core.limiter.wait.call_args.kwargs
+    assert kwargs['rpm'] == 2
+    assert kwargs['tpm'] == 1000
+    assert kwargs['tokens'] == 3
 
 def test_stop_enabled_and_is_stopped(indexing, window):
     window.core.config.s = {'llama.idx.stop.error': True}
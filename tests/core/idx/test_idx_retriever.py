@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+from unittest.mock import MagicMock
+
+from llama_index.core.schema import NodeWithScore, TextNode
+
+from pygpt_net.core.idx.retriever import HybridRetriever, KeywordRetriever
+
+
+def make_nodes(*ids):
+    return [NodeWithScore(node=TextNode(id_=id, text=id), score=1.0 - i * 0.1) for i, id in enumerate(ids)]
+
+
+def make_retriever(*ids):
+    retriever = MagicMock()
+    retriever.retrieve.return_value = make_nodes(*ids)
+    return retriever
+
+
+def test_hybrid_rrf():
+    """Test nodes found by both retrievers are ranked first"""
+    hybrid = HybridRetriever(make_retriever("a", "b", "c"), make_retriever("c", "d"), similarity_top_k=3)
+    nodes = hybrid.retrieve("query")
+    assert [n.node.node_id for n in nodes] == ["c", "a", "b"]
+    assert all(0 < n.score <= 1 for n in nodes)
+
+
+def test_keyword_scores_normalized():
+    """Test keyword scores are relative to best match"""
+    keyword = MagicMock()
+    keyword.search.return_value = [
+        NodeWithScore(node=TextNode(id_="a", text="a"), score=4.0),
+        NodeWithScore(node=TextNode(id_="b", text="b"), score=1.0),
+    ]
+    nodes = KeywordRetriever(keyword, "base", similarity_top_k=2).retrieve("query")
+    assert [n.score for n in nodes] == [1.0, 0.25]
+    keyword.search.assert_called_once_with("base", "query", 2)
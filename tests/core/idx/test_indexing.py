@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.23 19:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 import os
@@ -37,6 +37,7 @@ def test_get_documents(mock_window):
     idx = Indexing(mock_window)
     mock_window.core.filesystem.packer.is_archive = MagicMock(return_value=False)
     idx.get_online_loader = MagicMock(return_value=None)
+    idx.is_excluded_path = MagicMock(return_value=False)
     doc = Document()
     docs = [doc]
     reader = MagicMock()
@@ -77,6 +78,36 @@ def test_index_files_single_file(mock_window):
     assert errors == []
 
 
+def test_index_files_failed_in_stream(mock_window):
+    """Test documents of file that failed in the middle are removed"""
+    index = MagicMock()
+    path = "file.pdf"
+    idx = Indexing(mock_window)
+    idx.window.controller.idx = MagicMock()
+    idx.window.controller.idx.is_stopped = MagicMock(return_value=False)
+    idx.stop_enabled = MagicMock(return_value=False)
+    idx.index_document = MagicMock()
+
+    def get_documents(file, stream=False):
+        for i in range(2):
+            doc = Document()
+            doc.id_ = "page_{}".format(i)
+            yield doc
+        raise ValueError("broken page")
+
+    idx.get_documents = get_documents
+    with patch("os.path.isdir") as mock_isdir:
+        mock_isdir.return_value = False
+        with patch("os.path.isfile") as mock_isfile:
+            mock_isfile.return_value = True
+            indexed, errors = idx.index_files("base", index, path)
+    assert indexed == {}
+    assert errors == ["broken page"]
+    assert idx.index_document.call_count == 2
+    index.delete_ref_doc.assert_any_call("page_0", delete_from_docstore=True)
+    index.delete_ref_doc.assert_any_call("page_1", delete_from_docstore=True)
+
+
 def test_index_files_in_directory(mock_window):
     """Test index directory"""
     index = MagicMock()
@@ -166,13 +197,51 @@ def test_index_db_by_meta_id(mock_window):
     idx.window.controller.idx.is_stopped = MagicMock(return_value=False)
     doc = Document()
     doc.id_ = "test_id"
+    doc.metadata = {"item_id": 1}
     docs = [doc]
+    idx.window.core.idx.ctx.get_items = MagicMock(return_value={})
+    idx.get_db_items_ts = MagicMock(return_value={1: 100})
     idx.get_db_data_by_id = MagicMock(return_value=docs)
     idx.index_documents = MagicMock()
     index = MagicMock()
     indexed, errors = idx.index_db_by_meta_id("base", index, 123)
     assert indexed == 1
     assert errors == []
+    idx.window.core.idx.ctx.append.assert_called_once()
+    assert idx.window.core.idx.ctx.append.call_args.kwargs["item_id"] == 1
+
+
+def test_index_db_by_meta_id_items(mock_window):
+    """Test index db by meta id, only new and changed items"""
+    idx = Indexing(mock_window)
+    idx.window.controller.idx = MagicMock()
+    idx.window.controller.idx.is_stopped = MagicMock(return_value=False)
+    idx.window.core.idx.get_current_store = MagicMock(return_value="store")
+    idx.window.core.idx.ctx.get_items = MagicMock(return_value={
+        1: {"id": 10, "doc_id": "doc_1", "updated_ts": 200},  # not changed
+        2: {"id": 11, "doc_id": "doc_2", "updated_ts": 200},  # changed
+        3: {"id": 12, "doc_id": "doc_3", "updated_ts": 200},  # deleted
+    })
+    idx.get_db_items_ts = MagicMock(return_value={1: 150, 2: 250, 4: 300})
+    doc_2 = Document()
+    doc_2.id_ = "doc_2_new"
+    doc_2.metadata = {"item_id": 2}
+    doc_4 = Document()
+    doc_4.id_ = "doc_4"
+    doc_4.metadata = {"item_id": 4}
+    idx.get_db_data_by_id = MagicMock(return_value=[doc_2, doc_4])
+    idx.index_document = MagicMock()
+    indexed, errors = idx.index_db_by_meta_id("base", MagicMock(), 123, 100)
+    assert indexed == 2
+    assert errors == []
+    assert idx.get_db_data_by_id.call_args.kwargs["item_ids"] == [2, 4]
+    removed = [c.kwargs["doc_id"] for c in idx.window.core.idx.storage.remove_document.call_args_list]
+    assert removed == ["doc_3", "doc_2"]
+    idx.window.core.idx.ctx.remove_items.assert_called_once_with([12])
+    idx.window.core.idx.ctx.update_item.assert_called_once_with(11, "doc_2_new")
+    idx.window.core.ctx.idx.set_items_as_indexed.assert_called_once_with(
+        123, "base", ["doc_2_new", "doc_4"], ["doc_3", "doc_2"]
+    )
 
 
 def test_index_db_from_updated_ts(mock_window):
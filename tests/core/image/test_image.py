@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.03.17 13:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 import os
@@ -17,11 +17,11 @@ from tests.mocks import mock_window
 from pygpt_net.core.image import Image
 
 
-def test_install(mock_window):
+def test_install(mock_window, monkeypatch):
     """Test install"""
     image = Image(mock_window)
-    os.path.exists = MagicMock(return_value=False)
-    os.makedirs = MagicMock()
+    monkeypatch.setattr(os.path, "exists", MagicMock(return_value=False))
+    monkeypatch.setattr(os, "makedirs", MagicMock())
     image.install()
     os.makedirs.assert_called()
 
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+from types import SimpleNamespace
+
+import pytest
+
+from tests.mocks import mock_window
+from pygpt_net.core.limiter import Limiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, sec):
+        self.now += sec
+
+
+def make_limiter(window) -> Limiter:
+    limiter = Limiter(window)
+    clock = FakeClock()
+    limiter.clock = clock
+    limiter.sleep = clock.sleep
+    return limiter
+
+
+def test_acquire_rpm_burst(mock_window):
+    """Test RPM limit with burst"""
+    limiter = make_limiter(mock_window)
+    key = limiter.get_key("openai", "gpt-4o")
+    assert limiter.acquire(key, rpm=60, burst=2) == 0.0
+    assert limiter.acquire(key, rpm=60, burst=2) == 0.0
+    delay = limiter.acquire(key, rpm=60, burst=2)
+    assert delay == pytest.approx(1.0)
+    limiter.clock.now += 1.0
+    assert limiter.acquire(key, rpm=60, burst=2) == 0.0
+
+
+def test_acquire_tpm(mock_window):
+    """Test TPM limit"""
+    limiter = make_limiter(mock_window)
+    key = limiter.get_key("anthropic", "claude")
+    assert limiter.acquire(key, tokens=600, tpm=1000) == 0.0
+    delay = limiter.acquire(key, tokens=600, tpm=1000)
+    assert delay == pytest.approx(200 / (1000 / 60.0))
+    assert limiter.get_headroom(key)["tokens"] == 400
+
+
+def test_keys_are_separate(mock_window):
+    """Test separate buckets per provider and model"""
+    limiter = make_limiter(mock_window)
+    assert limiter.acquire("a/1", rpm=1) == 0.0
+    assert limiter.acquire("a/1", rpm=1) > 0
+    assert limiter.acquire("a/2", rpm=1) == 0.0
+
+
+def test_wait(mock_window):
+    """Test blocking wait"""
+    limiter = make_limiter(mock_window)
+    limiter.acquire("k", rpm=30)
+    slept = limiter.wait("k", rpm=30)
+    assert slept == pytest.approx(2.0)
+    slept = limiter.wait("k", rpm=30, stopped=lambda: True)
+    assert slept == 0.0
+
+
+def test_handle_error_retry_after(mock_window):
+    """Test Retry-After from 429 response"""
+    limiter = make_limiter(mock_window)
+    error = Exception("rate limit")
+    error.status_code = 429
+    error.response = SimpleNamespace(status_code=429, headers={"retry-after": "12"})
+    assert limiter.handle_error("k", error) is True
+    headroom = limiter.get_headroom("k")
+    assert headroom["blocked"] == pytest.approx(12.0)
+    assert headroom["factor"] == 0.5
+    assert limiter.acquire("k", rpm=60) == pytest.approx(12.0)
+    assert limiter.handle_error("k", ValueError("other")) is False
+
+
+def test_parse_retry_after():
+    """Test Retry-After parsing"""
+    assert Limiter.parse_retry_after("3") == 3.0
+    assert Limiter.parse_retry_after(None) is None
+    assert Limiter.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
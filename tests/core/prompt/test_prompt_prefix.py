@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.19 00:00:00                  #
+# ================================================== #
+
+from unittest.mock import MagicMock
+
+from tests.mocks import mock_window
+from pygpt_net.core.prompt.prefix import Prefix
+from pygpt_net.item.ctx import CtxItem
+
+
+def test_normalize(mock_window):
+    """Test whitespace normalization"""
+    prefix = Prefix(mock_window)
+    mock_window.core.config.data['prompt.cache'] = True
+    assert prefix.normalize("a  \nb\n\n\n\nc\n") == "a\nb\n\nc"
+    mock_window.core.config.data['prompt.cache'] = False
+    assert prefix.normalize("a  \n") == "a  \n"
+
+
+def test_align_history(mock_window):
+    """Test history start alignment"""
+    prefix = Prefix(mock_window)
+    mock_window.core.config.data['prompt.cache'] = True
+    mock_window.core.config.data['prompt.cache.history_step'] = 4
+    items = [CtxItem() for _ in range(10)]
+    assert prefix.align_history(items, 0) == items
+    assert prefix.align_history(items, 4) == items
+    assert prefix.align_history(items, 1) == items[3:]
+    assert prefix.align_history(items, 3) == items[1:]
+
+
+def test_is_history_aligned(mock_window):
+    """Test history alignment only for providers with prefix caching"""
+    prefix = Prefix(mock_window)
+    mock_window.core.config.data['prompt.cache'] = True
+    mock_window.core.config.data['prompt.cache.anthropic'] = True
+    model = MagicMock(provider="openai")
+    mock_window.core.models.has = MagicMock(return_value=True)
+    mock_window.core.models.get = MagicMock(return_value=model)
+    assert prefix.is_history_aligned("gpt-4o") is True
+    model.provider = "ollama"
+    assert prefix.is_history_aligned("llama3") is False
+    model.provider = "anthropic"
+    assert prefix.is_history_aligned("claude") is True
+    mock_window.core.config.data['prompt.cache.anthropic'] = False
+    assert prefix.is_history_aligned("claude") is False
+    mock_window.core.models.has.return_value = False
+    assert prefix.is_history_aligned("unknown") is False
+    mock_window.core.config.data['prompt.cache'] = False
+    model.provider = "openai"
+    mock_window.core.models.has.return_value = True
+    assert prefix.is_history_aligned("gpt-4o") is False
+
+
+def test_apply_anthropic(mock_window):
+    """Test Anthropic cache breakpoints"""
+    prefix = Prefix(mock_window)
+    mock_window.core.config.data['prompt.cache'] = True
+    mock_window.core.config.data['prompt.cache.anthropic'] = True
+    params = {
+        "system": "sys",
+        "tools": [
+            {"name": "a", "input_schema": {}},
+            {"name": "b", "input_schema": {}},
+        ],
+        "messages": [
+            {"role": "user", "content": "q1"},
+            {"role": "assistant", "content": "a1"},
+            {"role": "user", "content": [{"type": "text", "text": "q2"}]},
+        ],
+    }
+    params = prefix.apply_anthropic(params)
+    assert params["system"][0]["cache_control"] == {"type": "ephemeral"}
+    assert "cache_control" not in params["tools"][0]
+    assert params["tools"][1]["cache_control"] == {"type": "ephemeral"}
+    assert params["messages"][1]["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert "cache_control" not in params["messages"][2]["content"][0]
+
+
+def test_record_usage(mock_window):
+    """Test cached tokens in ctx usage"""
+    prefix = Prefix(mock_window)
+    ctx = CtxItem()
+    ctx.extra = {"usage": {"input_tokens": 100}}
+    prefix.record_usage(ctx, 80, 10)
+    assert ctx.extra["usage"]["input_tokens"] == 100
+    assert ctx.extra["usage"]["cached_tokens"] == 80
+    assert ctx.extra["usage"]["cache_write_tokens"] == 10
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.19 00:00:00                  #
+# ================================================== #
+
+import os
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from pygpt_net.core.remote_store.sync import Sync, SyncError
+
+
+class ApiError(Exception):
+    def __init__(self, msg: str, status_code: int = None):
+        super().__init__(msg)
+        self.status_code = status_code
+
+
+class FakeFilesAPI:
+    """Local fake of remote files API (upload + batch attach)"""
+    def __init__(self, fail_once: tuple = ()):
+        self.lock = threading.Lock()
+        self.uploaded = {}
+        self.attached = []
+        self.fail_once = set(fail_once)
+
+    def upload(self, path: str) -> str:
+        name = os.path.basename(path)
+        with self.lock:
+            if name in self.fail_once:
+                self.fail_once.discard(name)
+                raise ApiError("Rate limit", 429)
+            file_id = "file-{}".format(len(self.uploaded) + 1)
+            self.uploaded[file_id] = name
+        return file_id
+
+    def attach_batch(self, file_ids: list):
+        self.attached.append(list(file_ids))
+
+
+@pytest.fixture
+def sync(tmp_path):
+    window = MagicMock()
+    window.core.config.get.side_effect = lambda key, default=None: default
+    window.core.config.get_user_path.return_value = str(tmp_path / "workdir")
+    engine = Sync(window)
+    engine.sleep = lambda sec: None
+    return engine
+
+
+def make_files(tmp_path, contents: dict) -> list:
+    paths = []
+    for name, content in contents.items():
+        path = tmp_path / name
+        path.write_text(content)
+        paths.append(str(path))
+    return paths
+
+
+def test_upload_skips_existing_and_duplicates(sync, tmp_path):
+    """Test content-hash deduplication"""
+    api = FakeFilesAPI()
+    paths = make_files(tmp_path, {"a.txt": "A", "b.txt": "B", "c.txt": "A", "d.txt": "D"})
+    existing = {Sync.hash_file(paths[3]): "file-old"}
+    committed = []
+    stats = sync.upload(
+        "openai", "vs_1", paths, existing,
+        upload=api.upload,
+        commit=lambda path, result, hash: committed.append((os.path.basename(path), result, hash)),
+    )
+    assert stats == {"uploaded": 2, "skipped": 2, "failed": 0}
+    assert sorted(api.uploaded.values()) == ["a.txt", "b.txt"]
+    assert sorted(c[0] for c in committed) == ["a.txt", "b.txt"]
+    assert all(c[2] == Sync.hash_file(str(tmp_path / c[0])) for c in committed)
+
+
+def test_upload_retries_retryable_errors(sync, tmp_path):
+    """Test retry with backoff on 429"""
+    api = FakeFilesAPI(fail_once=("a.txt",))
+    paths = make_files(tmp_path, {"a.txt": "A"})
+    stats = sync.upload("openai", "vs_1", paths, {}, upload=api.upload, commit=lambda *args: None)
+    assert stats["uploaded"] == 1
+    assert api.fail_once == set()
+
+
+def test_upload_does_not_retry_client_errors(sync, tmp_path):
+    """Test 4xx errors are not retried"""
+    paths = make_files(tmp_path, {"a.txt": "A"})
+    upload = MagicMock(side_effect=ApiError("Bad request", 400))
+    stats = sync.upload("openai", "vs_1", paths, {}, upload=upload, commit=lambda *args: None)
+    assert stats == {"uploaded": 0, "skipped": 0, "failed": 1}
+    assert upload.call_count == 1
+
+
+def test_upload_batch_resumes_from_journal(sync, tmp_path):
+    """Test uploaded but not attached files are not uploaded again"""
+    api = FakeFilesAPI()
+    paths = make_files(tmp_path, {"a.txt": "A", "b.txt": "B"})
+    failing = MagicMock(side_effect=ApiError("Bad request", 400))
+    stats = sync.upload(
+        "openai", "vs_1", paths, {},
+        upload=api.upload, commit=lambda *args: None, attach_batch=failing,
+    )
+    assert stats["failed"] == 2
+    assert os.path.exists(sync.get_journal_path("openai", "vs_1"))
+
+    committed = []
+    stats = sync.upload(
+        "openai", "vs_1", paths, {},
+        upload=api.upload,
+        commit=lambda path, file_id, hash: committed.append(file_id),
+        attach_batch=api.attach_batch,
+    )
+    assert stats == {"uploaded": 2, "skipped": 0, "failed": 0}
+    assert len(api.uploaded) == 2  # no new uploads
+    assert sorted(api.attached[0]) == ["file-1", "file-2"]
+    assert sorted(committed) == ["file-1", "file-2"]
+    assert not os.path.exists(sync.get_journal_path("openai", "vs_1"))
+
+
+def test_upload_batch_size(sync, tmp_path):
+    """Test files are attached in batches"""
+    api = FakeFilesAPI()
+    sync.BATCH_SIZE = 2
+    paths = make_files(tmp_path, {"{}.txt".format(i): str(i) for i in range(5)})
+    progress = []
+    stats = sync.upload(
+        "openai", "vs_1", paths, {},
+        upload=api.upload, commit=lambda *args: None, attach_batch=api.attach_batch,
+        progress=lambda done, total: progress.append((done, total)),
+    )
+    assert stats["uploaded"] == 5
+    assert [len(b) for b in api.attached] == [2, 2, 1]
+    assert progress[-1] == (5, 5)
+
+
+def test_delete(sync):
+    """Test parallel delete"""
+    deleted = []
+
+    def delete(store_id, file_id):
+        if file_id == "f2":
+            raise ApiError("Not found", 404)
+        deleted.append((store_id, file_id))
+
+    callback = MagicMock()
+    items = [("vs_1", "f1"), ("vs_1", "f2"), ("vs_1", "f3")]
+    num = sync.delete(delete, items, callback=callback)
+    assert num == 2
+    assert sorted(deleted) == [("vs_1", "f1"), ("vs_1", "f3")]
+    assert callback.call_count == 1
+
+    deleted.clear()
+    with pytest.raises(SyncError) as e:
+        sync.delete(delete, items, callback=callback, raise_errors=True)
+    assert e.value.done == 2
+    assert e.value.failed == 1
+    assert sorted(deleted) == [("vs_1", "f1"), ("vs_1", "f3")]  # remaining items are deleted anyway
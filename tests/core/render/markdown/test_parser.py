@@ -6,12 +6,13 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.04.20 03:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
+import re
 from unittest.mock import MagicMock
 
 from tests.mocks import mock_window
-from pygpt_net.core.render.markdown.parser import Parser
+from pygpt_net.core.render.markdown.parser import Parser, split_blocks
 
 
 def test_init():
@@ -128,4 +129,44 @@ def test_parse_images():
     markdown_input = "![Alt text](/path/to/img.jpg)"
     expected_html_output = ' <p><img alt="Alt text" src="/path/to/img.jpg" width="400"/></p> '
     actual_html_output = parser.parse(markdown_input).replace("\n", "")
-    assert actual_html_output == expected_html_output
\ No newline at end of file
+    assert actual_html_output == expected_html_output
+
+def test_split_blocks():
+    text = "# Title\n\nPara one\n\n```python\na = 1\n\nb = 2\n```\n\n- a\n\n- b\n\nEnd"
+    assert split_blocks(text) == [
+        "# Title",
+        "Para one",
+        "```python\na = 1\n\nb = 2\n```\n\n- a\n\n- b",  # list is not split from previous block
+        "End",
+    ]
+    assert split_blocks("Text\n\n[1]: http://example.com\n\nEnd") == ["Text\n\n[1]: http://example.com\n\nEnd"]
+    assert split_blocks("Text\n\n<div>\n\nEnd\n</div>") == ["Text\n\n<div>\n\nEnd\n</div>"]
+    assert split_blocks("Open\n\n```\ncode\n\nmore") == ["Open", "```\ncode\n\nmore"]  # open fence
+
+
+def test_parse_incremental(monkeypatch):
+    monkeypatch.setattr("pygpt_net.core.render.markdown.parser.trans", lambda key: key)
+    parser = Parser()
+    parser.window = MagicMock()
+    text = "# Title\n\nPara one ![img](a.png)\n\n```python\nprint(1)\n```\n\nPara two\n\nEnd"
+    full = parser.parse(text)
+    parser.reset()
+    parser.parse_block = MagicMock(side_effect=parser.parse_block)
+    for n in range(1, len(text) + 1):
+        streamed = parser.parse(text[:n])
+    idx = int(re.search(r"extra-code-copy:(\d+)", streamed).group(1))  # open block parsed on each chunk
+    assert streamed == full.replace("extra-code-copy:1", "extra-code-copy:{}".format(idx))
+    assert 'width="400"' in streamed
+    assert parser.parse_block.call_count < len(text) + 5  # completed blocks are parsed once
+    assert parser.get_code_blocks()[idx] == "print(1)"
+
+
+def test_parse_blocks_cache_limit():
+    parser = Parser()
+    parser.window = MagicMock()
+    parser.MAX_BLOCKS = 3
+    for i in range(10):
+        parser.parse("Message {}\n\nSecond paragraph {}\n\nEnd".format(i, i))
+    assert len(parser.blocks) == 3
+    parser.reset()
+    assert len(parser.blocks) == 0
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.01.02 11:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 import os
@@ -33,14 +33,14 @@ def test_get_user_path(mock_window_conf):
     assert config.get_user_path() == 'test_path'
 
 
-def test_get_available_langs(mock_window_conf):
+def test_get_available_langs(mock_window_conf, monkeypatch):
     """
     Test get available languages
     """
     config = Config(mock_window_conf)
     config.get_app_path = MagicMock(return_value='test_path')
     config.get_user_path = MagicMock(return_value='test_path')
-    os.path.exists = MagicMock(return_value=True)
-    os.listdir = MagicMock(return_value=['locale.en.ini', 'locale.de.ini', 'locale.fr.ini'])
+    monkeypatch.setattr(os.path, "exists", MagicMock(return_value=True))
+    monkeypatch.setattr(os, "listdir", MagicMock(return_value=['locale.en.ini', 'locale.de.ini', 'locale.fr.ini']))
     assert config.get_available_langs() == ['en', 'de', 'fr']
 
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+
+import io
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from pygpt_net.core.vision.encoder import Encoder
+
+
+def make_encoder(optimize: bool = True, quality: int = 85, cache_mb: int = 64) -> Encoder:
+    window = MagicMock()
+    values = {
+        "vision.images.optimize": optimize,
+        "vision.images.quality": quality,
+        "vision.images.cache_mb": cache_mb,
+    }
+    window.core.config.get.side_effect = lambda key, default=None: values.get(key, default)
+    return Encoder(window)
+
+
+def test_get_scale():
+    """Test downscale factor per provider profile"""
+    encoder = make_encoder()
+    assert encoder.get_scale(800, 600, "openai") == 1.0
+    assert encoder.get_scale(4000, 3000, "openai") == pytest.approx(768 / 3000)
+    assert encoder.get_scale(3136, 1000, "anthropic") == pytest.approx(0.5)
+    assert encoder.get_scale(6144, 100, "google") == pytest.approx(0.5)
+    assert encoder.get_scale(4096, 4096, "unknown") == pytest.approx(0.5)
+
+
+def test_encode_raw_cached(tmp_path):
+    """Test raw payload is cached by path and mtime"""
+    encoder = make_encoder(optimize=False)
+    path = tmp_path / "image.png"
+    path.write_bytes(b"fake-png-data")
+    image = encoder.encode(str(path), "openai")
+    assert image.data == b"fake-png-data"
+    assert image.mime == "image/png"
+    assert image.data_url.startswith("data:image/png;base64,")
+    assert encoder.encode(str(path), "openai") is image
+    assert encoder.get_stats()["hits"] == 1
+
+    path.write_bytes(b"changed-png-data!")
+    os.utime(str(path), ns=(0, 10 ** 9))
+    assert encoder.encode(str(path), "openai") is not image
+
+
+def test_encode_optimized(tmp_path):
+    """Test large image is downscaled, re-encoded and bytes saved are reported"""
+    Image = pytest.importorskip("PIL.Image")
+    path = tmp_path / "photo.png"
+    img = Image.effect_noise((3000, 2000), 64).convert("RGB")
+    img.save(str(path), "PNG")
+    encoder = make_encoder()
+    image = encoder.encode(str(path), "anthropic")
+    assert image.optimized is True
+    assert image.mime == "image/jpeg"
+    assert max(image.width, image.height) <= 1568
+    assert image.width * image.height <= 1_150_000
+    assert image.saved > 0
+    with Image.open(io.BytesIO(image.data)) as out:
+        assert out.format == "JPEG"
+        assert len(out.getexif()) == 0
+
+    encoder.report([image], "anthropic")
+    assert encoder.get_stats()["saved_bytes"] == image.saved
+
+
+def test_encode_small_kept(tmp_path):
+    """Test small image without metadata is sent unchanged"""
+    Image = pytest.importorskip("PIL.Image")
+    path = tmp_path / "small.png"
+    Image.new("RGB", (16, 16), (255, 0, 0)).save(str(path), "PNG")
+    image = make_encoder().encode(str(path), "openai")
+    assert image.optimized is False
+    assert image.data == path.read_bytes()
+    assert image.mime == "image/png"
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.19 00:00:00                  #
+# ================================================== #
+
+import os
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from pygpt_net.core.web.cache import Cache
+
+
+class FakeServer:
+    """Local fake of HTTP server with ETag support"""
+    def __init__(self, pages: dict):
+        self.pages = pages
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        headers = headers or {}
+        self.requests.append((url, dict(headers)))
+        if url not in self.pages:
+            return SimpleNamespace(status_code=404, content=b"", headers={})
+        etag = '"{}"'.format(hash(self.pages[url]))
+        if headers.get("If-None-Match") == etag:
+            return SimpleNamespace(status_code=304, content=b"", headers={"etag": etag})
+        return SimpleNamespace(
+            status_code=200,
+            content=self.pages[url],
+            headers={"content-type": "text/html; charset=utf-8", "etag": etag},
+        )
+
+
+@pytest.fixture
+def config():
+    return {}
+
+
+@pytest.fixture
+def cache(tmp_path, config):
+    window = MagicMock()
+    window.core.config.get.side_effect = lambda key, default=None: config.get(key, default)
+    window.core.config.get_user_path.return_value = str(tmp_path)
+    return Cache(window)
+
+
+def test_fetch_hit_within_ttl(cache):
+    """Test fresh entry is returned without request"""
+    server = FakeServer({"https://a.com/1": b"page 1"})
+    cache.get = server.get
+    assert cache.fetch("https://a.com/1").text == "page 1"
+    response = cache.fetch("https://a.com/1")
+    assert response.from_cache
+    assert response.content == b"page 1"
+    assert len(server.requests) == 1
+    assert cache.get_stats()["hits"] == 1
+
+
+def test_fetch_revalidates_stale_entry(cache):
+    """Test conditional GET with ETag"""
+    server = FakeServer({"https://a.com/1": b"page 1"})
+    cache.get = server.get
+    cache.fetch("https://a.com/1", ttl=0)
+    response = cache.fetch("https://a.com/1", ttl=0)
+    assert response.from_cache
+    assert response.content == b"page 1"
+    assert "If-None-Match" in server.requests[1][1]
+    assert cache.get_stats()["revalidated"] == 1
+
+    server.pages["https://a.com/1"] = b"changed"
+    assert cache.fetch("https://a.com/1", ttl=0).content == b"changed"
+
+
+def test_offline_mode(cache, config):
+    """Test cache-only mode"""
+    server = FakeServer({"https://a.com/1": b"page 1"})
+    cache.get = server.get
+    cache.fetch("https://a.com/1", ttl=0)
+    config["web.cache.offline"] = True
+    assert cache.fetch("https://a.com/1", ttl=0).from_cache
+    with pytest.raises(ValueError):
+        cache.fetch("https://a.com/2")
+    assert len(server.requests) == 1
+
+
+def test_lru_eviction(cache, config):
+    """Test least recently used entries are removed over size limit"""
+    config["web.cache.max_size"] = 1  # MB
+    page = b"x" * (200 * 1024)
+    urls = ["https://a.com/{}".format(i) for i in range(6)]
+    server = FakeServer({url: page for url in urls})
+    cache.get = server.get
+    for url in urls[:4]:
+        cache.fetch(url)
+    cache.fetch(urls[0])  # recently used
+    cache.fetch(urls[4])
+    cache.fetch(urls[5])
+    assert cache.size <= 1024 * 1024
+    keys = set(cache.index.keys())
+    assert cache.get_key(urls[0]) in keys
+    assert cache.get_key(urls[1]) not in keys
+    assert not os.path.exists(os.path.join(cache.get_dir(), cache.get_key(urls[1])))
+
+
+def test_fetch_many_and_stats(cache):
+    """Test parallel fetch and hit rate"""
+    urls = ["https://a.com/{}".format(i) for i in range(5)] + ["https://b.com/missing"]
+    server = FakeServer({url: url.encode() for url in urls[:5]})
+    cache.get = server.get
+    results = cache.fetch_many(urls)
+    assert results[urls[0]].content == urls[0].encode()
+    assert results[urls[5]].status_code == 404
+    snapshot = cache.get_stats()
+    cache.fetch_many(urls[:5])
+    assert cache.format_stats(snapshot).endswith("hit rate: 100.0%")
+    assert os.path.exists(os.path.join(cache.get_dir(), Cache.INDEX_FILE))
+
+
+def test_fetch_saves_index(cache, tmp_path):
+    """Test index is saved after single fetch"""
+    server = FakeServer({"https://a.com": b"page"})
+    cache.get = server.get
+    cache.fetch("https://a.com")
+    reloaded = Cache(cache.window)
+    reloaded.get = server.get
+    assert reloaded.fetch("https://a.com").from_cache
+    assert len(server.requests) == 1
+
+
+def test_load_index_removes_orphans(cache, tmp_path):
+    """Test files not in index and entries without files are removed on load"""
+    server = FakeServer({"https://a.com": b"page", "https://b.com": b"other"})
+    cache.get = server.get
+    cache.fetch_many(["https://a.com", "https://b.com"])
+    path = tmp_path / Cache.DIR
+    (path / "orphan").write_bytes(b"x")
+    os.remove(path / cache.get_key("https://b.com"))
+
+    reloaded = Cache(cache.window)
+    reloaded.load_index()
+    assert not (path / "orphan").exists()
+    assert list(reloaded.index) == [cache.get_key("https://a.com")]
+    assert reloaded.size == len(b"page")
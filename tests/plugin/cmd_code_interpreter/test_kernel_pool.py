@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+
+import threading
+import time
+
+from pygpt_net.plugin.cmd_code_interpreter.ipython.pool import KernelPool
+
+
+class FakeKernels:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = []
+        self.reset = []
+        self.stopped = []
+
+    def start(self, slot):
+        with self.lock:
+            self.started.append(slot)
+        return {"slot": slot, "gen": 0}
+
+    def do_reset(self, kernel):
+        with self.lock:
+            self.reset.append(kernel["slot"])
+        return {"slot": kernel["slot"], "gen": kernel["gen"] + 1}
+
+    def stop(self, kernel):
+        with self.lock:
+            self.stopped.append(kernel["slot"])
+
+
+def make_pool():
+    fake = FakeKernels()
+    pool = KernelPool(start=fake.start, reset=fake.do_reset, stop=fake.stop)
+    return pool, fake
+
+
+def wait_for(cond, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if cond():
+            return True
+        time.sleep(0.01)
+    return cond()
+
+
+def test_acquire_warm_and_refill():
+    """Test acquire returns warm kernel and configure refills pool"""
+    pool, fake = make_pool()
+    pool.configure(2)
+    assert wait_for(lambda: pool.get_stats()["idle"] == 2)
+    assert sorted(fake.started) == [1, 2]
+
+    kernel = pool.acquire(timeout=1)
+    assert kernel is not None
+    assert kernel["slot"] in (1, 2)
+    assert pool.get_stats()["idle"] == 1
+
+    pool.configure(2)
+    assert wait_for(lambda: pool.get_stats()["idle"] == 2)
+    assert len(fake.started) == 3
+    assert 3 in fake.started  # slot in use is not reused
+
+
+def test_acquire_empty_pool():
+    """Test acquire without pool returns None immediately"""
+    pool, fake = make_pool()
+    pool.configure(0)
+    assert pool.acquire(timeout=5) is None
+    assert fake.started == []
+
+
+def test_recycle_resets_or_stops():
+    """Test recycle resets kernel into free slot and stops it when pool is full"""
+    pool, fake = make_pool()
+    pool.configure(1)
+    assert wait_for(lambda: pool.get_stats()["idle"] == 1)
+    kernel = pool.acquire(timeout=1)
+    assert pool.get_stats()["idle"] == 0
+
+    pool.recycle({"slot": 0, "gen": 0})  # previous kernel becomes replacement
+    assert wait_for(lambda: pool.get_stats()["idle"] == 1 and pool.get_stats()["warming"] == 0)
+    assert fake.reset == [0]
+    assert pool.acquire(timeout=1) == {"slot": 0, "gen": 1}
+
+    pool.recycle(kernel)
+    pool.recycle({"slot": 5, "gen": 0})  # pool is full
+    assert wait_for(lambda: fake.stopped == [5])
+    assert wait_for(lambda: pool.get_stats()["idle"] == 1)
+    assert fake.reset == [0, kernel["slot"]]
+
+
+def test_shutdown_and_stats():
+    """Test shutdown stops idle kernels and TTFO percentiles"""
+    pool, fake = make_pool()
+    pool.configure(2)
+    assert wait_for(lambda: pool.get_stats()["idle"] == 2)
+    pool.shutdown()
+    assert sorted(fake.stopped) == [1, 2]
+    assert pool.acquire(timeout=1) is None
+
+    for i in range(1, 101):
+        pool.add_ttfo(i / 1000.0)
+    stats = pool.get_stats()
+    assert stats["ttfo_count"] == 100
+    assert stats["ttfo_p50_ms"] == 50.0
+    assert stats["ttfo_p95_ms"] == 95.0
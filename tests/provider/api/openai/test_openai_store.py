@@ -6,12 +6,15 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2026.01.02 20:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 import os
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import MagicMock
+from pygpt_net.core.remote_store.sync import Sync, SyncError
 from pygpt_net.provider.api.openai.store import Store
 
 @pytest.fixture
@@ -22,6 +25,9 @@ def fake_window():
     window.core.remote_store.openai.parse_status.return_value = "parsed_status"
     window.core.remote_store.openai.append_status = MagicMock()
     window.core.remote_store.openai.files.insert = MagicMock()
+    config = {"remote_store.sync.retries": 0, "remote_store.sync.workers": 4}
+    window.core.config.get.side_effect = lambda key, default=None: config.get(key, default)
+    window.core.remote_store.sync = Sync(window)
     return window
 
 @pytest.fixture
@@ -126,7 +132,7 @@ def test_remove_files(store):
     result = store.remove_files(callback)
     assert result == 1
     assert store.delete_file.call_count == 2
-    assert callback.call_count == 3
+    assert callback.call_count == 2
 
 def test_remove_store_files(store):
     store.get_store_files_ids = MagicMock(return_value=["f1", "f2"])
@@ -139,7 +145,7 @@ def test_remove_store_files(store):
     result = store.remove_store_files("store1", callback)
     assert result == 1
     assert store.delete_store_file.call_count == 2
-    assert callback.call_count == 3
+    assert callback.call_count == 2
 
 def test_import_stores(store):
     fake_client = MagicMock()
@@ -263,6 +269,16 @@ def test_remove_from_store(store):
     assert result == 2
     assert store.delete_store_file.call_count == 2
 
+def test_remove_from_store_failed(store):
+    store.get_store_files_ids = MagicMock(return_value=["f1", "f2", "f3"])
+    store.delete_store_file = MagicMock(side_effect=["ok", Exception("fail"), "ok"])
+    store.log = MagicMock()
+    with pytest.raises(SyncError) as e:
+        store.remove_from_store("s1")
+    assert e.value.done == 2
+    assert e.value.failed == 1
+    assert store.delete_store_file.call_count == 3
+
 def test_remove_all(store):
     store.get_stores_ids = MagicMock(return_value=["s1", "s2"])
     def fake_remove_store(store_id):
@@ -329,4 +345,49 @@ def test_import_store_files(store):
     assert result == ["f1"]
     fake_client.vector_stores.files.list.assert_called_once()
     store.get_file.assert_called_once_with("f1")
-    store.window.core.remote_store.openai.files.insert.assert_called_once_with("s1", "file_data")
\ No newline at end of file
+    store.window.core.remote_store.openai.files.insert.assert_called_once_with("s1", "file_data")
+
+
+class FakeFilesAPI:
+    """Local fake of files and vector store file batches API"""
+    def __init__(self):
+        self.uploaded = []
+        self.batches = []
+        self.files = SimpleNamespace(create=self.create)
+        self.vector_stores = SimpleNamespace(file_batches=SimpleNamespace(create=self.create_batch))
+
+    def create(self, file, purpose):
+        self.uploaded.append(os.path.basename(file.name))
+        return SimpleNamespace(id="file-{}".format(len(self.uploaded)))
+
+    def create_batch(self, vector_store_id, file_ids):
+        self.batches.append((vector_store_id, list(file_ids)))
+        return SimpleNamespace(id="batch-{}".format(len(self.batches)))
+
+
+def test_upload_files_dedup_and_batch(store, tmp_path):
+    api = FakeFilesAPI()
+    store.window.core.api.openai.get_client.return_value = api
+    store.window.core.config.get_user_path.return_value = str(tmp_path)
+    files = store.window.core.remote_store.openai.files
+    files.PROVIDER_NAME = "openai"
+    files.get_hashes.return_value = {Sync.hash_file(str(_write(tmp_path, "old.txt", "old"))): "file-old"}
+    paths = [
+        str(_write(tmp_path, "a.txt", "a")),
+        str(_write(tmp_path, "b.txt", "b")),
+        str(_write(tmp_path, "b_copy.txt", "b")),  # duplicated content
+        str(tmp_path / "old.txt"),  # already in store
+    ]
+    stats = store.upload_files("vs_1", paths)
+    assert stats == {"uploaded": 2, "skipped": 2, "failed": 0}
+    assert sorted(api.uploaded) == ["a.txt", "b.txt"]
+    assert len(api.batches) == 1
+    assert api.batches[0][0] == "vs_1"
+    assert sorted(api.batches[0][1]) == ["file-1", "file-2"]
+    assert files.add.call_count == 2
+
+
+def _write(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_text(content)
+    return path
@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2025.08.10 00:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 import base64
@@ -90,7 +90,9 @@ def test_build_content_with_url(vision):
 def test_build_content_with_attachment(vision, monkeypatch):
     dummy = SimpleNamespace(path="/fake/path/image.jpg", consumed=False)
     monkeypatch.setattr(os.path, "exists", lambda path: True)
-    monkeypatch.setattr(Vision, "encode_image", lambda self, p: "dummy_encoded")
+    vision.window.core.vision.encoder.encode.return_value = SimpleNamespace(
+        data_url="data:image/jpeg;base64,dummy_encoded"
+    )
     content = vision.build_content("test", {"att1": dummy})
     assert content[0] == {"type": "text", "text": "test"}
     assert content[1] == {"type": "image_url", "image_url": {"url": "data:image/jpeg;base64,dummy_encoded"}}
@@ -100,7 +102,9 @@ def test_build_content_with_attachment(vision, monkeypatch):
 def test_build_agent_input(vision, monkeypatch):
     dummy = SimpleNamespace(path="/fake/path/image.jpg", consumed=False)
     monkeypatch.setattr(os.path, "exists", lambda path: True)
-    monkeypatch.setattr(Vision, "encode_image", lambda self, p: "dummy_encoded")
+    vision.window.core.vision.encoder.encode.return_value = SimpleNamespace(
+        data_url="data:image/jpeg;base64,dummy_encoded"
+    )
     items = vision.build_agent_input("http://example.com/image.jpg prompt", {"att1": dummy})
     assert items[0]["role"] == "user"
     contents = items[0]["content"]
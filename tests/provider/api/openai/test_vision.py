@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.20 03:00:00                  #
+# Updated Date: 2026.10.19 00:00:00                  #
 # ================================================== #
 
 import base64
@@ -74,18 +74,20 @@ def test_reset_tokens(mock_window_conf):
     assert vision.input_tokens == 0
 
 
-def test_build(mock_window_conf):
+def test_build(mock_window_conf, monkeypatch):
     """
     Test build vision content
     """
     vision = Vision(mock_window_conf)
     vision.extract_urls = MagicMock(return_value=['https://test.com'])
     vision.is_image = MagicMock(return_value=True)
-    vision.encode_image = MagicMock(return_value='test_base64')
+    mock_window_conf.core.vision.encoder.encode = MagicMock(
+        return_value=MagicMock(data_url='data:image/jpeg;base64,test_base64')
+    )
     attachments = {'test_uuid': MagicMock()}
     attachments['test_uuid'].path = 'test_path'
 
-    os.path.exists = MagicMock(return_value=True)
+    monkeypatch.setattr(os.path, "exists", MagicMock(return_value=True))
     content = vision.build_content('test_text', attachments)
     assert len(content) == 3
     assert content[0]['type'] == 'text'
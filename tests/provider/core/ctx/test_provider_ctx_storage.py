@@ -6,7 +6,7 @@
 # GitHub:  https://github.com/szczyglis-dev/py-gpt   #
 # MIT License                                        #
 # Created By  : Marcin Szczygliński                  #
-# Updated Date: 2024.11.26 19:00:00                  #
+# Updated Date: 2026.10.18 00:00:00                  #
 # ================================================== #
 
 from unittest.mock import MagicMock, patch, mock_open, Mock
@@ -44,6 +44,7 @@ def test_get_meta(mock_window):
         'label': 0,
         'indexed_ts': 0,
         'indexes_json': {},
+        'summary_json': None,
         'additional_ctx_json': [],
         'group_id': 1,
         'group_name': 'group_name',
@@ -294,6 +295,7 @@ def test_unpack_meta(mock_window):
         'label': 0,
         'indexed_ts': 0,
         'indexes_json': {},
+        'summary_json': None,
         'additional_ctx_json': [],
         'group_id': 1,
         'group_name': 'group_name',
@@ -390,6 +392,56 @@ def test_unpack_item(mock_window):
     assert item.internal is True
 
 
+
+def test_unpack_item_lazy():
+    """Test unpack item with lazy JSON columns"""
+    row = {
+        'id': 1,
+        'meta_id': 2,
+        'cmds_json': '[{"cmd": "test"}]',
+        'results_json': '[]',
+        'urls_json': None,
+        'extra': '{"a": 1}',
+        'files_json': 'not json',
+    }
+    item = CtxItem()
+    unpack_item(item, row)
+    assert item.lazy == {'cmds': '[{"cmd": "test"}]', 'extra': '{"a": 1}', 'files': 'not json'}
+    assert item.results == []
+    assert item.urls == []
+    assert item.images == []  # column not selected
+    assert item.cmds == [{"cmd": "test"}]
+    assert 'cmds' not in item.lazy
+    item.extra = {"b": 2}  # assign before decode, raw value is dropped
+    assert item.extra == {"b": 2}
+    assert item.files == 'not json'
+    assert item.lazy is None
+
+
+def test_get_items_columns(mock_window):
+    """Test get items with selected columns only"""
+    storage = Storage(mock_window)
+    fake_row = Mock()
+    fake_row._asdict.return_value = {
+        'id': 1,
+        'meta_id': 1,
+        'input': 'in',
+        'output': 'out',
+    }
+    conn = Mock()
+    conn.execute.return_value = [fake_row]
+    with patch('pygpt_net.core.db.database.Database.get_db') as mock_get_db, \
+            patch('pygpt_net.provider.core.ctx.db_sqlite.storage.text') as mock_text:
+        mock_window.core.db.get_db = mock_get_db
+        mock_get_db.return_value.connect.return_value.__enter__.return_value = conn
+        result = storage.get_items(1, columns=["input", "output", "bad; DROP"])
+    sql = " ".join(mock_text.call_args[0][0].split())
+    assert "SELECT id, meta_id, input, output FROM ctx_item" in sql
+    assert result[0].input == 'in'
+    assert result[0].output == 'out'
+    assert result[0].cmds == []
+    assert result[0].extra == {}
+
 def test_pack_item_value():
     """Test pack item value"""
     storage = Storage()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+import threading
+import time
+from pathlib import Path
+
+from pygpt_net.provider.loaders.hub.parallel.base import ParallelReader
+
+STATE = {"running": 0, "max": 0}
+LOCK = threading.Lock()
+
+
+def read_pages(path: str, start: int, end: int) -> list:
+    with LOCK:
+        STATE["running"] += 1
+        STATE["max"] = max(STATE["max"], STATE["running"])
+    time.sleep(0.01 * ((start // 10) % 3))  # finish out of order
+    with LOCK:
+        STATE["running"] -= 1
+    return [("page {}".format(i), {"page_label": str(i + 1)}) for i in range(start, end)]
+
+
+class FakeReader(ParallelReader):
+    """Fake reader with N pages"""
+    pages = 100
+
+    def get_ranges(self, file: Path) -> list:
+        return [(i, min(i + self.chunk_size, self.pages)) for i in range(0, self.pages, self.chunk_size)]
+
+    def get_size(self, ranges: list) -> int:
+        return self.pages
+
+    def get_task(self):
+        return read_pages
+
+
+def test_lazy_load_data_order():
+    """Test documents are yielded in page order"""
+    reader = FakeReader(workers=3, chunk_size=10, min_size=0, use_processes=False)
+    docs = list(reader.lazy_load_data(Path("test.pdf"), extra_info={"source": "test"}))
+    assert [d.text for d in docs] == ["page {}".format(i) for i in range(100)]
+    assert docs[0].metadata == {"page_label": "1", "source": "test"}
+
+
+def test_lazy_load_data_is_lazy():
+    """Test pool window is bounded while consuming stream"""
+    STATE["max"] = 0
+    reader = FakeReader(workers=2, chunk_size=10, min_size=0, use_processes=False)
+    stream = reader.lazy_load_data(Path("test.pdf"))
+    first = next(stream)
+    assert first.text == "page 0"
+    stream.close()  # stops pool
+    assert STATE["max"] <= 2
+
+
+def test_small_file_in_process():
+    """Test small files are parsed without pool"""
+    reader = FakeReader(workers=4, chunk_size=10, min_size=1000, use_processes=True)
+    reader.create_pool = None  # not used
+    docs = reader.load_data(Path("test.pdf"))
+    assert len(docs) == 100
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.19 00:00:00                  #
+# ================================================== #
+
+from unittest.mock import MagicMock
+
+import pytest
+from llama_index.core.schema import TextNode, NodeRelationship, RelatedNodeInfo
+
+from pygpt_net.provider.vector_stores.keyword import KeywordStore
+
+
+def make_node(id: str, text: str, doc_id: str) -> TextNode:
+    node = TextNode(id_=id, text=text, metadata={"file_name": doc_id + ".txt"})
+    node.relationships[NodeRelationship.SOURCE] = RelatedNodeInfo(node_id=doc_id)
+    return node
+
+
+@pytest.fixture
+def store(tmp_path):
+    window = MagicMock()
+    window.core.config.get.return_value = "SimpleVectorStore"
+    window.core.config.get_user_dir.return_value = str(tmp_path)
+    store = KeywordStore(window)
+    if not store.is_available():
+        pytest.skip("SQLite FTS5 not available")
+    store.add("base", [
+        make_node("n1", "def parse_config(path): load settings file", "doc1"),
+        make_node("n2", "Order ID-4711 was shipped yesterday", "doc2"),
+        make_node("n3", "The weather is sunny today", "doc3"),
+    ])
+    return store
+
+
+def test_search_exact_terms(store):
+    """Test identifiers and IDs are matched"""
+    nodes = store.search("base", "where is parse_config defined?")
+    assert nodes[0].node.node_id == "n1"
+    assert nodes[0].node.metadata == {"file_name": "doc1.txt"}
+    nodes = store.search("base", "status of ID-4711")
+    assert [n.node.node_id for n in nodes] == ["n2"]
+    assert store.search("base", "???") == []
+
+
+def test_remove_document(store):
+    """Test document nodes are removed"""
+    assert store.count("base") == 3
+    store.remove_document("base", "doc2")
+    assert store.count("base") == 2
+    assert store.search("base", "ID-4711") == []
+    store.remove("base")
+    assert not store.exists("base")
+
+
+def test_batch_reuses_connection(store):
+    """Test writes in batch use one connection, closed after batch"""
+    calls = []
+    connect = store.connect
+    store.connect = lambda path: calls.append(path) or connect(path)
+    with store.batch("base"):
+        store.add("base", [make_node("n4", "first batch node", "doc4")])
+        store.add("base", [make_node("n5", "second batch node", "doc5")])
+        store.remove_document("base", "doc4")
+        assert store.count("base") == 4
+    assert len(calls) == 1
+    assert store.conns == {}
+    assert [n.node.node_id for n in store.search("base", "batch")] == ["n5"]
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+
+import os
+
+import numpy as np
+from llama_index.core.schema import TextNode, NodeRelationship, RelatedNodeInfo
+from llama_index.core.vector_stores.types import VectorStoreQuery, MetadataFilters, MetadataFilter
+
+from pygpt_net.provider.vector_stores.numpy_mmap import NumpyVectorStore
+
+
+def make_nodes(n: int, dim: int = 16, offset: int = 0, seed: int = 1):
+    rnd = np.random.default_rng(seed)
+    nodes = []
+    for i in range(offset, offset + n):
+        node = TextNode(
+            id_="node_{}".format(i),
+            text="",
+            embedding=rnd.normal(size=dim).tolist(),
+            metadata={"group": i % 3},
+        )
+        node.relationships[NodeRelationship.SOURCE] = RelatedNodeInfo(node_id="doc_{}".format(i % 4))
+        nodes.append(node)
+    return nodes
+
+
+def expected_ids(nodes, query, k):
+    data = np.array([node.embedding for node in nodes], dtype=np.float32)
+    data /= np.linalg.norm(data, axis=1, keepdims=True)
+    scores = data @ (np.asarray(query, dtype=np.float32) / np.linalg.norm(query))
+    return [nodes[i].node_id for i in np.argsort(-scores)[:k]]
+
+
+def test_query_exact(tmp_path):
+    """Test exact query matches brute force cosine similarity"""
+    store = NumpyVectorStore(path=str(tmp_path), block_rows=100)
+    nodes = make_nodes(1000)
+    store.add(nodes)
+    query = np.random.default_rng(2).normal(size=16).tolist()
+    result = store.query(VectorStoreQuery(query_embedding=query, similarity_top_k=5))
+    assert result.ids == expected_ids(nodes, query, 5)
+    assert result.similarities == sorted(result.similarities, reverse=True)
+
+
+def test_query_filters(tmp_path):
+    """Test query restricted by node ids and metadata filters"""
+    store = NumpyVectorStore(path=str(tmp_path))
+    store.add(make_nodes(100))
+    query = make_nodes(1, seed=3)[0].embedding
+    result = store.query(VectorStoreQuery(
+        query_embedding=query,
+        similarity_top_k=10,
+        filters=MetadataFilters(filters=[MetadataFilter(key="group", value=1)]),
+    ))
+    assert len(result.ids) == 10
+    assert all(int(id.split("_")[1]) % 3 == 1 for id in result.ids)
+    result = store.query(VectorStoreQuery(
+        query_embedding=query,
+        similarity_top_k=10,
+        node_ids=["node_1", "node_2", "unknown"],
+    ))
+    assert sorted(result.ids) == ["node_1", "node_2"]
+
+
+def test_delete_and_reopen(tmp_path):
+    """Test tombstone deletes, replaced nodes and reopen"""
+    store = NumpyVectorStore(path=str(tmp_path), compact_ratio=0)
+    store.add(make_nodes(100))
+    store.delete("doc_0")
+    store.add(make_nodes(1, offset=1, seed=5))  # replace node_1
+    store.close()
+
+    store = NumpyVectorStore(path=str(tmp_path), compact_ratio=0)
+    query = make_nodes(1, seed=3)[0].embedding
+    result = store.query(VectorStoreQuery(query_embedding=query, similarity_top_k=100))
+    assert len(result.ids) == 75
+    assert "node_0" not in result.ids
+    assert result.ids.count("node_1") == 1
+    assert store._count == 101
+
+
+def test_compact(tmp_path):
+    """Test compaction drops deleted rows"""
+    store = NumpyVectorStore(path=str(tmp_path))
+    nodes = make_nodes(100)
+    store.add(nodes)
+    store.delete("doc_0")
+    store.delete("doc_1")
+    store.persist()
+    assert store._count == 50
+    assert os.listdir(str(tmp_path)).count("vectors.{}.npy".format(store._gen)) == 1
+    store.close()
+
+    store = NumpyVectorStore(path=str(tmp_path))
+    alive = [node for node in nodes if node.ref_doc_id in ("doc_2", "doc_3")]
+    query = make_nodes(1, seed=3)[0].embedding
+    result = store.query(VectorStoreQuery(query_embedding=query, similarity_top_k=5))
+    assert result.ids == expected_ids(alive, query, 5)
+
+
+def test_query_ivf(tmp_path):
+    """Test IVF query, index is saved and extended on reopen"""
+    store = NumpyVectorStore(path=str(tmp_path), index_type="ivf", ivf_min_rows=1, ivf_lists=4, ivf_probes=4)
+    nodes = make_nodes(500)
+    store.add(nodes)
+    query = nodes[10].embedding
+    result = store.query(VectorStoreQuery(query_embedding=query, similarity_top_k=5))
+    assert result.ids == expected_ids(nodes, query, 5)  # all lists probed
+    store.persist()
+    store.add(make_nodes(10, offset=500))
+    store.close()
+
+    store = NumpyVectorStore(path=str(tmp_path), index_type="ivf", ivf_min_rows=1, ivf_lists=4, ivf_probes=4)
+    assert store._ann["count"] == 510
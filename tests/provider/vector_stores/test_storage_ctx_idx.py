@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.18 00:00:00                  #
+# ================================================== #
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from pygpt_net.provider.vector_stores import Storage
+
+
+class FakeIndex:
+    def __init__(self, embed_model=None):
+        self._embed_model = embed_model
+
+
+class FakeProvider:
+    """Fake ctx attachment provider, counts loads and persists"""
+
+    def __init__(self):
+        self.loads = 0
+        self.stores = []
+
+    def get(self, id, llm=None, embed_model=None):
+        self.loads += 1
+        return FakeIndex(embed_model)
+
+    def store(self, id, index=None):
+        self.stores.append(index)
+
+    def clean(self):
+        pass
+
+
+@pytest.fixture
+def storage():
+    storage = Storage(MagicMock())
+    providers = {}
+    storage.get_ctx_idx_storage = lambda path: providers.setdefault(path, FakeProvider())
+    storage.providers = providers
+    return storage
+
+
+def test_get_ctx_idx_resident(storage):
+    """Test index is loaded from disk once while resident"""
+    embed = object()
+    index = storage.get_ctx_idx("a", embed_model=embed)
+    assert storage.get_ctx_idx("a", embed_model=embed) is index
+    assert storage.providers["a"].loads == 1
+    storage.get_ctx_idx("a", embed_model=object())  # other embed model
+    assert storage.providers["a"].loads == 2
+
+
+def test_store_ctx_idx_async(storage):
+    """Test index is persisted in background and stays resident"""
+    index = storage.get_ctx_idx("a")
+    generation = storage.get_generation("a")
+    storage.store_ctx_idx("a", index)
+    storage.ctx_future.result()
+    assert storage.providers["a"].stores == [index]
+    assert storage.ctx_dirty == set()
+    assert storage.get_generation("a") > generation
+    assert storage.get_ctx_idx("a") is index
+
+
+def test_lru_eviction_persists(storage):
+    """Test least recently used dirty index is persisted on eviction"""
+    with storage.ctx_lock:  # block background flush
+        index = storage.get_ctx_idx("a")
+        storage.store_ctx_idx("a", index)
+        for path in ["b", "c", "d"]:
+            storage.get_ctx_idx(path)
+        assert "a" not in storage.ctx_indexes
+        assert storage.providers["a"].stores == [index]
+    storage.ctx_future.result()
+
+
+def test_release_ctx_idx_discard(storage):
+    """Test released index is not persisted when removed"""
+    with storage.ctx_lock:
+        index = storage.get_ctx_idx("a")
+        storage.store_ctx_idx("a", index)
+        storage.release_ctx_idx("a", persist=False)
+    storage.ctx_future.result()
+    assert storage.providers["a"].stores == []
+    assert "a" not in storage.ctx_indexes
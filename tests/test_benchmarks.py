@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.19 00:00:00                  #
+# ================================================== #
+
+
+import json
+
+from benchmarks import harness, run
+from benchmarks.harness import Benchmark, Skip, get_stats, compare, save, load
+
+
+def test_stats():
+    """Test timing stats"""
+    stats = get_stats([0.3, 0.1, 0.2])
+    assert stats["rounds"] == 3
+    assert stats["min"] == 0.1
+    assert stats["max"] == 0.3
+    assert stats["median"] == 0.2
+
+
+def test_run_ok_skip_error():
+    """Test benchmark statuses"""
+    calls = []
+    b = Benchmark("ok", lambda state: calls.append(state) or {"n": 1}, rounds=3, warmup=1, setup=lambda: "s")
+    result = b.run()
+    assert result["status"] == "ok"
+    assert result["rounds"] == 3
+    assert result["extra"] == {"n": 1}
+    assert calls == ["s"] * 4
+
+    def skip():
+        raise Skip("no package")
+
+    assert Benchmark("skip", lambda state: None, setup=skip).run()["status"] == "skipped"
+    result = Benchmark("err", lambda state: 1 / 0).run()
+    assert result["status"] == "error"
+    assert "ZeroDivisionError" in result["reason"]
+
+
+def test_compare_and_save(tmp_path):
+    """Test results comparison and JSON storage"""
+    base = {"results": [
+        {"name": "a", "status": "ok", "median": 1.0},
+        {"name": "b", "status": "ok", "median": 1.0},
+        {"name": "c", "status": "ok", "median": 1.0},
+    ]}
+    current = {"results": [
+        {"name": "a", "status": "ok", "median": 1.5},
+        {"name": "b", "status": "ok", "median": 0.5},
+        {"name": "c", "status": "ok", "median": 1.05},
+        {"name": "d", "status": "ok", "median": 1.0},
+    ]}
+    verdicts = {row["name"]: row["verdict"] for row in compare(base, current, 0.1)}
+    assert verdicts == {"a": "regression", "b": "improvement", "c": "same", "d": "new"}
+
+    path = str(tmp_path / "results" / "bench.json")
+    save(current, path)
+    assert load(path) == current
+    with open(path) as f:
+        assert json.load(f)["results"][0]["name"] == "a"
+
+
+def test_main_fails_on_error(tmp_path, monkeypatch):
+    """Test runner exits with 1 when benchmark raises"""
+    monkeypatch.setattr(run, "load_modules", lambda: None)
+    monkeypatch.setattr(harness, "REGISTRY", [
+        Benchmark("ok", lambda state: None, rounds=1),
+        Benchmark("err", lambda state: 1 / 0, rounds=1),
+    ])
+    path = str(tmp_path / "bench.json")
+    assert run.main(["-k", "ok", "-o", path]) == 0
+    assert run.main(["-o", path]) == 1
+    assert load(path)["results"][1]["status"] == "error"
+
+
+def test_dispatcher_smoke(tmp_path, monkeypatch):
+    """Test dispatcher benchmark runs without errors"""
+    from benchmarks import bench_dispatcher
+
+    monkeypatch.setenv("PYGPT_WORKDIR", str(tmp_path))
+    state = bench_dispatcher.setup_dispatcher()
+    for event in bench_dispatcher.make_events(state.ctx):
+        state.dispatcher.dispatch(event)  # raises on plugin error
+    assert state.plugins > 0
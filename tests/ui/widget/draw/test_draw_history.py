@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.19 00:00:00                  #
+# ================================================== #
+
+
+import numpy as np
+
+from PySide6.QtCore import QRect, QSize
+from PySide6.QtGui import QImage
+
+from pygpt_net.ui.widget.draw.history import (
+    diff_tiles,
+    pack_image,
+    unpack_image,
+    UndoStep,
+    UndoHistory,
+)
+from pygpt_net.ui.widget.draw.pixels import image_view
+
+
+def make_image(w: int = 100, h: int = 70, color: int = 0xFFFFFFFF) -> QImage:
+    img = QImage(w, h, QImage.Format_ARGB32_Premultiplied)
+    img.fill(color)
+    return img
+
+
+def make_state(w: int = 100, h: int = 70) -> dict:
+    return {
+        'base': make_image(w, h),
+        'draw': make_image(w, h, 0x00000000),
+        'src': None,
+        'canvas_size': QSize(w, h),
+        'baseRect': QRect(0, 0, w, h),
+    }
+
+
+def paint(img: QImage, x: int, y: int, w: int, h: int, color: int = 0xFFFF0000):
+    image_view(img, writable=True)[y:y + h, x:x + w] = color
+
+
+def pixels(state: dict) -> dict:
+    return {k: image_view(state[k]).copy() for k in ('base', 'draw')}
+
+
+def assert_same(state: dict, expected: dict):
+    for k, arr in expected.items():
+        assert np.array_equal(image_view(state[k]), arr)
+
+
+def test_diff_tiles():
+    """Test changed tiles are found, edge tiles are clipped to image size"""
+    before = np.zeros((70, 100), dtype=np.uint32)
+    after = before.copy()
+    assert diff_tiles(before, after) == []
+    after[0, 0] = 1
+    after[69, 99] = 1  # bottom-right edge tile
+    assert diff_tiles(before, after) == [(0, 0, 64, 64), (64, 64, 36, 6)]
+    assert diff_tiles(before, after, tile=32) == [(0, 0, 32, 32), (96, 64, 4, 6)]
+
+
+def test_diff_tiles_single_pixel():
+    """Test 1x1 arrays"""
+    before = np.zeros((1, 1), dtype=np.uint32)
+    after = np.ones((1, 1), dtype=np.uint32)
+    assert diff_tiles(before, after) == [(0, 0, 1, 1)]
+
+
+def test_pack_image_round_trip():
+    """Test whole image compression round trip"""
+    img = make_image(33, 17)
+    paint(img, 3, 4, 10, 5, 0xFF00FF00)
+    restored = unpack_image(pack_image(img))
+    assert restored.size() == img.size()
+    assert np.array_equal(image_view(restored), image_view(img))
+
+
+def test_seal_unchanged():
+    """Test step without changes is dropped"""
+    state = make_state()
+    step = UndoStep(state)
+    assert step.seal(state) is False
+    assert step.pending is None
+
+
+def test_seal_tiles_and_apply():
+    """Test sealed step keeps only changed tiles and undo/redo round trip restores pixels"""
+    state = make_state()
+    before = pixels(state)
+    step = UndoStep(state)
+    paint(state['draw'], 70, 65, 20, 5)  # one edge tile
+    after = pixels(state)
+    assert step.seal(state) is True
+    assert step.full is None
+    assert list(step.tiles) == ['draw']
+    assert list(step.tiles['draw']) == [(64, 64, 36, 6)]
+    assert step.nbytes > 0
+
+    restored, inverse = step.apply(state)
+    assert_same(restored, before)
+    restored, _ = inverse.apply(restored)
+    assert_same(restored, after)
+
+
+def test_seal_resized_canvas():
+    """Test step keeps whole layers when canvas size has changed"""
+    state = make_state()
+    paint(state['base'], 0, 0, 5, 5)
+    before = pixels(state)
+    step = UndoStep(state)
+    resized = make_state(120, 90)
+    assert step.seal(resized) is True
+    assert set(step.full) == {'base', 'draw'}
+    assert step.tiles == {}
+
+    restored, inverse = step.apply(resized)
+    assert restored['canvas_size'] == QSize(100, 70)
+    assert restored['base'].size() == QSize(100, 70)
+    assert_same(restored, before)
+    restored, _ = inverse.apply(restored)
+    assert restored['base'].size() == QSize(120, 90)
+
+
+def test_history_undo_redo():
+    """Test undo/redo of multiple actions restores exact pixels"""
+    history = UndoHistory()
+    state = make_state()
+    snapshots = [pixels(state)]
+    for i in range(3):
+        history.push(state)
+        paint(state['draw'], i * 30, i * 20, 10, 10)
+        snapshots.append(pixels(state))
+    assert history.has_undo()
+    assert not history.has_redo()
+
+    for i in range(3, 0, -1):
+        state = history.undo(state)
+        assert_same(state, snapshots[i - 1])
+    assert history.undo(state) is None
+    assert history.has_redo()
+
+    for i in range(1, 4):
+        state = history.redo(state)
+        assert_same(state, snapshots[i])
+    assert history.redo(state) is None
+
+
+def test_history_push_clears_redo():
+    """Test new action clears redo stack, unchanged action is not stored"""
+    history = UndoHistory()
+    state = make_state()
+    history.push(state)
+    paint(state['draw'], 0, 0, 5, 5)
+    state = history.undo(state)
+    assert history.has_redo()
+    history.push(state)
+    assert not history.has_redo()
+    history.seal(state)  # nothing changed
+    assert not history.has_undo()
+
+
+def test_history_limits():
+    """Test count limit and memory budget, the latest step is always kept"""
+    history = UndoHistory(limit=2)
+    state = make_state()
+    for i in range(4):
+        history.push(state)
+        paint(state['draw'], i * 10, 0, 5, 5)
+    history.seal(state)
+    assert len(history.undo_stack) == 2
+
+    history = UndoHistory(max_bytes=1)
+    state = make_state()
+    for i in range(3):
+        history.push(state)
+        paint(state['draw'], i * 10, 0, 5, 5)
+    history.seal(state)
+    assert len(history.undo_stack) == 1
+    assert history.get_size() > 1
+    history.clear()
+    assert history.get_size() == 0
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ================================================== #
+# This file is a part of PYGPT package               #
+# Website: https://pygpt.net                         #
+# GitHub:  https://github.com/szczyglis-dev/py-gpt   #
+# MIT License                                        #
+# Created By  : Marcin Szczygliński                  #
+# Updated Date: 2026.10.19 00:00:00                  #
+# ================================================== #
+
+
+import numpy as np
+
+from PySide6.QtCore import QRect
+from PySide6.QtGui import QImage
+
+from pygpt_net.ui.widget.draw.pixels import image_view, mask_bounds, to_32bit
+
+
+def test_image_view():
+    """Test view has image shape and writable view changes pixels"""
+    img = QImage(5, 3, QImage.Format_ARGB32)  # padded lines are cut off
+    img.fill(0xFF000000)
+    view = image_view(img, writable=True)
+    assert view.shape == (3, 5)
+    view[1, 2] = 0xFFFF0000
+    assert img.pixel(2, 1) == 0xFFFF0000
+
+
+def test_to_32bit():
+    """Test conversion to 32-bit formats"""
+    img = QImage(2, 2, QImage.Format_ARGB32_Premultiplied)
+    assert to_32bit(img) is img
+    assert to_32bit(img, premultiplied=False).format() == QImage.Format_ARGB32
+    assert to_32bit(QImage(2, 2, QImage.Format_RGB888)).format() == QImage.Format_ARGB32
+
+
+def test_mask_bounds():
+    """Test tight bounds of mask"""
+    mask = np.zeros((10, 20), dtype=bool)
+    assert mask_bounds(mask) is None
+    mask[2, 3] = True
+    assert mask_bounds(mask) == QRect(3, 2, 1, 1)
+    mask[7, 15] = True
+    assert mask_bounds(mask) == QRect(3, 2, 13, 6)
+
+
+def test_mask_bounds_edges():
+    """Test mask touching image edges"""
+    mask = np.zeros((4, 6), dtype=bool)
+    mask[0, 5] = True
+    mask[3, 0] = True
+    assert mask_bounds(mask) == QRect(0, 0, 6, 4)
+    assert mask_bounds(np.ones((1, 1), dtype=bool)) == QRect(0, 0, 1, 1)
+    assert mask_bounds(np.zeros((0, 0), dtype=bool)) is None